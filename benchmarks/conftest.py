@@ -0,0 +1,195 @@
+"""Fixtures and result recording for the queue benchmark suite.
+
+The suite is opt-in: ``testpaths`` only names ``tests``, so it runs when its
+directory is given explicitly, e.g. ``python -m pytest benchmarks``. Redis
+benchmarks use ``BENCHMARK_REDIS_URL`` when it is set, otherwise a throwaway
+``redis-server`` started from ``PATH``; they are skipped if neither exists.
+"""
+
+import json
+import os
+import platform
+import shutil
+import socket
+import subprocess
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from benchmarks.helpers import QueueSpec
+
+_RESULTS = pytest.StashKey[list[dict[str, Any]]]()
+_DEFAULT_RESULTS_PATH = Path(__file__).parent / "results.json"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--benchmark-entries",
+        type=int,
+        default=2000,
+        help="Entries per enqueue, latency and throughput run (default 2000).",
+    )
+    group.addoption(
+        "--benchmark-workers",
+        default="1,4",
+        help="Comma-separated worker counts for throughput runs (default 1,4).",
+    )
+    group.addoption(
+        "--benchmark-retained",
+        default="10000",
+        help=(
+            "Comma-separated retained entry counts for list and prune runs "
+            "(default 10000; the full sweep is 10000,100000,1000000)."
+        ),
+    )
+    group.addoption(
+        "--benchmark-json",
+        default=str(_DEFAULT_RESULTS_PATH),
+        help="Where to write machine-readable results.",
+    )
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: queue hot-path benchmark, run with pytest benchmarks"
+    )
+    config.stash[_RESULTS] = []
+
+
+def pytest_generate_tests(metafunc):
+    if "worker_count" in metafunc.fixturenames:
+        counts = _int_list(metafunc.config.getoption("benchmark_workers"))
+        metafunc.parametrize("worker_count", counts, ids=[f"w{n}" for n in counts])
+    if "retained" in metafunc.fixturenames:
+        sizes = _int_list(metafunc.config.getoption("benchmark_retained"))
+        metafunc.parametrize("retained", sizes, ids=[f"n{n}" for n in sizes])
+
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        item.add_marker(pytest.mark.benchmark)
+
+
+def pytest_sessionfinish(session):
+    results = session.config.stash.get(_RESULTS, [])
+    if not results:
+        return
+    path = Path(session.config.getoption("benchmark_json"))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="session")
+def benchmark_redis_url():
+    url = os.environ.get("BENCHMARK_REDIS_URL")
+    if url:
+        yield url
+        return
+    pytest.importorskip("redis")
+    server = shutil.which("redis-server")
+    if server is None:
+        pytest.skip("Set BENCHMARK_REDIS_URL or put redis-server on PATH")
+    port = _free_port()
+    process = subprocess.Popen(
+        [server, "--port", str(port), "--save", "", "--appendonly", "no"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        import redis
+
+        client = redis.Redis(port=port)
+        deadline = time.monotonic() + 5
+        while True:
+            try:
+                client.ping()
+                break
+            except redis.ConnectionError:
+                if time.monotonic() > deadline:
+                    pytest.skip("redis-server did not start")
+                time.sleep(0.05)
+        client.close()
+        yield f"redis://127.0.0.1:{port}/0"
+    finally:
+        process.terminate()
+        process.wait()
+
+
+@pytest.fixture
+def make_queue(request):
+    """Build fresh queues of one spec, removing their Redis keys afterwards."""
+    redis_queue_names = []
+
+    def make(spec: QueueSpec, **options):
+        queue_name = f"bench-{uuid4().hex}"
+        if spec.backend == "memory":
+            return spec.queue_class(queue_name=queue_name, **options)
+        redis_url = request.getfixturevalue("benchmark_redis_url")
+        redis_queue_names.append(queue_name)
+        return spec.queue_class(
+            redis_url, queue_name=queue_name, **spec.options(), **options
+        )
+
+    yield make
+    if redis_queue_names:
+        _delete_redis_keys(
+            request.getfixturevalue("benchmark_redis_url"), redis_queue_names
+        )
+
+
+def _delete_redis_keys(redis_url: str, queue_names: list[str]) -> None:
+    import redis
+
+    client = redis.Redis.from_url(redis_url)
+    try:
+        for queue_name in queue_names:
+            keys = list(client.scan_iter(match=f"{queue_name}:*", count=1000))
+            for start in range(0, len(keys), 1000):
+                client.delete(*keys[start : start + 1000])
+    finally:
+        client.close()
+
+
+@pytest.fixture
+def record(request):
+    """Append one measurement to the session's machine-readable results."""
+
+    def record(spec: QueueSpec, benchmark: str, **measurements):
+        request.config.stash[_RESULTS].append(
+            {
+                "benchmark": benchmark,
+                "queue_class": spec.name,
+                "backend": spec.backend,
+                "test": request.node.nodeid,
+                **measurements,
+            }
+        )
+
+    return record
+
+
+@pytest.fixture
+def entry_count(request) -> int:
+    return request.config.getoption("benchmark_entries")
@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from importlib import import_module
+
+import pytest
+
+
+@dataclass(frozen=True, slots=True)
+class QueueSpec:
+    """One benchmarked queue class, imported lazily so Redis stays optional."""
+
+    name: str
+    backend: str
+    import_path: str
+    events: bool = False
+    # A dotted `EntryCodec` path for Redis queues; None keeps the default.
+    entry_codec: str | None = None
+
+    @property
+    def queue_class(self) -> type:
+        module_name, _, class_name = self.import_path.rpartition(".")
+        if self.backend == "redis":
+            pytest.importorskip("redis")
+        return getattr(import_module(module_name), class_name)
+
+    def options(self) -> dict:
+        if self.entry_codec is None:
+            return {}
+        module_name, _, class_name = self.entry_codec.rpartition(".")
+        return {"entry_codec": getattr(import_module(module_name), class_name)()}
+
+
+QUEUE_SPECS = (
+    QueueSpec("MemoryAsyncQueue", "memory", "django_queue.backends.MemoryAsyncQueue"),
+    QueueSpec(
+        "MemoryAsyncPriorityQueue",
+        "memory",
+        "django_queue.backends.MemoryAsyncPriorityQueue",
+    ),
+    QueueSpec(
+        "MemoryEventQueue",
+        "memory",
+        "django_queue.backends.MemoryEventQueue",
+        events=True,
+    ),
+    QueueSpec(
+        "RedisAsyncQueue", "redis", "django_queue.backends.redis.RedisAsyncQueue"
+    ),
+    QueueSpec(
+        "RedisAsyncPriorityQueue",
+        "redis",
+        "django_queue.backends.redis.RedisAsyncPriorityQueue",
+    ),
+    QueueSpec(
+        "RedisEventQueue",
+        "redis",
+        "django_queue.backends.redis.RedisEventQueue",
+        events=True,
+    ),
+    QueueSpec(
+        "RedisAsyncQueue[compact]",
+        "redis",
+        "django_queue.backends.redis.RedisAsyncQueue",
+        entry_codec="django_queue.codecs.CompactEntryCodec",
+    ),
+    QueueSpec(
+        "RedisEventQueue[compact]",
+        "redis",
+        "django_queue.backends.redis.RedisEventQueue",
+        events=True,
+        entry_codec="django_queue.codecs.CompactEntryCodec",
+    ),
+    QueueSpec(
+        "RedisAsyncQueue[hash]",
+        "redis",
+        "django_queue.backends.redis.RedisAsyncQueue",
+        entry_codec="django_queue.codecs.HashEntryCodec",
+    ),
+)
+ASYNC_QUEUE_SPECS = tuple(spec for spec in QUEUE_SPECS if not spec.events)
+EVENT_QUEUE_SPECS = tuple(spec for spec in QUEUE_SPECS if spec.events)
+
+
+def spec_params(specs):
+    return pytest.mark.parametrize("spec", specs, ids=[spec.name for spec in specs])
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """Summarise latency samples, given in seconds, as milliseconds."""
+    ordered = sorted(samples)
+
+    def at(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+    return {
+        "p50_ms": at(0.50) * 1000,
+        "p95_ms": at(0.95) * 1000,
+        "p99_ms": at(0.99) * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
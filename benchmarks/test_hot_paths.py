@@ -0,0 +1,183 @@
+"""Enqueue rate, claim-to-settle latency and worker throughput per queue class."""
+
+import asyncio
+import time
+
+from benchmarks.helpers import (
+    ASYNC_QUEUE_SPECS,
+    EVENT_QUEUE_SPECS,
+    QUEUE_SPECS,
+    percentiles,
+    spec_params,
+)
+from django_queue.listeners import ListenerRegistration
+
+ALIAS = "bench"
+
+
+async def _noop(entry):
+    return None
+
+
+async def _run_async_workers(queue, worker_count, entry_count):
+    """Run workers until every entry has settled; return the elapsed seconds."""
+    workers = [queue.create_worker(ALIAS, _noop) for _ in range(worker_count)]
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(worker.run()) for worker in workers]
+    try:
+        while sum(worker.snapshot.succeeded_count for worker in workers) < entry_count:
+            await asyncio.sleep(0.001)
+        return time.perf_counter() - start
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _consume_events(monkeypatch):
+    consumed = []
+
+    def consume(entry):
+        consumed.append(entry.id)
+        return True
+
+    monkeypatch.setattr(
+        "django_queue.event_worker.listeners_for",
+        lambda queue_name: (ListenerRegistration(consume),),
+    )
+    return consumed
+
+
+@spec_params(QUEUE_SPECS)
+def test_enqueue_rate(spec, make_queue, record, entry_count):
+    queue = make_queue(spec)
+
+    async def exercise():
+        start = time.perf_counter()
+        for index in range(entry_count):
+            await queue.aenqueue({"index": index})
+        single = time.perf_counter() - start
+        start = time.perf_counter()
+        await queue.aenqueue_many([{"index": index} for index in range(entry_count)])
+        batched = time.perf_counter() - start
+        await queue.aclose()
+        return single, batched
+
+    single, batched = asyncio.run(exercise())
+
+    record(
+        spec,
+        "enqueue",
+        entries=entry_count,
+        enqueue_per_second=entry_count / single,
+        enqueue_many_per_second=entry_count / batched,
+    )
+
+
+@spec_params(ASYNC_QUEUE_SPECS)
+def test_claim_to_settle_latency(spec, make_queue, record, entry_count):
+    queue = make_queue(spec)
+
+    async def exercise():
+        await queue.aenqueue_many([{"index": index} for index in range(entry_count)])
+        await _run_async_workers(queue, 1, entry_count)
+        # Measured on the queue's clock: dispatched_at is stamped by the claim
+        # and finished_at by the settle, so ran_for spans the worker's own
+        # persistence as well as the no-op handler.
+        entries = await queue.alist()
+        await queue.aclose()
+        return [entry.ran_for for entry in entries]
+
+    samples = asyncio.run(exercise())
+
+    assert len(samples) == entry_count
+    record(
+        spec,
+        "claim_to_settle",
+        entries=entry_count,
+        **percentiles(samples),
+    )
+
+
+@spec_params(EVENT_QUEUE_SPECS)
+def test_event_claim_to_consume_latency(
+    spec, make_queue, record, entry_count, monkeypatch
+):
+    queue = make_queue(spec)
+    consumed = _consume_events(monkeypatch)
+
+    async def exercise():
+        await queue.aenqueue_many([{"index": index} for index in range(entry_count)])
+        worker = queue.create_worker(ALIAS)
+        samples = []
+        for _ in range(entry_count):
+            start = time.perf_counter()
+            assert await worker.adispatch_once()
+            samples.append(time.perf_counter() - start)
+        await queue.aclose()
+        return samples
+
+    samples = asyncio.run(exercise())
+
+    assert len(consumed) == entry_count
+    record(
+        spec,
+        "claim_to_settle",
+        entries=entry_count,
+        **percentiles(samples),
+    )
+
+
+@spec_params(ASYNC_QUEUE_SPECS)
+def test_worker_throughput(spec, make_queue, record, entry_count, worker_count):
+    queue = make_queue(spec)
+
+    async def exercise():
+        await queue.aenqueue_many([{"index": index} for index in range(entry_count)])
+        elapsed = await _run_async_workers(queue, worker_count, entry_count)
+        await queue.aclose()
+        return elapsed
+
+    elapsed = asyncio.run(exercise())
+
+    record(
+        spec,
+        "worker_throughput",
+        entries=entry_count,
+        workers=worker_count,
+        entries_per_second=entry_count / elapsed,
+    )
+
+
+@spec_params(EVENT_QUEUE_SPECS)
+def test_event_worker_throughput(
+    spec, make_queue, record, entry_count, worker_count, monkeypatch
+):
+    queue = make_queue(spec)
+    consumed = _consume_events(monkeypatch)
+
+    async def exercise():
+        await queue.aenqueue_many([{"index": index} for index in range(entry_count)])
+        workers = [queue.create_worker(ALIAS) for _ in range(worker_count)]
+        start = time.perf_counter()
+        tasks = [asyncio.create_task(worker.run()) for worker in workers]
+        try:
+            while len(consumed) < entry_count:
+                await asyncio.sleep(0.001)
+            return time.perf_counter() - start
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await queue.aclose()
+
+    elapsed = asyncio.run(exercise())
+
+    assert len(consumed) == entry_count
+    record(
+        spec,
+        "worker_throughput",
+        entries=entry_count,
+        workers=worker_count,
+        entries_per_second=entry_count / elapsed,
+    )
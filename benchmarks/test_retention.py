@@ -0,0 +1,85 @@
+"""Cost of listing and pruning with many terminal entries retained."""
+
+import asyncio
+import time
+from dataclasses import replace
+
+from benchmarks.helpers import ASYNC_QUEUE_SPECS, percentiles, spec_params
+from django_queue.entries import QueueEntryStatus
+
+PRUNE_SAMPLES = 100
+STORE_CHUNK = 50
+
+
+async def _retain(queue, retained):
+    """Store ``retained`` succeeded entries, a tenth of them past retention.
+
+    Entries go straight to the provider: driving a million through a worker
+    would benchmark the worker, not the retained store. Returns the IDs of
+    entries still within retention and the number already expired.
+    """
+    queue._configure_provider_entry_class()
+    now = await queue.clock.anow()
+    expired_before = now - 2 * queue.retention_timeout
+    expired = retained // 10
+    current = []
+    for start in range(0, retained, STORE_CHUNK):
+        entries = []
+        for index in range(start, min(start + STORE_CHUNK, retained)):
+            finished_at = expired_before if index < expired else now
+            entries.append(
+                replace(
+                    queue.entry_class.create(
+                        queue=queue.queue_name,
+                        payload={"index": index},
+                        queued_at=finished_at,
+                    ),
+                    status=QueueEntryStatus.SUCCEEDED,
+                    dispatched_at=finished_at,
+                    finished_at=finished_at,
+                )
+            )
+        await asyncio.gather(*(queue._provider.astore(entry) for entry in entries))
+        current.extend(entry.id for entry in entries[max(0, expired - start) :])
+    return current, expired
+
+
+@spec_params(ASYNC_QUEUE_SPECS)
+def test_list_and_prune_cost(spec, make_queue, record, retained):
+    queue = make_queue(spec)
+
+    async def exercise():
+        current, expired = await _retain(queue, retained)
+
+        start = time.perf_counter()
+        listed = await queue.alist()
+        list_seconds = time.perf_counter() - start
+        assert len(listed) == retained
+
+        prune_samples = []
+        for entry_id in current[:PRUNE_SAMPLES]:
+            start = time.perf_counter()
+            await queue.aprune(entry_id)
+            prune_samples.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        assert await queue._aprune_expired() == expired
+        expire_seconds = time.perf_counter() - start
+
+        await queue.aclose()
+        return list_seconds, prune_samples, expired, expire_seconds
+
+    list_seconds, prune_samples, expired, expire_seconds = asyncio.run(exercise())
+
+    record(
+        spec,
+        "list_and_prune",
+        retained=retained,
+        list_seconds=list_seconds,
+        prune={"entries": len(prune_samples), **percentiles(prune_samples)},
+        retention_sweep={
+            "entries": expired,
+            "seconds": expire_seconds,
+            "entries_per_second": expired / expire_seconds if expire_seconds else None,
+        },
+    )
@@ -18,7 +18,6 @@ from django_queue.entries import QueueEntry, QueueEntryStatus
 
 _RUNNING_DELAY_SECONDS = (30, 60)
 _IMMEDIATE_RELEASE_DELAY_SECONDS = 1 / MICROSECONDS_PER_SECOND
-_MAX_CONCURRENT_HANDLERS = 5
 
 logger = logging.getLogger(__name__)
 _faker = Faker("en_US")
@@ -56,8 +55,7 @@ PRIORITY_TIERS = {
 
 
 class DemoPriorityQueueWorker(RedisAsyncQueueWorker):
-    """Dispatch due entries, letting up to `_MAX_CONCURRENT_HANDLERS`
-    handlers run concurrently.
+    """Dispatch due entries, up to the alias's `CONCURRENCY` at once.
 
     Routes claim/release through the queue-level `aclaim`/`arelease` hooks
     (`queue.aclaim(...)`, `queue.arelease(...)`) rather than calling the
@@ -68,19 +66,16 @@ class DemoPriorityQueueWorker(RedisAsyncQueueWorker):
 
     Without a concurrency cap, a steady drip of low/normal-priority entries
     can keep an unbounded number of handlers running at once, drowning out
-    the rare high/urgent arrivals this demo exists to make visible. The cap
-    is enforced in `_next`, *before* claiming -- not in `_dispatch` after
-    the claim -- so a blocked entry stays visibly `queued` and claimable by
-    the time a slot frees, rather than sitting claimed-but-idle and
-    starving other entries (including higher-priority ones) from being
-    claimed at all while a slot is full.
+    the rare high/urgent arrivals this demo exists to make visible. The
+    worker enforces `CONCURRENCY` (5, in settings.py) *before* claiming, so
+    a blocked entry stays visibly `queued` and claimable by the time a slot
+    frees, rather than sitting claimed-but-idle and starving other entries
+    (including higher-priority ones) from being claimed at all.
     """
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self._handler_tasks: set[asyncio.Task[None]] = set()
         self._injection_tasks: list[asyncio.Task[None]] = []
-        self._handler_slots = asyncio.Semaphore(_MAX_CONCURRENT_HANDLERS)
 
     async def run(self) -> None:
         queue = self._queues["demo"]
@@ -96,10 +91,6 @@ class DemoPriorityQueueWorker(RedisAsyncQueueWorker):
             for task in self._injection_tasks:
                 with contextlib.suppress(asyncio.CancelledError):
                     await task
-            tasks = tuple(self._handler_tasks)
-            for task in tasks:
-                task.cancel()
-            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _inject_tier_entries(
         self, queue: BaseQueue, tier: str, config: dict
@@ -122,12 +113,6 @@ class DemoPriorityQueueWorker(RedisAsyncQueueWorker):
 
     async def _next(self, queue: BaseQueue) -> tuple[QueueEntry, float | None] | None:
         await self._recover_expired_claims(queue)
-        if self._handler_slots.locked():
-            # All _MAX_CONCURRENT_HANDLERS slots are busy -- skip claiming
-            # entirely this cycle, leaving every pending entry visibly
-            # `queued` and available to be claimed once a slot frees,
-            # rather than claiming one and leaving it idle mid-lifecycle.
-            return None
         entry = await queue.aclaim(self._worker_id, queue.default_claim_lease_seconds)
         provider = self._providers[queue]
         try:
@@ -157,60 +142,6 @@ class DemoPriorityQueueWorker(RedisAsyncQueueWorker):
         )
         return None
 
-    async def _dispatch(
-        self,
-        queue: BaseQueue,
-        handler,
-        entry: QueueEntry,
-        lease_seconds: float | None = None,
-    ) -> None:
-        await self._handler_slots.acquire()
-        running_entry = await self._mark_running(queue, entry)
-        if running_entry is None:
-            # Lost the claim race after all -- no handler task is starting,
-            # so the slot this entry would have used must be freed here;
-            # _complete_entry, which normally releases it, never runs.
-            self._handler_slots.release()
-            return
-        await queue.apublish(running_entry)
-        task = asyncio.create_task(self._complete_entry(queue, handler, running_entry))
-        self._handler_tasks.add(task)
-        task.add_done_callback(self._handler_tasks.discard)
-
-    async def _complete_entry(
-        self, queue: BaseQueue, handler, entry: QueueEntry
-    ) -> None:
-        """Settle one independently running demo handler."""
-        try:
-            try:
-                result = await handler(entry)
-            except asyncio.CancelledError:
-                await self._record_failure(
-                    queue,
-                    entry,
-                    RuntimeError("Demo handler terminated during shutdown"),
-                    self._worker_id,
-                )
-                raise
-            except Exception as exc:  # noqa: BLE001 - demo failures are intentional.
-                await self._record_failure(queue, entry, exc, self._worker_id)
-            else:
-                if entry.payload["should_fail"]:
-                    await self._settle_terminal(
-                        queue,
-                        entry,
-                        self._worker_id,
-                        QueueEntryStatus.FAILED,
-                        error={
-                            "type": "RuntimeError",
-                            "message": "Intentional demo failure",
-                        },
-                    )
-                else:
-                    await self._record_result(queue, entry, result, self._worker_id)
-        finally:
-            self._handler_slots.release()
-
 
 def seed_one_entry_per_tier() -> None:
     """Enqueue one entry per priority tier if the demo queue is empty.
@@ -254,6 +185,8 @@ async def handle_demo_entry(entry: QueueEntry) -> dict[str, str]:
         else QueueEntryStatus.SUCCEEDED
     )
     await asyncio.sleep(max(0, _transition_at(entry, terminal_state) - time.time()))
+    if terminal_state is QueueEntryStatus.FAILED:
+        raise RuntimeError("Intentional demo failure")
     return {"message": entry.payload["message"], "status": "processed"}
 
 
@@ -42,6 +42,7 @@ QUEUES = {
         "LOCATION": os.environ.get("DEMO_REDIS_URL", "redis://127.0.0.1:16389/0"),
         "TIMEOUT": 300,
         "RETENTION_TIMEOUT": 30,
+        "CONCURRENCY": 5,
         "HANDLER": "dashboard.demo_worker.handle_demo_entry",
         "WORKER": "dashboard.demo_worker.DemoPriorityQueueWorker",
     }
@@ -11,8 +11,9 @@ from django.utils.module_loading import import_string
 from .backends import InvalidQueueBackendError
 from .backends.base import AsyncQueue, EventQueue
 from .clock import ClockTime
+from .codecs import EntryCodec
 from .entries import QueueEntry, QueueEntryStatus, validate_budget
-from .event_worker import EventQueueWorker
+from .event_worker import EventQueueWorker, ListenerStats
 from .listeners import queue_listener
 from .observers import QueueSubscription, queue_observer
 from .providers import QueueProvider
@@ -26,6 +27,7 @@ __all__ = (
     "BaseQueueWorker",
     "ClockTime",
     "EventQueueWorker",
+    "ListenerStats",
     "QueueEntry",
     "QueueEntryStatus",
     "QueueProvider",
@@ -45,6 +47,12 @@ __all__ = (
 
 DEFAULT_QUEUE_ALIAS = "default"
 _FORBIDDEN_QUEUE_ALIAS_CHARACTERS = frozenset("*?[]")
+# Where runqueues runs a HANDLER: awaited on the worker's event loop, or, for
+# a synchronous handler, called in a forked handler process.
+HANDLER_EXECUTORS = ("loop", "process")
+# Where the queue runtime runs an event queue's listeners: inline on its shared
+# loop, on a loop thread of the alias's own, or as budgeted pool tasks.
+LISTENER_EXECUTORS = ("loop", "thread", "pool")
 
 
 class QueueRegistry(BaseConnectionHandler):
@@ -91,12 +99,28 @@ class QueueRegistry(BaseConnectionHandler):
             _resolve_extension_class(
                 alias, "ENTRY_CLASS", configured_options.get("ENTRY_CLASS"), QueueEntry
             )
+            if "ENTRY_CODEC" in configured_options:
+                _resolve_extension_class(
+                    alias, "ENTRY_CODEC", configured_options["ENTRY_CODEC"], EntryCodec
+                )
             if "TIMEOUT" in configured_options:
                 _resolve_timeout(alias, configured_options["TIMEOUT"])
             if "RETENTION_TIMEOUT" in configured_options:
                 _resolve_retention_timeout(
                     alias, configured_options["RETENTION_TIMEOUT"]
                 )
+            if "CONCURRENCY" in configured_options:
+                _resolve_concurrency(alias, configured_options["CONCURRENCY"])
+            if "PROCESSES" in configured_options:
+                _resolve_processes(alias, configured_options["PROCESSES"])
+            if "HANDLER_EXECUTOR" in configured_options:
+                _resolve_handler_executor(alias, configured_options["HANDLER_EXECUTOR"])
+            if "LISTENER_EXECUTOR" in configured_options:
+                _resolve_listener_executor(
+                    alias, configured_options["LISTENER_EXECUTOR"]
+                )
+            if "LISTENER_TIMEOUT" in configured_options:
+                _resolve_listener_timeout(alias, configured_options["LISTENER_TIMEOUT"])
             configured_queues[alias] = configured_options
         return configured_queues
 
@@ -112,9 +136,15 @@ class QueueRegistry(BaseConnectionHandler):
         params.pop("WORKER", None)
         params.pop("TIMEOUT", None)
         params.pop("RETENTION_TIMEOUT", None)
+        params.pop("CONCURRENCY", None)
+        params.pop("PROCESSES", None)
+        params.pop("HANDLER_EXECUTOR", None)
+        params.pop("LISTENER_EXECUTOR", None)
+        params.pop("LISTENER_TIMEOUT", None)
         entry_class = _resolve_extension_class(
             alias, "ENTRY_CLASS", params.pop("ENTRY_CLASS", None), QueueEntry
         )
+        entry_codec = params.pop("ENTRY_CODEC", None)
         try:
             backend_cls = import_string(backend)
         except ImportError as e:
@@ -123,6 +153,14 @@ class QueueRegistry(BaseConnectionHandler):
             ) from e
         if getattr(backend_cls, "requires_entry_class_at_construction", False):
             params["entry_class"] = entry_class
+        if entry_codec is not None:
+            if not getattr(backend_cls, "stores_encoded_entries", False):
+                raise InvalidQueueBackendError(
+                    f"Queue alias '{alias}' ENTRY_CODEC is not supported by {backend}"
+                )
+            params["entry_codec"] = _resolve_extension_class(
+                alias, "ENTRY_CODEC", entry_codec, EntryCodec
+            )()
         if getattr(backend_cls, "connection_scope", "thread") == "process":
             with self._process_queues_lock:
                 if (queue := self._process_queues.get(alias)) is None:
@@ -163,6 +201,15 @@ class QueueRegistry(BaseConnectionHandler):
         retention_timeout = _resolve_retention_timeout(
             alias, self.settings[alias].get("RETENTION_TIMEOUT", 600)
         )
+        concurrency = _resolve_concurrency(
+            alias, self.settings[alias].get("CONCURRENCY", 1)
+        )
+        listener_executor = _resolve_listener_executor(
+            alias, self.settings[alias].get("LISTENER_EXECUTOR", "loop")
+        )
+        listener_timeout = _resolve_listener_timeout(
+            alias, self.settings[alias].get("LISTENER_TIMEOUT", 30)
+        )
         if isinstance(queue, EventQueue) and handler is not None:
             raise InvalidQueueBackendError(
                 f"Queue alias '{alias}' event queues use registered listeners and "
@@ -172,6 +219,11 @@ class QueueRegistry(BaseConnectionHandler):
         queue.timeout_seconds = timeout_seconds
         if isinstance(queue, AsyncQueue):
             queue.retention_timeout = retention_timeout
+        if isinstance(queue, AsyncQueue | EventQueue):
+            queue.concurrency = concurrency
+        if isinstance(queue, EventQueue):
+            queue.listener_executor = listener_executor
+            queue.listener_timeout = listener_timeout
         if worker_class is not None:
             queue.worker_class = worker_class
         if isinstance(queue, AsyncQueue | EventQueue):
@@ -248,6 +300,54 @@ def _resolve_retention_timeout(alias: str, value: object) -> float | None:
         ) from exc
 
 
+def _resolve_concurrency(alias: str, value: object) -> int:
+    """Validate how many entries an alias may dispatch at once."""
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise InvalidQueueBackendError(
+            f"Queue alias '{alias}' CONCURRENCY is invalid: must be a positive integer"
+        )
+    return value
+
+
+def _resolve_processes(alias: str, value: object) -> int:
+    """Validate how many worker processes ``runqueues`` starts for an alias."""
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise InvalidQueueBackendError(
+            f"Queue alias '{alias}' PROCESSES is invalid: must be a positive integer"
+        )
+    return value
+
+
+def _resolve_handler_executor(alias: str, value: object) -> str:
+    """Validate where ``runqueues`` runs an alias's handler."""
+    if not isinstance(value, str) or value not in HANDLER_EXECUTORS:
+        raise InvalidQueueBackendError(
+            f"Queue alias '{alias}' HANDLER_EXECUTOR is invalid: must be one of "
+            + ", ".join(repr(executor) for executor in HANDLER_EXECUTORS)
+        )
+    return value
+
+
+def _resolve_listener_executor(alias: str, value: object) -> str:
+    """Validate where the queue runtime runs an event queue's listeners."""
+    if not isinstance(value, str) or value not in LISTENER_EXECUTORS:
+        raise InvalidQueueBackendError(
+            f"Queue alias '{alias}' LISTENER_EXECUTOR is invalid: must be one of "
+            + ", ".join(repr(executor) for executor in LISTENER_EXECUTORS)
+        )
+    return value
+
+
+def _resolve_listener_timeout(alias: str, value: object) -> float:
+    """Validate the budget a pooled listener call runs under, in seconds."""
+    try:
+        return validate_budget(value)
+    except (TypeError, ValueError) as exc:
+        raise InvalidQueueBackendError(
+            f"Queue alias '{alias}' LISTENER_TIMEOUT is invalid: {exc}"
+        ) from exc
+
+
 def _resolve_extension_class(
     alias: str, name: str, value: object, base_class: type
 ) -> type:
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import builtins
 import logging
 import os
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable, Coroutine
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from dataclasses import replace
 from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid7
@@ -14,7 +15,6 @@ from django.utils.module_loading import import_string
 
 from django_queue.backends.exceptions import (
     InvalidQueueBackendError,
-    QueueEntryNotFoundError,
 )
 from django_queue.clock import DEFAULT_CLOCK, ClockTime, QueueClock
 from django_queue.entries import (
@@ -23,7 +23,7 @@ from django_queue.entries import (
     validate_budget,
     validate_json_value,
 )
-from django_queue.signals import send_entry_enqueued
+from django_queue.signals import send_entries_enqueued, send_entry_enqueued
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +45,16 @@ class BaseQueue(ABC):
     # as entry_class and worker_class are. An entry's own budget takes
     # precedence over it, and a worker override over both.
     timeout_seconds: float | None = None
+    # How many entries a built-in backend's `aenqueue_many` stores per call.
+    enqueue_batch_size = 500
+    # How often an idle worker re-polls a backend with no wake-up channel.
+    poll_interval = 0.1
+    # Whether entries live only in this process's memory, so that
+    # `runqueues` cannot spread the queue's work over worker processes.
+    process_local = False
+    # Set from the alias's CONCURRENCY setting: how many of this queue's
+    # entries or events one worker may have in flight at once.
+    concurrency: int = 1
     _queue_name: str = ""
     _clock: QueueClock | None = None
     _provider: Any
@@ -186,6 +196,46 @@ class BaseQueue(ABC):
         """
         raise NotImplementedError("aenqueue")
 
+    def enqueue_many(
+        self,
+        payloads: Iterable,
+        *,
+        timeout_seconds: float | None = None,
+        priority: int = 0,
+        available_at: ClockTime | None = None,
+    ) -> builtins.list[UUID]:
+        return self._run_synchronously(
+            self.aenqueue_many,
+            payloads,
+            timeout_seconds=timeout_seconds,
+            priority=priority,
+            available_at=available_at,
+        )
+
+    async def aenqueue_many(
+        self,
+        payloads: Iterable,
+        *,
+        timeout_seconds: float | None = None,
+        priority: int = 0,
+        available_at: ClockTime | None = None,
+    ) -> builtins.list[UUID]:
+        """Enqueue each payload with the same options; return IDs in order.
+
+        This default enqueues them one at a time. Built-in backends validate
+        and create every entry first, then store them in chunks of
+        `enqueue_batch_size` with one provider call each.
+        """
+        return [
+            await self.aenqueue(
+                payload,
+                timeout_seconds=timeout_seconds,
+                priority=priority,
+                available_at=available_at,
+            )
+            for payload in payloads
+        ]
+
     def find(self, entry_id: UUID) -> QueueEntry:
         return self._run_synchronously(self.afind, entry_id)
 
@@ -213,6 +263,15 @@ class BaseQueue(ABC):
         """Return whether an entry worker can dequeue pending work."""
         raise NotImplementedError("ahas_pending")
 
+    async def _await_pending(self, timeout: float) -> None:
+        """Wait up to *timeout* seconds for pending work to arrive.
+
+        Built-in backends return as soon as work is pushed or falls due. This
+        default has no way to tell, so it sleeps for at most `poll_interval`
+        and leaves the caller to poll again.
+        """
+        await asyncio.sleep(min(timeout, self.poll_interval))
+
     def __len__(self):
         return self.size()
 
@@ -224,6 +283,8 @@ class AsyncQueue(BaseQueue):
     """A queue whose worker persists asynchronous lifecycle outcomes."""
 
     retention_timeout: float | None = 600
+    # How many expired terminal entries one retention cleanup round removes.
+    retention_batch_size = 500
 
     def resolve_worker(self, alias: str) -> type[AsyncQueueWorker]:
         """Import and validate this queue's configured worker class."""
@@ -294,7 +355,6 @@ class AsyncQueue(BaseQueue):
         priority: int = 0,
         available_at: ClockTime | None = None,
     ) -> UUID:
-        validate_json_value(payload)
         if available_at is not None and not isinstance(available_at, ClockTime):
             raise TypeError("available_at must be a ClockTime or None")
         entry = self.entry_class.create(
@@ -312,6 +372,62 @@ class AsyncQueue(BaseQueue):
         send_entry_enqueued(self, entry=entry)
         return entry.id
 
+    async def aenqueue_many(
+        self,
+        payloads: Iterable,
+        *,
+        timeout_seconds: float | None = None,
+        priority: int = 0,
+        available_at: ClockTime | None = None,
+    ) -> builtins.list[UUID]:
+        """Enqueue a batch with one clock read, one store per chunk, and one
+        `entries_enqueued` signal.
+
+        Every payload is validated before anything is stored, so an invalid
+        one stores none of the batch. A failure while storing can leave the
+        chunks already stored in place.
+        """
+        payloads = builtins.list(payloads)
+        if available_at is not None and not isinstance(available_at, ClockTime):
+            raise TypeError("available_at must be a ClockTime or None")
+        queued_at = await self.clock.anow()
+        entries = [
+            self.entry_class.create(
+                queue=self.queue_name,
+                payload=payload,
+                queued_at=queued_at,
+                timeout_seconds=timeout_seconds,
+                priority=priority,
+            )
+            for payload in payloads
+        ]
+        self._configure_provider_entry_class()
+        for start in range(0, len(entries), self.enqueue_batch_size):
+            await self._astore_and_push_many(
+                entries[start : start + self.enqueue_batch_size],
+                available_at=available_at,
+            )
+        if entries:
+            send_entries_enqueued(self, entries=entries)
+        return [entry.id for entry in entries]
+
+    async def _astore_and_push_many(
+        self,
+        entries: builtins.list[QueueEntry],
+        *,
+        available_at: ClockTime | None = None,
+    ) -> None:
+        """Store and push one chunk of a batch enqueue.
+
+        The default stores each in turn; Redis queues override this with one
+        script call per chunk.
+        """
+        for entry in entries:
+            if available_at is None:
+                await self._astore_and_push(entry)
+            else:
+                await self._astore_and_push(entry, available_at=available_at)
+
     async def _astore_and_push(
         self, entry: QueueEntry, *, available_at: ClockTime | None = None
     ) -> None:
@@ -362,10 +478,53 @@ class AsyncQueue(BaseQueue):
         self._configure_provider_entry_class()
         return await self._provider.afind(entry_id)
 
-    async def alist(self) -> builtins.list[QueueEntry]:
-        """Return retained entry snapshots for observation and administration."""
+    async def alist(
+        self,
+        status: QueueEntryStatus | str | Iterable[QueueEntryStatus | str] | None = None,
+        *,
+        after: UUID | None = None,
+        limit: int | None = None,
+        newest_first: bool = False,
+    ) -> builtins.list[QueueEntry]:
+        """Return retained entry snapshots for observation and administration.
+
+        Without arguments, every retained entry, in no particular order.
+        Otherwise entries come back in ID order -- creation order for
+        UUIDv7 -- read from the provider's indexes: only those with
+        ``status`` (one status or several), only those after the ``after``
+        cursor, and at most ``limit`` of them. ``newest_first`` reverses the
+        order, so the cursor then moves back in time. The last entry of one
+        page is the ``after`` cursor for the next.
+        """
         self._configure_provider_entry_class()
-        return await self._provider.alist()
+        if status is None and after is None and limit is None and not newest_first:
+            return await self._provider.alist()
+        if after is not None and not isinstance(after, UUID):
+            raise TypeError("Queue listing cursor must be a UUID")
+        if limit is not None and (type(limit) is not int or limit <= 0):
+            raise ValueError("Queue listing limit must be a positive integer")
+        statuses = None
+        if status is not None:
+            statuses = {
+                QueueEntryStatus(value)
+                for value in (
+                    (status,) if isinstance(status, QueueEntryStatus | str) else status
+                )
+            }
+        return await self._provider.alist_after(
+            after, limit, statuses=statuses, newest_first=newest_first
+        )
+
+    async def _alist_after(
+        self, after: UUID | None, limit: int
+    ) -> builtins.list[QueueEntry]:
+        """Return up to ``limit`` retained entries created after ``after``.
+
+        Entries come back in ID order, which for UUIDv7 is creation order, so
+        the last one returned is the cursor for the next page.
+        """
+        self._configure_provider_entry_class()
+        return await self._provider.alist_after(after, limit)
 
     async def aprune(self, entry_id: UUID) -> None:
         self._configure_provider_entry_class()
@@ -373,24 +532,34 @@ class AsyncQueue(BaseQueue):
         await self.apublish(replace(entry, status=QueueEntryStatus.TERMINATED))
 
     async def _aprune_expired(self) -> int:
+        """Remove terminal entries past retention, a bounded batch at a time.
+
+        The provider finds them through its finished-at index, so the cost
+        follows the number of expired entries rather than those retained.
+        """
         if self.retention_timeout is None:
             return 0
-        now = await self.clock.anow()
-        expired_entry_ids = [
-            entry.id
-            for entry in await self.alist()
-            if QueueEntryStatus.TERMINATED in entry.status.next_state()
-            and entry.finished_at is not None
-            and now - entry.finished_at >= self.retention_timeout
-        ]
+        self._configure_provider_entry_class()
+        finished_before = await self.clock.anow() - self.retention_timeout
         pruned = 0
-        for entry_id in expired_entry_ids:
-            try:
-                await self.aprune(entry_id)
-            except QueueEntryNotFoundError:
-                continue
-            pruned += 1
-        return pruned
+        while True:
+            entries = await self._provider.aprune_expired(
+                finished_before, self.retention_batch_size
+            )
+            await self._apublish_many(
+                [
+                    replace(entry, status=QueueEntryStatus.TERMINATED)
+                    for entry in entries
+                ]
+            )
+            pruned += len(entries)
+            if len(entries) < self.retention_batch_size:
+                return pruned
+
+    async def _apublish_many(self, entries: builtins.list[QueueEntry]) -> None:
+        """Publish several lifecycle snapshots, in order."""
+        for entry in entries:
+            await self.apublish(entry)
 
     async def adequeue(self) -> QueueEntry:
         self._configure_provider_entry_class()
@@ -454,9 +623,18 @@ class AsyncQueue(BaseQueue):
             finished_at=await self.clock.anow(),
         )
 
-    def list(self) -> builtins.list[QueueEntry]:
-        """Synchronously return retained entry snapshots."""
-        return self._run_synchronously(self.alist)
+    def list(
+        self,
+        status: QueueEntryStatus | str | Iterable[QueueEntryStatus | str] | None = None,
+        *,
+        after: UUID | None = None,
+        limit: int | None = None,
+        newest_first: bool = False,
+    ) -> builtins.list[QueueEntry]:
+        """Synchronously return retained entry snapshots; see `alist`."""
+        return self._run_synchronously(
+            self.alist, status, after=after, limit=limit, newest_first=newest_first
+        )
 
     def prune(self, entry_id: UUID) -> None:
         """Remove one retained terminal entry and publish its final snapshot."""
@@ -496,6 +674,11 @@ class EventQueue(BaseQueue):
     """A queue whose listeners consume transient events."""
 
     default_lifetime_seconds = 60
+    # Set from the alias's LISTENER_EXECUTOR and LISTENER_TIMEOUT settings:
+    # where the queue runtime runs this queue's listeners, and the budget each
+    # listener call has when they run as pool tasks.
+    listener_executor = "loop"
+    listener_timeout: float = 30.0
     worker_class: type[EventQueueWorker] | str = (
         "django_queue.event_worker.EventQueueWorker"
     )
@@ -528,7 +711,6 @@ class EventQueue(BaseQueue):
     ) -> UUID:
         """`priority` and `available_at` are accepted for signature compatibility
         with `AsyncQueue` and ignored -- events always dispatch in arrival order."""
-        validate_json_value(payload)
         lifetime = validate_budget(self._resolve_lifetime(timeout_seconds))
         entry = self.entry_class.create(
             queue=self.queue_name,
@@ -540,6 +722,42 @@ class EventQueue(BaseQueue):
         await self._astore_and_push(entry)
         return entry.id
 
+    async def aenqueue_many(
+        self,
+        payloads: Iterable,
+        *,
+        timeout_seconds: float | None = None,
+        priority: int = 0,
+        available_at: ClockTime | None = None,
+    ) -> builtins.list[UUID]:
+        """Enqueue a batch of events sharing one lifetime and enqueue time.
+
+        `priority` and `available_at` are ignored, as for `aenqueue`.
+        """
+        payloads = builtins.list(payloads)
+        lifetime = validate_budget(self._resolve_lifetime(timeout_seconds))
+        queued_at = await self.clock.anow()
+        entries = [
+            self.entry_class.create(
+                queue=self.queue_name,
+                payload=payload,
+                queued_at=queued_at,
+                timeout_seconds=lifetime,
+            )
+            for payload in payloads
+        ]
+        self._configure_provider_entry_class()
+        for start in range(0, len(entries), self.enqueue_batch_size):
+            await self._astore_and_push_many(
+                entries[start : start + self.enqueue_batch_size]
+            )
+        return [entry.id for entry in entries]
+
+    async def _astore_and_push_many(self, entries: builtins.list[QueueEntry]) -> None:
+        """Store and push one chunk of events; see `AsyncQueue`'s counterpart."""
+        for entry in entries:
+            await self._astore_and_push(entry)
+
     async def _astore_and_push(self, entry: QueueEntry) -> None:
         """Store a freshly enqueued event and add it to the pending store.
 
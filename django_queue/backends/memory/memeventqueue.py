@@ -8,6 +8,7 @@ class MemoryEventQueue(EventQueue):
     """Process-local transient event delivery with lease ownership."""
 
     connection_scope = "process"
+    process_local = True
     worker_provider_kind = "memory"
     worker_provider_type = "memory"
     worker_class = "django_queue.backends.memory.MemoryEventQueueWorker"
@@ -22,3 +23,6 @@ class MemoryEventQueue(EventQueue):
         self._queue_name = options.pop("queue_name", "default")
         self._clock: QueueClock = options.pop("clock", DEFAULT_CLOCK)
         self._provider = QueueProviderMemory(clock=self._clock, maxsize=maxsize)
+
+    async def _await_pending(self, timeout: float) -> None:
+        await self._provider.await_pending(timeout)
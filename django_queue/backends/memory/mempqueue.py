@@ -6,6 +6,7 @@ from .provider import QueueProviderMemory
 
 
 class MemoryAsyncPriorityQueue(AsyncQueue):
+    process_local = True
     worker_class = "django_queue.backends.memory.MemoryAsyncQueueWorker"
 
     def __init__(self, _: str | None = None, options: dict | None = None, **kwargs):
@@ -59,6 +60,7 @@ class MemoryAsyncPriorityQueue(AsyncQueue):
     apublish = MemoryAsyncQueue.apublish
     adequeue = MemoryAsyncQueue.adequeue
     ahas_pending = MemoryAsyncQueue.ahas_pending
+    _await_pending = MemoryAsyncQueue._await_pending
     _amark_running = MemoryAsyncQueue._amark_running
     _amark_succeeded = MemoryAsyncQueue._amark_succeeded
     _amark_failed = MemoryAsyncQueue._amark_failed
@@ -7,6 +7,7 @@ from .provider import QueueProviderMemory
 
 
 class MemoryAsyncQueue(AsyncQueue):
+    process_local = True
     worker_class = "django_queue.backends.memory.MemoryAsyncQueueWorker"
 
     def __init__(self, _: str | None = None, options: dict | None = None, **kwargs):
@@ -29,6 +30,9 @@ class MemoryAsyncQueue(AsyncQueue):
     async def _apromote_scheduled(self) -> None:
         await self._provider.apromote_scheduled()
 
+    async def _await_pending(self, timeout: float) -> None:
+        await self._provider.await_pending(timeout)
+
 
 class MemoryAsyncStack(MemoryAsyncQueue):
     def __init__(self, _: str | None = None, options: dict | None = None, **kwargs):
@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import contextlib
 import heapq
+import itertools
 import queue
+import weakref
+from collections import OrderedDict
+from collections.abc import Collection
 from threading import RLock
 from uuid import UUID
 
@@ -19,6 +25,178 @@ from django_queue.clock import DEFAULT_CLOCK, ClockTime, QueueClock
 from django_queue.entries import QueueEntry, QueueEntryStatus, validate_budget
 
 
+class _DeadlineIndex(dict[UUID, ClockTime]):
+    """Entry deadlines, with a heap giving the earliest in O(log n).
+
+    The mapping stays authoritative. Replacing or removing a deadline leaves
+    its old heap item behind; such items are discarded when they reach the
+    top, and the heap is rebuilt once they outnumber the live deadlines. Ties
+    come out in the order their deadlines were set.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._heap: list[tuple[ClockTime, int, UUID]] = []
+        self._sequence = 0
+
+    def __setitem__(self, entry_id: UUID, deadline: ClockTime) -> None:
+        super().__setitem__(entry_id, deadline)
+        self._sequence += 1
+        heapq.heappush(self._heap, (deadline, self._sequence, entry_id))
+        if len(self._heap) > 2 * len(self) + 64:
+            self._heap = [item for item in self._heap if self.get(item[2]) == item[0]]
+            heapq.heapify(self._heap)
+
+    def earliest(self) -> ClockTime | None:
+        """Return the earliest deadline, or ``None`` if there are none."""
+        heap = self._heap
+        while heap and self.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def pop_earliest(self) -> list[UUID]:
+        """Remove and return every entry sharing the earliest deadline."""
+        if (deadline := self.earliest()) is None:
+            return []
+        entry_ids = []
+        while self._heap and self._heap[0][0] == deadline:
+            _, _, entry_id = heapq.heappop(self._heap)
+            if self.get(entry_id) == deadline:
+                del self[entry_id]
+                entry_ids.append(entry_id)
+        return entry_ids
+
+
+class _PendingIds:
+    """Pending entry IDs in delivery order, removable by ID in O(1).
+
+    Each push takes its own slot, so an ID pushed twice is pending twice. A
+    FIFO store delivers its oldest slot first and a LIFO store its newest;
+    `push_back` files a slot where it will be delivered last.
+    """
+
+    def __init__(self, *, lifo: bool = False) -> None:
+        self._lifo = lifo
+        self._slots: OrderedDict[int, UUID] = OrderedDict()
+        self._slots_by_id: dict[UUID, dict[int, None]] = {}
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def push(self, entry_id: UUID) -> None:
+        self._sequence += 1
+        self._slots[self._sequence] = entry_id
+        self._slots_by_id.setdefault(entry_id, {})[self._sequence] = None
+
+    def push_back(self, entry_id: UUID) -> None:
+        self.push(entry_id)
+        if self._lifo:
+            self._slots.move_to_end(self._sequence, last=False)
+
+    def pop(self) -> UUID:
+        """Remove and return the next ID to deliver."""
+        if not self._slots:
+            raise QueueEmptyException
+        slot, entry_id = self._slots.popitem(last=self._lifo)
+        self._forget(entry_id, slot)
+        return entry_id
+
+    def remove(self, entry_id: UUID) -> None:
+        """Remove the earliest-pushed slot holding *entry_id*, if any."""
+        if (slots := self._slots_by_id.get(entry_id)) is None:
+            return
+        slot = next(iter(slots))
+        del self._slots[slot]
+        self._forget(entry_id, slot)
+
+    def _forget(self, entry_id: UUID, slot: int) -> None:
+        slots = self._slots_by_id[entry_id]
+        del slots[slot]
+        if not slots:
+            del self._slots_by_id[entry_id]
+
+
+class _PendingPriorityIds:
+    """Pending entry IDs by priority, then arrival, with tombstoned removal.
+
+    Heap items are ``(-priority, sequence, entry_id)``: a monotonic sequence
+    breaks every tie before the entry ID is compared, giving arrival order
+    within a priority. Removing an ID tombstones its sequences; tombstoned
+    items are dropped as they reach the top, or all at once when they come
+    to outnumber the live ones.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[int, int, UUID]] = []
+        self._sequences_by_id: dict[UUID, set[int]] = {}
+        self._tombstones: set[int] = set()
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._heap) - len(self._tombstones)
+
+    def push(self, entry_id: UUID, priority: int) -> None:
+        self._sequence += 1
+        self.restore((-int(priority), self._sequence, entry_id))
+
+    def restore(self, item: tuple[int, int, UUID]) -> None:
+        """Put back an item `pop` returned, at its original position."""
+        heapq.heappush(self._heap, item)
+        self._sequences_by_id.setdefault(item[2], set()).add(item[1])
+
+    def pop(self) -> tuple[int, int, UUID]:
+        """Remove and return the highest-priority, earliest-pushed item."""
+        while self._heap:
+            item = heapq.heappop(self._heap)
+            if item[1] in self._tombstones:
+                self._tombstones.discard(item[1])
+                continue
+            sequences = self._sequences_by_id[item[2]]
+            sequences.discard(item[1])
+            if not sequences:
+                del self._sequences_by_id[item[2]]
+            return item
+        raise QueueEmptyException
+
+    def remove(self, entry_id: UUID) -> None:
+        """Remove every pending item for *entry_id*."""
+        self._tombstones |= self._sequences_by_id.pop(entry_id, set())
+        if len(self._tombstones) > len(self._heap) // 2:
+            self._heap = [
+                item for item in self._heap if item[1] not in self._tombstones
+            ]
+            heapq.heapify(self._heap)
+            self._tombstones.clear()
+
+
+def _insert_id(entry_ids: list[UUID], entry_id: UUID) -> None:
+    # UUIDv7 IDs minted in this process arrive in order; append is the
+    # common case and insort only covers an ID created elsewhere.
+    if not entry_ids or entry_ids[-1] < entry_id:
+        entry_ids.append(entry_id)
+    else:
+        bisect.insort(entry_ids, entry_id)
+
+
+def _remove_id(entry_ids: list[UUID], entry_id: UUID) -> None:
+    index = bisect.bisect_left(entry_ids, entry_id)
+    if index < len(entry_ids) and entry_ids[index] == entry_id:
+        del entry_ids[index]
+
+
+def _page(
+    entry_ids: list[UUID], after: UUID | None, limit: int | None, newest_first: bool
+) -> list[UUID]:
+    """Return up to *limit* of the sorted *entry_ids* past *after*."""
+    if newest_first:
+        stop = len(entry_ids) if after is None else bisect.bisect_left(entry_ids, after)
+        start = 0 if limit is None else max(stop - limit, 0)
+        return entry_ids[start:stop][::-1]
+    start = 0 if after is None else bisect.bisect_right(entry_ids, after)
+    return entry_ids[start : None if limit is None else start + limit]
+
+
 class QueueProviderMemory:
     """Process-local entry storage, claims, and delayed availability."""
 
@@ -29,7 +207,6 @@ class QueueProviderMemory:
         stack: bool = False,
         maxsize: int = 0,
         entries: dict[UUID, QueueEntry] | None = None,
-        pending: queue.Queue[UUID] | None = None,
     ) -> None:
         self._clock = clock or DEFAULT_CLOCK
         self._lock = RLock()
@@ -38,15 +215,33 @@ class QueueProviderMemory:
         self._items = (queue.LifoQueue if stack else queue.Queue)(maxsize=maxsize)
         self._priority_items: queue.PriorityQueue = queue.PriorityQueue(maxsize=maxsize)
         self._entries = {} if entries is None else entries
-        self._pending = pending or (queue.LifoQueue() if stack else queue.Queue())
-        self._pending_priority: queue.PriorityQueue = queue.PriorityQueue()
-        self._pending_priority_sequence = 0
+        # Every stored entry ID in UUIDv7 order, so a reader can resume from
+        # the last ID it saw instead of walking the whole retained history.
+        self._entry_ids: list[UUID] = sorted(self._entries)
+        # The same, per status, so a filtered listing reads only its statuses.
+        self._entry_ids_by_status: dict[QueueEntryStatus, list[UUID]] = {}
+        for entry_id in self._entry_ids:
+            self._entry_ids_by_status.setdefault(
+                self._entries[entry_id].status, []
+            ).append(entry_id)
+        # (finished_at, entry ID) for terminal entries, earliest first. An
+        # item can go stale when its entry is removed another way; pruning
+        # checks each against the stored entry before acting on it.
+        self._finished: list[tuple[ClockTime, UUID]] = []
+        self._pending = _PendingIds(lifo=stack)
+        self._pending_priority = _PendingPriorityIds()
         self._claims: dict[UUID, UUID] = {}
-        self._claim_deadlines: dict[UUID, ClockTime] = {}
-        self._available_at: dict[UUID, ClockTime] = {}
-        self._scheduled: dict[UUID, ClockTime] = {}
-        self._unclaimed_deadlines: dict[UUID, ClockTime] = {}
+        self._claim_deadlines = _DeadlineIndex()
+        self._available_at = _DeadlineIndex()
+        self._scheduled = _DeadlineIndex()
+        self._unclaimed_deadlines = _DeadlineIndex()
         self._unclaimed_remaining: dict[UUID, float] = {}
+        # One wake-up per event loop with an idle worker waiting on this
+        # provider. Set from whichever thread makes work claimable, so a sync
+        # enqueue on its own bridge loop still wakes an async worker.
+        self._wakeups: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Event
+        ] = weakref.WeakKeyDictionary()
 
     @property
     def clock(self) -> QueueClock:
@@ -138,12 +333,21 @@ class QueueProviderMemory:
 
     async def astore(self, entry: QueueEntry) -> None:
         with self._lock:
+            previous = self._entries.get(entry.id)
+            self._index_entry(entry)
             self._entries[entry.id] = entry
+            if (
+                entry.finished_at is not None
+                and QueueEntryStatus.TERMINATED in entry.status.next_state()
+                and (previous is None or previous.finished_at != entry.finished_at)
+            ):
+                heapq.heappush(self._finished, (entry.finished_at, entry.id))
 
     async def astore_event(self, entry: QueueEntry) -> None:
         if entry.timeout_seconds is None:
             raise ValueError("Event entries require a resolved lifetime")
         with self._lock:
+            self._index_entry(entry)
             self._entries[entry.id] = entry
             self._unclaimed_deadlines[entry.id] = (
                 entry.queued_at + entry.timeout_seconds
@@ -169,7 +373,7 @@ class QueueProviderMemory:
         # present in the priority store after its durable record is
         # already gone.
         with self._lock:
-            self._entries.pop(entry_id, None)
+            self._pop_entry(entry_id)
             self._claims.pop(entry_id, None)
             self._claim_deadlines.pop(entry_id, None)
             self._available_at.pop(entry_id, None)
@@ -186,6 +390,34 @@ class QueueProviderMemory:
         await self.adelete(entry_id)
         return entry
 
+    async def aprune_expired(
+        self, finished_before: ClockTime, limit: int
+    ) -> list[QueueEntry]:
+        """Remove up to ``limit`` terminal entries finished by ``finished_before``."""
+        pruned = []
+        with self._lock:
+            while (
+                self._finished
+                and len(pruned) < limit
+                and self._finished[0][0] <= finished_before
+            ):
+                finished_at, entry_id = heapq.heappop(self._finished)
+                entry = self._entries.get(entry_id)
+                if (
+                    entry is None
+                    or entry.finished_at != finished_at
+                    or QueueEntryStatus.TERMINATED not in entry.status.next_state()
+                ):
+                    continue
+                self._pop_entry(entry_id)
+                self._claims.pop(entry_id, None)
+                self._claim_deadlines.pop(entry_id, None)
+                self._available_at.pop(entry_id, None)
+                self._scheduled.pop(entry_id, None)
+                self._remove_pending(entry_id)
+                pruned.append(entry)
+        return pruned
+
     async def aexpire(self, entry_id: UUID) -> bool:
         """Delete an event only when no worker currently owns its claim."""
         with self._lock:
@@ -193,7 +425,7 @@ class QueueProviderMemory:
                 return False
             if entry_id not in self._entries:
                 return False
-            self._entries.pop(entry_id)
+            self._pop_entry(entry_id)
             self._available_at.pop(entry_id, None)
             self._scheduled.pop(entry_id, None)
             self._unclaimed_deadlines.pop(entry_id, None)
@@ -205,56 +437,97 @@ class QueueProviderMemory:
         with self._lock:
             return list(self._entries.values())
 
+    async def alist_after(
+        self,
+        after: UUID | None,
+        limit: int | None,
+        *,
+        statuses: Collection[QueueEntryStatus] | None = None,
+        newest_first: bool = False,
+    ) -> list[QueueEntry]:
+        """Return up to ``limit`` entries past ``after``, in ID order.
+
+        With ``statuses``, only entries in one of them; with ``newest_first``,
+        entries with IDs below ``after``, highest first.
+        """
+        with self._lock:
+            if statuses is None:
+                indexes = [self._entry_ids]
+            else:
+                indexes = [
+                    self._entry_ids_by_status.get(status, []) for status in statuses
+                ]
+            pages = [_page(ids, after, limit, newest_first) for ids in indexes]
+            entry_ids = (
+                pages[0]
+                if len(pages) == 1
+                else itertools.islice(heapq.merge(*pages, reverse=newest_first), limit)
+            )
+            return [self._entries[entry_id] for entry_id in entry_ids]
+
+    async def await_pending(self, timeout: float) -> None:
+        """Wait until work is pushed, delayed work falls due, or *timeout*
+        seconds elapse -- whichever comes first."""
+        loop = asyncio.get_running_loop()
+        now = await self.clock.anow()
+        with self._lock:
+            wakeup = self._wakeups.get(loop)
+            if wakeup is None:
+                wakeup = self._wakeups[loop] = asyncio.Event()
+            # A deadline already past belongs to work the caller's claim just
+            # passed over, so it bounds nothing.
+            for due in (self._scheduled.earliest(), self._available_at.earliest()):
+                if due is not None and due > now:
+                    timeout = min(timeout, due - now)
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(wakeup.wait(), timeout)
+        wakeup.clear()
+
+    def _wake(self) -> None:
+        """Wake every loop waiting in `await_pending`; call with the lock held."""
+        for loop, wakeup in list(self._wakeups.items()):
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                del self._wakeups[loop]
+
     async def apush(self, entry_id: UUID) -> None:
         with self._lock:
-            self._pending.put_nowait(entry_id)
+            self._pending.push(entry_id)
+            self._wake()
 
     async def aschedule(self, entry_id: UUID, available_at: ClockTime) -> None:
         with self._lock:
             self._scheduled[entry_id] = available_at
+            self._wake()
 
     async def apromote_scheduled(self) -> None:
         now = await self.clock.anow()
         with self._lock:
             entry_id = self._pop_next_due_scheduled(now)
             if entry_id is not None:
-                self._pending.put_nowait(entry_id)
+                self._pending.push(entry_id)
 
     async def apromote_scheduled_priority(self) -> None:
         now = await self.clock.anow()
         with self._lock:
             entry_id = self._pop_next_due_scheduled(now, priority=True)
             if entry_id is not None:
-                entry = self._entries[entry_id]
-                self._pending_priority_sequence += 1
-                self._pending_priority.put_nowait(
-                    (-int(entry.priority), self._pending_priority_sequence, entry_id)
-                )
+                self._pending_priority.push(entry_id, self._entries[entry_id].priority)
 
     def _pop_next_due_scheduled(
         self, now: ClockTime, *, priority: bool = False
     ) -> UUID | None:
         """Remove one valid entry from the earliest due availability group."""
-        while due_entries := [
-            (entry_id, available_at)
-            for entry_id, available_at in self._scheduled.items()
-            if available_at <= now
-        ]:
-            earliest_available_at = min(available_at for _, available_at in due_entries)
-            candidates = [
-                entry_id
-                for entry_id, available_at in due_entries
-                if available_at == earliest_available_at
-            ]
+        while (
+            earliest_available_at := self._scheduled.earliest()
+        ) is not None and earliest_available_at <= now:
             queued_candidates = [
                 entry_id
-                for entry_id in candidates
+                for entry_id in self._scheduled.pop_earliest()
                 if (entry := self._entries.get(entry_id)) is not None
                 and entry.status is QueueEntryStatus.QUEUED
             ]
-            for entry_id in candidates:
-                if entry_id not in queued_candidates:
-                    self._scheduled.pop(entry_id, None)
             if not queued_candidates:
                 continue
             if priority:
@@ -264,17 +537,17 @@ class QueueProviderMemory:
                 )
             else:
                 entry_id = queued_candidates[0]
-            self._scheduled.pop(entry_id)
+            for candidate in queued_candidates:
+                if candidate != entry_id:
+                    self._scheduled[candidate] = earliest_available_at
             return entry_id
         return None
 
     async def apop(self) -> QueueEntry:
         with self._lock:
+            entry_id = self._pending.pop()
             try:
-                entry_id = self._pending.get_nowait()
                 return self._entries[entry_id]
-            except queue.Empty as exc:
-                raise QueueEmptyException from exc
             except KeyError as exc:
                 raise QueueEntryNotFoundError(entry_id) from exc
 
@@ -296,33 +569,26 @@ class QueueProviderMemory:
         # ever reached, giving arrival order deterministically. Matches the
         # Redis backend's own sequence counter (apush_priority there).
         with self._lock:
-            self._pending_priority_sequence += 1
-            self._pending_priority.put_nowait(
-                (-int(priority), self._pending_priority_sequence, entry_id)
-            )
+            self._pending_priority.push(entry_id, priority)
+            self._wake()
 
     async def apop_priority(self) -> QueueEntry:
         with self._lock:
+            _, _, entry_id = self._pending_priority.pop()
             try:
-                _, _, entry_id = self._pending_priority.get_nowait()
                 return self._entries[entry_id]
-            except queue.Empty as exc:
-                raise QueueEmptyException from exc
             except KeyError as exc:
                 raise QueueEntryNotFoundError(entry_id) from exc
 
     async def adiscard_priority(self, entry_id: UUID) -> None:
-        with self._lock, self._pending_priority.mutex:
-            self._pending_priority.queue = [
-                item for item in self._pending_priority.queue if item[2] != entry_id
-            ]
-            heapq.heapify(self._pending_priority.queue)
+        with self._lock:
+            self._pending_priority.remove(entry_id)
 
     async def ahas_pending(self) -> bool:
         with self._lock:
             return (
-                not self._pending.empty()
-                or not self._pending_priority.empty()
+                bool(self._pending)
+                or bool(self._pending_priority)
                 or bool(self._scheduled)
             )
 
@@ -341,11 +607,10 @@ class QueueProviderMemory:
         now = await self.clock.anow()
         with self._lock:
             self._recover_expired_claims(now)
-            for _ in range(self._pending.qsize()):
-                try:
-                    entry_id = self._pending.get_nowait()
-                except queue.Empty:
+            for _ in range(len(self._pending)):
+                if not self._pending:
                     break
+                entry_id = self._pending.pop()
                 available_at = self._available_at.get(entry_id)
                 if available_at is not None and available_at > now:
                     self._requeue_skipped_pending(entry_id)
@@ -375,49 +640,154 @@ class QueueProviderMemory:
         now = await self.clock.anow()
         if lease_seconds is not None:
             validate_budget(lease_seconds)
-        await self.apromote_scheduled()
         with self._lock:
             self._recover_expired_claims(now)
-            for _ in range(self._pending.qsize()):
+            return self._claim_next(
+                worker_id, lease_seconds, now, expire_unclaimed=expire_unclaimed
+            )
+
+    async def aclaim_many(
+        self, worker_id: UUID, lease_seconds: float | None, limit: int
+    ) -> list[QueueEntry]:
+        """Claim up to ``limit`` entries, in delivery order, under one lock.
+
+        Returns fewer, possibly none, once pending work runs out or the next
+        entry is already claimed. Entries that expired unclaimed or whose
+        record is gone are skipped, as they would be one claim at a time.
+        """
+        return await self._aclaim_many(
+            worker_id, lease_seconds, limit, expire_unclaimed=False, priority=False
+        )
+
+    async def aclaim_many_unexpired(
+        self, worker_id: UUID, lease_seconds: float | None, limit: int
+    ) -> list[QueueEntry]:
+        return await self._aclaim_many(
+            worker_id, lease_seconds, limit, expire_unclaimed=True, priority=False
+        )
+
+    async def aclaim_many_priority(
+        self, worker_id: UUID, lease_seconds: float | None, limit: int
+    ) -> list[QueueEntry]:
+        """Like `aclaim_many`, falling back to the priority store.
+
+        Matches the Redis priority claim: the plain pending store, where
+        recovered claims return, is drained first, then entries leave the
+        priority store highest priority first, in arrival order within one.
+        """
+        return await self._aclaim_many(
+            worker_id, lease_seconds, limit, expire_unclaimed=False, priority=True
+        )
+
+    async def _aclaim_many(
+        self,
+        worker_id: UUID,
+        lease_seconds: float | None,
+        limit: int,
+        *,
+        expire_unclaimed: bool,
+        priority: bool,
+    ) -> list[QueueEntry]:
+        if type(limit) is not int or limit <= 0:
+            raise ValueError("Claim batch size must be a positive integer")
+        now = await self.clock.anow()
+        if lease_seconds is not None:
+            validate_budget(lease_seconds)
+        claimed = []
+        with self._lock:
+            self._recover_expired_claims(now)
+            while len(claimed) < limit:
                 try:
-                    entry_id = self._pending.get_nowait()
-                except queue.Empty:
-                    break
-                available_at = self._available_at.get(entry_id)
-                if available_at is not None and available_at > now:
-                    self._requeue_skipped_pending(entry_id)
+                    claimed.append(
+                        self._claim_next(
+                            worker_id,
+                            lease_seconds,
+                            now,
+                            expire_unclaimed=expire_unclaimed,
+                            priority=priority,
+                        )
+                    )
+                except QueueEntryExpiredError, QueueEntryNotFoundError:
                     continue
-                if entry_id in self._claims:
-                    # A duplicate pending ID must not steal an active claim.
-                    # Preserve it for the owner to settle or for lease recovery.
-                    self._requeue_skipped_pending(entry_id)
-                    raise QueueClaimConflictError(entry_id)
-                try:
-                    entry = self._entries[entry_id]
-                except KeyError as exc:
-                    raise QueueEntryNotFoundError(entry_id) from exc
-                if (
-                    expire_unclaimed
-                    and (deadline := self._unclaimed_deadlines.get(entry_id))
-                    is not None
-                    and deadline <= now
-                ):
-                    self._entries.pop(entry_id)
-                    self._available_at.pop(entry_id, None)
-                    self._unclaimed_deadlines.pop(entry_id, None)
-                    raise QueueEntryExpiredError(entry_id)
-                if expire_unclaimed:
-                    deadline = self._unclaimed_deadlines.pop(entry_id, None)
-                    if deadline is None:
-                        raise QueueEntryExpiredError(entry_id)
-                    self._unclaimed_remaining[entry_id] = deadline - now
+                except QueueEmptyException, QueueClaimConflictError:
+                    break
+        return claimed
+
+    def _claim_next(
+        self,
+        worker_id: UUID,
+        lease_seconds: float | None,
+        now: ClockTime,
+        *,
+        expire_unclaimed: bool,
+        priority: bool = False,
+    ) -> QueueEntry:
+        """Claim one entry; the caller holds the lock."""
+        if (
+            entry_id := self._pop_next_due_scheduled(now, priority=priority)
+        ) is not None:
+            if priority:
+                self._pending_priority.push(entry_id, self._entries[entry_id].priority)
+            else:
+                self._pending.push(entry_id)
+        for _ in range(len(self._pending)):
+            if not self._pending:
+                break
+            entry_id = self._pending.pop()
+            available_at = self._available_at.get(entry_id)
+            if available_at is not None and available_at > now:
+                self._requeue_skipped_pending(entry_id)
+                continue
+            if entry_id in self._claims:
+                # A duplicate pending ID must not steal an active claim.
+                # Preserve it for the owner to settle or for lease recovery.
+                self._requeue_skipped_pending(entry_id)
+                raise QueueClaimConflictError(entry_id)
+            try:
+                entry = self._entries[entry_id]
+            except KeyError as exc:
+                raise QueueEntryNotFoundError(entry_id) from exc
+            if (
+                expire_unclaimed
+                and (deadline := self._unclaimed_deadlines.get(entry_id)) is not None
+                and deadline <= now
+            ):
+                self._pop_entry(entry_id)
                 self._available_at.pop(entry_id, None)
-                self._claims[entry_id] = worker_id
-                if lease_seconds is not None:
-                    self._claim_deadlines[entry_id] = now + lease_seconds
-                return entry
+                self._unclaimed_deadlines.pop(entry_id, None)
+                raise QueueEntryExpiredError(entry_id)
+            if expire_unclaimed:
+                deadline = self._unclaimed_deadlines.pop(entry_id, None)
+                if deadline is None:
+                    raise QueueEntryExpiredError(entry_id)
+                self._unclaimed_remaining[entry_id] = deadline - now
+            self._available_at.pop(entry_id, None)
+            return self._hold_claim(entry, worker_id, lease_seconds, now)
+        if priority and self._pending_priority:
+            item = self._pending_priority.pop()
+            entry_id = item[2]
+            if entry_id in self._claims:
+                self._pending_priority.restore(item)
+                raise QueueClaimConflictError(entry_id)
+            try:
+                entry = self._entries[entry_id]
+            except KeyError as exc:
+                raise QueueEntryNotFoundError(entry_id) from exc
+            return self._hold_claim(entry, worker_id, lease_seconds, now)
         raise QueueEmptyException
 
+    def _hold_claim(
+        self,
+        entry: QueueEntry,
+        worker_id: UUID,
+        lease_seconds: float | None,
+        now: ClockTime,
+    ) -> QueueEntry:
+        self._claims[entry.id] = worker_id
+        if lease_seconds is not None:
+            self._claim_deadlines[entry.id] = now + lease_seconds
+        return entry
+
     async def arenew(
         self, entry_id: UUID, worker_id: UUID, lease_seconds: float
     ) -> bool:
@@ -444,14 +814,15 @@ class QueueProviderMemory:
             if (remaining := self._unclaimed_remaining.pop(entry_id, None)) is not None:
                 self._unclaimed_deadlines[entry_id] = released_at + remaining
             self._available_at[entry_id] = available_at
-            self._pending.put_nowait(entry_id)
+            self._pending.push(entry_id)
+            self._wake()
             return True
 
     async def aremove(self, entry_id: UUID, worker_id: UUID) -> bool:
         with self._lock:
             if self._claims.get(entry_id) != worker_id:
                 return False
-            self._entries.pop(entry_id, None)
+            self._pop_entry(entry_id)
             self._claims.pop(entry_id, None)
             self._claim_deadlines.pop(entry_id, None)
             self._available_at.pop(entry_id, None)
@@ -466,50 +837,64 @@ class QueueProviderMemory:
     async def aexpire_due(self) -> list[UUID]:
         now = await self.clock.anow()
         with self._lock:
-            expired_ids = [
-                entry_id
-                for entry_id, deadline in self._unclaimed_deadlines.items()
-                if deadline <= now and entry_id not in self._claims
-            ]
+            expired_ids = []
+            claimed = []
+            while (
+                deadline := self._unclaimed_deadlines.earliest()
+            ) is not None and deadline <= now:
+                for entry_id in self._unclaimed_deadlines.pop_earliest():
+                    if entry_id in self._claims:
+                        claimed.append((entry_id, deadline))
+                    else:
+                        expired_ids.append(entry_id)
+            # A claimed event is its owner's to settle; keep its deadline.
+            for entry_id, deadline in claimed:
+                self._unclaimed_deadlines[entry_id] = deadline
             for entry_id in expired_ids:
                 self._delete_event(entry_id)
             return expired_ids
 
     def _remove_pending(self, entry_id: UUID) -> None:
-        with self._pending.mutex:
-            try:
-                self._pending.queue.remove(entry_id)
-            except ValueError:
-                pass
+        self._pending.remove(entry_id)
 
     def _requeue_skipped_pending(self, entry_id: UUID) -> None:
         """Preserve skipped LIFO IDs without placing them back on top."""
-        if not self._stack:
-            self._pending.put_nowait(entry_id)
-            return
-        with self._pending.mutex:
-            self._pending.queue.appendleft(entry_id)
-            self._pending.not_empty.notify()
+        self._pending.push_back(entry_id)
 
     def _recover_expired_claims(self, now: ClockTime) -> None:
         """Return uncompleted local claims to pending delivery after their lease."""
-        expired_ids = [
-            entry_id
-            for entry_id, deadline in self._claim_deadlines.items()
-            if deadline <= now
-        ]
+        expired_ids = []
+        while (
+            deadline := self._claim_deadlines.earliest()
+        ) is not None and deadline <= now:
+            expired_ids += self._claim_deadlines.pop_earliest()
         for entry_id in expired_ids:
             self._claims.pop(entry_id, None)
-            self._claim_deadlines.pop(entry_id, None)
             if entry_id in self._entries:
                 if (
                     remaining := self._unclaimed_remaining.pop(entry_id, None)
                 ) is not None:
                     self._unclaimed_deadlines[entry_id] = now + remaining
-                self._pending.put_nowait(entry_id)
+                self._pending.push(entry_id)
+
+    def _index_entry(self, entry: QueueEntry) -> None:
+        previous = self._entries.get(entry.id)
+        if previous is None:
+            _insert_id(self._entry_ids, entry.id)
+        elif previous.status is entry.status:
+            return
+        else:
+            _remove_id(self._entry_ids_by_status[previous.status], entry.id)
+        _insert_id(self._entry_ids_by_status.setdefault(entry.status, []), entry.id)
+
+    def _pop_entry(self, entry_id: UUID) -> None:
+        if (entry := self._entries.pop(entry_id, None)) is None:
+            return
+        _remove_id(self._entry_ids, entry_id)
+        _remove_id(self._entry_ids_by_status[entry.status], entry_id)
 
     def _delete_event(self, entry_id: UUID) -> None:
-        self._entries.pop(entry_id, None)
+        self._pop_entry(entry_id)
         self._available_at.pop(entry_id, None)
         self._unclaimed_deadlines.pop(entry_id, None)
         self._unclaimed_remaining.pop(entry_id, None)
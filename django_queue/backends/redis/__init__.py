@@ -10,7 +10,13 @@ from .redispqueue import RedisAsyncPriorityQueue
 from .redispqueuejson import RedisAsyncPriorityQueueJson
 from .redisqueue import RedisAsyncQueue, RedisAsyncStack
 from .redisqueuejson import RedisAsyncQueueJson, RedisAsyncStackJson
-from .worker import RedisAsyncQueueWorker, RedisEventQueueWorker
+from .redisshardedqueue import RedisShardedAsyncQueue, RedisShardedAsyncStack
+from .redisstreameventqueue import RedisStreamEventQueue
+from .worker import (
+    RedisAsyncQueueWorker,
+    RedisEventQueueWorker,
+    RedisStreamEventQueueWorker,
+)
 
 __all__ = (
     "RedisAsyncPriorityQueue",
@@ -22,4 +28,8 @@ __all__ = (
     "RedisAsyncStackJson",
     "RedisEventQueue",
     "RedisEventQueueWorker",
+    "RedisShardedAsyncQueue",
+    "RedisShardedAsyncStack",
+    "RedisStreamEventQueue",
+    "RedisStreamEventQueueWorker",
 )
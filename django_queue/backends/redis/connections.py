@@ -0,0 +1,191 @@
+"""Redis connection pools shared by every provider in a process.
+
+An asyncio Redis connection belongs to the event loop that opened it, so a
+pool cannot be shared between loops. Within one loop, every provider, queue
+clock and lifecycle subscriber using the same Redis URL and pool options
+draws from one pool instead of opening its own. A pool is closed when the
+last provider using it on that loop is closed. A Redis Cluster client keeps a
+pool per node, and is shared the same way.
+
+A blocking read or a Pub/Sub subscription holds its connection for as long as
+it waits, so `acquire_blocking` hands those out from a pool that
+`max_connections` does not bound. Idle workers and observers then cannot take
+every connection of a bounded pool and starve the commands that return at
+once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import math
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import redis.asyncio as async_redis
+from redis.asyncio.cluster import RedisCluster
+
+from django_queue.backends.exceptions import InvalidQueueBackendError
+
+
+@dataclass(frozen=True, slots=True)
+class RedisPoolOptions:
+    """Connection pool settings, taken from a Redis queue's backend options.
+
+    Without `max_connections` a pool opens a connection whenever none is idle.
+    With it, a caller waits up to `pool_timeout` seconds for one to be
+    returned. A connection idle for `health_check_interval` seconds is pinged
+    before reuse, and `socket_keepalive` turns on TCP keepalive. With
+    `cluster`, the URL names one node of a Redis Cluster and the client
+    discovers the rest; `max_connections` then bounds each node's pool, and a
+    caller finding it exhausted gets an error rather than waiting. Blocking
+    reads and Pub/Sub subscriptions are not counted against
+    `max_connections`; see `RedisConnectionPools.acquire_blocking`.
+    """
+
+    max_connections: int | None = None
+    pool_timeout: float = 20
+    health_check_interval: float = 30
+    socket_keepalive: bool = True
+    cluster: bool = False
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> RedisPoolOptions:
+        pool_options = cls(
+            **{
+                name: options[name]
+                for name in (
+                    "max_connections",
+                    "pool_timeout",
+                    "health_check_interval",
+                    "socket_keepalive",
+                    "cluster",
+                )
+                if name in options
+            }
+        )
+        max_connections = pool_options.max_connections
+        if max_connections is not None and (
+            isinstance(max_connections, bool)
+            or not isinstance(max_connections, int)
+            or max_connections < 1
+        ):
+            raise InvalidQueueBackendError(
+                "Redis max_connections must be a positive integer or None"
+            )
+        for name in ("pool_timeout", "health_check_interval"):
+            value = getattr(pool_options, name)
+            if (
+                isinstance(value, bool)
+                or not isinstance(value, int | float)
+                or not math.isfinite(value)
+                or value < 0
+            ):
+                raise InvalidQueueBackendError(
+                    f"Redis {name} must be a finite number of seconds, not negative"
+                )
+        if not isinstance(pool_options.socket_keepalive, bool):
+            raise InvalidQueueBackendError("Redis socket_keepalive must be a boolean")
+        if not isinstance(pool_options.cluster, bool):
+            raise InvalidQueueBackendError("Redis cluster must be a boolean")
+        return pool_options
+
+
+@dataclass(slots=True)
+class _SharedClient:
+    client: Any
+    references: int = 0
+
+
+class RedisConnectionPools:
+    """Hand out one client per event loop, Redis URL and pool options.
+
+    Each `acquire` must be matched by an `arelease` on the same loop. Clients
+    left behind by a loop that has since closed are dropped on the next
+    `acquire`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: dict[
+            asyncio.AbstractEventLoop,
+            dict[tuple[str, RedisPoolOptions], _SharedClient],
+        ] = {}
+
+    def acquire(self, redis_url: str, options: RedisPoolOptions) -> Any:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for closed in [stale for stale in self._clients if stale.is_closed()]:
+                del self._clients[closed]
+            clients = self._clients.setdefault(loop, {})
+            shared = clients.get((redis_url, options))
+            if shared is None:
+                shared = clients[redis_url, options] = _SharedClient(
+                    self._client(redis_url, options)
+                )
+            shared.references += 1
+            return shared.client
+
+    async def arelease(self, client: Any) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._clients.get(loop, {})
+            for key, shared in clients.items():
+                if shared.client is client:
+                    break
+            else:
+                return
+            shared.references -= 1
+            if shared.references:
+                return
+            del clients[key]
+            if not clients:
+                del self._clients[loop]
+        if isinstance(client, RedisCluster):
+            await client.aclose()
+        else:
+            await client.aclose(close_connection_pool=True)
+
+    def acquire_blocking(self, redis_url: str, options: RedisPoolOptions) -> Any:
+        """Acquire a client for commands that hold a connection while waiting.
+
+        The client draws from the unbounded pool for *redis_url*, shared with
+        providers that set no `max_connections`. Release it with `arelease`.
+        """
+        return self.acquire(
+            redis_url, dataclasses.replace(options, max_connections=None)
+        )
+
+    def pool_count(self) -> int:
+        """Return how many pools are open on the running event loop."""
+        with self._lock:
+            return len(self._clients.get(asyncio.get_running_loop(), {}))
+
+    @staticmethod
+    def _client(redis_url: str, options: RedisPoolOptions) -> Any:
+        connection_kwargs: dict[str, Any] = {
+            "health_check_interval": options.health_check_interval,
+            "socket_keepalive": options.socket_keepalive,
+        }
+        if options.cluster:
+            # A standalone client waits on a socket indefinitely; a cluster
+            # client would otherwise give up on a blocking wait after 5 seconds.
+            connection_kwargs["socket_timeout"] = None
+            if options.max_connections is not None:
+                connection_kwargs["max_connections"] = options.max_connections
+            return RedisCluster.from_url(redis_url, **connection_kwargs)
+        if options.max_connections is None:
+            pool = async_redis.ConnectionPool.from_url(redis_url, **connection_kwargs)
+        else:
+            pool = async_redis.BlockingConnectionPool.from_url(
+                redis_url,
+                max_connections=options.max_connections,
+                timeout=options.pool_timeout,
+                **connection_kwargs,
+            )
+        return async_redis.Redis(connection_pool=pool)
+
+
+connection_pools = RedisConnectionPools()
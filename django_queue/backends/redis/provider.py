@@ -12,11 +12,11 @@ import codecs
 import json
 import logging
 import uuid
+from collections.abc import Collection
 from dataclasses import dataclass
 from typing import Any
 
 import redis
-import redis.asyncio as async_redis
 from asgiref.sync import async_to_sync
 
 from django_queue.backends.exceptions import (
@@ -32,12 +32,22 @@ from django_queue.backends.exceptions import (
 )
 from django_queue.clock import (
     MICROSECONDS_PER_SECOND,
+    ClockTime,
     QueueClock,
     QueueClockError,
     RedisQueueClock,
 )
+from django_queue.codecs import (
+    COMPACT_RECORD_MARKER,
+    HASH_RECORD_MARKER,
+    EntryCodec,
+    JsonEntryCodec,
+)
 from django_queue.entries import QueueEntry, QueueEntryStatus, validate_budget
 
+from .connections import RedisPoolOptions, connection_pools
+from .publishing import SnapshotBuffer, SnapshotBufferOptions
+
 logger = logging.getLogger(__name__)
 
 _PRIORITY_SEQUENCE_SPACE = 2**32
@@ -71,81 +81,367 @@ def validate_redis_priority_magnitude(priority: int) -> int:
     return priority
 
 
-_CLAIM_SCRIPT = b"""
-    local now = redis.call("TIME")
-    local now_us = tonumber(now[1]) * 1000000 + tonumber(now[2])
-    local earliest = redis.call("ZRANGEBYSCORE", KEYS[7], "-inf", now_us, "WITHSCORES", "LIMIT", 0, 1)
-    if #earliest > 0 then
-        local scheduled = redis.call("ZRANGEBYSCORE", KEYS[7], earliest[2], earliest[2])
-        for index = 1, #scheduled do
-            local raw_entry = redis.call("GET", KEYS[5] .. scheduled[index])
-            local ok, entry = pcall(cjson.decode, raw_entry)
-            if ok and type(entry) == "table" and entry.status == "queued" then
-                if ARGV[3] == "1" then redis.call("LPUSH", KEYS[1], scheduled[index])
-                else redis.call("RPUSH", KEYS[1], scheduled[index]) end
-                redis.call("ZREM", KEYS[7], scheduled[index])
-                break
+# Every stored entry's ID is a member of the index for its status,
+# `<queue>:entries:status:<status>`, scored 0 like the entry index so each
+# sorts in creation order. Its key is derived from the entry key, which is
+# the entries prefix followed by the 36-character entry ID, so any script
+# that writes or deletes an entry keeps its status index with it:
+# `index_status` files the entry under a status (or none), and
+# `delete_entry` deletes it.
+_STATUS_INDEX_LUA = (
+    b"""
+    local ENTRY_STATUSES = {"""
+    + b", ".join(b'"%s"' % status.value.encode() for status in QueueEntryStatus)
+    + b"""}
+    local function index_status(entry_key, status)
+        local prefix = string.sub(entry_key, 1, -37) .. "status:"
+        local entry_id = string.sub(entry_key, -36)
+        for _, known in ipairs(ENTRY_STATUSES) do
+            if known ~= status then redis.call("ZREM", prefix .. known, entry_id) end
+        end
+        if status then redis.call("ZADD", prefix .. status, 0, entry_id) end
+    end
+    local function delete_entry(entry_key)
+        index_status(entry_key, nil)
+        return redis.call("DEL", entry_key)
+    end
+"""
+)
+
+# Reads and rewrites the lifecycle fields of a stored record in any format an
+# `EntryCodec` writes: a JSON object, or a compact record's binary header (see
+# `django_queue.codecs.CompactEntryCodec`), which is unpacked and spliced at
+# its fixed offsets without touching the JSON body after it, or a hash (see
+# `django_queue.codecs.HashEntryCodec`), whose fields are read and set on
+# their own. Rewriting a compact record keeps its body as stored; a queued or
+# running entry never has a result or error there to clear.
+#
+# `load_entry` reads a stored entry's lifecycle fields whichever way it is
+# stored, `entry_record` returns it as a record the provider can decode, and
+# `write_entry` stores a record the provider encoded: a hash record into a
+# hash, anything else as a string. A partial hash record only updates a
+# stored hash, so `write_entry` returns false for an entry still stored as a
+# string, and the caller sends the whole record instead.
+_ENTRY_LUA = (
+    _STATUS_INDEX_LUA
+    + b"""
+    local ENTRY_STATUS_CODES = {}
+    for code, status in ipairs(ENTRY_STATUSES) do ENTRY_STATUS_CODES[status] = code - 1 end
+    local function is_compact(raw_entry)
+        return type(raw_entry) == "string" and string.byte(raw_entry, 1) == 0
+    end
+    local function read_entry(raw_entry)
+        if type(raw_entry) ~= "string" then return nil end
+        if is_compact(raw_entry) then
+            if #raw_entry < 60 or string.byte(raw_entry, 2) ~= 1 then return nil end
+            local _, _, code, flags, priority, budget, _, dispatched = struct.unpack(
+                ">BBBBi8di8i8", raw_entry
+            )
+            return {
+                status = ENTRY_STATUSES[code + 1],
+                priority = priority,
+                timeout_seconds = bit.band(flags, 1) == 1 and budget or nil,
+                dispatched = bit.band(flags, 2) == 2
+            }
+        end
+        local ok, entry = pcall(cjson.decode, raw_entry)
+        if ok and type(entry) == "table" then return entry end
+        return nil
+    end
+    local function restamp_compact(raw_entry, status, dispatched_us)
+        local flags = bit.band(string.byte(raw_entry, 4), 1)
+        if dispatched_us then flags = flags + 2 end
+        return string.sub(raw_entry, 1, 2)
+            .. string.char(ENTRY_STATUS_CODES[status], flags)
+            .. string.sub(raw_entry, 5, 28)
+            .. struct.pack(">i8i8", dispatched_us or 0, 0)
+            .. string.sub(raw_entry, 45)
+    end
+    local function requeued_entry(raw_entry, entry)
+        if is_compact(raw_entry) then return restamp_compact(raw_entry, "queued", nil) end
+        entry.status = "queued"
+        entry.dispatched_at = cjson.null
+        entry.finished_at = cjson.null
+        entry.result = cjson.null
+        entry.error = cjson.null
+        return cjson.encode(entry)
+    end
+    local NUL = string.char(0)
+    local function record_fields(record)
+        local fields = {}
+        local start = 2
+        while true do
+            local stop = string.find(record, NUL, start, true)
+            fields[#fields + 1] = string.sub(record, start, stop and stop - 1)
+            if not stop then return fields end
+            start = stop + 1
+        end
+    end
+    local function load_entry(entry_key)
+        local kind = redis.call("TYPE", entry_key).ok
+        if kind == "hash" then
+            local values = redis.call(
+                "HMGET", entry_key, "status", "priority", "timeout_seconds", "dispatched_at"
+            )
+            if not values[1] then return nil end
+            return {
+                hash = true,
+                status = values[1],
+                priority = tonumber(values[2]),
+                timeout_seconds = tonumber(values[3]),
+                dispatched = values[4] and values[4] ~= ""
+            }
+        end
+        if kind ~= "string" then return nil end
+        local raw_entry = redis.call("GET", entry_key)
+        return read_entry(raw_entry), raw_entry
+    end
+    local function entry_record(entry_key)
+        local kind = redis.call("TYPE", entry_key).ok
+        if kind == "hash" then
+            return string.char(1) .. table.concat(redis.call("HGETALL", entry_key), NUL)
+        end
+        if kind == "string" then return redis.call("GET", entry_key) end
+        return nil
+    end
+    local function record_status(record)
+        local marker = string.byte(record, 1)
+        if marker == 0 then return ENTRY_STATUSES[string.byte(record, 3) + 1] end
+        if marker ~= 1 and marker ~= 2 then
+            return string.match(record, '"status": "(%a+)"')
+        end
+        local fields = record_fields(record)
+        for index = 1, #fields - 1, 2 do
+            if fields[index] == "status" then return fields[index + 1] end
+        end
+        return nil
+    end
+    local function write_entry(entry_key, record)
+        local marker = string.byte(record, 1)
+        local status = record_status(record)
+        if marker ~= 1 and marker ~= 2 then
+            redis.call("SET", entry_key, record)
+        else
+            if marker == 2 then
+                if redis.call("TYPE", entry_key).ok ~= "hash" then return false end
+            else
+                redis.call("DEL", entry_key)
             end
-            redis.call("ZREM", KEYS[7], scheduled[index])
+            redis.call("HSET", entry_key, unpack(record_fields(record)))
         end
+        if status then index_status(entry_key, status) end
+        return true
     end
-    local delayed = redis.call("ZRANGEBYSCORE", KEYS[2], "-inf", now_us)
-    for index = 1, #delayed do
-        if ARGV[3] == "1" then
-            redis.call("LPUSH", KEYS[1], delayed[index])
+    local function requeue_entry(entry_key, entry, raw_entry)
+        if entry.hash then
+            redis.call(
+                "HSET", entry_key, "status", "queued", "dispatched_at", "",
+                "finished_at", "", "result", "null", "error", "null"
+            )
         else
-            redis.call("RPUSH", KEYS[1], delayed[index])
+            redis.call("SET", entry_key, requeued_entry(raw_entry, entry))
         end
-        redis.call("ZREM", KEYS[2], delayed[index])
+        index_status(entry_key, "queued")
     end
-    local entry_id
-    if ARGV[3] == "1" then
-        entry_id = redis.call("RPOP", KEYS[1])
-    else
-        entry_id = redis.call("LPOP", KEYS[1])
+"""
+)
+
+# Shared by both claim scripts. When the worker asks a claim to also start
+# the entry (a JSON object in the script's last ARGV, empty otherwise), the
+# lease is sized from the record's own budget and the record is moved to
+# RUNNING, published, and returned in the same call -- see
+# `QueueProviderRedis.aclaim_and_start`. The record is rewritten by splicing
+# its `status` and `dispatched_at` values rather than re-encoding it with
+# cjson, which would not round-trip every payload (empty arrays, large
+# integers). Both fields precede `payload` in `QueueEntry.to_dict()` order
+# and a JSON string cannot contain an unescaped quote, so the first match of
+# each is the top-level field. A compact record has both rewritten in its
+# header, and a hash has both fields set. A record in any other shape is still claimed and returned as
+# stored, and the worker starts it the slower way.
+_START_CLAIMED_LUA = (
+    _ENTRY_LUA
+    + b"""
+    local function claim_lease_us(entry, start, default_lease_us)
+        if not start then return default_lease_us end
+        local budget_us = start.budget_us
+        if type(budget_us) ~= "number" then
+            local timeout_seconds = entry and entry.timeout_seconds
+            if type(timeout_seconds) == "number" then
+                budget_us = math.floor(timeout_seconds * 1000000 + 0.5)
+            else
+                budget_us = start.default_budget_us
+            end
+        end
+        return budget_us + start.grace_us
     end
-    if not entry_id then
-        return {"empty", ""}
+    local function running_entry(raw_entry, now)
+        if is_compact(raw_entry) then
+            local entry = read_entry(raw_entry)
+            if not entry or entry.status ~= "queued" or entry.dispatched then return nil end
+            return restamp_compact(
+                raw_entry, "running", tonumber(now[1]) * 1000000 + tonumber(now[2])
+            )
+        end
+        local status_from, status_to = string.find(raw_entry, '"status": "queued"', 1, true)
+        if not status_from then return nil end
+        local dispatched_from, dispatched_to = string.find(
+            raw_entry, '"dispatched_at": null', status_to, true
+        )
+        if not dispatched_from then return nil end
+        return string.sub(raw_entry, 1, status_from - 1)
+            .. '"status": "running"'
+            .. string.sub(raw_entry, status_to + 1, dispatched_from - 1)
+            .. '"dispatched_at": ' .. now[1] .. "." .. string.format("%06d", tonumber(now[2]))
+            .. string.sub(raw_entry, dispatched_to + 1)
     end
-    local remaining
-    if ARGV[4] == "1" then
-        local expiry_deadline = redis.call("ZSCORE", KEYS[6], entry_id)
-        if not expiry_deadline or tonumber(expiry_deadline) <= now_us then
-            redis.call("DEL", KEYS[5] .. entry_id)
-            redis.call("ZREM", KEYS[2], entry_id)
-            redis.call("ZREM", KEYS[4], entry_id)
-            redis.call("ZREM", KEYS[6], entry_id)
-            return {"expired", entry_id}
+    local function start_claimed(entry_id, entry_key, entry, raw_entry, now, start)
+        local publish_queued = type(start.published_through) ~= "string"
+            or entry_id > start.published_through
+        if entry and entry.hash then
+            if entry.status ~= "queued" or entry.dispatched then
+                return {"claimed", entry_id, entry_record(entry_key)}
+            end
+            if publish_queued then redis.call("PUBLISH", start.channel, entry_record(entry_key)) end
+            redis.call(
+                "HSET", entry_key, "status", "running",
+                "dispatched_at", now[1] .. string.format("%06d", tonumber(now[2]))
+            )
+            index_status(entry_key, "running")
+            local running = entry_record(entry_key)
+            redis.call("PUBLISH", start.channel, running)
+            return {"started", entry_id, running}
         end
-        remaining = tonumber(expiry_deadline) - now_us
-        redis.call("ZREM", KEYS[6], entry_id)
+        if not raw_entry then return {"claimed", entry_id, ""} end
+        local running = running_entry(raw_entry, now)
+        if not running then return {"claimed", entry_id, raw_entry} end
+        redis.call("SET", entry_key, running)
+        index_status(entry_key, "running")
+        if publish_queued then redis.call("PUBLISH", start.channel, raw_entry) end
+        redis.call("PUBLISH", start.channel, running)
+        return {"started", entry_id, running}
     end
-    local claim_key = KEYS[3] .. entry_id
-    local deadline = now_us + tonumber(ARGV[2])
-    local claim = cjson.encode({
-        worker_id = ARGV[1],
-        claimed_at = {seconds = tonumber(now[1]), microseconds = tonumber(now[2])},
-        lease_deadline = deadline
-    })
-    if remaining then
-        claim = cjson.encode({
+"""
+)
+
+# Closes both claim scripts. A single claim returns `claim_one()`'s reply with
+# the Redis `TIME` it claimed at, in microseconds, inserted as its third
+# element, so the caller can calibrate its clock without asking. With a batch size in `limit`, it claims until that many are held
+# or the pending work runs out, skipping entries that expired unclaimed, and
+# stops at the first claim conflict rather than spinning on the same
+# requeued ID. The claimed records come back together; a claimed ID whose
+# record is gone is acknowledged on the spot, as `aack` would.
+_CLAIM_MANY_LUA = b"""
+    if limit == "" then
+        local outcome = claim_one()
+        table.insert(outcome, 3, claimed_at_us)
+        return outcome
+    end
+    local claimed = {}
+    while #claimed < tonumber(limit) do
+        local outcome = claim_one()
+        if outcome[1] == "claimed" then
+            local raw_entry = entry_record(KEYS[5] .. outcome[2])
+            if raw_entry then
+                claimed[#claimed + 1] = raw_entry
+            else
+                redis.call("DEL", KEYS[3] .. outcome[2])
+                redis.call("ZREM", KEYS[4], outcome[2])
+            end
+        elseif outcome[1] ~= "expired" then
+            break
+        end
+    end
+    return claimed
+"""
+
+_CLAIM_SCRIPT = (
+    _START_CLAIMED_LUA
+    + b"""
+    local start = ARGV[5] ~= "" and cjson.decode(ARGV[5]) or nil
+    local limit = ARGV[6]
+    local claimed_at_us
+    local function claim_one()
+        local now = redis.call("TIME")
+        local now_us = tonumber(now[1]) * 1000000 + tonumber(now[2])
+        claimed_at_us = now_us
+        local earliest = redis.call("ZRANGEBYSCORE", KEYS[7], "-inf", now_us, "WITHSCORES", "LIMIT", 0, 1)
+        if #earliest > 0 then
+            local scheduled = redis.call("ZRANGEBYSCORE", KEYS[7], earliest[2], earliest[2])
+            for index = 1, #scheduled do
+                local entry = load_entry(KEYS[5] .. scheduled[index])
+                if entry and entry.status == "queued" then
+                    if ARGV[3] == "1" then redis.call("LPUSH", KEYS[1], scheduled[index])
+                    else redis.call("RPUSH", KEYS[1], scheduled[index]) end
+                    redis.call("ZREM", KEYS[7], scheduled[index])
+                    break
+                end
+                redis.call("ZREM", KEYS[7], scheduled[index])
+            end
+        end
+        local delayed = redis.call("ZRANGEBYSCORE", KEYS[2], "-inf", now_us)
+        for index = 1, #delayed do
+            if ARGV[3] == "1" then
+                redis.call("LPUSH", KEYS[1], delayed[index])
+            else
+                redis.call("RPUSH", KEYS[1], delayed[index])
+            end
+            redis.call("ZREM", KEYS[2], delayed[index])
+        end
+        local entry_id
+        if ARGV[3] == "1" then
+            entry_id = redis.call("RPOP", KEYS[1])
+        else
+            entry_id = redis.call("LPOP", KEYS[1])
+        end
+        if not entry_id then
+            return {"empty", ""}
+        end
+        local remaining
+        if ARGV[4] == "1" then
+            local expiry_deadline = redis.call("ZSCORE", KEYS[6], entry_id)
+            if not expiry_deadline or tonumber(expiry_deadline) <= now_us then
+                delete_entry(KEYS[5] .. entry_id)
+                redis.call("ZREM", KEYS[2], entry_id)
+                redis.call("ZREM", KEYS[4], entry_id)
+                redis.call("ZREM", KEYS[6], entry_id)
+                redis.call("ZREM", KEYS[8], entry_id)
+                return {"expired", entry_id}
+            end
+            remaining = tonumber(expiry_deadline) - now_us
+            redis.call("ZREM", KEYS[6], entry_id)
+        end
+        local claim_key = KEYS[3] .. entry_id
+        local entry, raw_entry
+        if start then entry, raw_entry = load_entry(KEYS[5] .. entry_id) end
+        local deadline = now_us + claim_lease_us(entry, start, tonumber(ARGV[2]))
+        local claim = cjson.encode({
             worker_id = ARGV[1],
             claimed_at = {seconds = tonumber(now[1]), microseconds = tonumber(now[2])},
-            lease_deadline = deadline,
-            unclaimed_remaining_us = remaining
+            lease_deadline = deadline
         })
+        if remaining then
+            claim = cjson.encode({
+                worker_id = ARGV[1],
+                claimed_at = {seconds = tonumber(now[1]), microseconds = tonumber(now[2])},
+                lease_deadline = deadline,
+                unclaimed_remaining_us = remaining
+            })
+        end
+        if redis.call("SET", claim_key, claim, "NX") then
+            redis.call("ZADD", KEYS[4], deadline, entry_id)
+            if start then return start_claimed(entry_id, KEYS[5] .. entry_id, entry, raw_entry, now, start) end
+            return {"claimed", entry_id}
+        end
+        if ARGV[3] == "1" then
+            redis.call("RPUSH", KEYS[1], entry_id)
+        else
+            redis.call("LPUSH", KEYS[1], entry_id)
+        end
+        return {"conflict", entry_id}
     end
-    if redis.call("SET", claim_key, claim, "NX") then
-        redis.call("ZADD", KEYS[4], deadline, entry_id)
-        return {"claimed", entry_id}
-    end
-    if ARGV[3] == "1" then
-        redis.call("RPUSH", KEYS[1], entry_id)
-    else
-        redis.call("LPUSH", KEYS[1], entry_id)
-    end
-    return {"conflict", entry_id}
 """
+    + _CLAIM_MANY_LUA
+)
 
 # Identical to _CLAIM_SCRIPT except the pop step: a priority-variant queue's
 # tracked entries live in the priority ZSET (KEYS[7]), never the plain list,
@@ -155,116 +451,131 @@ _CLAIM_SCRIPT = b"""
 # by fresh priority pushes), falling back to the highest-scored priority
 # ZSET member (same ZREVRANGE/ZREM shape as apop_priority) only when the
 # plain list is empty. Everything from claim_key onward is unchanged.
-_CLAIM_SCRIPT_WITH_PRIORITY = b"""
-    local now = redis.call("TIME")
-    local now_us = tonumber(now[1]) * 1000000 + tonumber(now[2])
-    local earliest = redis.call("ZRANGEBYSCORE", KEYS[9], "-inf", now_us, "WITHSCORES", "LIMIT", 0, 1)
-    if #earliest > 0 then
-        local scheduled = redis.call("ZRANGEBYSCORE", KEYS[9], earliest[2], earliest[2])
-        local selected_id
-        local selected_priority
-        for index = 1, #scheduled do
-            local raw_entry = redis.call("GET", KEYS[5] .. scheduled[index])
-            local ok, entry = pcall(cjson.decode, raw_entry)
-            if ok and type(entry) == "table" and entry.status == "queued" then
-                local priority = tonumber(entry.priority) or 0
-                if not selected_id or priority > selected_priority then
-                    selected_id, selected_priority = scheduled[index], priority
+_CLAIM_SCRIPT_WITH_PRIORITY = (
+    _START_CLAIMED_LUA
+    + b"""
+    local start = ARGV[6] ~= "" and cjson.decode(ARGV[6]) or nil
+    local limit = ARGV[7]
+    local claimed_at_us
+    local function claim_one()
+        local now = redis.call("TIME")
+        local now_us = tonumber(now[1]) * 1000000 + tonumber(now[2])
+        claimed_at_us = now_us
+        local earliest = redis.call("ZRANGEBYSCORE", KEYS[9], "-inf", now_us, "WITHSCORES", "LIMIT", 0, 1)
+        if #earliest > 0 then
+            local scheduled = redis.call("ZRANGEBYSCORE", KEYS[9], earliest[2], earliest[2])
+            local selected_id
+            local selected_priority
+            for index = 1, #scheduled do
+                local entry = load_entry(KEYS[5] .. scheduled[index])
+                if entry and entry.status == "queued" then
+                    local priority = tonumber(entry.priority) or 0
+                    if not selected_id or priority > selected_priority then
+                        selected_id, selected_priority = scheduled[index], priority
+                    end
+                else
+                    redis.call("ZREM", KEYS[9], scheduled[index])
                 end
-            else
-                redis.call("ZREM", KEYS[9], scheduled[index])
+            end
+            if selected_id then
+                local sequence = redis.call("INCR", KEYS[8])
+                redis.call("ZADD", KEYS[7], selected_priority * ARGV[5] - sequence, selected_id)
+                redis.call("ZREM", KEYS[9], selected_id)
             end
         end
-        if selected_id then
-            local sequence = redis.call("INCR", KEYS[8])
-            redis.call("ZADD", KEYS[7], selected_priority * ARGV[5] - sequence, selected_id)
-            redis.call("ZREM", KEYS[9], selected_id)
+        local delayed = redis.call("ZRANGEBYSCORE", KEYS[2], "-inf", now_us)
+        for index = 1, #delayed do
+            if ARGV[3] == "1" then
+                redis.call("LPUSH", KEYS[1], delayed[index])
+            else
+                redis.call("RPUSH", KEYS[1], delayed[index])
+            end
+            redis.call("ZREM", KEYS[2], delayed[index])
         end
-    end
-    local delayed = redis.call("ZRANGEBYSCORE", KEYS[2], "-inf", now_us)
-    for index = 1, #delayed do
+        local entry_id
+        local priority_score
         if ARGV[3] == "1" then
-            redis.call("LPUSH", KEYS[1], delayed[index])
+            entry_id = redis.call("RPOP", KEYS[1])
         else
-            redis.call("RPUSH", KEYS[1], delayed[index])
+            entry_id = redis.call("LPOP", KEYS[1])
         end
-        redis.call("ZREM", KEYS[2], delayed[index])
-    end
-    local entry_id
-    local priority_score
-    if ARGV[3] == "1" then
-        entry_id = redis.call("RPOP", KEYS[1])
-    else
-        entry_id = redis.call("LPOP", KEYS[1])
-    end
-    if not entry_id then
-        local top = redis.call("ZREVRANGE", KEYS[7], 0, 0, "WITHSCORES")
-        if #top > 0 then
-            entry_id = top[1]
-            priority_score = top[2]
-            redis.call("ZREM", KEYS[7], entry_id)
-            -- The sequence key is reset only once this claim attempt
-            -- reaches a genuinely terminal outcome for this entry (below,
-            -- at "expired" and "claimed") -- not here. A conflict requeues
-            -- this same entry with its original, pre-reset score; resetting
-            -- now would let a later, unrelated push get a small sequence
-            -- number that outranks this still-pending entry's now-stale
-            -- one at the same priority tier, corrupting arrival order for
-            -- an entry that was never actually removed.
+        if not entry_id then
+            local top = redis.call("ZREVRANGE", KEYS[7], 0, 0, "WITHSCORES")
+            if #top > 0 then
+                entry_id = top[1]
+                priority_score = top[2]
+                redis.call("ZREM", KEYS[7], entry_id)
+                -- The sequence key is reset only once this claim attempt
+                -- reaches a genuinely terminal outcome for this entry (below,
+                -- at "expired" and "claimed") -- not here. A conflict requeues
+                -- this same entry with its original, pre-reset score; resetting
+                -- now would let a later, unrelated push get a small sequence
+                -- number that outranks this still-pending entry's now-stale
+                -- one at the same priority tier, corrupting arrival order for
+                -- an entry that was never actually removed.
+            end
         end
-    end
-    if not entry_id then
-        return {"empty", ""}
-    end
-    local remaining
-    if ARGV[4] == "1" then
-        local expiry_deadline = redis.call("ZSCORE", KEYS[6], entry_id)
-        if not expiry_deadline or tonumber(expiry_deadline) <= now_us then
-            redis.call("DEL", KEYS[5] .. entry_id)
-            redis.call("ZREM", KEYS[2], entry_id)
-            redis.call("ZREM", KEYS[4], entry_id)
-            redis.call("ZREM", KEYS[6], entry_id)
-            if priority_score and redis.call("ZCARD", KEYS[7]) == 0 then
-                redis.call("SET", KEYS[8], 0, "XX")
+        if not entry_id then
+            return {"empty", ""}
+        end
+        local remaining
+        if ARGV[4] == "1" then
+            local expiry_deadline = redis.call("ZSCORE", KEYS[6], entry_id)
+            if not expiry_deadline or tonumber(expiry_deadline) <= now_us then
+                delete_entry(KEYS[5] .. entry_id)
+                redis.call("ZREM", KEYS[2], entry_id)
+                redis.call("ZREM", KEYS[4], entry_id)
+                redis.call("ZREM", KEYS[6], entry_id)
+                redis.call("ZREM", KEYS[10], entry_id)
+                if priority_score and redis.call("ZCARD", KEYS[7]) == 0 then
+                    redis.call("SET", KEYS[8], 0, "XX")
+                end
+                return {"expired", entry_id}
             end
-            return {"expired", entry_id}
+            remaining = tonumber(expiry_deadline) - now_us
+            redis.call("ZREM", KEYS[6], entry_id)
         end
-        remaining = tonumber(expiry_deadline) - now_us
-        redis.call("ZREM", KEYS[6], entry_id)
-    end
-    local claim_key = KEYS[3] .. entry_id
-    local deadline = now_us + tonumber(ARGV[2])
-    local claim = cjson.encode({
-        worker_id = ARGV[1],
-        claimed_at = {seconds = tonumber(now[1]), microseconds = tonumber(now[2])},
-        lease_deadline = deadline
-    })
-    if remaining then
-        claim = cjson.encode({
+        local claim_key = KEYS[3] .. entry_id
+        local entry, raw_entry
+        if start then entry, raw_entry = load_entry(KEYS[5] .. entry_id) end
+        local deadline = now_us + claim_lease_us(entry, start, tonumber(ARGV[2]))
+        local claim = cjson.encode({
             worker_id = ARGV[1],
             claimed_at = {seconds = tonumber(now[1]), microseconds = tonumber(now[2])},
-            lease_deadline = deadline,
-            unclaimed_remaining_us = remaining
+            lease_deadline = deadline
         })
-    end
-    if redis.call("SET", claim_key, claim, "NX") then
-        redis.call("ZADD", KEYS[4], deadline, entry_id)
-        if priority_score and redis.call("ZCARD", KEYS[7]) == 0 then
-            redis.call("SET", KEYS[8], 0, "XX")
+        if remaining then
+            claim = cjson.encode({
+                worker_id = ARGV[1],
+                claimed_at = {seconds = tonumber(now[1]), microseconds = tonumber(now[2])},
+                lease_deadline = deadline,
+                unclaimed_remaining_us = remaining
+            })
         end
-        return {"claimed", entry_id}
-    end
-    if priority_score then
-        redis.call("ZADD", KEYS[7], priority_score, entry_id)
-    elseif ARGV[3] == "1" then
-        redis.call("RPUSH", KEYS[1], entry_id)
-    else
-        redis.call("LPUSH", KEYS[1], entry_id)
+        if redis.call("SET", claim_key, claim, "NX") then
+            redis.call("ZADD", KEYS[4], deadline, entry_id)
+            if priority_score and redis.call("ZCARD", KEYS[7]) == 0 then
+                redis.call("SET", KEYS[8], 0, "XX")
+            end
+            if start then return start_claimed(entry_id, KEYS[5] .. entry_id, entry, raw_entry, now, start) end
+            return {"claimed", entry_id}
+        end
+        if priority_score then
+            redis.call("ZADD", KEYS[7], priority_score, entry_id)
+        elseif ARGV[3] == "1" then
+            redis.call("RPUSH", KEYS[1], entry_id)
+        else
+            redis.call("LPUSH", KEYS[1], entry_id)
+        end
+        return {"conflict", entry_id}
     end
-    return {"conflict", entry_id}
 """
+    + _CLAIM_MANY_LUA
+)
 
-_DEQUEUE_EVENT_SCRIPT = b"""
+_DEQUEUE_EVENT_SCRIPT = (
+    _ENTRY_LUA
+    + b"""
     local now = redis.call("TIME")
     local now_us = tonumber(now[1]) * 1000000 + tonumber(now[2])
     local delayed = redis.call("ZRANGEBYSCORE", KEYS[2], "-inf", now_us)
@@ -294,25 +605,28 @@ _DEQUEUE_EVENT_SCRIPT = b"""
             end
         else
             local entry_key = KEYS[5] .. entry_id
-            local raw_entry = redis.call("GET", entry_key)
+            local raw_entry = entry_record(entry_key)
             local expiry_deadline = redis.call("ZSCORE", KEYS[6], entry_id)
             if raw_entry and expiry_deadline and tonumber(expiry_deadline) > now_us then
-                redis.call("DEL", entry_key)
+                delete_entry(entry_key)
                 redis.call("ZREM", KEYS[2], entry_id)
                 redis.call("ZREM", KEYS[4], entry_id)
                 redis.call("ZREM", KEYS[6], entry_id)
+                redis.call("ZREM", KEYS[7], entry_id)
                 redis.call("LREM", KEYS[1], 0, entry_id)
                 return {"dequeued", raw_entry}
             end
-            redis.call("DEL", entry_key)
+            delete_entry(entry_key)
             redis.call("ZREM", KEYS[2], entry_id)
             redis.call("ZREM", KEYS[4], entry_id)
             redis.call("ZREM", KEYS[6], entry_id)
+            redis.call("ZREM", KEYS[7], entry_id)
             redis.call("LREM", KEYS[1], 0, entry_id)
         end
     end
     return {"empty", ""}
 """
+)
 
 _RENEW_SCRIPT = b"""
     local raw = redis.call("GET", KEYS[1])
@@ -329,7 +643,22 @@ _RENEW_SCRIPT = b"""
     return 1
 """
 
-_RELEASE_SCRIPT = b"""
+# Idle workers block on a per-queue wake list (BLPOP) rather than polling.
+# Every script that makes work claimable pushes one token per entry; the list
+# is trimmed so a burst nobody was waiting for leaves behind at most a
+# bounded number of spurious wake-ups, each costing one empty claim.
+_WAKE_LUA = b"""
+    local function wake(key, count)
+        for _ = 1, math.min(count, 64) do
+            redis.call("LPUSH", key, "1")
+        end
+        redis.call("LTRIM", key, 0, 63)
+    end
+"""
+
+_RELEASE_SCRIPT = (
+    _WAKE_LUA
+    + b"""
     local raw = redis.call("GET", KEYS[1])
     if not raw then return 0 end
     local ok, claim = pcall(cjson.decode, raw)
@@ -343,8 +672,10 @@ _RELEASE_SCRIPT = b"""
     if type(claim.unclaimed_remaining_us) == "number" then
         redis.call("ZADD", KEYS[4], now_us + claim.unclaimed_remaining_us, ARGV[2])
     end
+    wake(KEYS[5], 1)
     return 1
 """
+)
 
 # arelease always parks the released entry on the plain delayed set --
 # correct for a plain FIFO/stack queue, but _CLAIM_SCRIPT_WITH_PRIORITY
@@ -362,14 +693,16 @@ _RELEASE_SCRIPT = b"""
 # not honoured here: the priority ZSET has no "not yet due" concept the way
 # the delayed set does, and the only caller (RedisAsyncQueueWorker._mark_running,
 # via queue.arelease) passes an effectively-instant delay anyway.
-_RELEASE_SCRIPT_WITH_PRIORITY = b"""
+_RELEASE_SCRIPT_WITH_PRIORITY = (
+    _WAKE_LUA
+    + _ENTRY_LUA
+    + b"""
     local raw = redis.call("GET", KEYS[1])
     if not raw then return 0 end
     local ok, claim = pcall(cjson.decode, raw)
     if not ok or type(claim) ~= "table" or claim.worker_id ~= ARGV[1] then return 0 end
-    local raw_entry = redis.call("GET", KEYS[6] .. ARGV[2])
-    local entry_ok, entry = pcall(cjson.decode, raw_entry)
-    local priority = (entry_ok and type(entry) == "table") and tonumber(entry.priority) or 0
+    local entry = load_entry(KEYS[6] .. ARGV[2])
+    local priority = entry and tonumber(entry.priority) or 0
     local now = redis.call("TIME")
     local now_us = tonumber(now[1]) * 1000000 + tonumber(now[2])
     redis.call("DEL", KEYS[1])
@@ -380,10 +713,14 @@ _RELEASE_SCRIPT_WITH_PRIORITY = b"""
     if type(claim.unclaimed_remaining_us) == "number" then
         redis.call("ZADD", KEYS[4], now_us + claim.unclaimed_remaining_us, ARGV[2])
     end
+    wake(KEYS[8], 1)
     return 1
 """
+)
 
-_REMOVE_SCRIPT = b"""
+_REMOVE_SCRIPT = (
+    _STATUS_INDEX_LUA
+    + b"""
     local raw = redis.call("GET", KEYS[1])
     if not raw then return 0 end
     local ok, claim = pcall(cjson.decode, raw)
@@ -393,23 +730,30 @@ _REMOVE_SCRIPT = b"""
     redis.call("ZREM", KEYS[3], ARGV[2])
     redis.call("LREM", KEYS[4], 0, ARGV[2])
     redis.call("ZREM", KEYS[6], ARGV[2])
-    return redis.call("DEL", KEYS[5])
+    redis.call("ZREM", KEYS[7], ARGV[2])
+    redis.call("ZREM", KEYS[8], ARGV[2])
+    return delete_entry(KEYS[5])
 """
+)
 
-_EXPIRE_SCRIPT = b"""
+_EXPIRE_SCRIPT = (
+    _STATUS_INDEX_LUA
+    + b"""
     if redis.call("GET", KEYS[1]) then return 0 end
     local now = redis.call("TIME")
     local now_us = tonumber(now[1]) * 1000000 + tonumber(now[2])
     local deadline = redis.call("ZSCORE", KEYS[6], ARGV[1])
     if not deadline or tonumber(deadline) > now_us then return 0 end
-    local removed = redis.call("DEL", KEYS[2])
+    local removed = delete_entry(KEYS[2])
     if removed == 0 then return 0 end
     redis.call("LREM", KEYS[3], 0, ARGV[1])
     redis.call("ZREM", KEYS[4], ARGV[1])
     redis.call("ZREM", KEYS[5], ARGV[1])
     redis.call("ZREM", KEYS[6], ARGV[1])
+    redis.call("ZREM", KEYS[7], ARGV[1])
     return 1
 """
+)
 
 _ACK_SCRIPT = b"""
     local raw_claim = redis.call("GET", KEYS[1])
@@ -420,32 +764,39 @@ _ACK_SCRIPT = b"""
     return redis.call("DEL", KEYS[1])
 """
 
-_MARK_RUNNING_SCRIPT = b"""
+_MARK_RUNNING_SCRIPT = (
+    _ENTRY_LUA
+    + b"""
     local raw_claim = redis.call("GET", KEYS[1])
     if not raw_claim then return 0 end
     local ok, claim = pcall(cjson.decode, raw_claim)
     if not ok or type(claim) ~= "table" or claim.worker_id ~= ARGV[1] then return 0 end
-    local raw_entry = redis.call("GET", KEYS[2])
-    local entry_ok, entry = pcall(cjson.decode, raw_entry)
-    if not entry_ok or type(entry) ~= "table" or entry.status ~= "queued" then return 0 end
-    redis.call("SET", KEYS[2], ARGV[2])
+    local entry = load_entry(KEYS[2])
+    if not entry or entry.status ~= "queued" then return 0 end
+    if not write_entry(KEYS[2], ARGV[2]) then return -1 end
     return 1
 """
+)
 
-_SETTLE_SCRIPT = b"""
+_SETTLE_SCRIPT = (
+    _ENTRY_LUA
+    + b"""
     local raw_claim = redis.call("GET", KEYS[1])
     if not raw_claim then return 0 end
     local ok, claim = pcall(cjson.decode, raw_claim)
     if not ok or type(claim) ~= "table" or claim.worker_id ~= ARGV[1] then return 0 end
-    local raw_entry = redis.call("GET", KEYS[3])
-    local entry_ok, entry = pcall(cjson.decode, raw_entry)
-    if not entry_ok or type(entry) ~= "table" or entry.status ~= "running" then return 0 end
-    redis.call("SET", KEYS[3], ARGV[3])
+    local entry = load_entry(KEYS[3])
+    if not entry or entry.status ~= "running" then return 0 end
+    if not write_entry(KEYS[3], ARGV[3]) then return -1 end
+    if ARGV[4] ~= "" then redis.call("ZADD", KEYS[4], ARGV[4], ARGV[2]) end
     redis.call("ZREM", KEYS[2], ARGV[2])
     return redis.call("DEL", KEYS[1])
 """
+)
 
-_RECOVER_SCRIPT = b"""
+_RECOVER_SCRIPT = (
+    _ENTRY_LUA
+    + b"""
     local now = redis.call("TIME")
     local deadline = tonumber(now[1]) * 1000000 + tonumber(now[2])
     local ids = redis.call("ZRANGEBYSCORE", KEYS[1], "-inf", deadline, "LIMIT", 0, ARGV[2])
@@ -458,15 +809,9 @@ _RECOVER_SCRIPT = b"""
         local ok, claim = pcall(cjson.decode, raw_claim)
         local lease_deadline = ok and type(claim) == "table" and tonumber(claim.lease_deadline)
         if not lease_deadline or lease_deadline <= deadline then
-            local raw_entry = redis.call("GET", KEYS[4] .. entry_id)
-            local entry_ok, entry = pcall(cjson.decode, raw_entry)
-            if entry_ok and type(entry) == "table" and (entry.status == "queued" or entry.status == "running") then
-                entry.status = "queued"
-                entry.dispatched_at = cjson.null
-                entry.finished_at = cjson.null
-                entry.result = cjson.null
-                entry.error = cjson.null
-                redis.call("SET", KEYS[4] .. entry_id, cjson.encode(entry))
+            local entry, raw_entry = load_entry(KEYS[4] .. entry_id)
+            if entry and (entry.status == "queued" or entry.status == "running") then
+                requeue_entry(KEYS[4] .. entry_id, entry, raw_entry)
                 if type(claim.unclaimed_remaining_us) == "number" then
                     redis.call("ZADD", KEYS[5], deadline + claim.unclaimed_remaining_us, entry_id)
                     if ARGV[1] == "1" then redis.call("LPUSH", KEYS[3], entry_id)
@@ -488,6 +833,7 @@ _RECOVER_SCRIPT = b"""
     end
     return {recovered, discarded}
 """
+)
 
 # Identical to _RECOVER_SCRIPT except where a recovered entry is redelivered:
 # a priority-variant queue's entries only ever come from and return to the
@@ -506,7 +852,9 @@ _RECOVER_SCRIPT = b"""
 # guard, `tonumber(nil)` yields nil and the multiplication crashes with
 # "attempt to perform arithmetic on a nil value" instead of just treating
 # the entry as unprioritised.
-_RECOVER_SCRIPT_WITH_PRIORITY = b"""
+_RECOVER_SCRIPT_WITH_PRIORITY = (
+    _ENTRY_LUA
+    + b"""
     local now = redis.call("TIME")
     local deadline = tonumber(now[1]) * 1000000 + tonumber(now[2])
     local ids = redis.call("ZRANGEBYSCORE", KEYS[1], "-inf", deadline, "LIMIT", 0, ARGV[2])
@@ -519,15 +867,9 @@ _RECOVER_SCRIPT_WITH_PRIORITY = b"""
         local ok, claim = pcall(cjson.decode, raw_claim)
         local lease_deadline = ok and type(claim) == "table" and tonumber(claim.lease_deadline)
         if not lease_deadline or lease_deadline <= deadline then
-            local raw_entry = redis.call("GET", KEYS[4] .. entry_id)
-            local entry_ok, entry = pcall(cjson.decode, raw_entry)
-            if entry_ok and type(entry) == "table" and (entry.status == "queued" or entry.status == "running") then
-                entry.status = "queued"
-                entry.dispatched_at = cjson.null
-                entry.finished_at = cjson.null
-                entry.result = cjson.null
-                entry.error = cjson.null
-                redis.call("SET", KEYS[4] .. entry_id, cjson.encode(entry))
+            local entry, raw_entry = load_entry(KEYS[4] .. entry_id)
+            if entry and (entry.status == "queued" or entry.status == "running") then
+                requeue_entry(KEYS[4] .. entry_id, entry, raw_entry)
                 if type(claim.unclaimed_remaining_us) == "number" then
                     redis.call("ZADD", KEYS[5], deadline + claim.unclaimed_remaining_us, entry_id)
                 end
@@ -547,18 +889,50 @@ _RECOVER_SCRIPT_WITH_PRIORITY = b"""
     end
     return {recovered, discarded}
 """
+)
 
-_PRUNE_SCRIPT = b"""
-    local raw_entry = redis.call("GET", KEYS[1])
-    if not raw_entry then return 0 end
-    local ok, entry = pcall(cjson.decode, raw_entry)
-    if not ok or type(entry) ~= "table" then return 0 end
+_PRUNE_SCRIPT = (
+    _ENTRY_LUA
+    + b"""
+    local entry = load_entry(KEYS[1])
+    if not entry then return 0 end
     if entry.status ~= "succeeded" and entry.status ~= "failed"
         and entry.status ~= "cancelled" and entry.status ~= "timeout" then return -1 end
     redis.call("LREM", KEYS[2], 0, ARGV[1])
-    if redis.call("DEL", KEYS[1]) == 0 then return 0 end
+    redis.call("ZREM", KEYS[3], ARGV[1])
+    redis.call("ZREM", KEYS[4], ARGV[1])
+    local raw_entry = entry_record(KEYS[1])
+    if delete_entry(KEYS[1]) == 0 then return 0 end
     return raw_entry
 """
+)
+
+# One bounded read of the finished-at index, then one pass deleting each
+# expired record it names. Returns how many IDs the read found, stale ones
+# included, and the raw records removed so the caller can publish their final
+# snapshots without reading them again.
+_PRUNE_EXPIRED_SCRIPT = (
+    _ENTRY_LUA
+    + b"""
+    local ids = redis.call("ZRANGEBYSCORE", KEYS[1], "-inf", ARGV[1], "LIMIT", 0, ARGV[2])
+    local pruned = {}
+    for index = 1, #ids do
+        local entry_id = ids[index]
+        local entry_key = KEYS[2] .. entry_id
+        redis.call("ZREM", KEYS[1], entry_id)
+        local entry = load_entry(entry_key)
+        if entry and (entry.status == "succeeded"
+            or entry.status == "failed" or entry.status == "cancelled"
+            or entry.status == "timeout") then
+            redis.call("LREM", KEYS[3], 0, entry_id)
+            redis.call("ZREM", KEYS[4], entry_id)
+            pruned[#pruned + 1] = entry_record(entry_key)
+            delete_entry(entry_key)
+        end
+    end
+    return {#ids, pruned}
+"""
+)
 
 _PUSH_PRIORITY_SCRIPT = b"""
     local sequence = redis.call("INCR", KEYS[2])
@@ -593,26 +967,44 @@ _DISCARD_PRIORITY_SCRIPT = b"""
 # apop/aclaim's subsequent afind() raises a named, caught exception -- but
 # this direction had no such safety net. One script per store+push
 # combination closes the window entirely.
-_STORE_AND_PUSH_SCRIPT = b"""
-    redis.call("SET", KEYS[1], ARGV[1])
+_STORE_AND_PUSH_SCRIPT = (
+    _WAKE_LUA
+    + _ENTRY_LUA
+    + b"""
+    write_entry(KEYS[1], ARGV[1])
+    redis.call("ZADD", KEYS[3], 0, ARGV[3])
     if ARGV[2] == "1" then
         redis.call("LPUSH", KEYS[2], ARGV[3])
     else
         redis.call("RPUSH", KEYS[2], ARGV[3])
     end
+    wake(KEYS[4], 1)
 """
+)
 
-_STORE_AND_PUSH_PRIORITY_SCRIPT = b"""
-    redis.call("SET", KEYS[1], ARGV[1])
+_STORE_AND_PUSH_PRIORITY_SCRIPT = (
+    _WAKE_LUA
+    + _ENTRY_LUA
+    + b"""
+    write_entry(KEYS[1], ARGV[1])
+    redis.call("ZADD", KEYS[4], 0, ARGV[2])
     local sequence = redis.call("INCR", KEYS[3])
     local score = tonumber(ARGV[3]) - sequence
     redis.call("ZADD", KEYS[2], score, ARGV[2])
+    wake(KEYS[5], 1)
 """
+)
 
-_STORE_AVAILABLE_SCRIPT = b"""
+# A scheduled entry wakes idle workers too, so a worker already blocked
+# past its due time re-reads the next due instant (see `_NEXT_DUE_SCRIPT`).
+_STORE_AVAILABLE_SCRIPT = (
+    _WAKE_LUA
+    + _ENTRY_LUA
+    + b"""
     local now = redis.call("TIME")
     local now_us = tonumber(now[1]) * 1000000 + tonumber(now[2])
-    redis.call("SET", KEYS[1], ARGV[1])
+    write_entry(KEYS[1], ARGV[1])
+    redis.call("ZADD", KEYS[6], 0, ARGV[2])
     if tonumber(ARGV[3]) > now_us then
         redis.call("ZADD", KEYS[3], ARGV[3], ARGV[2])
     elseif ARGV[5] == "1" then
@@ -623,18 +1015,21 @@ _STORE_AVAILABLE_SCRIPT = b"""
     else
         redis.call("RPUSH", KEYS[2], ARGV[2])
     end
+    wake(KEYS[7], 1)
 """
+)
 
-_PROMOTE_SCHEDULED_SCRIPT = b"""
+_PROMOTE_SCHEDULED_SCRIPT = (
+    _ENTRY_LUA
+    + b"""
     local now = redis.call("TIME")
     local now_us = tonumber(now[1]) * 1000000 + tonumber(now[2])
     local earliest = redis.call("ZRANGEBYSCORE", KEYS[1], "-inf", now_us, "WITHSCORES", "LIMIT", 0, 1)
     if #earliest == 0 then return false end
     local ids = redis.call("ZRANGEBYSCORE", KEYS[1], earliest[2], earliest[2])
     for index = 1, #ids do
-        local raw_entry = redis.call("GET", KEYS[2] .. ids[index])
-        local ok, entry = pcall(cjson.decode, raw_entry)
-        if ok and type(entry) == "table" and entry.status == "queued" then
+        local entry = load_entry(KEYS[2] .. ids[index])
+        if entry and entry.status == "queued" then
             if ARGV[1] == "1" then redis.call("LPUSH", KEYS[3], ids[index])
             else redis.call("RPUSH", KEYS[3], ids[index]) end
             redis.call("ZREM", KEYS[1], ids[index])
@@ -644,8 +1039,11 @@ _PROMOTE_SCHEDULED_SCRIPT = b"""
     end
     return false
 """
+)
 
-_PROMOTE_SCHEDULED_PRIORITY_SCRIPT = b"""
+_PROMOTE_SCHEDULED_PRIORITY_SCRIPT = (
+    _ENTRY_LUA
+    + b"""
     local now = redis.call("TIME")
     local now_us = tonumber(now[1]) * 1000000 + tonumber(now[2])
     local earliest = redis.call("ZRANGEBYSCORE", KEYS[1], "-inf", now_us, "WITHSCORES", "LIMIT", 0, 1)
@@ -654,9 +1052,8 @@ _PROMOTE_SCHEDULED_PRIORITY_SCRIPT = b"""
     local selected_id
     local selected_priority
     for index = 1, #ids do
-        local raw_entry = redis.call("GET", KEYS[2] .. ids[index])
-        local ok, entry = pcall(cjson.decode, raw_entry)
-        if ok and type(entry) == "table" and entry.status == "queued" then
+        local entry = load_entry(KEYS[2] .. ids[index])
+        if entry and entry.status == "queued" then
             local priority = tonumber(entry.priority) or 0
             if not selected_id or priority > selected_priority then
                 selected_id, selected_priority = ids[index], priority
@@ -671,23 +1068,198 @@ _PROMOTE_SCHEDULED_PRIORITY_SCRIPT = b"""
     redis.call("ZREM", KEYS[1], selected_id)
     return selected_id
 """
+)
 
-_STORE_AND_DISCARD_SCRIPT = b"""
-    redis.call("SET", KEYS[1], ARGV[1])
+_STORE_AND_DISCARD_SCRIPT = (
+    _ENTRY_LUA
+    + b"""
+    write_entry(KEYS[1], ARGV[1])
+    if ARGV[3] ~= "" then redis.call("ZADD", KEYS[6], ARGV[3], ARGV[2]) end
     redis.call("LREM", KEYS[2], 0, ARGV[2])
     redis.call("ZREM", KEYS[3], ARGV[2])
     redis.call("ZREM", KEYS[5], ARGV[2])
     if redis.call("ZCARD", KEYS[3]) == 0 then redis.call("SET", KEYS[4], 0, "XX") end
 """
+)
+
+# Stores one entry and indexes it, for `astore` and `astore_event`: ARGV[3],
+# when not empty, scores it in KEYS[3] -- the finished-at index for a
+# terminal entry, the unclaimed-deadline index for an event.
+_STORE_SCRIPT = (
+    _ENTRY_LUA
+    + b"""
+    write_entry(KEYS[1], ARGV[1])
+    redis.call("ZADD", KEYS[2], 0, ARGV[2])
+    if ARGV[3] ~= "" then redis.call("ZADD", KEYS[3], ARGV[3], ARGV[2]) end
+"""
+)
+
+# Returns the record stored for each entry key in KEYS, or false for one that
+# is gone, whether the entry is stored as a string or a hash.
+_READ_SCRIPT = (
+    _ENTRY_LUA
+    + b"""
+    local records = {}
+    for index = 1, #KEYS do records[index] = entry_record(KEYS[index]) or false end
+    return records
+"""
+)
+
+# Pages entry IDs out of one or more lexically sorted ID indexes -- the entry
+# index, or the status indexes of a filtered listing -- and returns their
+# records, reading nothing beyond the page. KEYS are the indexes followed by
+# the entries prefix; ARGV[1] is the exclusive cursor ("" for none), ARGV[2]
+# the page size ("" for all) and ARGV[3] "1" to page from the newest ID down.
+# A member whose record has gone is dropped from every index on the way past.
+_LIST_SCRIPT = (
+    _ENTRY_LUA
+    + b"""
+    local prefix = KEYS[#KEYS]
+    local newest_first = ARGV[3] == "1"
+    local limit = tonumber(ARGV[2]) or -1
+    local entry_ids = {}
+    for index = 1, #KEYS - 1 do
+        local members
+        if newest_first then
+            local start = ARGV[1] == "" and "+" or "(" .. ARGV[1]
+            members = redis.call("ZREVRANGEBYLEX", KEYS[index], start, "-", "LIMIT", 0, limit)
+        else
+            local start = ARGV[1] == "" and "-" or "(" .. ARGV[1]
+            members = redis.call("ZRANGEBYLEX", KEYS[index], start, "+", "LIMIT", 0, limit)
+        end
+        for _, entry_id in ipairs(members) do entry_ids[#entry_ids + 1] = entry_id end
+    end
+    if #KEYS > 2 then
+        if newest_first then
+            table.sort(entry_ids, function(left, right) return left > right end)
+        else
+            table.sort(entry_ids)
+        end
+    end
+    local records = {}
+    for _, entry_id in ipairs(entry_ids) do
+        if limit >= 0 and #records >= limit then break end
+        local record = entry_record(prefix .. entry_id)
+        if record then
+            records[#records + 1] = record
+        else
+            for index = 1, #KEYS - 1 do redis.call("ZREM", KEYS[index], entry_id) end
+        end
+    end
+    return records
+"""
+)
+
+# Adds stored entries to the indexes kept for them, for entries stored before
+# those indexes existed: KEYS[1] is the entry ID index, KEYS[2] the finished-at
+# index, and the rest are entry keys. Each entry still stored is added to the ID
+# index and filed under the status index for its status. ARGV holds a status
+# and a finished-at score ("" for none) per entry key, as the caller read the
+# entry; the score is added only while the entry still has that status.
+_INDEX_ENTRIES_SCRIPT = (
+    _ENTRY_LUA
+    + b"""
+    for index = 3, #KEYS do
+        local entry_key = KEYS[index]
+        local record = entry_record(entry_key)
+        if record then
+            local entry_id = string.sub(entry_key, -36)
+            redis.call("ZADD", KEYS[1], "NX", 0, entry_id)
+            local status = record_status(record)
+            local prefix = string.sub(entry_key, 1, -37)
+            if status and not redis.call("ZSCORE", prefix .. "status:" .. status, entry_id) then
+                index_status(entry_key, status)
+            end
+            local score = ARGV[2 * index - 4]
+            if score ~= "" and status == ARGV[2 * index - 5] then
+                redis.call("ZADD", KEYS[2], "NX", score, entry_id)
+            end
+        end
+    end
+"""
+)
+
+# Rewrites an entry in a new record format, but only while it is stored
+# exactly as the caller read it, so a transition in between is never lost.
+_MIGRATE_SCRIPT = (
+    _ENTRY_LUA
+    + b"""
+    if entry_record(KEYS[1]) ~= ARGV[1] then return 0 end
+    write_entry(KEYS[1], ARGV[2])
+    return 1
+"""
+)
+
+# The batch form of the store-and-push scripts above: ARGV[4..] holds one
+# (entry ID, record, priority score, unclaimed deadline) group per entry, and
+# each group gets exactly the writes its single-entry script would make, in
+# order, so a batch lands as if enqueued one at a time. ARGV[1] selects the
+# priority store, ARGV[3] is an availability instant (empty when immediate),
+# and an empty deadline marks a tracked entry rather than an event.
+_STORE_MANY_SCRIPT = (
+    _WAKE_LUA
+    + _ENTRY_LUA
+    + b"""
+    local now_us
+    if ARGV[3] ~= "" then
+        local now = redis.call("TIME")
+        now_us = tonumber(now[1]) * 1000000 + tonumber(now[2])
+    end
+    for index = 4, #ARGV, 4 do
+        local entry_id = ARGV[index]
+        write_entry(KEYS[1] .. entry_id, ARGV[index + 1])
+        redis.call("ZADD", KEYS[6], 0, entry_id)
+        if ARGV[index + 3] ~= "" then
+            redis.call("ZADD", KEYS[7], ARGV[index + 3], entry_id)
+        end
+        if now_us and tonumber(ARGV[3]) > now_us then
+            redis.call("ZADD", KEYS[3], ARGV[3], entry_id)
+        elseif ARGV[1] == "1" then
+            local sequence = redis.call("INCR", KEYS[5])
+            redis.call("ZADD", KEYS[4], tonumber(ARGV[index + 2]) - sequence, entry_id)
+        elseif ARGV[2] == "1" then
+            redis.call("LPUSH", KEYS[2], entry_id)
+        else
+            redis.call("RPUSH", KEYS[2], entry_id)
+        end
+    end
+    wake(KEYS[8], (#ARGV - 3) / 4)
+"""
+)
 
-_STORE_EVENT_AND_PUSH_SCRIPT = b"""
-    redis.call("SET", KEYS[1], ARGV[1])
+_STORE_EVENT_AND_PUSH_SCRIPT = (
+    _WAKE_LUA
+    + _ENTRY_LUA
+    + b"""
+    write_entry(KEYS[1], ARGV[1])
+    redis.call("ZADD", KEYS[4], 0, ARGV[3])
     redis.call("ZADD", KEYS[2], ARGV[4], ARGV[3])
     if ARGV[2] == "1" then
         redis.call("LPUSH", KEYS[3], ARGV[3])
     else
         redis.call("RPUSH", KEYS[3], ARGV[3])
     end
+    wake(KEYS[5], 1)
+"""
+)
+
+# The earliest future instant at which scheduled or delayed work in KEYS
+# becomes claimable, in microseconds from Redis TIME, or false if none is
+# waiting. Due members are ignored: the worker's claim just passed them by.
+_NEXT_DUE_SCRIPT = b"""
+    local now = redis.call("TIME")
+    local now_us = tonumber(now[1]) * 1000000 + tonumber(now[2])
+    local due
+    for index = 1, #KEYS do
+        local earliest = redis.call(
+            "ZRANGEBYSCORE", KEYS[index], "(" .. now_us, "+inf", "WITHSCORES", "LIMIT", 0, 1
+        )
+        if #earliest > 0 and (due == nil or tonumber(earliest[2]) < due) then
+            due = tonumber(earliest[2])
+        end
+    end
+    if due == nil then return false end
+    return due - now_us
 """
 
 # adelete()'s contract is "remove entry_id from every store it could be
@@ -697,8 +1269,10 @@ _STORE_EVENT_AND_PUSH_SCRIPT = b"""
 # (EventQueue.aclear()) that has no way to resume or detect which entries
 # were only half-removed. One script closes the window the same way every
 # other multi-key mutation in this provider already does.
-_DELETE_SCRIPT = b"""
-    redis.call("DEL", KEYS[1])
+_DELETE_SCRIPT = (
+    _STATUS_INDEX_LUA
+    + b"""
+    delete_entry(KEYS[1])
     redis.call("LREM", KEYS[2], 0, ARGV[1])
     redis.call("ZREM", KEYS[3], ARGV[1])
     redis.call("ZREM", KEYS[4], ARGV[1])
@@ -706,10 +1280,28 @@ _DELETE_SCRIPT = b"""
     redis.call("DEL", KEYS[6])
     redis.call("ZREM", KEYS[7], ARGV[1])
     redis.call("ZREM", KEYS[9], ARGV[1])
+    redis.call("ZREM", KEYS[10], ARGV[1])
+    redis.call("ZREM", KEYS[11], ARGV[1])
     if redis.call("ZCARD", KEYS[7]) == 0 then
         redis.call("SET", KEYS[8], 0, "XX")
     end
 """
+)
+
+
+# A `SCAN` pattern matching every entry ID, and no other key's suffix.
+_ANY_ENTRY_ID = "????????-????-????-????-????????????"
+
+
+def _record_format(record: bytes | str) -> int | None:
+    """Return the marker a compact or hash record starts with, None for JSON."""
+    marker = record[0]
+    return marker if marker in (COMPACT_RECORD_MARKER, HASH_RECORD_MARKER) else None
+
+
+def _instant(microseconds: int) -> ClockTime:
+    """Return a script's `TIME` reading, in whole microseconds, as an instant."""
+    return ClockTime(*divmod(int(microseconds), MICROSECONDS_PER_SECOND))
 
 
 @dataclass(frozen=True, slots=True)
@@ -728,6 +1320,7 @@ class _Scripts:
     recover: Any
     recover_priority: Any
     prune: Any
+    prune_expired: Any
     push_priority: Any
     pop_priority: Any
     discard_priority: Any
@@ -738,9 +1331,35 @@ class _Scripts:
     promote_scheduled_priority: Any
     store_and_discard: Any
     store_event_and_push: Any
+    store_many: Any
+    store: Any
+    read: Any
+    migrate: Any
+    list: Any
+    index_entries: Any
+    next_due: Any
     delete: Any
 
 
+class _SlotTime:
+    """Read Redis `TIME` from the cluster node serving one key's slot.
+
+    A cluster sends a keyless `TIME` to any node, but a queue's scripts time
+    its leases and schedules on the node holding its keys.
+    """
+
+    def __init__(self, client: Any, key: str) -> None:
+        self._client = client
+        self._key = key
+
+    async def time(self) -> tuple[int, int]:
+        # A cluster client learns the slot map on its first command.
+        await self._client.initialize()
+        return await self._client.time(
+            target_nodes=self._client.get_node_from_key(self._key)
+        )
+
+
 class _RedisClockFacade:
     def __init__(self, provider: QueueProviderRedis) -> None:
         self._provider = provider
@@ -826,34 +1445,79 @@ class QueueProviderRedis:
                 "A Redis client with decode_responses cannot use a non-UTF-8 queue encoding"
             )
         self._redis_url = redis_url
+        self._pool_options = RedisPoolOptions.from_options(options)
+        self._publish_options = SnapshotBufferOptions.from_options(options)
         self.entry_class = entry_class
+        self.entry_codec = options.get("entry_codec") or JsonEntryCodec()
+        if not isinstance(self.entry_codec, EntryCodec):
+            raise InvalidQueueBackendError("Queue entry codec must be an EntryCodec")
+        if connection_kwargs.get("decode_responses", False) and not isinstance(
+            self.entry_codec, JsonEntryCodec
+        ):
+            raise InvalidQueueBackendError(
+                "A Redis client with decode_responses can only store JSON entry records"
+            )
         self._queue_name = options.get("queue_name", f"queue_{uuid.uuid4().hex}")
+        if self._pool_options.cluster:
+            if connection_kwargs.get("db", 0):
+                raise InvalidQueueBackendError(
+                    "A Redis Cluster URL cannot select a database"
+                )
+            if not self._queue_name:
+                raise InvalidQueueBackendError("Redis Cluster queues require a name")
+            # The braces make the queue name the hash tag of every entry key,
+            # so all of them -- including those a script builds from an entry
+            # ID -- fall in one cluster slot, on one node.
+            self._key_prefix = f"{{{self._queue_name}}}"
+        else:
+            self._key_prefix = self._queue_name
         self._stack = bool(options.get("stack", False))
         self._maxsize = options.get("maxsize", 0)
         self._connection_encoding = connection_kwargs.get("encoding", "utf-8")
-        self._entry_pending_name = f"{self._queue_name}:entries:pending"
+        self._entry_pending_name = f"{self._key_prefix}:entries:pending"
         self._entry_pending_priority_name = (
-            f"{self._queue_name}:entries:pending:priority"
+            f"{self._key_prefix}:entries:pending:priority"
         )
         self._entry_pending_priority_sequence_name = (
-            f"{self._queue_name}:entries:pending:priority:sequence"
+            f"{self._key_prefix}:entries:pending:priority:sequence"
         )
-        self._entry_delayed_name = f"{self._queue_name}:entries:delayed"
-        self._entry_scheduled_name = f"{self._queue_name}:entries:scheduled"
-        self._entry_claim_prefix = f"{self._queue_name}:entries:claims:"
-        self._entry_claim_deadlines_name = f"{self._queue_name}:entries:claim-leases"
+        self._entry_delayed_name = f"{self._key_prefix}:entries:delayed"
+        self._entry_scheduled_name = f"{self._key_prefix}:entries:scheduled"
+        # Every stored entry ID, all scored 0 so members sort lexically: the
+        # canonical text of a UUIDv7 sorts in creation order.
+        self._entry_index_name = f"{self._key_prefix}:entries:index"
+        # Terminal entry IDs scored by finished_at, in microseconds.
+        self._entry_finished_name = f"{self._key_prefix}:entries:finished"
+        # Tokens pushed as work becomes claimable; see `_WAKE_LUA`.
+        self._entry_wake_name = f"{self._key_prefix}:entries:wake"
+        self._entry_claim_prefix = f"{self._key_prefix}:entries:claims:"
+        self._entry_claim_deadlines_name = f"{self._key_prefix}:entries:claim-leases"
         self._entry_unclaimed_deadlines_name = (
-            f"{self._queue_name}:entries:unclaimed-leases"
+            f"{self._key_prefix}:entries:unclaimed-leases"
         )
         self._async_redis_by_loop: dict[asyncio.AbstractEventLoop, Any] = {}
+        # Clients for blocking reads; see `connection_pools.acquire_blocking`.
+        self._async_blocking_redis_by_loop: dict[asyncio.AbstractEventLoop, Any] = {}
         self._async_scripts_by_loop: dict[asyncio.AbstractEventLoop, _Scripts] = {}
         self._clocks_by_loop: dict[asyncio.AbstractEventLoop, RedisQueueClock] = {}
+        self._snapshot_buffers_by_loop: dict[
+            asyncio.AbstractEventLoop, SnapshotBuffer
+        ] = {}
         self._clock: QueueClock = _RedisClockFacade(self)
 
     @property
     def clock(self) -> QueueClock:
         return self._clock
 
+    def _encode_entry(self, entry: QueueEntry) -> bytes:
+        return self.entry_codec.encode(entry)
+
+    def _encode_changes(self, entry: QueueEntry) -> bytes:
+        return self.entry_codec.encode_changes(entry)
+
+    def _decode_entry(self, raw: bytes | str) -> QueueEntry:
+        return self.entry_codec.decode(raw, self.entry_class)
+
     @property
     def queue_name(self) -> str:
         return self._queue_name
@@ -930,7 +1594,7 @@ class QueueProviderRedis:
         """
         client = self._async_redis()
         keys = [self._queue_name]
-        async for key in client.scan_iter(match=f"{self._queue_name}:entries:*"):
+        async for key in client.scan_iter(match=f"{self._key_prefix}:entries:*"):
             keys.append(key)
         await client.delete(*keys)
 
@@ -986,8 +1650,31 @@ class QueueProviderRedis:
     async def aclear_priority(self) -> None:
         await self._async_redis().delete(self._queue_name)
 
-    def _entry_key(self, entry_id: uuid.UUID) -> str:
-        return f"{self._queue_name}:entries:{entry_id}"
+    def _entry_key(self, entry_id: uuid.UUID | str) -> str:
+        return f"{self._key_prefix}:entries:{entry_id}"
+
+    def _entry_status_index_name(self, status: QueueEntryStatus) -> str:
+        # Named by `index_status` in `_STATUS_INDEX_LUA`, from the entry key.
+        return f"{self._key_prefix}:entries:status:{status.value}"
+
+    @staticmethod
+    def _finished_score(entry: QueueEntry) -> int | None:
+        """Return a terminal entry's finished-at index score, in microseconds."""
+        if (
+            entry.finished_at is None
+            or QueueEntryStatus.TERMINATED not in entry.status.next_state()
+        ):
+            return None
+        return (
+            entry.finished_at.seconds * MICROSECONDS_PER_SECOND
+            + entry.finished_at.microseconds
+        )
+
+    def _finished_score_arg(self, entry: QueueEntry) -> bytes:
+        finished_score = self._finished_score(entry)
+        return (
+            b"" if finished_score is None else self.encode(str(finished_score), "ascii")
+        )
 
     def _claim_key(self, entry_id: uuid.UUID) -> bytes:
         return self.encode(
@@ -999,11 +1686,19 @@ class QueueProviderRedis:
         registered.sha = self.encode(registered.sha, "ascii")
         return registered
 
+    def _async_blocking_redis(self) -> Any:
+        loop = asyncio.get_running_loop()
+        if client := self._async_blocking_redis_by_loop.get(loop):
+            return client
+        client = connection_pools.acquire_blocking(self._redis_url, self._pool_options)
+        self._async_blocking_redis_by_loop[loop] = client
+        return client
+
     def _async_redis(self) -> Any:
         loop = asyncio.get_running_loop()
         if client := self._async_redis_by_loop.get(loop):
             return client
-        client = async_redis.from_url(self._redis_url)
+        client = connection_pools.acquire(self._redis_url, self._pool_options)
         self._async_redis_by_loop[loop] = client
         self._async_scripts_by_loop[loop] = _Scripts(
             claim=self._register_script(client, _CLAIM_SCRIPT),
@@ -1024,6 +1719,7 @@ class QueueProviderRedis:
                 client, _RECOVER_SCRIPT_WITH_PRIORITY
             ),
             prune=self._register_script(client, _PRUNE_SCRIPT),
+            prune_expired=self._register_script(client, _PRUNE_EXPIRED_SCRIPT),
             push_priority=self._register_script(client, _PUSH_PRIORITY_SCRIPT),
             pop_priority=self._register_script(client, _POP_PRIORITY_SCRIPT),
             discard_priority=self._register_script(client, _DISCARD_PRIORITY_SCRIPT),
@@ -1040,69 +1736,123 @@ class QueueProviderRedis:
             store_event_and_push=self._register_script(
                 client, _STORE_EVENT_AND_PUSH_SCRIPT
             ),
+            store_many=self._register_script(client, _STORE_MANY_SCRIPT),
+            store=self._register_script(client, _STORE_SCRIPT),
+            read=self._register_script(client, _READ_SCRIPT),
+            migrate=self._register_script(client, _MIGRATE_SCRIPT),
+            list=self._register_script(client, _LIST_SCRIPT),
+            index_entries=self._register_script(client, _INDEX_ENTRIES_SCRIPT),
+            next_due=self._register_script(client, _NEXT_DUE_SCRIPT),
             delete=self._register_script(client, _DELETE_SCRIPT),
         )
         return client
 
     async def aobserve(self, on_snapshot) -> None:
         """Receive and decode lifecycle snapshots through provider-owned Pub/Sub."""
-        client = async_redis.from_url(self._redis_url)
-        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        client = connection_pools.acquire_blocking(self._redis_url, self._pool_options)
         try:
-            await pubsub.subscribe(self.lifecycle_channel)
-            async for message in pubsub.listen():
-                if message["type"] != "message":
-                    continue
-                try:
-                    entry = self.entry_class.from_dict(json.loads(message["data"]))
-                except Exception:
-                    logger.exception(
-                        "Ignoring invalid queue lifecycle snapshot",
-                        extra={"queue": self._queue_name},
-                    )
-                    continue
-                on_snapshot(entry)
+            if self._pool_options.cluster:
+                # A cluster client learns the slot map on its first command,
+                # and cannot subscribe without it.
+                await client.initialize()
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.lifecycle_channel)
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    try:
+                        entry = self._decode_entry(message["data"])
+                    except Exception:
+                        logger.exception(
+                            "Ignoring invalid queue lifecycle snapshot",
+                            extra={"queue": self._queue_name},
+                        )
+                        continue
+                    on_snapshot(entry)
+            finally:
+                await pubsub.aclose()
         finally:
-            await pubsub.aclose()
-            await client.aclose()
+            await connection_pools.arelease(client)
 
     async def apublish(self, entry: QueueEntry) -> None:
-        await self._async_redis().publish(
-            self.lifecycle_channel, json.dumps(entry.to_dict())
+        """Buffer a lifecycle snapshot; see `django_queue.backends.redis.publishing`."""
+        self._snapshot_buffer().submit(self._encode_entry(entry))
+
+    async def apublish_many(self, entries: list[QueueEntry]) -> None:
+        buffer = self._snapshot_buffer()
+        for entry in entries:
+            buffer.submit(self._encode_entry(entry))
+
+    def _snapshot_buffer(self) -> SnapshotBuffer:
+        loop = asyncio.get_running_loop()
+        if buffer := self._snapshot_buffers_by_loop.get(loop):
+            return buffer
+        buffer = SnapshotBuffer(
+            self._async_redis(), self.lifecycle_channel, self._publish_options
         )
+        self._snapshot_buffers_by_loop[loop] = buffer
+        return buffer
+
+    async def _aflush_snapshots(self) -> None:
+        """Send buffered snapshots ahead of any a script is about to publish."""
+        if buffer := self._snapshot_buffers_by_loop.get(asyncio.get_running_loop()):
+            await buffer.aflush()
 
     def _async_clock(self) -> RedisQueueClock:
         loop = asyncio.get_running_loop()
         if clock := self._clocks_by_loop.get(loop):
             return clock
-        clock = RedisQueueClock(self._async_redis(), asynchronous=True)
+        client = self._async_redis()
+        clock = RedisQueueClock(
+            _SlotTime(client, self._entry_index_name)
+            if self._pool_options.cluster
+            else client,
+            asynchronous=True,
+        )
         self._clocks_by_loop[loop] = clock
         return clock
 
     async def astore(self, entry: QueueEntry) -> None:
         if entry.status is QueueEntryStatus.TERMINATED:
             raise TypeError("Terminated queue entry snapshots cannot be stored")
-        await self._async_redis().set(
-            self._entry_key(entry.id),
-            self.encode(json.dumps(entry.to_dict()), "ascii"),
+        self._async_redis()
+        await self._async_scripts_by_loop[asyncio.get_running_loop()].store(
+            keys=(
+                self._entry_key(entry.id),
+                self._entry_index_name,
+                self._entry_finished_name,
+            ),
+            args=(
+                self._encode_entry(entry),
+                self.encode(str(entry.id), "ascii"),
+                self._finished_score_arg(entry),
+            ),
         )
 
     async def astore_event(self, entry: QueueEntry) -> None:
         if entry.timeout_seconds is None:
             raise ValueError("Event entries require a resolved lifetime")
-        client = self._async_redis()
-        await client.set(
-            self._entry_key(entry.id),
-            self.encode(json.dumps(entry.to_dict()), "ascii"),
-        )
-        await client.zadd(
-            self._entry_unclaimed_deadlines_name,
-            {
-                str(entry.id): round(
-                    (entry.queued_at + entry.timeout_seconds).to_timestamp()
-                    * MICROSECONDS_PER_SECOND
-                )
-            },
+        self._async_redis()
+        await self._async_scripts_by_loop[asyncio.get_running_loop()].store(
+            keys=(
+                self._entry_key(entry.id),
+                self._entry_index_name,
+                self._entry_unclaimed_deadlines_name,
+            ),
+            args=(
+                self._encode_entry(entry),
+                self.encode(str(entry.id), "ascii"),
+                self.encode(
+                    str(
+                        round(
+                            (entry.queued_at + entry.timeout_seconds).to_timestamp()
+                            * MICROSECONDS_PER_SECOND
+                        )
+                    ),
+                    "ascii",
+                ),
+            ),
         )
 
     async def astore_and_push(self, entry: QueueEntry) -> None:
@@ -1117,9 +1867,14 @@ class QueueProviderRedis:
             raise TypeError("Terminated queue entry snapshots cannot be stored")
         self._async_redis()
         await self._async_scripts_by_loop[asyncio.get_running_loop()].store_and_push(
-            keys=(self._entry_key(entry.id), self._entry_pending_name),
+            keys=(
+                self._entry_key(entry.id),
+                self._entry_pending_name,
+                self._entry_index_name,
+                self._entry_wake_name,
+            ),
             args=(
-                self.encode(json.dumps(entry.to_dict()), "ascii"),
+                self._encode_entry(entry),
                 b"1" if self._stack else b"0",
                 self.encode(str(entry.id), "ascii"),
             ),
@@ -1139,9 +1894,11 @@ class QueueProviderRedis:
                 self._entry_key(entry.id),
                 self._entry_pending_priority_name,
                 self._entry_pending_priority_sequence_name,
+                self._entry_index_name,
+                self._entry_wake_name,
             ),
             args=(
-                self.encode(json.dumps(entry.to_dict()), "ascii"),
+                self._encode_entry(entry),
                 self.encode(str(entry.id), "ascii"),
                 self.encode(str(entry.priority * _PRIORITY_SEQUENCE_SPACE), "ascii"),
             ),
@@ -1163,9 +1920,11 @@ class QueueProviderRedis:
                 self._entry_scheduled_name,
                 self._entry_pending_priority_name,
                 self._entry_pending_priority_sequence_name,
+                self._entry_index_name,
+                self._entry_wake_name,
             ),
             args=(
-                self.encode(json.dumps(entry.to_dict()), "ascii"),
+                self._encode_entry(entry),
                 self.encode(str(entry.id), "ascii"),
                 self.encode(
                     str(
@@ -1180,6 +1939,91 @@ class QueueProviderRedis:
             ),
         )
 
+    async def astore_and_push_many(
+        self,
+        entries: list[QueueEntry],
+        *,
+        available_at: ClockTime | None = None,
+        priority: bool = False,
+    ) -> None:
+        """Atomically store and push a batch of new entries in one script call.
+
+        Equivalent to `astore_and_push`, `astore_and_push_priority` or
+        `astore_available` for each entry in turn -- see `_STORE_MANY_SCRIPT`.
+        """
+        for entry in entries:
+            if entry.status is QueueEntryStatus.TERMINATED:
+                raise TypeError("Terminated queue entry snapshots cannot be stored")
+            if priority:
+                validate_redis_priority_magnitude(entry.priority)
+        await self._astore_many(
+            entries, available_at=available_at, priority=priority, event=False
+        )
+
+    async def astore_event_and_push_many(self, entries: list[QueueEntry]) -> None:
+        """Like `astore_event_and_push`, for a batch of new events."""
+        if any(entry.timeout_seconds is None for entry in entries):
+            raise ValueError("Event entries require a resolved lifetime")
+        await self._astore_many(entries, available_at=None, priority=False, event=True)
+
+    async def _astore_many(
+        self,
+        entries: list[QueueEntry],
+        *,
+        available_at: ClockTime | None,
+        priority: bool,
+        event: bool,
+    ) -> None:
+        if not entries:
+            return
+        args = [
+            b"1" if priority else b"0",
+            b"1" if self._stack else b"0",
+            b""
+            if available_at is None
+            else self.encode(
+                str(
+                    available_at.seconds * MICROSECONDS_PER_SECOND
+                    + available_at.microseconds
+                ),
+                "ascii",
+            ),
+        ]
+        for entry in entries:
+            deadline = b""
+            if event:
+                if (lifetime := entry.timeout_seconds) is None:
+                    raise ValueError("Event entries require a resolved lifetime")
+                deadline = self.encode(
+                    str(
+                        round(
+                            (entry.queued_at + lifetime).to_timestamp()
+                            * MICROSECONDS_PER_SECOND
+                        )
+                    ),
+                    "ascii",
+                )
+            args += (
+                self.encode(str(entry.id), "ascii"),
+                self._encode_entry(entry),
+                self.encode(str(entry.priority * _PRIORITY_SEQUENCE_SPACE), "ascii"),
+                deadline,
+            )
+        self._async_redis()
+        await self._async_scripts_by_loop[asyncio.get_running_loop()].store_many(
+            keys=(
+                self.encode(f"{self._key_prefix}:entries:", self._connection_encoding),
+                self._entry_pending_name,
+                self._entry_scheduled_name,
+                self._entry_pending_priority_name,
+                self._entry_pending_priority_sequence_name,
+                self._entry_index_name,
+                self._entry_unclaimed_deadlines_name,
+                self._entry_wake_name,
+            ),
+            args=args,
+        )
+
     async def astore_and_discard(self, entry: QueueEntry) -> None:
         self._async_redis()
         await self._async_scripts_by_loop[asyncio.get_running_loop()].store_and_discard(
@@ -1189,10 +2033,12 @@ class QueueProviderRedis:
                 self._entry_pending_priority_name,
                 self._entry_pending_priority_sequence_name,
                 self._entry_scheduled_name,
+                self._entry_finished_name,
             ),
             args=(
-                self.encode(json.dumps(entry.to_dict()), "ascii"),
+                self._encode_entry(entry),
                 self.encode(str(entry.id), "ascii"),
+                self._finished_score_arg(entry),
             ),
         )
 
@@ -1211,9 +2057,11 @@ class QueueProviderRedis:
                 self._entry_key(entry.id),
                 self._entry_unclaimed_deadlines_name,
                 self._entry_pending_name,
+                self._entry_index_name,
+                self._entry_wake_name,
             ),
             args=(
-                self.encode(json.dumps(entry.to_dict()), "ascii"),
+                self._encode_entry(entry),
                 b"1" if self._stack else b"0",
                 self.encode(str(entry.id), "ascii"),
                 self.encode(
@@ -1228,11 +2076,21 @@ class QueueProviderRedis:
             ),
         )
 
+    async def _aread(self, keys: list) -> list[bytes | None]:
+        """Return the record stored under each entry key, or None if gone.
+
+        Entries may be stored as strings or hashes; see `_READ_SCRIPT`.
+        """
+        self._async_redis()
+        return await self._async_scripts_by_loop[asyncio.get_running_loop()].read(
+            keys=keys
+        )
+
     async def afind(self, entry_id: uuid.UUID) -> QueueEntry:
-        raw = await self._async_redis().get(self._entry_key(entry_id))
+        (raw,) = await self._aread([self._entry_key(entry_id)])
         if raw is None:
             raise QueueEntryNotFoundError(entry_id)
-        return self.entry_class.from_dict(json.loads(raw))
+        return self._decode_entry(raw)
 
     async def adelete(self, entry_id: uuid.UUID) -> None:
         """Atomically remove entry_id from every store it could be sitting
@@ -1260,6 +2118,8 @@ class QueueProviderRedis:
                 self._entry_pending_priority_name,
                 self._entry_pending_priority_sequence_name,
                 self._entry_scheduled_name,
+                self._entry_index_name,
+                self._entry_finished_name,
             ),
             args=(entry_id_value,),
         )
@@ -1276,6 +2136,7 @@ class QueueProviderRedis:
                     self._entry_delayed_name,
                     self._entry_claim_deadlines_name,
                     self._entry_unclaimed_deadlines_name,
+                    self._entry_index_name,
                 ),
                 args=(self.encode(str(entry_id), "ascii"),),
             )
@@ -1298,17 +2159,69 @@ class QueueProviderRedis:
     async def alist(self) -> list[QueueEntry]:
         client = self._async_redis()
         keys = []
-        match = f"{self._queue_name}:entries:????????-????-????-????-????????????"
-        async for key in client.scan_iter(match=match):
+        async for key in client.scan_iter(match=self._entry_key(_ANY_ENTRY_ID)):
             keys.append(key)
         if not keys:
             return []
         return [
-            self.entry_class.from_dict(json.loads(raw))
-            for raw in await client.mget(keys)
+            self._decode_entry(raw)
+            for raw in await self._aread(keys)
             if raw is not None
         ]
 
+    async def alist_after(
+        self,
+        after: uuid.UUID | None,
+        limit: int | None,
+        *,
+        statuses: Collection[QueueEntryStatus] | None = None,
+        newest_first: bool = False,
+    ) -> list[QueueEntry]:
+        """Return up to ``limit`` entries past ``after``, in ID order.
+
+        With ``statuses``, only entries in one of them; with ``newest_first``,
+        entries with IDs below ``after``, highest first. Reads the entry
+        index, or the status indexes, in one script rather than scanning the
+        keyspace, so the cost follows the size of the page, not the number
+        of retained records.
+        """
+        if statuses is None:
+            indexes = [self._entry_index_name]
+        elif not statuses:
+            return []
+        else:
+            indexes = [self._entry_status_index_name(status) for status in statuses]
+        self._async_redis()
+        raw_entries = await self._async_scripts_by_loop[
+            asyncio.get_running_loop()
+        ].list(
+            keys=[*indexes, f"{self._key_prefix}:entries:"],
+            args=(
+                b"" if after is None else self.encode(str(after), "ascii"),
+                b"" if limit is None else self.encode(str(limit), "ascii"),
+                b"1" if newest_first else b"0",
+            ),
+        )
+        return [self._decode_entry(raw) for raw in raw_entries]
+
+    async def await_pending(self, timeout: float) -> None:
+        """Block until work is pushed, scheduled work falls due, or *timeout*
+        seconds elapse -- whichever comes first.
+
+        Consumes one wake token (see `_WAKE_LUA`), so a burst of N entries
+        wakes at most N idle workers rather than every one of them.
+        """
+        self._async_redis()
+        due_us = await self._async_scripts_by_loop[asyncio.get_running_loop()].next_due(
+            keys=(self._entry_scheduled_name, self._entry_delayed_name)
+        )
+        if due_us is not None:
+            timeout = min(timeout, int(due_us) / MICROSECONDS_PER_SECOND)
+        if timeout > 0:
+            await self._async_blocking_redis().blpop(
+                [self._entry_wake_name], timeout=timeout
+            )
+
     async def apush(self, entry_id: uuid.UUID) -> None:
         await self._async_redis().rpush(
             self._entry_pending_name, self.encode(str(entry_id), "ascii")
@@ -1320,7 +2233,7 @@ class QueueProviderRedis:
         await self._async_scripts_by_loop[asyncio.get_running_loop()].promote_scheduled(
             keys=(
                 self._entry_scheduled_name,
-                self.encode(f"{self._queue_name}:entries:", self._connection_encoding),
+                self.encode(f"{self._key_prefix}:entries:", self._connection_encoding),
                 self._entry_pending_name,
             ),
             args=(b"1" if self._stack else b"0",),
@@ -1334,7 +2247,7 @@ class QueueProviderRedis:
         ].promote_scheduled_priority(
             keys=(
                 self._entry_scheduled_name,
-                self.encode(f"{self._queue_name}:entries:", self._connection_encoding),
+                self.encode(f"{self._key_prefix}:entries:", self._connection_encoding),
                 self._entry_pending_priority_name,
                 self._entry_pending_priority_sequence_name,
             ),
@@ -1463,6 +2376,199 @@ class QueueProviderRedis:
             worker_id, lease_seconds, expire_unclaimed=True
         )
 
+    async def aclaim_many(
+        self, worker_id: uuid.UUID, lease_seconds: float | None, limit: int
+    ) -> list[QueueEntry]:
+        """Claim up to ``limit`` entries, in delivery order, in one script call.
+
+        Returns fewer, possibly none, once pending work runs out or the next
+        entry is claimed elsewhere. See `_CLAIM_MANY_LUA`.
+        """
+        return await self._aclaim_many(
+            worker_id, lease_seconds, limit, expire_unclaimed=False, priority=False
+        )
+
+    async def aclaim_many_unexpired(
+        self, worker_id: uuid.UUID, lease_seconds: float | None, limit: int
+    ) -> list[QueueEntry]:
+        return await self._aclaim_many(
+            worker_id, lease_seconds, limit, expire_unclaimed=True, priority=False
+        )
+
+    async def aclaim_many_priority(
+        self, worker_id: uuid.UUID, lease_seconds: float | None, limit: int
+    ) -> list[QueueEntry]:
+        """Like `aclaim_many`, through `_CLAIM_SCRIPT_WITH_PRIORITY`."""
+        return await self._aclaim_many(
+            worker_id, lease_seconds, limit, expire_unclaimed=False, priority=True
+        )
+
+    async def aclaim_and_start(
+        self,
+        worker_id: uuid.UUID,
+        *,
+        budget_seconds: float | None,
+        default_budget_seconds: float,
+        grace_seconds: float,
+        published_through: uuid.UUID | None,
+    ) -> QueueEntry:
+        """Claim the next entry and start it in the same script call.
+
+        The lease is `budget_seconds` (or, when that is None, the entry's own
+        `timeout_seconds`, else `default_budget_seconds`) plus
+        `grace_seconds`. A claimed QUEUED record is moved to RUNNING with a
+        Redis `TIME` dispatch instant and published, preceded by its QUEUED
+        snapshot unless its ID is within `published_through`. The returned
+        entry is RUNNING when that happened; otherwise it is the claimed
+        record as stored, for the caller to start itself. See
+        `_START_CLAIMED_LUA`.
+        """
+        await self._aflush_snapshots()
+        return await self._aclaim(
+            worker_id,
+            None,
+            expire_unclaimed=False,
+            start=self._claim_start_arg(
+                budget_seconds, default_budget_seconds, grace_seconds, published_through
+            ),
+        )
+
+    async def aclaim_priority_and_start(
+        self,
+        worker_id: uuid.UUID,
+        *,
+        budget_seconds: float | None,
+        default_budget_seconds: float,
+        grace_seconds: float,
+        published_through: uuid.UUID | None,
+    ) -> QueueEntry:
+        """Like `aclaim_and_start`, through `_CLAIM_SCRIPT_WITH_PRIORITY`."""
+        await self._aflush_snapshots()
+        return await self._aclaim_priority(
+            worker_id,
+            None,
+            expire_unclaimed=False,
+            start=self._claim_start_arg(
+                budget_seconds, default_budget_seconds, grace_seconds, published_through
+            ),
+        )
+
+    def _claim_start_arg(
+        self,
+        budget_seconds: float | None,
+        default_budget_seconds: float,
+        grace_seconds: float,
+        published_through: uuid.UUID | None,
+    ) -> bytes:
+        return self.encode(
+            json.dumps(
+                {
+                    "budget_us": None
+                    if budget_seconds is None
+                    else round(
+                        validate_budget(budget_seconds) * MICROSECONDS_PER_SECOND
+                    ),
+                    "default_budget_us": round(
+                        validate_budget(default_budget_seconds)
+                        * MICROSECONDS_PER_SECOND
+                    ),
+                    "grace_us": round(grace_seconds * MICROSECONDS_PER_SECOND),
+                    "published_through": None
+                    if published_through is None
+                    else str(published_through),
+                    "channel": self.lifecycle_channel,
+                }
+            ),
+            "ascii",
+        )
+
+    async def _aclaim_many(
+        self,
+        worker_id: uuid.UUID,
+        lease_seconds: float | None,
+        limit: int,
+        *,
+        expire_unclaimed: bool,
+        priority: bool,
+    ) -> list[QueueEntry]:
+        if type(limit) is not int or limit <= 0:
+            raise ValueError("Claim batch size must be a positive integer")
+        lease_seconds = (
+            600.0 if lease_seconds is None else validate_budget(lease_seconds)
+        )
+        client = self._async_redis()
+        scripts = self._async_scripts_by_loop[asyncio.get_running_loop()]
+        args = (
+            self.encode(str(worker_id), "ascii"),
+            self.encode(str(round(lease_seconds * MICROSECONDS_PER_SECOND)), "ascii"),
+            b"1" if self._stack else b"0",
+            b"1" if expire_unclaimed else b"0",
+        )
+        if priority:
+            raw_entries = await scripts.claim_priority(
+                keys=(
+                    self._entry_pending_name,
+                    self._entry_delayed_name,
+                    self.encode(self._entry_claim_prefix, self._connection_encoding),
+                    self._entry_claim_deadlines_name,
+                    self.encode(
+                        f"{self._key_prefix}:entries:", self._connection_encoding
+                    ),
+                    self._entry_unclaimed_deadlines_name,
+                    self._entry_pending_priority_name,
+                    self._entry_pending_priority_sequence_name,
+                    self._entry_scheduled_name,
+                    self._entry_index_name,
+                ),
+                args=(
+                    *args,
+                    self.encode(str(_PRIORITY_SEQUENCE_SPACE), "ascii"),
+                    b"",
+                    self.encode(str(limit), "ascii"),
+                ),
+                client=client,
+            )
+        else:
+            raw_entries = await scripts.claim(
+                keys=(
+                    self._entry_pending_name,
+                    self._entry_delayed_name,
+                    self.encode(self._entry_claim_prefix, self._connection_encoding),
+                    self._entry_claim_deadlines_name,
+                    self.encode(
+                        f"{self._key_prefix}:entries:", self._connection_encoding
+                    ),
+                    self._entry_unclaimed_deadlines_name,
+                    self._entry_scheduled_name,
+                    self._entry_index_name,
+                ),
+                args=(*args, b"", self.encode(str(limit), "ascii")),
+                client=client,
+            )
+        return [self._decode_entry(raw) for raw in raw_entries]
+
+    async def _claimed_entry(self, reply: list[Any]) -> QueueEntry:
+        """Turn a claim script's reply into the claimed entry or an error."""
+        self._async_clock().observe(_instant(reply[2]))
+        outcome = self.decode(reply[0], "ascii")
+        if outcome == "empty":
+            raise QueueEmptyException
+        entry_id = uuid.UUID(self.decode(reply[1], "ascii"))
+        if outcome == "conflict":
+            raise QueueClaimConflictError(entry_id)
+        if outcome == "expired":
+            raise QueueEntryExpiredError(entry_id)
+        if outcome not in {"claimed", "started"}:
+            raise QueueValueError(f"Unknown Redis claim outcome: {outcome!r}")
+        if len(reply) > 3:
+            if not reply[3]:
+                raise QueueEntryMissingError(entry_id)
+            return self._decode_entry(reply[3])
+        try:
+            return await self.afind(entry_id)
+        except QueueEntryNotFoundError as exc:
+            raise QueueEntryMissingError(entry_id) from exc
+
     async def adequeue(self) -> QueueEntry:
         """Atomically remove and return the next unclaimed live event."""
         client = self._async_redis()
@@ -1474,8 +2580,9 @@ class QueueProviderRedis:
                 self._entry_delayed_name,
                 self.encode(self._entry_claim_prefix, self._connection_encoding),
                 self._entry_claim_deadlines_name,
-                self.encode(f"{self._queue_name}:entries:", self._connection_encoding),
+                self.encode(f"{self._key_prefix}:entries:", self._connection_encoding),
                 self._entry_unclaimed_deadlines_name,
+                self._entry_index_name,
             ),
             args=(b"1" if self._stack else b"0",),
             client=client,
@@ -1485,7 +2592,7 @@ class QueueProviderRedis:
             raise QueueEmptyException
         if outcome != "dequeued":
             raise QueueValueError(f"Unknown Redis event dequeue outcome: {outcome!r}")
-        return self.entry_class.from_dict(json.loads(raw_entry))
+        return self._decode_entry(raw_entry)
 
     async def _aclaim(
         self,
@@ -1493,21 +2600,23 @@ class QueueProviderRedis:
         lease_seconds: float | None,
         *,
         expire_unclaimed: bool,
+        start: bytes = b"",
     ) -> QueueEntry:
         lease_seconds = (
             600.0 if lease_seconds is None else validate_budget(lease_seconds)
         )
         client = self._async_redis()
         scripts = self._async_scripts_by_loop[asyncio.get_running_loop()]
-        outcome, raw_entry_id = await scripts.claim(
+        reply = await scripts.claim(
             keys=(
                 self._entry_pending_name,
                 self._entry_delayed_name,
                 self.encode(self._entry_claim_prefix, self._connection_encoding),
                 self._entry_claim_deadlines_name,
-                self.encode(f"{self._queue_name}:entries:", self._connection_encoding),
+                self.encode(f"{self._key_prefix}:entries:", self._connection_encoding),
                 self._entry_unclaimed_deadlines_name,
                 self._entry_scheduled_name,
+                self._entry_index_name,
             ),
             args=(
                 self.encode(str(worker_id), "ascii"),
@@ -1516,23 +2625,12 @@ class QueueProviderRedis:
                 ),
                 b"1" if self._stack else b"0",
                 b"1" if expire_unclaimed else b"0",
+                start,
+                b"",
             ),
             client=client,
         )
-        outcome = self.decode(outcome, "ascii")
-        if outcome == "empty":
-            raise QueueEmptyException
-        entry_id = uuid.UUID(self.decode(raw_entry_id, "ascii"))
-        if outcome == "conflict":
-            raise QueueClaimConflictError(entry_id)
-        if outcome == "expired":
-            raise QueueEntryExpiredError(entry_id)
-        if outcome != "claimed":
-            raise QueueValueError(f"Unknown Redis claim outcome: {outcome!r}")
-        try:
-            return await self.afind(entry_id)
-        except QueueEntryNotFoundError as exc:
-            raise QueueEntryMissingError(entry_id) from exc
+        return await self._claimed_entry(reply)
 
     async def _aclaim_priority(
         self,
@@ -1540,23 +2638,25 @@ class QueueProviderRedis:
         lease_seconds: float | None,
         *,
         expire_unclaimed: bool,
+        start: bytes = b"",
     ) -> QueueEntry:
         lease_seconds = (
             600.0 if lease_seconds is None else validate_budget(lease_seconds)
         )
         client = self._async_redis()
         scripts = self._async_scripts_by_loop[asyncio.get_running_loop()]
-        outcome, raw_entry_id = await scripts.claim_priority(
+        reply = await scripts.claim_priority(
             keys=(
                 self._entry_pending_name,
                 self._entry_delayed_name,
                 self.encode(self._entry_claim_prefix, self._connection_encoding),
                 self._entry_claim_deadlines_name,
-                self.encode(f"{self._queue_name}:entries:", self._connection_encoding),
+                self.encode(f"{self._key_prefix}:entries:", self._connection_encoding),
                 self._entry_unclaimed_deadlines_name,
                 self._entry_pending_priority_name,
                 self._entry_pending_priority_sequence_name,
                 self._entry_scheduled_name,
+                self._entry_index_name,
             ),
             args=(
                 self.encode(str(worker_id), "ascii"),
@@ -1566,23 +2666,12 @@ class QueueProviderRedis:
                 b"1" if self._stack else b"0",
                 b"1" if expire_unclaimed else b"0",
                 self.encode(str(_PRIORITY_SEQUENCE_SPACE), "ascii"),
+                start,
+                b"",
             ),
             client=client,
         )
-        outcome = self.decode(outcome, "ascii")
-        if outcome == "empty":
-            raise QueueEmptyException
-        entry_id = uuid.UUID(self.decode(raw_entry_id, "ascii"))
-        if outcome == "conflict":
-            raise QueueClaimConflictError(entry_id)
-        if outcome == "expired":
-            raise QueueEntryExpiredError(entry_id)
-        if outcome != "claimed":
-            raise QueueValueError(f"Unknown Redis claim outcome: {outcome!r}")
-        try:
-            return await self.afind(entry_id)
-        except QueueEntryNotFoundError as exc:
-            raise QueueEntryMissingError(entry_id) from exc
+        return await self._claimed_entry(reply)
 
     async def arenew(
         self, entry_id: uuid.UUID, worker_id: uuid.UUID, lease_seconds: float
@@ -1614,6 +2703,7 @@ class QueueProviderRedis:
                     self._entry_claim_deadlines_name,
                     self._entry_delayed_name,
                     self._entry_unclaimed_deadlines_name,
+                    self._entry_wake_name,
                 ),
                 args=(
                     self.encode(str(worker_id), "ascii"),
@@ -1648,9 +2738,10 @@ class QueueProviderRedis:
                     self._entry_unclaimed_deadlines_name,
                     self._entry_pending_priority_name,
                     self.encode(
-                        f"{self._queue_name}:entries:", self._connection_encoding
+                        f"{self._key_prefix}:entries:", self._connection_encoding
                     ),
                     self._entry_pending_priority_sequence_name,
+                    self._entry_wake_name,
                 ),
                 args=(
                     self.encode(str(worker_id), "ascii"),
@@ -1671,6 +2762,8 @@ class QueueProviderRedis:
                     self._entry_pending_name,
                     self._entry_key(entry_id),
                     self._entry_unclaimed_deadlines_name,
+                    self._entry_index_name,
+                    self._entry_finished_name,
                 ),
                 args=(
                     self.encode(str(worker_id), "ascii"),
@@ -1693,32 +2786,44 @@ class QueueProviderRedis:
 
     async def amark_running(self, worker_id: uuid.UUID, entry: QueueEntry) -> bool:
         self._async_redis()
-        return bool(
-            await self._async_scripts_by_loop[asyncio.get_running_loop()].mark_running(
-                keys=(self._claim_key(entry.id), self._entry_key(entry.id)),
-                args=(
-                    self.encode(str(worker_id), "ascii"),
-                    self.encode(json.dumps(entry.to_dict()), "ascii"),
-                ),
-            )
+        mark_running = self._async_scripts_by_loop[
+            asyncio.get_running_loop()
+        ].mark_running
+        keys = (self._claim_key(entry.id), self._entry_key(entry.id))
+        worker = self.encode(str(worker_id), "ascii")
+        outcome = await mark_running(
+            keys=keys, args=(worker, self._encode_changes(entry))
         )
+        if outcome == -1:
+            # Still stored as a string, so it needs the whole record.
+            outcome = await mark_running(
+                keys=keys, args=(worker, self._encode_entry(entry))
+            )
+        return outcome == 1
 
     async def asettle(self, worker_id: uuid.UUID, entry: QueueEntry) -> bool:
         self._async_redis()
-        return bool(
-            await self._async_scripts_by_loop[asyncio.get_running_loop()].settle(
-                keys=(
-                    self._claim_key(entry.id),
-                    self._entry_claim_deadlines_name,
-                    self._entry_key(entry.id),
-                ),
-                args=(
-                    self.encode(str(worker_id), "ascii"),
-                    self.encode(str(entry.id), "ascii"),
-                    self.encode(json.dumps(entry.to_dict()), "ascii"),
-                ),
-            )
+        settle = self._async_scripts_by_loop[asyncio.get_running_loop()].settle
+        keys = (
+            self._claim_key(entry.id),
+            self._entry_claim_deadlines_name,
+            self._entry_key(entry.id),
+            self._entry_finished_name,
+        )
+        args = (
+            self.encode(str(worker_id), "ascii"),
+            self.encode(str(entry.id), "ascii"),
+        )
+        finished_score = self._finished_score_arg(entry)
+        outcome = await settle(
+            keys=keys, args=(*args, self._encode_changes(entry), finished_score)
         )
+        if outcome == -1:
+            # Still stored as a string, so it needs the whole record.
+            outcome = await settle(
+                keys=keys, args=(*args, self._encode_entry(entry), finished_score)
+            )
+        return outcome == 1
 
     async def arecover(self, batch_size: int) -> tuple[int, int]:
         if type(batch_size) is not int or batch_size <= 0:
@@ -1731,7 +2836,7 @@ class QueueProviderRedis:
                 self._entry_claim_deadlines_name,
                 self.encode(self._entry_claim_prefix, self._connection_encoding),
                 self._entry_pending_name,
-                self.encode(f"{self._queue_name}:entries:", self._connection_encoding),
+                self.encode(f"{self._key_prefix}:entries:", self._connection_encoding),
                 self._entry_unclaimed_deadlines_name,
             ),
             args=(
@@ -1755,7 +2860,7 @@ class QueueProviderRedis:
                 self._entry_claim_deadlines_name,
                 self.encode(self._entry_claim_prefix, self._connection_encoding),
                 self._entry_pending_name,
-                self.encode(f"{self._queue_name}:entries:", self._connection_encoding),
+                self.encode(f"{self._key_prefix}:entries:", self._connection_encoding),
                 self._entry_unclaimed_deadlines_name,
                 self._entry_pending_priority_name,
                 self._entry_pending_priority_sequence_name,
@@ -1774,19 +2879,123 @@ class QueueProviderRedis:
             raise ValueError("Only terminal queue entries can be pruned")
         self._async_redis()
         outcome = await self._async_scripts_by_loop[asyncio.get_running_loop()].prune(
-            keys=(self._entry_key(entry_id), self._entry_pending_name),
+            keys=(
+                self._entry_key(entry_id),
+                self._entry_pending_name,
+                self._entry_index_name,
+                self._entry_finished_name,
+            ),
             args=(self.encode(str(entry_id), "ascii"),),
         )
         if outcome == 0:
             raise QueueEntryNotFoundError(entry_id)
         if outcome == -1:
             raise ValueError("Only terminal queue entries can be pruned")
-        return self.entry_class.from_dict(json.loads(outcome))
+        return self._decode_entry(outcome)
+
+    async def aprune_expired(
+        self, finished_before: ClockTime, limit: int
+    ) -> list[QueueEntry]:
+        """Remove up to ``limit`` terminal entries finished by ``finished_before``.
+
+        See `_PRUNE_EXPIRED_SCRIPT`: reading the finished-at index keeps the
+        work proportional to the expired entries, not to everything retained.
+        Index IDs left by entries since removed or rewritten are dropped
+        without counting against ``limit``, so this returns fewer only once
+        the expired entries run out.
+        """
+        self._async_redis()
+        scripts = self._async_scripts_by_loop[asyncio.get_running_loop()]
+        keys = (
+            self._entry_finished_name,
+            self.encode(f"{self._key_prefix}:entries:", self._connection_encoding),
+            self._entry_pending_name,
+            self._entry_index_name,
+        )
+        finished_score = self.encode(
+            str(
+                finished_before.seconds * MICROSECONDS_PER_SECOND
+                + finished_before.microseconds
+            ),
+            "ascii",
+        )
+        pruned: list[QueueEntry] = []
+        while len(pruned) < limit:
+            batch_limit = limit - len(pruned)
+            scanned, raw_entries = await scripts.prune_expired(
+                keys=keys,
+                args=(finished_score, self.encode(str(batch_limit), "ascii")),
+            )
+            pruned += [self._decode_entry(raw) for raw in raw_entries]
+            if scanned < batch_limit:
+                break
+        return pruned
+
+    async def amigrate_entries(self, batch_size: int = 500) -> int:
+        """Rewrite stored entries in this queue's record format.
+
+        Scans the keyspace for entry records, *batch_size* at a time, and
+        rewrites every record stored in another format -- a string record
+        after switching to `HashEntryCodec`, say -- returning how many were
+        rewritten. A record that changes between being read and rewritten is
+        left as it is, so this is safe while workers run; running it again
+        picks up whatever it skipped.
+
+        Entries stored before the entry ID, per-status and finished-at
+        indexes existed are added to them on the way past, so first-seen
+        publishing, paged or filtered listings and retention cleanup find
+        them. Run it once after upgrading.
+        """
+        if type(batch_size) is not int or batch_size <= 0:
+            raise ValueError("Migration batch size must be a positive integer")
+        client = self._async_redis()
+        migrated = 0
+        keys = []
+        async for key in client.scan_iter(
+            match=self._entry_key(_ANY_ENTRY_ID), count=batch_size
+        ):
+            keys.append(key)
+            if len(keys) == batch_size:
+                migrated += await self._amigrate_batch(keys)
+                keys = []
+        if keys:
+            migrated += await self._amigrate_batch(keys)
+        return migrated
+
+    async def _amigrate_batch(self, keys: list) -> int:
+        scripts = self._async_scripts_by_loop[asyncio.get_running_loop()]
+        raw_entries = await self._aread(keys)
+        entries = [
+            None if raw is None else self._decode_entry(raw) for raw in raw_entries
+        ]
+        args = []
+        for entry in entries:
+            if entry is None:
+                args += (b"", b"")
+            else:
+                args += (entry.status.value, self._finished_score_arg(entry))
+        await scripts.index_entries(
+            keys=[self._entry_index_name, self._entry_finished_name, *keys],
+            args=args,
+        )
+        migrated = 0
+        for key, raw, entry in zip(keys, raw_entries, entries, strict=True):
+            if raw is None or entry is None:
+                continue
+            record = self._encode_entry(entry)
+            if _record_format(raw) == _record_format(record):
+                continue
+            migrated += await scripts.migrate(keys=(key,), args=(raw, record))
+        return migrated
 
     async def aclose(self) -> None:
         loop = asyncio.get_running_loop()
+        if buffer := self._snapshot_buffers_by_loop.pop(loop, None):
+            await buffer.aflush()
         if clock := self._clocks_by_loop.pop(loop, None):
             await clock.aclose()
         self._async_scripts_by_loop.pop(loop, None)
         if client := self._async_redis_by_loop.pop(loop, None):
-            await client.aclose(close_connection_pool=True)
+            await connection_pools.arelease(client)
+        if client := self._async_blocking_redis_by_loop.pop(loop, None):
+            await connection_pools.arelease(client)
@@ -0,0 +1,150 @@
+"""Batch a provider's lifecycle snapshots into pipelined Redis publishes.
+
+A worker publishes a snapshot for every state change of every entry it runs,
+so a backlog drain publishes thousands a second. Rather than one `PUBLISH`
+round trip each, a provider buffers them per event loop, and one task sends
+each batch through a pipeline: as soon as a batch fills, or a few
+milliseconds after the first snapshot of one arrives.
+
+Snapshots are sent in the order they were buffered, so one entry's snapshots
+keep their order. Publishing stays best effort: a full buffer drops a
+snapshot rather than making its caller wait, and a batch Redis rejects is
+logged and dropped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import math
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from django_queue.backends.exceptions import InvalidQueueBackendError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotBufferOptions:
+    """Publish buffer settings, taken from a Redis queue's backend options.
+
+    A batch of `publish_batch_size` snapshots is sent at once; a smaller one
+    waits up to `publish_interval` seconds for more. At most
+    `publish_buffer_size` snapshots wait to be sent.
+    """
+
+    publish_batch_size: int = 128
+    publish_interval: float = 0.002
+    publish_buffer_size: int = 10_000
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> SnapshotBufferOptions:
+        buffer_options = cls(
+            **{
+                name: options[name]
+                for name in (
+                    "publish_batch_size",
+                    "publish_interval",
+                    "publish_buffer_size",
+                )
+                if name in options
+            }
+        )
+        for name in ("publish_batch_size", "publish_buffer_size"):
+            value = getattr(buffer_options, name)
+            if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                raise InvalidQueueBackendError(
+                    f"Redis {name} must be a positive integer"
+                )
+        interval = buffer_options.publish_interval
+        if (
+            isinstance(interval, bool)
+            or not isinstance(interval, int | float)
+            or not math.isfinite(interval)
+            or interval < 0
+        ):
+            raise InvalidQueueBackendError(
+                "Redis publish_interval must be a finite number of seconds, not negative"
+            )
+        return buffer_options
+
+
+class SnapshotBuffer:
+    """Publish encoded snapshots to one channel in pipelined batches.
+
+    Belongs to the event loop it was created on, like the client it sends
+    through.
+    """
+
+    def __init__(
+        self, client: Any, channel: str, options: SnapshotBufferOptions
+    ) -> None:
+        self._client = client
+        self._channel = channel
+        self._options = options
+        self._pending: deque[bytes] = deque()
+        self._wake = asyncio.Event()
+        self._flushes = 0
+        self._dropped = 0
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def submit(self, snapshot: bytes) -> None:
+        """Buffer *snapshot* for publishing, or drop it if the buffer is full."""
+        if len(self._pending) >= self._options.publish_buffer_size:
+            self._dropped += 1
+            return
+        self._pending.append(snapshot)
+        if len(self._pending) >= self._options.publish_batch_size:
+            self._wake.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+
+    async def aflush(self) -> None:
+        """Publish everything buffered without waiting out the interval.
+
+        Returns once the buffer is empty. Cancelling the caller does not
+        cancel the publishing.
+        """
+        if self._task is None or self._task.done():
+            return
+        self._flushes += 1
+        self._wake.set()
+        try:
+            await asyncio.shield(self._task)
+        finally:
+            self._flushes -= 1
+
+    async def _drain(self) -> None:
+        batch_size = self._options.publish_batch_size
+        while self._pending:
+            if len(self._pending) < batch_size and not self._flushes:
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(self._options.publish_interval):
+                        await self._wake.wait()
+            self._wake.clear()
+            batch = [
+                self._pending.popleft()
+                for _ in range(min(batch_size, len(self._pending)))
+            ]
+            try:
+                async with self._client.pipeline(transaction=False) as pipe:
+                    for snapshot in batch:
+                        pipe.publish(self._channel, snapshot)
+                    await pipe.execute()
+            except Exception:
+                logger.exception(
+                    "Unable to publish %d queue lifecycle snapshots", len(batch)
+                )
+            if self._dropped:
+                logger.warning(
+                    "Dropped %d queue lifecycle snapshots: the publish buffer is full",
+                    self._dropped,
+                )
+                self._dropped = 0
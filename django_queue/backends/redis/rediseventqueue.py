@@ -16,7 +16,10 @@ class RedisEventQueue(EventQueue):
     """
 
     recovery_batch_size = 100
+    provider_class: type[QueueProviderRedis] = QueueProviderRedis
     requires_entry_class_at_construction = True
+    # Records are written through an `EntryCodec`; see the ENTRY_CODEC setting.
+    stores_encoded_entries = True
     worker_provider_kind = "redis"
     worker_provider_type = "redis"
     worker_class = "django_queue.backends.redis.RedisEventQueueWorker"
@@ -27,13 +30,20 @@ class RedisEventQueue(EventQueue):
         options = {} if options is None else options
         options |= kwargs
         self.entry_class = options.pop("entry_class", self.entry_class)
-        self._provider = QueueProviderRedis(
+        self._provider = self.provider_class(
             redis_url, options, entry_class=self.entry_class
         )
         self._queue_name = self._provider.queue_name
         self._clock = self._provider.clock
 
+    async def _await_pending(self, timeout: float) -> None:
+        await self._provider.await_pending(timeout)
+
     async def _astore_and_push(self, entry: QueueEntry) -> None:
         """Atomically store a freshly enqueued event and add it to the
         pending list -- see `QueueProviderRedis.astore_event_and_push`."""
         await self._provider.astore_event_and_push(entry)
+
+    async def _astore_and_push_many(self, entries: list[QueueEntry]) -> None:
+        """Atomically store and push a chunk of events in one script call."""
+        await self._provider.astore_event_and_push_many(entries)
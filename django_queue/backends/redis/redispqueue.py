@@ -60,6 +60,11 @@ try:
                     entry, available_at, priority=True
                 )
 
+        async def _astore_and_push_many(self, entries, *, available_at=None) -> None:
+            await self._provider.astore_and_push_many(
+                entries, available_at=available_at, priority=True
+            )
+
         async def _apromote_scheduled(self) -> None:
             await self._provider.apromote_scheduled_priority()
 
@@ -79,6 +84,14 @@ try:
                 worker_id, lease_seconds
             )
 
+        async def aclaim_many(self, worker_id, lease_seconds, limit):
+            return await self._provider.aclaim_many_priority(
+                worker_id, lease_seconds, limit
+            )
+
+        async def aclaim_and_start(self, worker_id, **start):
+            return await self._provider.aclaim_priority_and_start(worker_id, **start)
+
         async def arecover(self, batch_size: int) -> tuple[int, int]:
             return await self._provider.arecover_priority(batch_size)
 
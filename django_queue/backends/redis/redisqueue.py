@@ -7,12 +7,18 @@ try:
     from django_queue.entries import QueueEntry
 
     from .provider import QueueProviderRedis
+    from .shardedprovider import QueueProviderRedisSharded
 
     logger = logging.getLogger(__name__)
 
     class RedisAsyncQueue(AsyncQueue):
         recovery_batch_size = 100
+        provider_class: type[QueueProviderRedis | QueueProviderRedisSharded] = (
+            QueueProviderRedis
+        )
         requires_entry_class_at_construction = True
+        # Records are written through an `EntryCodec`; see the ENTRY_CODEC setting.
+        stores_encoded_entries = True
         worker_provider_kind = "redis"
         worker_provider_type = "redis"
         worker_class = "django_queue.backends.redis.RedisAsyncQueueWorker"
@@ -22,7 +28,7 @@ try:
             options = {} if options is None else options
             options |= kwargs
             self.entry_class = options.pop("entry_class", self.entry_class)
-            self._provider = QueueProviderRedis(
+            self._provider = self.provider_class(
                 redis_url, options, entry_class=self.entry_class
             )
             self._queue_name = self._provider.queue_name
@@ -36,6 +42,14 @@ try:
                     "Unable to publish queue lifecycle snapshot for entry %s", entry.id
                 )
 
+        async def _apublish_many(self, entries: list[QueueEntry]) -> None:
+            try:
+                await self._provider.apublish_many(entries)
+            except Exception:
+                logger.exception(
+                    "Unable to publish %d queue lifecycle snapshots", len(entries)
+                )
+
         def _observer_receiver(self, on_snapshot):
             self._configure_provider_entry_class()
             return functools.partial(self._provider.aobserve, on_snapshot)
@@ -59,9 +73,19 @@ try:
                     entry, available_at, priority=False
                 )
 
+        async def _astore_and_push_many(
+            self, entries: list[QueueEntry], *, available_at=None
+        ) -> None:
+            await self._provider.astore_and_push_many(
+                entries, available_at=available_at, priority=False
+            )
+
         async def _apromote_scheduled(self) -> None:
             await self._provider.apromote_scheduled()
 
+        async def _await_pending(self, timeout: float) -> None:
+            await self._provider.await_pending(timeout)
+
         async def _astore_and_discard(self, entry: QueueEntry) -> None:
             await self._provider.astore_and_discard(entry)
 
@@ -83,6 +107,35 @@ try:
         ) -> QueueEntry:
             return await self._provider.aclaim_unexpired(worker_id, lease_seconds)
 
+        async def aclaim_many(
+            self, worker_id: uuid.UUID, lease_seconds: float | None, limit: int
+        ) -> list[QueueEntry]:
+            """Claim up to ``limit`` entries in one round trip; see `aclaim`."""
+            return await self._provider.aclaim_many(worker_id, lease_seconds, limit)
+
+        async def aclaim_and_start(
+            self,
+            worker_id: uuid.UUID,
+            *,
+            budget_seconds: float | None,
+            default_budget_seconds: float,
+            grace_seconds: float,
+            published_through: uuid.UUID | None,
+        ) -> QueueEntry:
+            """Claim and start the next entry in one round trip.
+
+            See `QueueProviderRedis.aclaim_and_start`; like `aclaim`,
+            `RedisAsyncPriorityQueue` overrides this to claim from its
+            priority-ordered pending store.
+            """
+            return await self._provider.aclaim_and_start(
+                worker_id,
+                budget_seconds=budget_seconds,
+                default_budget_seconds=default_budget_seconds,
+                grace_seconds=grace_seconds,
+                published_through=published_through,
+            )
+
         async def arecover(self, batch_size: int) -> tuple[int, int]:
             """Recover expired claims for `RedisAsyncQueueWorker`.
 
@@ -108,6 +161,14 @@ try:
             """
             return await self._provider.arelease(entry_id, worker_id, delay_seconds)
 
+        async def amigrate_entries(self, batch_size: int = 500) -> int:
+            """Rewrite stored entries in this queue's ENTRY_CODEC format.
+
+            See `QueueProviderRedis.amigrate_entries`; returns how many were
+            rewritten.
+            """
+            return await self._provider.amigrate_entries(batch_size)
+
     class RedisAsyncStack(RedisAsyncQueue):
         def __init__(self, redis_url: str, options: dict | None = None, **kwargs):
             options = {} if options is None else options
@@ -0,0 +1,23 @@
+"""Redis-backed async queue sharded across several Redis servers."""
+
+from __future__ import annotations
+
+from .redisqueue import RedisAsyncQueue, RedisAsyncStack
+from .shardedprovider import QueueProviderRedisSharded
+
+
+class RedisShardedAsyncQueue(RedisAsyncQueue):
+    """An async queue whose entries are spread across several Redis servers.
+
+    ``LOCATION`` is a list of Redis URLs, one per shard. Each entry lives on
+    the shard its ID selects and moves through its lifecycle there, with the
+    same scripts and guarantees as :class:`RedisAsyncQueue`; see
+    :class:`QueueProviderRedisSharded`. Entries are dispatched in FIFO order
+    within a shard, but only roughly across shards.
+    """
+
+    provider_class = QueueProviderRedisSharded
+
+
+class RedisShardedAsyncStack(RedisShardedAsyncQueue, RedisAsyncStack):
+    """:class:`RedisShardedAsyncQueue` in LIFO order within each shard."""
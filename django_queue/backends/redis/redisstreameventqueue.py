@@ -0,0 +1,19 @@
+"""Redis Streams-backed transient event queue."""
+
+from __future__ import annotations
+
+from .rediseventqueue import RedisEventQueue
+from .streamprovider import QueueProviderRedisStream
+
+
+class RedisStreamEventQueue(RedisEventQueue):
+    """Transient events delivered through a Redis stream and consumer group.
+
+    Applies the same lifetime and removal contract as :class:`RedisEventQueue`;
+    persistence is delegated to :class:`QueueProviderRedisStream`.
+    """
+
+    provider_class = QueueProviderRedisStream
+    worker_provider_type = "redis-stream"
+    worker_class = "django_queue.backends.redis.RedisStreamEventQueueWorker"
+    compatible_worker_class = "django_queue.backends.redis.RedisStreamEventQueueWorker"
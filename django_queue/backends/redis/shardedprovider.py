@@ -0,0 +1,412 @@
+"""Spread one async queue's entries across several Redis servers.
+
+:class:`QueueProviderRedisSharded` holds one :class:`QueueProviderRedis` per
+Redis URL, all with the same queue name, and stores each entry on the shard
+its ID selects. A shard keeps its own pending list, scheduled and delayed
+sets, claims, leases and indexes, exactly as a single-server queue does, so
+every state transition of an entry runs on one server with the same scripts.
+
+Claims take turns across the shards: each starts at the shard after the one
+the previous claim started at and moves on past any shard with nothing to
+claim, so an idle shard never holds a worker back. Reads of one entry go to
+its shard; listing, recovery, pruning and promotion visit every shard.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import urllib.parse
+import uuid
+from collections.abc import Awaitable, Callable, Collection, Sequence
+from typing import Any
+
+from django_queue.backends.exceptions import (
+    InvalidQueueBackendError,
+    QueueEmptyException,
+)
+from django_queue.clock import ClockTime, QueueClock
+from django_queue.entries import QueueEntry, QueueEntryStatus
+
+from .provider import QueueProviderRedis
+
+
+class QueueProviderRedisSharded:
+    """Store a queue's entries across Redis servers, one shard per URL.
+
+    Supports the async-queue operations of :class:`QueueProviderRedis` with
+    the same signatures. Raw-value operations (`aadd`, `aget` and the like)
+    use the first shard. The queue's clock is the first shard's; each
+    shard's scripts still time its own leases and schedules, so the servers'
+    clocks should agree as closely as those of any Redis deployment.
+    """
+
+    def __init__(
+        self,
+        redis_urls: Sequence[str],
+        options: dict | None = None,
+        *,
+        entry_class: type[QueueEntry],
+        **kwargs,
+    ) -> None:
+        if isinstance(redis_urls, str) or not isinstance(redis_urls, Sequence):
+            raise InvalidQueueBackendError(
+                "Sharded Redis queues require a list of Redis URLs"
+            )
+        if not redis_urls:
+            raise InvalidQueueBackendError(
+                "Sharded Redis queues require at least one Redis URL"
+            )
+        if len(set(redis_urls)) != len(redis_urls):
+            raise InvalidQueueBackendError(
+                "Sharded Redis queue URLs must each name a different database"
+            )
+        options = ({} if options is None else options) | kwargs
+        # Every shard must agree on the queue name, so a generated one is
+        # chosen here rather than by each shard.
+        options.setdefault("queue_name", f"queue_{uuid.uuid4().hex}")
+        self._redis_urls = tuple(redis_urls)
+        self._shards = tuple(
+            QueueProviderRedis(redis_url, options, entry_class=entry_class)
+            for redis_url in redis_urls
+        )
+        self._next_shard = itertools.cycle(range(len(self._shards)))
+        # Per loop, each shard's outstanding `await_pending`, kept across
+        # calls so a wait on one shard is not abandoned when another wakes.
+        self._waits_by_loop: dict[
+            asyncio.AbstractEventLoop, dict[int, asyncio.Task[None]]
+        ] = {}
+
+    @property
+    def shards(self) -> tuple[QueueProviderRedis, ...]:
+        return self._shards
+
+    def shard_for(self, entry_id: uuid.UUID) -> QueueProviderRedis:
+        """Return the shard that stores *entry_id*.
+
+        Chosen from the ID's low bits, which a UUIDv7 fills at random, so
+        entries spread evenly and every process agrees on the choice.
+        """
+        return self._shards[entry_id.int % len(self._shards)]
+
+    @property
+    def entry_class(self) -> type[QueueEntry]:
+        return self._shards[0].entry_class
+
+    @entry_class.setter
+    def entry_class(self, entry_class: type[QueueEntry]) -> None:
+        for shard in self._shards:
+            shard.entry_class = entry_class
+
+    @property
+    def clock(self) -> QueueClock:
+        return self._shards[0].clock
+
+    @property
+    def queue_name(self) -> str:
+        return self._shards[0].queue_name
+
+    @property
+    def lifecycle_channel(self) -> str:
+        return self._shards[0].lifecycle_channel
+
+    @property
+    def capacity(self) -> int:
+        return self._shards[0].capacity
+
+    @property
+    def stack(self) -> bool:
+        return self._shards[0].stack
+
+    async def aadd(self, *items: str) -> None:
+        await self._shards[0].aadd(*items)
+
+    async def aget(self) -> str:
+        return await self._shards[0].aget()
+
+    async def apoll(self) -> str:
+        return await self._shards[0].apoll()
+
+    async def apeek(self) -> str:
+        return await self._shards[0].apeek()
+
+    async def asize(self) -> int:
+        return await self._shards[0].asize()
+
+    async def aclear(self) -> None:
+        await self._shards[0].aclear()
+
+    async def aclear_records(self) -> None:
+        await self._each(lambda shard: shard.aclear_records())
+
+    async def aobserve(self, on_snapshot) -> None:
+        """Receive lifecycle snapshots from every shard until cancelled.
+
+        A shard's snapshots arrive in the order it published them, so one
+        entry's snapshots stay in order; snapshots of different entries on
+        different shards may interleave.
+
+        Pub/sub ignores the database number, so shards sharing a server share
+        one subscription rather than each receiving every snapshot.
+        """
+        observed = {
+            _server(redis_url): shard
+            for redis_url, shard in zip(self._redis_urls, self._shards, strict=True)
+        }
+        async with asyncio.TaskGroup() as observers:
+            for shard in observed.values():
+                observers.create_task(shard.aobserve(on_snapshot))
+
+    async def apublish(self, entry: QueueEntry) -> None:
+        # On the entry's own shard, behind the snapshots its scripts publish.
+        await self.shard_for(entry.id).apublish(entry)
+
+    async def apublish_many(self, entries: list[QueueEntry]) -> None:
+        await self._each_group(entries, lambda shard, group: shard.apublish_many(group))
+
+    async def astore(self, entry: QueueEntry) -> None:
+        await self.shard_for(entry.id).astore(entry)
+
+    async def astore_and_push(self, entry: QueueEntry) -> None:
+        await self.shard_for(entry.id).astore_and_push(entry)
+
+    async def astore_available(
+        self, entry: QueueEntry, available_at: ClockTime, *, priority: bool
+    ) -> None:
+        await self.shard_for(entry.id).astore_available(
+            entry, available_at, priority=priority
+        )
+
+    async def astore_and_push_many(
+        self,
+        entries: list[QueueEntry],
+        *,
+        available_at: ClockTime | None,
+        priority: bool,
+    ) -> None:
+        """Store each shard's share of a batch with one script call per shard."""
+        await self._each_group(
+            entries,
+            lambda shard, group: shard.astore_and_push_many(
+                group, available_at=available_at, priority=priority
+            ),
+        )
+
+    async def astore_and_discard(self, entry: QueueEntry) -> None:
+        await self.shard_for(entry.id).astore_and_discard(entry)
+
+    async def afind(self, entry_id: uuid.UUID) -> QueueEntry:
+        return await self.shard_for(entry_id).afind(entry_id)
+
+    async def adelete(self, entry_id: uuid.UUID) -> None:
+        await self.shard_for(entry_id).adelete(entry_id)
+
+    async def alist(self) -> list[QueueEntry]:
+        return [
+            entry
+            for entries in await self._each(lambda shard: shard.alist())
+            for entry in entries
+        ]
+
+    async def alist_after(
+        self,
+        after: uuid.UUID | None,
+        limit: int | None,
+        *,
+        statuses: Collection[QueueEntryStatus] | None = None,
+        newest_first: bool = False,
+    ) -> list[QueueEntry]:
+        """Return up to ``limit`` entries past ``after``, in ID order.
+
+        Reads a page of that size from every shard and merges them.
+        """
+        pages = await self._each(
+            lambda shard: shard.alist_after(
+                after, limit, statuses=statuses, newest_first=newest_first
+            )
+        )
+        return list(
+            itertools.islice(
+                heapq.merge(*pages, key=lambda entry: entry.id, reverse=newest_first),
+                limit,
+            )
+        )
+
+    async def await_pending(self, timeout: float) -> None:
+        """Block until any shard has work, or *timeout* seconds elapse.
+
+        Each shard is waited on separately; the waits still running when
+        this returns carry over to the next call.
+        """
+        waits = self._waits_by_loop.setdefault(asyncio.get_running_loop(), {})
+        for index, shard in enumerate(self._shards):
+            if index not in waits:
+                waits[index] = asyncio.create_task(shard.await_pending(timeout))
+        try:
+            await asyncio.wait(
+                waits.values(), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        except asyncio.CancelledError:
+            await self._acancel_waits()
+            raise
+        for index, wait in list(waits.items()):
+            if wait.done():
+                del waits[index]
+                wait.result()
+
+    async def apush(self, entry_id: uuid.UUID) -> None:
+        await self.shard_for(entry_id).apush(entry_id)
+
+    async def apromote_scheduled(self) -> None:
+        await self._each(lambda shard: shard.apromote_scheduled())
+
+    async def apop(self) -> QueueEntry:
+        return await self._claim_from_next(lambda shard: shard.apop())
+
+    async def adiscard(self, entry_id: uuid.UUID) -> None:
+        await self.shard_for(entry_id).adiscard(entry_id)
+
+    async def adiscard_scheduled(self, entry_id: uuid.UUID) -> None:
+        await self.shard_for(entry_id).adiscard_scheduled(entry_id)
+
+    async def ahas_pending(self) -> bool:
+        return any(await self._each(lambda shard: shard.ahas_pending()))
+
+    async def aclaim(
+        self, worker_id: uuid.UUID, lease_seconds: float | None = None
+    ) -> QueueEntry:
+        return await self._claim_from_next(
+            lambda shard: shard.aclaim(worker_id, lease_seconds)
+        )
+
+    async def aclaim_unexpired(
+        self, worker_id: uuid.UUID, lease_seconds: float | None = None
+    ) -> QueueEntry:
+        return await self._claim_from_next(
+            lambda shard: shard.aclaim_unexpired(worker_id, lease_seconds)
+        )
+
+    async def aclaim_many(
+        self, worker_id: uuid.UUID, lease_seconds: float | None, limit: int
+    ) -> list[QueueEntry]:
+        """Claim up to ``limit`` entries, taking what each shard has in turn."""
+        if type(limit) is not int or limit <= 0:
+            raise ValueError("Claim batch size must be a positive integer")
+        claimed: list[QueueEntry] = []
+        for shard in self._shards_from_next():
+            claimed += await shard.aclaim_many(
+                worker_id, lease_seconds, limit - len(claimed)
+            )
+            if len(claimed) == limit:
+                break
+        return claimed
+
+    async def aclaim_and_start(self, worker_id: uuid.UUID, **start) -> QueueEntry:
+        """Claim and start the next entry; see `QueueProviderRedis.aclaim_and_start`."""
+        return await self._claim_from_next(
+            lambda shard: shard.aclaim_and_start(worker_id, **start)
+        )
+
+    async def arenew(
+        self, entry_id: uuid.UUID, worker_id: uuid.UUID, lease_seconds: float
+    ) -> bool:
+        return await self.shard_for(entry_id).arenew(entry_id, worker_id, lease_seconds)
+
+    async def arelease(
+        self, entry_id: uuid.UUID, worker_id: uuid.UUID, delay_seconds: float
+    ) -> bool:
+        return await self.shard_for(entry_id).arelease(
+            entry_id, worker_id, delay_seconds
+        )
+
+    async def aremove(self, entry_id: uuid.UUID, worker_id: uuid.UUID) -> bool:
+        return await self.shard_for(entry_id).aremove(entry_id, worker_id)
+
+    async def aack(self, entry_id: uuid.UUID, worker_id: uuid.UUID) -> bool:
+        return await self.shard_for(entry_id).aack(entry_id, worker_id)
+
+    async def amark_running(self, worker_id: uuid.UUID, entry: QueueEntry) -> bool:
+        return await self.shard_for(entry.id).amark_running(worker_id, entry)
+
+    async def asettle(self, worker_id: uuid.UUID, entry: QueueEntry) -> bool:
+        return await self.shard_for(entry.id).asettle(worker_id, entry)
+
+    async def arecover(self, batch_size: int) -> tuple[int, int]:
+        """Recover up to ``batch_size`` expired claims on every shard."""
+        outcomes = await self._each(lambda shard: shard.arecover(batch_size))
+        return (
+            sum(recovered for recovered, _ in outcomes),
+            sum(discarded for _, discarded in outcomes),
+        )
+
+    async def aprune(self, entry_id: uuid.UUID) -> QueueEntry:
+        return await self.shard_for(entry_id).aprune(entry_id)
+
+    async def aprune_expired(
+        self, finished_before: ClockTime, limit: int
+    ) -> list[QueueEntry]:
+        """Remove up to ``limit`` expired terminal entries, shard by shard.
+
+        Returns fewer than ``limit`` only once every shard has run out.
+        """
+        pruned: list[QueueEntry] = []
+        for shard in self._shards:
+            pruned += await shard.aprune_expired(finished_before, limit - len(pruned))
+            if len(pruned) == limit:
+                break
+        return pruned
+
+    async def amigrate_entries(self, batch_size: int = 500) -> int:
+        return sum(await self._each(lambda shard: shard.amigrate_entries(batch_size)))
+
+    async def aclose(self) -> None:
+        await self._acancel_waits()
+        self._waits_by_loop.pop(asyncio.get_running_loop(), None)
+        await self._each(lambda shard: shard.aclose())
+
+    def _shards_from_next(self) -> list[QueueProviderRedis]:
+        start = next(self._next_shard)
+        return [*self._shards[start:], *self._shards[:start]]
+
+    async def _claim_from_next(
+        self, claim: Callable[[QueueProviderRedis], Awaitable[QueueEntry]]
+    ) -> QueueEntry:
+        for shard in self._shards_from_next():
+            try:
+                return await claim(shard)
+            except QueueEmptyException:
+                continue
+        raise QueueEmptyException
+
+    async def _each(
+        self, operation: Callable[[QueueProviderRedis], Awaitable[Any]]
+    ) -> list[Any]:
+        return list(await asyncio.gather(*(operation(shard) for shard in self._shards)))
+
+    async def _each_group(
+        self,
+        entries: list[QueueEntry],
+        operation: Callable[[QueueProviderRedis, list[QueueEntry]], Awaitable[Any]],
+    ) -> None:
+        groups: dict[QueueProviderRedis, list[QueueEntry]] = {}
+        for entry in entries:
+            groups.setdefault(self.shard_for(entry.id), []).append(entry)
+        await asyncio.gather(
+            *(operation(shard, group) for shard, group in groups.items())
+        )
+
+    async def _acancel_waits(self) -> None:
+        waits = self._waits_by_loop.get(asyncio.get_running_loop(), {})
+        for wait in waits.values():
+            wait.cancel()
+        await asyncio.gather(*waits.values(), return_exceptions=True)
+        waits.clear()
+
+
+def _server(redis_url: str) -> tuple[str | None, int | None, str]:
+    """Return the server a Redis URL connects to, without its database."""
+    parts = urllib.parse.urlsplit(redis_url)
+    if parts.scheme == "unix":
+        return None, None, parts.path
+    return parts.hostname, parts.port, ""
@@ -0,0 +1,598 @@
+"""Redis Streams delivery for transient event queues.
+
+:class:`QueueProviderRedisStream` keeps the event contract of
+:class:`QueueProviderRedis` -- unclaimed lifetimes, owned claims, delayed
+release and lease recovery -- but carries each event as one stream message
+read through a consumer group instead of a record key, a claim key and a
+pending-list member. Under the queue's key prefix it uses:
+
+- ``entries:stream``: the stream. Each message holds the event's ``id``, its
+  ``entry`` record and the ``deadline`` of its original lifetime. Consuming an
+  event acknowledges and deletes its message.
+- ``entries:stream:ids``: a hash from event ID to message ID.
+- ``entries:stream:remaining``: a hash from a claimed message to the lifetime
+  it had left when claimed.
+- ``entries:delayed`` and ``entries:unclaimed-leases``: when a released message
+  is due for redelivery, and when each unclaimed message expires.
+
+The consumer group's pending-entries list is the claim table: the consumer is
+the worker ID, and a message idle for longer than the claim lease has lost its
+claim and is recovered with ``XAUTOCLAIM``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+import redis
+
+from django_queue.backends.exceptions import (
+    QueueEmptyException,
+    QueueEntryExpiredError,
+    QueueEntryNotFoundError,
+    QueueValueError,
+)
+from django_queue.clock import MICROSECONDS_PER_SECOND
+from django_queue.entries import QueueEntry, validate_budget
+
+from .provider import QueueProviderRedis
+
+# Every stream script takes the same keys: KEYS[1] the stream, KEYS[2] the
+# event-ID index, KEYS[3] claimed messages' remaining lifetimes, KEYS[4] the
+# released messages' redelivery times and KEYS[5] unclaimed deadlines.
+# ARGV[1] is always the consumer group.
+_STREAM_LUA = b"""
+    local function read_message(message_id)
+        local messages = redis.call("XRANGE", KEYS[1], message_id, message_id)
+        if #messages == 0 then return nil end
+        local fields = {}
+        local values = messages[1][2]
+        for index = 1, #values, 2 do fields[values[index]] = values[index + 1] end
+        return fields
+    end
+    local function forget(message_id, entry_id)
+        redis.call("XACK", KEYS[1], ARGV[1], message_id)
+        redis.call("XDEL", KEYS[1], message_id)
+        if entry_id then redis.call("HDEL", KEYS[2], entry_id) end
+        redis.call("HDEL", KEYS[3], message_id)
+        redis.call("ZREM", KEYS[4], message_id)
+        redis.call("ZREM", KEYS[5], message_id)
+    end
+    -- A released message stays pending for the consumer that released it
+    -- until redelivery, but is no longer claimed by it.
+    local function claim_of(message_id, consumer)
+        if redis.call("ZSCORE", KEYS[4], message_id) then return nil end
+        local pending = redis.call("XPENDING", KEYS[1], ARGV[1], message_id, message_id, 1)
+        if #pending == 0 or pending[1][2] ~= consumer then return nil end
+        return pending[1]
+    end
+    local now = redis.call("TIME")
+    local now_us = tonumber(now[1]) * 1000000 + tonumber(now[2])
+"""
+
+_STREAM_STORE_SCRIPT = (
+    _STREAM_LUA
+    + b"""
+    if redis.call("EXISTS", KEYS[1]) == 0 then
+        redis.call("XGROUP", "CREATE", KEYS[1], ARGV[1], "0", "MKSTREAM")
+    end
+    for index = 2, #ARGV, 3 do
+        local message_id = redis.call(
+            "XADD", KEYS[1], "*",
+            "id", ARGV[index], "entry", ARGV[index + 1], "deadline", ARGV[index + 2]
+        )
+        redis.call("HSET", KEYS[2], ARGV[index], message_id)
+        redis.call("ZADD", KEYS[5], ARGV[index + 2], message_id)
+    end
+"""
+)
+
+# ARGV[2] is the consumer, ARGV[3] a message that consumer has already read
+# with a blocking XREADGROUP (or "" to claim the next event), and ARGV[4] "1"
+# to consume the event outright rather than claim it. Released events that
+# are due go before new ones. A claimed event's unclaimed deadline becomes its
+# remaining lifetime, restored when it is released.
+_STREAM_CLAIM_SCRIPT = (
+    _STREAM_LUA
+    + b"""
+    local function deliver(message_id)
+        local fields = read_message(message_id)
+        if not fields then
+            forget(message_id, nil)
+            return {"missing", ""}
+        end
+        local deadline = tonumber(redis.call("ZSCORE", KEYS[5], message_id))
+        if not deadline then
+            local remaining = tonumber(redis.call("HGET", KEYS[3], message_id))
+            deadline = remaining and now_us + remaining or tonumber(fields.deadline)
+        end
+        if deadline <= now_us then
+            forget(message_id, fields.id)
+            return {"expired", fields.id}
+        end
+        if ARGV[4] == "1" then
+            forget(message_id, fields.id)
+            return {"dequeued", fields.id, fields.entry}
+        end
+        redis.call("HSET", KEYS[3], message_id, deadline - now_us)
+        redis.call("ZREM", KEYS[4], message_id)
+        redis.call("ZREM", KEYS[5], message_id)
+        return {"claimed", fields.id, fields.entry}
+    end
+    if ARGV[3] ~= "" then return deliver(ARGV[3]) end
+    if redis.call("EXISTS", KEYS[1]) == 0 then return {"empty", ""} end
+    for _ = 1, 100 do
+        local message_id
+        local due = redis.call("ZRANGEBYSCORE", KEYS[4], "-inf", now_us, "LIMIT", 0, 1)
+        if #due > 0 then
+            message_id = due[1]
+            redis.call("XCLAIM", KEYS[1], ARGV[1], ARGV[2], 0, message_id, "JUSTID")
+        else
+            local read = redis.call(
+                "XREADGROUP", "GROUP", ARGV[1], ARGV[2], "COUNT", 1, "STREAMS", KEYS[1], ">"
+            )
+            if not read then return {"empty", ""} end
+            message_id = read[1][2][1][1]
+        end
+        local outcome = deliver(message_id)
+        if outcome[1] == "claimed" or outcome[1] == "dequeued"
+            or (outcome[1] == "expired" and ARGV[4] ~= "1") then
+            return outcome
+        end
+    end
+    return {"empty", ""}
+"""
+)
+
+# ARGV[2] is the consumer, ARGV[3] the event ID and ARGV[4] the lease in
+# microseconds: a claim idle for longer is already open to recovery.
+_STREAM_RENEW_SCRIPT = (
+    _STREAM_LUA
+    + b"""
+    local message_id = redis.call("HGET", KEYS[2], ARGV[3])
+    if not message_id then return 0 end
+    local claim = claim_of(message_id, ARGV[2])
+    if not claim or tonumber(claim[3]) * 1000 >= tonumber(ARGV[4]) then return 0 end
+    redis.call("XCLAIM", KEYS[1], ARGV[1], ARGV[2], 0, message_id, "JUSTID")
+    return 1
+"""
+)
+
+# ARGV[2] is the consumer, ARGV[3] the event ID and ARGV[4] the redelivery
+# delay in microseconds.
+_STREAM_RELEASE_SCRIPT = (
+    _STREAM_LUA
+    + b"""
+    local message_id = redis.call("HGET", KEYS[2], ARGV[3])
+    if not message_id or not claim_of(message_id, ARGV[2]) then return 0 end
+    local remaining = tonumber(redis.call("HGET", KEYS[3], message_id))
+    local deadline
+    if remaining then
+        deadline = now_us + remaining
+    else
+        local fields = read_message(message_id)
+        deadline = fields and tonumber(fields.deadline) or now_us
+    end
+    redis.call("HDEL", KEYS[3], message_id)
+    redis.call("ZADD", KEYS[5], deadline, message_id)
+    redis.call("ZADD", KEYS[4], now_us + tonumber(ARGV[4]), message_id)
+    -- Restart the idle time so recovery leaves it for redelivery.
+    redis.call("XCLAIM", KEYS[1], ARGV[1], ARGV[2], 0, message_id, "JUSTID")
+    return 1
+"""
+)
+
+# ARGV[2] is the consumer and ARGV[3] the event ID.
+_STREAM_REMOVE_SCRIPT = (
+    _STREAM_LUA
+    + b"""
+    local message_id = redis.call("HGET", KEYS[2], ARGV[3])
+    if not message_id or not claim_of(message_id, ARGV[2]) then return 0 end
+    forget(message_id, ARGV[3])
+    return 1
+"""
+)
+
+# ARGV[2] is the recovering consumer, ARGV[3] the lease in milliseconds,
+# ARGV[4] the XAUTOCLAIM cursor and ARGV[5] the batch size. Recovered events
+# are released for immediate redelivery with the lifetime they had left.
+_STREAM_RECOVER_SCRIPT = (
+    _STREAM_LUA
+    + b"""
+    if redis.call("EXISTS", KEYS[1]) == 0 then return {"0-0", 0, 0} end
+    local reply = redis.call(
+        "XAUTOCLAIM", KEYS[1], ARGV[1], ARGV[2], ARGV[3], ARGV[4],
+        "COUNT", ARGV[5], "JUSTID"
+    )
+    local recovered = 0
+    local discarded = 0
+    for _, message_id in ipairs(reply[2]) do
+        if not redis.call("ZSCORE", KEYS[4], message_id) then
+            if read_message(message_id) then
+                local remaining = tonumber(redis.call("HGET", KEYS[3], message_id))
+                if remaining then
+                    redis.call("ZADD", KEYS[5], now_us + remaining, message_id)
+                    redis.call("HDEL", KEYS[3], message_id)
+                end
+                redis.call("ZADD", KEYS[4], now_us, message_id)
+                recovered = recovered + 1
+            else
+                forget(message_id, nil)
+                discarded = discarded + 1
+            end
+        end
+    end
+    return {reply[1], recovered, discarded}
+"""
+)
+
+# ARGV[2] is the batch size. Returns the IDs of the events it expired.
+_STREAM_EXPIRE_SCRIPT = (
+    _STREAM_LUA
+    + b"""
+    local expired = {}
+    local message_ids = redis.call("ZRANGEBYSCORE", KEYS[5], "-inf", now_us, "LIMIT", 0, ARGV[2])
+    for _, message_id in ipairs(message_ids) do
+        local fields = read_message(message_id)
+        forget(message_id, fields and fields.id)
+        if fields then expired[#expired + 1] = fields.id end
+    end
+    return expired
+"""
+)
+
+# ARGV[2] is the event ID.
+_STREAM_DELETE_SCRIPT = (
+    _STREAM_LUA
+    + b"""
+    local message_id = redis.call("HGET", KEYS[2], ARGV[2])
+    if message_id then forget(message_id, ARGV[2]) end
+"""
+)
+
+# Pending means unread, or released and waiting for redelivery; every other
+# message in the group's pending-entries list is claimed.
+_STREAM_HAS_PENDING_SCRIPT = (
+    _STREAM_LUA
+    + b"""
+    if redis.call("EXISTS", KEYS[1]) == 0 then return 0 end
+    local in_flight = redis.call("XPENDING", KEYS[1], ARGV[1])[1]
+    if redis.call("XLEN", KEYS[1]) > in_flight or redis.call("ZCARD", KEYS[4]) > 0 then
+        return 1
+    end
+    return 0
+"""
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _StreamScripts:
+    store: Any
+    claim: Any
+    renew: Any
+    release: Any
+    remove: Any
+    recover: Any
+    expire: Any
+    delete: Any
+    has_pending: Any
+
+
+class QueueProviderRedisStream(QueueProviderRedis):
+    """Deliver event records as Redis stream messages to a consumer group.
+
+    Supports the event operations of :class:`QueueProviderRedis` with the
+    same signatures, except that `arecover` also takes the claim lease, and
+    adds `aread` for blocking delivery. Task-queue operations are not
+    supported.
+    """
+
+    consumer_group = "listeners"
+    # How many unclaimed events one `aexpire_due` call removes.
+    expire_batch_size = 500
+
+    def __init__(self, redis_url: str, options: dict | None = None, **kwargs) -> None:
+        super().__init__(redis_url, options, **kwargs)
+        self._stream_name = f"{self._key_prefix}:entries:stream"
+        self._stream_ids_name = f"{self._key_prefix}:entries:stream:ids"
+        self._stream_remaining_name = f"{self._key_prefix}:entries:stream:remaining"
+        self._stream_scripts_by_loop: dict[
+            asyncio.AbstractEventLoop, _StreamScripts
+        ] = {}
+        # Where the next `arecover` resumes its scan of the pending entries.
+        self._recovery_cursor = b"0-0"
+
+    def _async_redis(self) -> Any:
+        loop = asyncio.get_running_loop()
+        client = super()._async_redis()
+        if loop not in self._stream_scripts_by_loop:
+            self._stream_scripts_by_loop[loop] = _StreamScripts(
+                store=self._register_script(client, _STREAM_STORE_SCRIPT),
+                claim=self._register_script(client, _STREAM_CLAIM_SCRIPT),
+                renew=self._register_script(client, _STREAM_RENEW_SCRIPT),
+                release=self._register_script(client, _STREAM_RELEASE_SCRIPT),
+                remove=self._register_script(client, _STREAM_REMOVE_SCRIPT),
+                recover=self._register_script(client, _STREAM_RECOVER_SCRIPT),
+                expire=self._register_script(client, _STREAM_EXPIRE_SCRIPT),
+                delete=self._register_script(client, _STREAM_DELETE_SCRIPT),
+                has_pending=self._register_script(client, _STREAM_HAS_PENDING_SCRIPT),
+            )
+        return client
+
+    def _stream_scripts(self) -> _StreamScripts:
+        self._async_redis()
+        return self._stream_scripts_by_loop[asyncio.get_running_loop()]
+
+    @property
+    def _stream_keys(self) -> tuple[str, ...]:
+        return (
+            self._stream_name,
+            self._stream_ids_name,
+            self._stream_remaining_name,
+            self._entry_delayed_name,
+            self._entry_unclaimed_deadlines_name,
+        )
+
+    def _group_arg(self) -> bytes:
+        return self.encode(self.consumer_group, "ascii")
+
+    @staticmethod
+    def _deadline(entry: QueueEntry) -> int:
+        if entry.timeout_seconds is None:
+            raise ValueError("Event entries require a resolved lifetime")
+        return round(
+            (entry.queued_at + entry.timeout_seconds).to_timestamp()
+            * MICROSECONDS_PER_SECOND
+        )
+
+    def _message_entry(self, fields: dict) -> QueueEntry:
+        raw = fields.get(b"entry", fields.get("entry"))
+        if raw is None:
+            raise QueueValueError("Redis stream message has no entry record")
+        return self._decode_entry(raw)
+
+    async def astore_event_and_push(self, entry: QueueEntry) -> None:
+        """Add one event to the stream, indexing its ID and unclaimed deadline."""
+        await self.astore_event_and_push_many([entry])
+
+    async def astore_event_and_push_many(self, entries: list[QueueEntry]) -> None:
+        """Add a batch of events to the stream in one script call."""
+        args = [self._group_arg()]
+        for entry in entries:
+            args.extend(
+                (
+                    self.encode(str(entry.id), "ascii"),
+                    self._encode_entry(entry),
+                    self.encode(str(self._deadline(entry)), "ascii"),
+                )
+            )
+        await self._stream_scripts().store(keys=self._stream_keys, args=args)
+
+    async def astore_event(self, entry: QueueEntry) -> None:
+        await self.astore_event_and_push(entry)
+
+    async def afind(self, entry_id: uuid.UUID) -> QueueEntry:
+        client = self._async_redis()
+        message_id = await client.hget(self._stream_ids_name, str(entry_id))
+        if message_id is not None:
+            messages = await client.xrange(
+                self._stream_name, min=message_id, max=message_id
+            )
+            if messages:
+                return self._message_entry(messages[0][1])
+        raise QueueEntryNotFoundError(entry_id)
+
+    async def alist(self) -> list[QueueEntry]:
+        messages = await self._async_redis().xrange(self._stream_name)
+        return [self._message_entry(fields) for _, fields in messages]
+
+    async def adelete(self, entry_id: uuid.UUID) -> None:
+        await self._stream_scripts().delete(
+            keys=self._stream_keys,
+            args=(self._group_arg(), self.encode(str(entry_id), "ascii")),
+        )
+
+    async def aexpire_due(self) -> list[uuid.UUID]:
+        raw_ids = await self._stream_scripts().expire(
+            keys=self._stream_keys,
+            args=(
+                self._group_arg(),
+                self.encode(str(self.expire_batch_size), "ascii"),
+            ),
+        )
+        return [uuid.UUID(self.decode(raw_id, "ascii")) for raw_id in raw_ids]
+
+    async def ahas_pending(self) -> bool:
+        return bool(
+            await self._stream_scripts().has_pending(
+                keys=self._stream_keys, args=(self._group_arg(),)
+            )
+        )
+
+    async def _aclaim_stream(
+        self, consumer: str, *, message_id: bytes = b"", consume: bool = False
+    ) -> list[bytes]:
+        return await self._stream_scripts().claim(
+            keys=self._stream_keys,
+            args=(
+                self._group_arg(),
+                self.encode(consumer, "ascii"),
+                message_id,
+                b"1" if consume else b"0",
+            ),
+        )
+
+    def _delivered_entry(self, reply: list[bytes]) -> QueueEntry | None:
+        """Turn a claim script's reply into the delivered entry or an error.
+
+        Returns None for a message deleted before it could be delivered.
+        """
+        outcome = self.decode(reply[0], "ascii")
+        if outcome == "empty":
+            raise QueueEmptyException
+        if outcome == "missing":
+            return None
+        if outcome == "expired":
+            raise QueueEntryExpiredError(uuid.UUID(self.decode(reply[1], "ascii")))
+        if outcome not in {"claimed", "dequeued"}:
+            raise QueueValueError(f"Unknown Redis stream claim outcome: {outcome!r}")
+        return self._decode_entry(reply[2])
+
+    async def aclaim_unexpired(
+        self, worker_id: uuid.UUID, lease_seconds: float | None = None
+    ) -> QueueEntry:
+        """Claim the next due released or new event for *worker_id*.
+
+        The lease is not stored: the consumer group records when the message
+        was delivered, and `arecover` reclaims it once it has been idle for
+        longer than the lease.
+        """
+        if lease_seconds is not None:
+            validate_budget(lease_seconds)
+        entry = self._delivered_entry(await self._aclaim_stream(str(worker_id)))
+        if entry is None:
+            raise QueueEmptyException
+        return entry
+
+    async def aread(self, worker_id: uuid.UUID, timeout: float) -> QueueEntry | None:
+        """Block for up to *timeout* seconds for a new event, and claim it.
+
+        The read ends early, returning None, when a released event falls due
+        for redelivery, since only `aclaim_unexpired` delivers those.
+        """
+        self._async_redis()
+        due_us = await self._async_scripts_by_loop[asyncio.get_running_loop()].next_due(
+            keys=(self._entry_delayed_name,)
+        )
+        if due_us is not None:
+            timeout = min(timeout, int(due_us) / MICROSECONDS_PER_SECOND)
+        client = self._async_blocking_redis()
+        try:
+            reply = await client.xreadgroup(
+                self.consumer_group,
+                str(worker_id),
+                {self._stream_name: ">"},
+                count=1,
+                # BLOCK 0 would wait indefinitely.
+                block=max(1, round(timeout * 1000)),
+            )
+        except redis.ResponseError as exc:
+            if "NOGROUP" not in str(exc):
+                raise
+            # Nothing has been enqueued yet: create the stream to wait on.
+            try:
+                await client.xgroup_create(
+                    self._stream_name, self.consumer_group, id="0", mkstream=True
+                )
+            except redis.ResponseError as exists:
+                if "BUSYGROUP" not in str(exists):
+                    raise
+            return None
+        if not reply:
+            return None
+        message_id = reply[0][1][0][0]
+        return self._delivered_entry(
+            await self._aclaim_stream(str(worker_id), message_id=message_id)
+        )
+
+    async def await_pending(self, timeout: float) -> None:
+        """Block until an event is added, a released one falls due, or
+        *timeout* seconds elapse, without reading anything for the group."""
+        self._async_redis()
+        due_us = await self._async_scripts_by_loop[asyncio.get_running_loop()].next_due(
+            keys=(self._entry_delayed_name,)
+        )
+        if due_us is not None:
+            timeout = min(timeout, int(due_us) / MICROSECONDS_PER_SECOND)
+        if timeout > 0:
+            await self._async_blocking_redis().xread(
+                {self._stream_name: "$"}, count=1, block=max(1, round(timeout * 1000))
+            )
+
+    async def adequeue(self) -> QueueEntry:
+        """Atomically consume and return the next live event."""
+        while True:
+            entry = self._delivered_entry(
+                await self._aclaim_stream("dequeue", consume=True)
+            )
+            if entry is not None:
+                return entry
+
+    async def arenew(
+        self, entry_id: uuid.UUID, worker_id: uuid.UUID, lease_seconds: float
+    ) -> bool:
+        validate_budget(lease_seconds)
+        return bool(
+            await self._stream_scripts().renew(
+                keys=self._stream_keys,
+                args=(
+                    self._group_arg(),
+                    self.encode(str(worker_id), "ascii"),
+                    self.encode(str(entry_id), "ascii"),
+                    self.encode(
+                        str(round(lease_seconds * MICROSECONDS_PER_SECOND)), "ascii"
+                    ),
+                ),
+            )
+        )
+
+    async def arelease(
+        self, entry_id: uuid.UUID, worker_id: uuid.UUID, delay_seconds: float
+    ) -> bool:
+        validate_budget(delay_seconds)
+        return bool(
+            await self._stream_scripts().release(
+                keys=self._stream_keys,
+                args=(
+                    self._group_arg(),
+                    self.encode(str(worker_id), "ascii"),
+                    self.encode(str(entry_id), "ascii"),
+                    self.encode(
+                        str(round(delay_seconds * MICROSECONDS_PER_SECOND)), "ascii"
+                    ),
+                ),
+            )
+        )
+
+    async def aremove(self, entry_id: uuid.UUID, worker_id: uuid.UUID) -> bool:
+        return bool(
+            await self._stream_scripts().remove(
+                keys=self._stream_keys,
+                args=(
+                    self._group_arg(),
+                    self.encode(str(worker_id), "ascii"),
+                    self.encode(str(entry_id), "ascii"),
+                ),
+            )
+        )
+
+    async def arecover(
+        self, batch_size: int, lease_seconds: float = 600.0
+    ) -> tuple[int, int]:
+        """Release claims idle for longer than *lease_seconds* for redelivery.
+
+        Scans at most *batch_size* pending messages per call, resuming where
+        the previous call stopped.
+        """
+        if type(batch_size) is not int or batch_size <= 0:
+            raise ValueError("Recovery batch size must be a positive integer")
+        validate_budget(lease_seconds)
+        cursor, recovered, discarded = await self._stream_scripts().recover(
+            keys=self._stream_keys,
+            args=(
+                self._group_arg(),
+                b"recovery",
+                self.encode(str(round(lease_seconds * 1000)), "ascii"),
+                self._recovery_cursor,
+                self.encode(str(batch_size), "ascii"),
+            ),
+        )
+        self._recovery_cursor = cursor
+        return int(recovered), int(discarded)
+
+    async def aclose(self) -> None:
+        self._stream_scripts_by_loop.pop(asyncio.get_running_loop(), None)
+        await super().aclose()
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from collections import deque
 from dataclasses import replace
 from uuid import UUID
 
@@ -15,7 +16,7 @@ from django_queue.backends.exceptions import (
 from django_queue.clock import MICROSECONDS_PER_SECOND
 from django_queue.entries import QueueEntry, QueueEntryStatus
 from django_queue.event_worker import EventQueueWorker
-from django_queue.worker import AsyncQueueWorker
+from django_queue.worker import DEFAULT_TIMEOUT_SECONDS, AsyncQueueWorker
 
 logger = logging.getLogger(__name__)
 
@@ -58,16 +59,26 @@ class RedisAsyncQueueWorker(AsyncQueueWorker):
                 )
 
     async def _next(self, queue) -> tuple[QueueEntry, float | None] | None:
-        """Claim the next Redis entry and establish its delivery lease."""
+        """Claim, lease, and start the next Redis entry in one round trip.
+
+        The claim script sizes the lease from the entry's own budget and
+        returns the entry already RUNNING and published; one it could not
+        start comes back as stored, and `_dispatch` starts it as before.
+        """
         await self._recover_expired_claims(queue)
-        provider = self._providers[queue]
-        entry = await queue.aclaim(self._worker_id, queue.default_claim_lease_seconds)
-        lease_seconds = self.budget_for(queue, entry) + self._cancellation_grace_period
-        if not await provider.arenew(entry.id, self._worker_id, lease_seconds):
-            logger.warning("Lost claim for queue entry %s before dispatch", entry.id)
-            return None
+        entry = await queue.aclaim_and_start(
+            self._worker_id,
+            budget_seconds=self._timeout_seconds,
+            default_budget_seconds=(
+                DEFAULT_TIMEOUT_SECONDS
+                if queue.timeout_seconds is None
+                else queue.timeout_seconds
+            ),
+            grace_seconds=self._cancellation_grace_period,
+            published_through=self._last_observed_entry_id.get(queue),
+        )
         self._last_claim_conflict_at.pop(entry.id, None)
-        return entry, lease_seconds
+        return entry, self.budget_for(queue, entry) + self._cancellation_grace_period
 
     async def _discard_missing(self, queue, entry_id: UUID) -> None:
         """Discard a Redis claim whose durable entry is unexpectedly absent."""
@@ -181,17 +192,21 @@ class RedisEventQueueWorker(EventQueueWorker):
                 extra={"queue": self._queue.queue_name, "entry_id": str(exc.entry_id)},
             )
             return None
-        if not await self._provider.arenew(entry.id, self._worker_id, lease_seconds):
+        if not await self._confirm_lease(entry, lease_seconds):
             logger.warning("Lost claim for event entry %s before dispatch", entry.id)
             return None
         return entry, lease_seconds
 
+    async def _confirm_lease(self, entry: QueueEntry, lease_seconds: float) -> bool:
+        """Start a freshly claimed event's lease, or report it already lost."""
+        return await self._provider.arenew(entry.id, self._worker_id, lease_seconds)
+
     async def _recover_expired_claims(self) -> None:
         now = asyncio.get_running_loop().time()
         if now - self._last_recovery_at < self.recovery_interval:
             return
         self._last_recovery_at = now
-        recovered, discarded = await self._provider.arecover(
+        recovered, discarded = await self._arecover(
             getattr(self._queue, "recovery_batch_size", 100)
         )
         if recovered:
@@ -207,6 +222,10 @@ class RedisEventQueueWorker(EventQueueWorker):
                 "s" if discarded != 1 else "",
             )
 
+    async def _arecover(self, batch_size: int) -> tuple[int, int]:
+        """Return expired claims to delivery; return (recovered, discarded)."""
+        return await self._provider.arecover(batch_size)
+
     async def _renew_claim(self, entry: QueueEntry, lease_seconds: float) -> bool:
         try:
             while True:
@@ -233,3 +252,43 @@ class RedisEventQueueWorker(EventQueueWorker):
     async def _remove(self, entry: QueueEntry) -> None:
         if not await self._provider.aremove(entry.id, self._worker_id):
             logger.warning("Lost claim for event entry %s before removal", entry.id)
+
+
+class RedisStreamEventQueueWorker(RedisEventQueueWorker):
+    """Event worker for queues composed with QueueProviderRedisStream.
+
+    Idles in a blocking consumer-group read rather than polling, so a new
+    event is claimed by the read that wakes for it.
+    """
+
+    provider_type = "redis-stream"
+
+    def __init__(self, queue, **kwargs) -> None:
+        super().__init__(queue, **kwargs)
+        self._delivered: deque[tuple[QueueEntry, float | None]] = deque()
+
+    async def _next(self) -> tuple[QueueEntry, float | None] | None:
+        if self._delivered:
+            return self._delivered.popleft()
+        return await super()._next()
+
+    async def _confirm_lease(self, entry: QueueEntry, lease_seconds: float) -> bool:
+        # Delivery to this consumer already started the lease.
+        return True
+
+    async def _arecover(self, batch_size: int) -> tuple[int, int]:
+        return await self._provider.arecover(
+            batch_size, self._queue.default_claim_lease_seconds
+        )
+
+    async def _await_delivery(self, timeout: float) -> None:
+        try:
+            entry = await self._provider.aread(self._worker_id, timeout)
+        except QueueEntryExpiredError as exc:
+            logger.debug(
+                "Skipping event entry that expired before dispatch",
+                extra={"queue": self._queue.queue_name, "entry_id": str(exc.entry_id)},
+            )
+            return
+        if entry is not None:
+            self._delivered.append((entry, self._queue.default_claim_lease_seconds))
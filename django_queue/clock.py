@@ -180,8 +180,26 @@ class QueueClockError(RuntimeError):
     """Raised when Redis-backed queue time cannot be trusted."""
 
 
+@dataclass(frozen=True, slots=True)
+class _Calibration:
+    """A Redis-to-local UTC offset and the monotonic reading it was taken at."""
+
+    # Named rather than positional: both are counts of seconds, one a
+    # wall-clock offset and one a monotonic reading, so a transposition would
+    # type-check and silently break refreshing.
+    offset: float
+    read_at: float
+
+
 class RedisQueueClock:
-    """Derive timestamps from a periodically refreshed Redis-to-local UTC offset."""
+    """Derive timestamps from a periodically refreshed Redis-to-local UTC offset.
+
+    The offset lives in one immutable calibration that a refresh replaces
+    whole, so reading the time takes no lock: only the first calibration and
+    the start of a background refresh do. A provider that already has a Redis
+    `TIME` reading to hand -- a script's reply -- can pass it to `observe`
+    instead of leaving the clock to ask Redis for one.
+    """
 
     def __init__(
         self,
@@ -197,8 +215,8 @@ class RedisQueueClock:
         self._refresh_interval = refresh_interval
         self._monotonic = monotonic
         self._utcnow = utcnow
+        self._calibration: _Calibration | None = None
         self._last_refresh_attempt: float | None = None
-        self._offset: float | None = None
         self._refreshing = False
         self._lock = Lock()
         self._async_lock = AsyncLock()
@@ -216,43 +234,82 @@ class RedisQueueClock:
         return self._refreshing
 
     def now(self) -> ClockTime:
-        with self._lock:
-            if self._asynchronous:
-                if self._offset is None:
-                    try:
-                        get_running_loop()
-                    except RuntimeError:
-                        pass
-                    else:
-                        raise QueueClockError(
-                            "Redis queue clock is not calibrated; await anow() first"
-                        )
-                    return async_to_sync(self.anow)()
-                return self._utcnow() + self._offset
-            monotonic_now = self._monotonic()
-            if self._offset is None:
-                self._set_calibration(self._read_calibration())
-            elif self._needs_refresh(monotonic_now) and not self._refreshing:
-                self._refreshing = True
-                self._last_refresh_attempt = monotonic_now
-                Thread(target=self._refresh_in_background, daemon=True).start()
-
-            assert self._offset is not None
-            return self._utcnow() + self._offset
+        """Return Redis-derived time from the current calibration.
+
+        Never waits on Redis once calibrated, so an asynchronous clock serves
+        it inside its event loop too; a due refresh runs in the background.
+        """
+        calibration = self._calibration
+        if calibration is None:
+            return self._calibrate()
+        self._refresh_if_due(asynchronous=self._asynchronous)
+        return self._utcnow() + calibration.offset
 
     async def anow(self) -> ClockTime:
         """Return Redis-derived time without blocking the running event loop."""
-        async with self._async_lock:
-            monotonic_now = self._monotonic()
-            if self._offset is None:
-                self._set_calibration(await self._aread_calibration())
-            elif self._needs_refresh(monotonic_now) and not self._refreshing:
-                self._refreshing = True
-                self._last_refresh_attempt = monotonic_now
-                self._refresh_task = create_task(self._arefresh_in_background())
-
-            assert self._offset is not None
-            return self._utcnow() + self._offset
+        calibration = self._calibration
+        if calibration is None:
+            async with self._async_lock:
+                if self._calibration is None:
+                    self._set_calibration(await self._aread_calibration())
+            calibration = self._calibration
+            assert calibration is not None
+        else:
+            self._refresh_if_due(asynchronous=True)
+        return self._utcnow() + calibration.offset
+
+    def observe(self, instant: ClockTime) -> None:
+        """Calibrate from a Redis `TIME` instant read moments ago, when due.
+
+        Takes the place of the next refresh, saving its round trip, but only
+        once one is due, so the offset does not shift with every reply. An
+        instant beyond the permitted drift is ignored; the next refresh reports
+        it.
+        """
+        monotonic_now = self._monotonic()
+        if self._calibration is not None and not self._needs_refresh(monotonic_now):
+            return
+        offset = instant - self._utcnow()
+        if abs(offset) <= MAX_CLOCK_DRIFT_SECONDS:
+            self._set_calibration(_Calibration(offset, monotonic_now))
+
+    def _calibrate(self) -> ClockTime:
+        if self._asynchronous:
+            try:
+                get_running_loop()
+            except RuntimeError:
+                return async_to_sync(self.anow)()
+            raise QueueClockError(
+                "Redis queue clock is not calibrated; await anow() first"
+            )
+        with self._lock:
+            calibration = self._calibration
+            if calibration is None:
+                calibration = self._read_calibration()
+                self._set_calibration(calibration)
+            return self._utcnow() + calibration.offset
+
+    def _refresh_if_due(self, *, asynchronous: bool) -> None:
+        monotonic_now = self._monotonic()
+        if self._refreshing or not self._needs_refresh(monotonic_now):
+            return
+        if asynchronous:
+            try:
+                get_running_loop()
+            except RuntimeError:
+                return
+            # The loop runs one task at a time, so nothing else can start a
+            # refresh between the check above and setting the flag here.
+            self._refreshing = True
+            self._last_refresh_attempt = monotonic_now
+            self._refresh_task = create_task(self._arefresh_in_background())
+            return
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+            self._last_refresh_attempt = monotonic_now
+        Thread(target=self._refresh_in_background, daemon=True).start()
 
     def _needs_refresh(self, monotonic_now: float) -> bool:
         return (
@@ -260,31 +317,25 @@ class RedisQueueClock:
             or monotonic_now - self._last_refresh_attempt >= self._refresh_interval
         )
 
-    def _read_calibration(self) -> tuple[float, float]:
+    def _read_calibration(self) -> _Calibration:
         local_time = self._utcnow()
         try:
             seconds, microseconds = cast(RedisTimeClient, self._redis).time()
         except Exception as exc:
             raise QueueClockError("Redis TIME is unavailable") from exc
+        return self._calibration_from(seconds, microseconds, local_time)
 
-        try:
-            offset = ClockTime.from_timeval(seconds, microseconds) - local_time
-        except (TypeError, ValueError) as exc:
-            raise QueueClockError(
-                f"Redis TIME reported an unusable instant: {seconds!r}, {microseconds!r}"
-            ) from exc
-        if abs(offset) > MAX_CLOCK_DRIFT_SECONDS:
-            raise QueueClockError(
-                "Redis and local UTC clocks exceed the maximum permitted drift"
-            )
-        return offset, self._monotonic()
-
-    async def _aread_calibration(self) -> tuple[float, float]:
+    async def _aread_calibration(self) -> _Calibration:
         local_time = self._utcnow()
         try:
             seconds, microseconds = await cast(AsyncRedisTimeClient, self._redis).time()
         except Exception as exc:
             raise QueueClockError("Redis TIME is unavailable") from exc
+        return self._calibration_from(seconds, microseconds, local_time)
+
+    def _calibration_from(
+        self, seconds: int, microseconds: int, local_time: ClockTime
+    ) -> _Calibration:
         try:
             offset = ClockTime.from_timeval(seconds, microseconds) - local_time
         except (TypeError, ValueError) as exc:
@@ -295,15 +346,13 @@ class RedisQueueClock:
             raise QueueClockError(
                 "Redis and local UTC clocks exceed the maximum permitted drift"
             )
-        return offset, self._monotonic()
+        return _Calibration(offset, self._monotonic())
 
-    def _set_calibration(self, calibration: tuple[float, float]) -> None:
-        # Named rather than unpacked: both are counts of seconds, one a
-        # wall-clock offset and one a monotonic reading, so a transposition
-        # would type-check and silently break refreshing.
-        offset, read_at = calibration
-        self._offset = offset
-        self._last_refresh_attempt = read_at
+    def _set_calibration(self, calibration: _Calibration) -> None:
+        # The offset is swapped in as part of one object, so a reader without
+        # the lock sees the old calibration or the new one, never a mixture.
+        self._calibration = calibration
+        self._last_refresh_attempt = calibration.read_at
 
     def _refresh_in_background(self) -> None:
         # Any failure retains the last good offset and retries at the next
@@ -321,8 +370,7 @@ class RedisQueueClock:
                 exc_info=exc,
             )
         else:
-            with self._lock:
-                self._set_calibration(calibration)
+            self._set_calibration(calibration)
         finally:
             with self._lock:
                 self._refreshing = False
@@ -336,12 +384,10 @@ class RedisQueueClock:
                 exc_info=exc,
             )
         else:
-            async with self._async_lock:
-                self._set_calibration(calibration)
+            self._set_calibration(calibration)
         finally:
-            async with self._async_lock:
-                self._refreshing = False
-                self._refresh_task = None
+            self._refreshing = False
+            self._refresh_task = None
 
     async def aclose(self) -> None:
         """Cancel the loop-local calibration refresh, if one is running."""
@@ -356,7 +402,6 @@ class RedisQueueClock:
             if task is not None and task.cancelling():
                 raise
         finally:
-            async with self._async_lock:
-                if self._refresh_task is refresh_task:
-                    self._refreshing = False
-                    self._refresh_task = None
+            if self._refresh_task is refresh_task:
+                self._refreshing = False
+                self._refresh_task = None
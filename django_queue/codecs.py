@@ -0,0 +1,302 @@
+"""Stored-record formats for queue entries.
+
+A provider that persists entries outside the process -- the Redis provider --
+writes each one through an :class:`EntryCodec`, selected per queue with the
+``ENTRY_CODEC`` setting. :class:`JsonEntryCodec`, the default, stores
+`QueueEntry.to_dict` as JSON. :class:`CompactEntryCodec` stores the fixed
+lifecycle fields in a binary header and only the rest as JSON, which is
+smaller and cheaper to encode and decode. :class:`HashEntryCodec` stores
+each entry as a Redis hash, one field per entry field, so a state transition
+rewrites only the fields it changes.
+
+Redis scripts read an entry's status, priority and budget straight from the
+stored record, so a codec's records must be in one of these three formats; a
+subclass may change how a record is produced, but not its layout.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import struct
+import uuid
+from abc import ABC, abstractmethod
+
+from django_queue.clock import MICROSECONDS_PER_SECOND, ClockTime
+from django_queue.entries import (
+    QueueEntry,
+    QueueEntryStatus,
+    stored_fields,
+    trusted_entry,
+)
+
+
+class EntryCodec(ABC):
+    """Convert queue entries to stored records and back."""
+
+    @abstractmethod
+    def encode(self, entry: QueueEntry) -> bytes:
+        raise NotImplementedError("encode")
+
+    @abstractmethod
+    def decode(self, raw: bytes | str, entry_class: type[QueueEntry]) -> QueueEntry:
+        raise NotImplementedError("decode")
+
+    def encode_changes(self, entry: QueueEntry) -> bytes:
+        """Return the record a state transition writes over a stored entry.
+
+        Defaults to the whole record; a codec may leave out the fields no
+        transition changes.
+        """
+        return self.encode(entry)
+
+
+class JsonEntryCodec(EntryCodec):
+    """Store `QueueEntry.to_dict` as an ASCII JSON object."""
+
+    def encode(self, entry: QueueEntry) -> bytes:
+        # The default separators are part of the format: Redis scripts start a
+        # claimed entry by splicing its `"status": ` and `"dispatched_at": `
+        # values in place.
+        record = entry.to_dict()
+        record["payload"] = None
+        return _with_payload(json.dumps(record), '"payload": null', entry)
+
+    def decode(self, raw: bytes | str, entry_class: type[QueueEntry]) -> QueueEntry:
+        return entry_class.from_trusted_dict(json.loads(raw))
+
+
+# A JSON record always starts with "{", so a leading NUL marks a compact one.
+COMPACT_RECORD_MARKER = 0
+COMPACT_RECORD_VERSION = 1
+# Marker, version, status code, field flags, priority, budget, then queued_at,
+# dispatched_at and finished_at in microseconds, then the entry ID. Redis
+# scripts unpack the same layout; see `_ENTRY_LUA` in the Redis provider.
+_COMPACT_HEADER = struct.Struct(">BBBBqdqqq16s")
+# Bits of the flags byte, set when the matching optional field has a value.
+_HAS_TIMEOUT = 1
+_HAS_DISPATCHED_AT = 2
+_HAS_FINISHED_AT = 4
+_STATUSES = tuple(QueueEntryStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+_HEADER_FIELDS = frozenset(
+    {
+        "id",
+        "status",
+        "queued_at",
+        "dispatched_at",
+        "finished_at",
+        "timeout_seconds",
+        "priority",
+    }
+)
+_INT64 = range(-(2**63), 2**63)
+
+
+def _with_payload(text: str, placeholder: str, entry: QueueEntry) -> bytes:
+    """Splice the entry's already serialised payload over *placeholder*.
+
+    The fields ahead of the payload are the ID, queue name, status and
+    instants; a JSON string escapes its quotes, so none of them can contain
+    the placeholder and its first match is the payload's own.
+    """
+    key = placeholder.removesuffix("null")
+    return text.replace(placeholder, key + entry.payload_json(), 1).encode("ascii")
+
+
+@functools.cache
+def _body_fields(entry_class: type[QueueEntry]) -> tuple[str, ...]:
+    """Return the fields a compact record stores in its JSON body."""
+    return tuple(
+        field.name
+        for field in stored_fields(entry_class)
+        if field.init and field.name not in _HEADER_FIELDS
+    )
+
+
+def _instant_us(instant: ClockTime | None) -> int:
+    if instant is None:
+        return 0
+    return instant.seconds * MICROSECONDS_PER_SECOND + instant.microseconds
+
+
+def _instant(microseconds: int) -> ClockTime:
+    return ClockTime(*divmod(microseconds, MICROSECONDS_PER_SECOND))
+
+
+class CompactEntryCodec(EntryCodec):
+    """Store the lifecycle fields in a fixed binary header, the rest as JSON.
+
+    The header holds the ID as 16 bytes, the status as a one-byte code and the
+    instants as whole microseconds, so they are exact and need no parsing.
+    The queue name, payload, result, error and any subclass fields follow as
+    one compact JSON object. An entry whose priority does not fit in 64 bits
+    is stored as JSON instead; `decode` reads either format.
+    """
+
+    _json = JsonEntryCodec()
+
+    def encode(self, entry: QueueEntry) -> bytes:
+        if entry.priority not in _INT64:
+            return self._json.encode(entry)
+        flags = (
+            (_HAS_TIMEOUT if entry.timeout_seconds is not None else 0)
+            | (_HAS_DISPATCHED_AT if entry.dispatched_at is not None else 0)
+            | (_HAS_FINISHED_AT if entry.finished_at is not None else 0)
+        )
+        header = _COMPACT_HEADER.pack(
+            COMPACT_RECORD_MARKER,
+            COMPACT_RECORD_VERSION,
+            _STATUS_CODES[entry.status],
+            flags,
+            entry.priority,
+            0.0 if entry.timeout_seconds is None else entry.timeout_seconds,
+            _instant_us(entry.queued_at),
+            _instant_us(entry.dispatched_at),
+            _instant_us(entry.finished_at),
+            entry.id.bytes,
+        )
+        # Body fields have no wire conversion, so they are stored as they are.
+        body = {name: getattr(entry, name) for name in _body_fields(type(entry))}
+        body["payload"] = None
+        return header + _with_payload(
+            json.dumps(body, separators=(",", ":")), '"payload":null', entry
+        )
+
+    def decode(self, raw: bytes | str, entry_class: type[QueueEntry]) -> QueueEntry:
+        if isinstance(raw, str) or not raw or raw[0] != COMPACT_RECORD_MARKER:
+            return self._json.decode(raw, entry_class)
+        try:
+            (
+                _,
+                version,
+                status_code,
+                flags,
+                priority,
+                timeout_seconds,
+                queued_us,
+                dispatched_us,
+                finished_us,
+                entry_id,
+            ) = _COMPACT_HEADER.unpack_from(raw)
+            if version != COMPACT_RECORD_VERSION:
+                raise ValueError(f"unsupported record version {version}")
+            body = json.loads(raw[_COMPACT_HEADER.size :])
+            values = {
+                name: body[name] for name in _body_fields(entry_class) if name in body
+            }
+            values.update(
+                id=uuid.UUID(bytes=entry_id),
+                status=_STATUSES[status_code],
+                queued_at=_instant(queued_us),
+                dispatched_at=_instant(dispatched_us)
+                if flags & _HAS_DISPATCHED_AT
+                else None,
+                finished_at=_instant(finished_us) if flags & _HAS_FINISHED_AT else None,
+                timeout_seconds=timeout_seconds if flags & _HAS_TIMEOUT else None,
+                priority=priority,
+            )
+            return trusted_entry(entry_class, values)
+        except (TypeError, ValueError, IndexError, struct.error) as exc:
+            raise ValueError(f"Queue entry record is invalid: {exc}") from exc
+
+
+# A hash record is "\x01" followed by its field names and values, all joined
+# by NUL; a JSON value never contains an unescaped NUL. "\x02" marks a partial
+# one, which only updates the fields it names. Redis scripts write either kind
+# into a hash and read a stored hash back as a full record; see `_ENTRY_LUA`
+# in the Redis provider.
+HASH_RECORD_MARKER = 1
+HASH_CHANGES_MARKER = 2
+# Fields no state transition changes, left out of a partial record.
+_UNCHANGING_FIELDS = frozenset({"payload"})
+
+
+@functools.cache
+def _changing_fields(entry_class: type[QueueEntry]) -> tuple[str, ...]:
+    return tuple(
+        name for name in _body_fields(entry_class) if name not in _UNCHANGING_FIELDS
+    )
+
+
+def _hash_instant(text: bytes) -> ClockTime | None:
+    return _instant(int(text)) if text else None
+
+
+class HashEntryCodec(EntryCodec):
+    """Store each entry as a Redis hash, one field per entry field.
+
+    The status, ID and instants are stored as text -- the instants as whole
+    microseconds, empty when unset -- and every other field as JSON, so Redis
+    scripts read and rewrite the lifecycle fields without touching the
+    payload. `encode_changes` leaves the payload out, so a state transition
+    costs the same whatever the payload's size. `decode` also reads the JSON
+    and compact formats, so a queue can switch to this codec with records of
+    either kind still stored.
+    """
+
+    _compact = CompactEntryCodec()
+
+    def encode(self, entry: QueueEntry) -> bytes:
+        return self._encode(entry, HASH_RECORD_MARKER, _body_fields(type(entry)))
+
+    def encode_changes(self, entry: QueueEntry) -> bytes:
+        return self._encode(entry, HASH_CHANGES_MARKER, _changing_fields(type(entry)))
+
+    @staticmethod
+    def _encode(entry: QueueEntry, marker: int, names: tuple[str, ...]) -> bytes:
+        values = [
+            "id",
+            str(entry.id),
+            "status",
+            entry.status.value,
+            "priority",
+            str(entry.priority),
+            "timeout_seconds",
+            json.dumps(entry.timeout_seconds),
+            "queued_at",
+            str(_instant_us(entry.queued_at)),
+            "dispatched_at",
+            ""
+            if entry.dispatched_at is None
+            else str(_instant_us(entry.dispatched_at)),
+            "finished_at",
+            "" if entry.finished_at is None else str(_instant_us(entry.finished_at)),
+        ]
+        for name in names:
+            values += (
+                name,
+                entry.payload_json()
+                if name == "payload"
+                else json.dumps(getattr(entry, name)),
+            )
+        return bytes((marker,)) + "\0".join(values).encode("ascii")
+
+    def decode(self, raw: bytes | str, entry_class: type[QueueEntry]) -> QueueEntry:
+        if isinstance(raw, str) or not raw or raw[0] != HASH_RECORD_MARKER:
+            return self._compact.decode(raw, entry_class)
+        try:
+            parts = raw[1:].split(b"\0")
+            stored = dict(zip(parts[::2], parts[1::2], strict=True))
+            values = {
+                name: json.loads(stored[key])
+                for name in _body_fields(entry_class)
+                if (key := name.encode()) in stored
+            }
+            values.update(
+                id=uuid.UUID(stored[b"id"].decode("ascii")),
+                status=QueueEntryStatus(stored[b"status"].decode("ascii")),
+                queued_at=_instant(int(stored[b"queued_at"])),
+                dispatched_at=_hash_instant(stored[b"dispatched_at"]),
+                finished_at=_hash_instant(stored[b"finished_at"]),
+                timeout_seconds=json.loads(stored[b"timeout_seconds"]),
+                priority=int(stored[b"priority"]),
+            )
+            payload_json = stored.get(b"payload")
+            return trusted_entry(
+                entry_class,
+                values,
+                None if payload_json is None else payload_json.decode("ascii"),
+            )
+        except (TypeError, ValueError, KeyError) as exc:
+            raise ValueError(f"Queue entry record is invalid: {exc}") from exc
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import math
 import uuid
 from collections.abc import Callable, Mapping
-from dataclasses import MISSING, dataclass, fields
+from dataclasses import MISSING, Field, dataclass, field, fields
 from enum import StrEnum
 from typing import Any
 
@@ -132,14 +133,38 @@ def validate_priority(value: Any) -> int:
     return value
 
 
-def validate_json_value(value: Any) -> None:
-    """Raise ``TypeError`` unless *value* can be stored in the JSON wire format."""
+def validate_json_value(value: Any) -> str:
+    """Return *value* as compact JSON text, raising ``TypeError`` unless it can
+    be stored in the JSON wire format."""
     try:
-        json.dumps(value)
+        return json.dumps(value, separators=(",", ":"))
     except (TypeError, ValueError) as exc:
         raise TypeError("Queue entry values must be JSON-serialisable") from exc
 
 
+class EncodedValue:
+    """A JSON-safe value and its JSON text, serialised at most once.
+
+    A `QueueEntry` keeps one for its payload, and every copy `replace` makes
+    of it shares the same one while the payload is the same object, so the
+    payload is validated and serialised once however often the entry moves
+    through its lifecycle. Without *text*, the value is taken as already
+    valid and serialised only if `text` is asked for.
+    """
+
+    __slots__ = ("_text", "value")
+
+    def __init__(self, value: Any, text: str | None = None) -> None:
+        self.value = value
+        self._text = text
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = validate_json_value(self.value)
+        return self._text
+
+
 @dataclass(frozen=True, slots=True)
 class QueueEntry:
     """An immutable, identified record of queued work and its lifecycle."""
@@ -159,6 +184,10 @@ class QueueEntry:
     # Higher dispatches first; only consulted by priority-variant backends'
     # tracked aenqueue/adequeue path. Ignored (FIFO) elsewhere.
     priority: int = 0
+    # The payload's JSON text, kept rather than stored; see `payload_json`.
+    _payload_json: EncodedValue | None = field(
+        default=None, kw_only=True, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         if not isinstance(self.id, uuid.UUID):
@@ -180,12 +209,19 @@ class QueueEntry:
             raise ValueError("Queue entry IDs must be UUIDv7 values")
         if not self.queue:
             raise ValueError("Queue entry queue names must not be empty")
-        for field in fields(self):
+        payload_json = self._payload_json
+        if payload_json is None or payload_json.value is not self.payload:
+            object.__setattr__(
+                self,
+                "_payload_json",
+                EncodedValue(self.payload, validate_json_value(self.payload)),
+            )
+        for entry_field in stored_fields(type(self)):
             # A field either has a wire conversion or is stored as-is, in which
-            # case it must already be JSON-safe. That covers the payload and any
-            # field a subclass declares.
-            if field.name not in _WIRE_DECODERS:
-                validate_json_value(getattr(self, field.name))
+            # case it must already be JSON-safe. That covers the result, error
+            # and any field a subclass declares; the payload is checked above.
+            if entry_field.name not in _WIRE_DECODERS and entry_field.name != "payload":
+                validate_json_value(getattr(self, entry_field.name))
 
     @property
     def queued_for(self) -> float | None:
@@ -197,6 +233,18 @@ class QueueEntry:
         """
         return elapsed_time(self.queued_at, self.dispatched_at)
 
+    def payload_json(self) -> str:
+        """Return the payload as compact JSON text.
+
+        Serialised when the entry was created -- or, for an entry restored by
+        a provider, the first time it is asked for -- and shared with every
+        copy that keeps the same payload, so writing a record back does not
+        serialise the payload again.
+        """
+        # Set by `__post_init__` and `trusted_entry`; None only as a default.
+        assert self._payload_json is not None
+        return self._payload_json.text
+
     @property
     def ran_for(self) -> float | None:
         """Seconds this entry's handler ran, once it reached a terminal state."""
@@ -230,8 +278,10 @@ class QueueEntry:
     def to_dict(self) -> dict[str, Any]:
         """Return the complete JSON-compatible durable representation."""
         return {
-            field.name: _encode_wire_value(field.name, getattr(self, field.name))
-            for field in fields(self)
+            entry_field.name: _encode_wire_value(
+                entry_field.name, getattr(self, entry_field.name)
+            )
+            for entry_field in stored_fields(type(self))
         }
 
     @classmethod
@@ -244,23 +294,137 @@ class QueueEntry:
         a caller catches one class and an operator reads one kind of message.
         """
         missing = [
-            field.name
-            for field in fields(cls)
-            if field.init
-            and field.name not in value
-            and field.default is MISSING
-            and field.default_factory is MISSING
+            entry_field.name
+            for entry_field in stored_fields(cls)
+            if entry_field.init
+            and entry_field.name not in value
+            and entry_field.default is MISSING
+            and entry_field.default_factory is MISSING
         ]
         if missing:
             raise ValueError(
                 f"Queue entry record is missing {', '.join(sorted(missing))}"
             )
         decoded = {
-            field.name: _decode_wire_value(field.name, value[field.name])
-            for field in fields(cls)
-            if field.init and field.name in value
+            entry_field.name: _decode_wire_value(
+                entry_field.name, value[entry_field.name]
+            )
+            for entry_field in stored_fields(cls)
+            if entry_field.init and entry_field.name in value
         }
         try:
             return cls(**decoded)
         except (TypeError, ValueError) as exc:
             raise ValueError(f"Queue entry record is invalid: {exc}") from exc
+
+    @classmethod
+    def from_trusted_dict(cls, value: dict[str, Any]) -> QueueEntry:
+        """Rebuild an entry from a durable representation this package wrote.
+
+        For records a provider stored or published itself, which were valid
+        when written: the wire values are decoded, but the entry is not
+        validated again -- see `trusted_entry`. A record that will not decode
+        is handed to `from_dict`, so it fails the same way there.
+        """
+        try:
+            decoded = {
+                name: value[name]
+                if decoder is None or value[name] is None
+                else decoder(value[name])
+                for name, decoder, _, _ in _field_plan(cls).fields
+                if name in value
+            }
+        except TypeError, ValueError:
+            return cls.from_dict(value)
+        return trusted_entry(cls, decoded)
+
+
+@functools.cache
+def stored_fields(entry_class: type[QueueEntry]) -> tuple[Field, ...]:
+    """Return the fields of *entry_class* that make up its durable record."""
+    return tuple(
+        entry_field
+        for entry_field in fields(entry_class)
+        if entry_field.name != "_payload_json"
+    )
+
+
+# Marks a field without a default in a `_FieldPlan`.
+_REQUIRED = object()
+
+
+@dataclass(frozen=True, slots=True)
+class _FieldPlan:
+    """How to rebuild one entry class from stored values, worked out once."""
+
+    # Name, wire decoder (None when stored as-is), default and default
+    # factory for each field, in declaration order.
+    fields: tuple[tuple[str, Callable[[Any], Any] | None, Any, Any], ...]
+    # False when the class can only be built through its constructor: it
+    # declares a field the constructor does not set, or a `__post_init__` of
+    # its own that may derive state rather than only validate it.
+    direct: bool
+
+
+@functools.cache
+def _field_plan(entry_class: type[QueueEntry]) -> _FieldPlan:
+    entry_fields = stored_fields(entry_class)
+    return _FieldPlan(
+        fields=tuple(
+            (
+                entry_field.name,
+                _WIRE_DECODERS.get(entry_field.name),
+                _REQUIRED if entry_field.default is MISSING else entry_field.default,
+                None
+                if entry_field.default_factory is MISSING
+                else entry_field.default_factory,
+            )
+            for entry_field in entry_fields
+            if entry_field.init
+        ),
+        direct=entry_class.__post_init__ is QueueEntry.__post_init__
+        and all(entry_field.init for entry_field in entry_fields),
+    )
+
+
+def trusted_entry(
+    entry_class: type[QueueEntry],
+    values: Mapping[str, Any],
+    payload_json: str | None = None,
+) -> QueueEntry:
+    """Build an entry from field values a provider restored from its own record.
+
+    Skips `QueueEntry.__post_init__`, which checks every field and serialises
+    the payload and result to prove they are JSON-safe -- work already done
+    when the record was written. Values for undeclared fields are ignored, and
+    a missing field without a default raises ValueError as `from_dict` would.
+    A class with its own `__post_init__` is still built through its
+    constructor, so its checks and derived state are kept.
+
+    *payload_json* is the payload's stored JSON text, when the record kept it
+    apart; otherwise the payload is serialised only if it is written back.
+    """
+    plan = _field_plan(entry_class)
+    if not plan.direct:
+        try:
+            return entry_class(
+                **{name: values[name] for name, *_ in plan.fields if name in values},
+                _payload_json=EncodedValue(values.get("payload"), payload_json),
+            )
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"Queue entry record is invalid: {exc}") from exc
+    entry = object.__new__(entry_class)
+    for name, _, default, default_factory in plan.fields:
+        if name in values:
+            value = values[name]
+        elif default_factory is not None:
+            value = default_factory()
+        elif default is not _REQUIRED:
+            value = default
+        else:
+            raise ValueError(f"Queue entry record is missing {name}")
+        object.__setattr__(entry, name, value)
+    object.__setattr__(
+        entry, "_payload_json", EncodedValue(entry.payload, payload_json)
+    )
+    return entry
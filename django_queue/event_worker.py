@@ -6,7 +6,9 @@ import asyncio
 import contextlib
 import inspect
 import logging
+import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Any
 
 from asgiref.sync import sync_to_async
@@ -19,18 +21,44 @@ from django_queue.worker import BaseQueueWorker
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class ListenerStats:
+    """Immutable listener timing for one event worker, for spotting stalls.
+
+    Durations are seconds spent in listener and filter calls. ``max_loop_lag``
+    is the furthest the worker's own loop has fallen behind a scheduled
+    wake-up: a listener that holds that loop shows up there, and on every
+    other alias sharing the loop.
+    """
+
+    executor: str
+    invocations: int
+    slow_invocations: int
+    timed_out_invocations: int
+    total_duration: float
+    max_duration: float
+    max_loop_lag: float
+
+
 class EventQueueWorker(BaseQueueWorker, ABC):
     """Provider-agnostic listener orchestration for event workers."""
 
     release_delay = 1.0
     recovery_interval = 1.0
+    # A listener call that runs at least this long is logged and counted slow.
+    slow_listener_seconds = 1.0
+    # How often a running worker samples its loop's lag, in seconds.
+    loop_lag_interval = 0.1
+    # How many listener calls may hold a slot under the "pool" executor,
+    # counting calls abandoned after their budget that have yet to finish.
+    listener_pool_size = 8
 
     def __init__(
         self,
         queue: EventQueue,
         *,
         alias: str | None = None,
-        idle_delay: float = 0.1,
+        idle_delay: float = 1.0,
     ) -> None:
         if not isinstance(queue, EventQueue):
             raise TypeError("EventQueueWorker requires an EventQueue")
@@ -49,16 +77,85 @@ class EventQueueWorker(BaseQueueWorker, ABC):
         self._queue = queue
         self._alias = queue.queue_name if alias is None else alias
         self._cursor = -1
+        self._dispatches_started = 0
+        self._listener_slots = asyncio.Semaphore(self.listener_pool_size)
+        self._invocations = 0
+        self._slow_invocations = 0
+        self._timed_out_invocations = 0
+        self._total_duration = 0.0
+        self._max_duration = 0.0
+        self._max_loop_lag = 0.0
+
+    @property
+    def listener_stats(self) -> ListenerStats:
+        return ListenerStats(
+            executor=self._queue.listener_executor,
+            invocations=self._invocations,
+            slow_invocations=self._slow_invocations,
+            timed_out_invocations=self._timed_out_invocations,
+            total_duration=self._total_duration,
+            max_duration=self._max_duration,
+            max_loop_lag=self._max_loop_lag,
+        )
 
     async def run(self) -> None:
+        """Dispatch events until cancelled, up to the queue's `concurrency` at
+        once, each in its own task with its own claim renewal."""
         self._running = True
+        lag_probe = asyncio.create_task(self._probe_loop_lag())
+        dispatches: set[asyncio.Task[None]] = set()
         try:
             while True:
-                if not await self.adispatch_once():
-                    await asyncio.sleep(self._idle_delay)
+                self._reap_dispatches(dispatches)
+                # Checked before claiming, so an event this worker has no room
+                # for stays pending for another dispatcher to take.
+                if len(dispatches) >= self._queue.concurrency:
+                    await asyncio.wait(dispatches, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+                delivery = await self._next()
+                if delivery is None:
+                    await self._await_delivery(self._idle_delay)
+                    continue
+                dispatches.add(asyncio.create_task(self._dispatch(*delivery)))
         finally:
+            # Each cancelled dispatch releases its event for redelivery.
+            for task in dispatches:
+                task.cancel()
+            await asyncio.gather(*dispatches, return_exceptions=True)
+            lag_probe.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await lag_probe
             self._running = False
 
+    def _reap_dispatches(self, dispatches: set[asyncio.Task[None]]) -> None:
+        """Forget finished dispatches, raising the first failure.
+
+        A dispatch only fails when its event could not be settled, which stops
+        the worker exactly as it did when dispatches ran inline. Any further
+        failures among the same finished dispatches are logged.
+        """
+        error: BaseException | None = None
+        for task in [task for task in dispatches if task.done()]:
+            dispatches.discard(task)
+            if task.cancelled() or (failure := task.exception()) is None:
+                continue
+            if error is None:
+                error = failure
+            else:
+                logger.error(
+                    "Event dispatch failed",
+                    exc_info=(type(failure), failure, failure.__traceback__),
+                )
+        if error is not None:
+            raise error
+
+    async def _probe_loop_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            due = loop.time() + self.loop_lag_interval
+            await asyncio.sleep(self.loop_lag_interval)
+            self._max_loop_lag = max(self._max_loop_lag, loop.time() - due)
+
     async def adispatch_once(self) -> bool:
         """Receive one provider-specific delivery and dispatch its listeners."""
         delivery = await self._next()
@@ -68,6 +165,10 @@ class EventQueueWorker(BaseQueueWorker, ABC):
         await self._dispatch(entry, lease_seconds)
         return True
 
+    async def _await_delivery(self, timeout: float) -> None:
+        """Idle until the queue may have an event to deliver, or *timeout*."""
+        await self._queue._await_pending(timeout)
+
     @abstractmethod
     async def _next(self) -> tuple[QueueEntry, float | None] | None:
         """Receive one event using this worker's provider-specific delivery."""
@@ -83,8 +184,14 @@ class EventQueueWorker(BaseQueueWorker, ABC):
         )
         try:
             registrations = listeners_for(self._alias)
+            self._dispatches_started += 1
+            dispatch_number = self._dispatches_started
             for index, registration in self._rotated(registrations):
-                self._cursor = index
+                # Only the newest dispatch moves the cursor: concurrent ones
+                # start at successive listeners, and an older one finishing
+                # late cannot wind the rotation back.
+                if dispatch_number == self._dispatches_started:
+                    self._cursor = index
                 try:
                     if registration.filter is not None and not await self._invoke(
                         registration.filter, entry
@@ -170,9 +277,56 @@ class EventQueueWorker(BaseQueueWorker, ABC):
         raise NotImplementedError
 
     async def _invoke(self, callback: Any, entry: QueueEntry) -> Any:
+        started = time.monotonic()
+        try:
+            if self._queue.listener_executor == "pool":
+                return await self._invoke_pooled(callback, entry)
+            return await self._call(callback, entry)
+        finally:
+            self._record_invocation(entry, time.monotonic() - started)
+
+    async def _invoke_pooled(self, callback: Any, entry: QueueEntry) -> Any:
+        """Run one listener call as a pool task under the queue's budget.
+
+        A call that outlives its budget is cancelled and reported as a failure,
+        so the event is released for retry. It is abandoned rather than
+        awaited: one that ignores cancellation keeps its slot until it ends.
+        """
+        await self._listener_slots.acquire()
+        task = asyncio.create_task(self._call(callback, entry))
+        task.add_done_callback(lambda task: self._listener_slots.release())
+        budget = self._queue.listener_timeout
+        try:
+            async with asyncio.timeout(budget) as deadline:
+                return await asyncio.shield(task)
+        except TimeoutError:
+            if not deadline.expired():
+                raise
+            task.cancel()
+            self._timed_out_invocations += 1
+            raise TimeoutError(
+                f"Event listener exceeded its {budget} second budget"
+            ) from None
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+
+    async def _call(self, callback: Any, entry: QueueEntry) -> Any:
         if inspect.iscoroutinefunction(callback):
             return await callback(entry)
         result = await sync_to_async(callback)(entry)
         if inspect.isawaitable(result):
             return await result
         return result
+
+    def _record_invocation(self, entry: QueueEntry, duration: float) -> None:
+        self._invocations += 1
+        self._total_duration += duration
+        self._max_duration = max(self._max_duration, duration)
+        if duration >= self.slow_listener_seconds:
+            self._slow_invocations += 1
+            logger.warning(
+                "Event listener ran for %.3f seconds",
+                duration,
+                extra={"queue": self._queue.queue_name, "entry_id": str(entry.id)},
+            )
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import inspect
 import logging
+import multiprocessing
+import os
 import signal
+import time
 from collections.abc import Callable, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
 from typing import cast
 
 from django.core.management.base import BaseCommand, CommandError
@@ -16,16 +22,47 @@ from django.utils.module_loading import import_string
 import django_queue
 from django_queue.backends.base import AsyncQueue
 from django_queue.backends.exceptions import InvalidQueueBackendError
-from django_queue.worker import Handler
+from django_queue.process_handlers import ProcessHandler
+from django_queue.queue_runtime import queue_runtime
+from django_queue.worker import AsyncQueueWorker, Handler, WorkerSnapshot
 
 logger = logging.getLogger(__name__)
 
+# The longest an alias with no pending work waits before checking again.
+_ACTIVATION_WAIT_SECONDS = 1.0
+# A crashed worker process is restarted after this delay, doubled for each
+# consecutive crash up to the maximum. A process that outlived the maximum
+# before crashing starts again from the first delay.
+_RESTART_BACKOFF_SECONDS = 1.0
+_RESTART_BACKOFF_MAX_SECONDS = 30.0
+# How often a worker process reports its workers' snapshots to the supervisor.
+_SNAPSHOT_INTERVAL_SECONDS = 5.0
+# How long worker processes may take to drain after SIGTERM before SIGKILL.
+_DRAIN_TIMEOUT_SECONDS = 60.0
+
 
 @dataclass(frozen=True)
 class WorkerActivation:
     alias: str
     queue: AsyncQueue
     handler: Handler
+    processes: int = 1
+
+
+@dataclass
+class _WorkerProcess:
+    """One supervised worker process slot and its restart state."""
+
+    slot: int
+    activations: tuple[WorkerActivation, ...]
+    process: BaseProcess | None = None
+    connection: Connection | None = None
+    started_at: float = 0.0
+    restart_at: float = 0.0
+    failures: int = 0
+    snapshots: dict[str, WorkerSnapshot] = field(default_factory=dict)
+    # The last snapshots of each earlier process in this slot, oldest first.
+    exited_snapshots: list[dict[str, WorkerSnapshot]] = field(default_factory=list)
 
 
 class Command(BaseCommand):
@@ -33,20 +70,43 @@ class Command(BaseCommand):
 
     help = "Run workers for queues configured with HANDLER."
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._workers: dict[str, AsyncQueueWorker] = {}
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=None,
+            help=(
+                "Worker processes for each queue without its own PROCESSES "
+                "setting (default 1)."
+            ),
+        )
+
     def handle(self, *args, **options) -> None:
-        activations = self._create_workers()
+        processes = options.get("processes")
+        if processes is not None and processes < 1:
+            raise CommandError("--processes must be a positive integer.")
+        activations = self._create_workers(processes)
         if not activations:
             self.stdout.write("No queue handlers configured.")
             return
 
         self.stdout.write(f"Starting {len(activations)} queue handlers.")
-        asyncio.run(self._run_configured_workers(activations))
+        plan = _process_plan(activations)
+        if len(plan) == 1:
+            asyncio.run(self._run_configured_workers(activations))
+            return
+        self.stdout.write(f"Starting {len(plan)} worker processes.")
+        self._supervise_processes(plan)
 
-    def _create_workers(self) -> list[WorkerActivation]:
+    def _create_workers(self, processes: int | None = None) -> list[WorkerActivation]:
         try:
             queues = django_queue.initialise_queues()
             configured_handlers = [
-                (alias, options["HANDLER"])
+                (alias, options["HANDLER"], options)
                 for alias, options in queues.settings.items()
                 if "HANDLER" in options
             ]
@@ -54,9 +114,14 @@ class Command(BaseCommand):
                 WorkerActivation(
                     alias,
                     cast(AsyncQueue, queues[alias]),
-                    self._load_handler(alias, handler_path),
+                    self._load_handler(
+                        alias,
+                        handler_path,
+                        options.get("HANDLER_EXECUTOR", "loop"),
+                    ),
+                    options.get("PROCESSES", processes or 1),
                 )
-                for alias, handler_path in configured_handlers
+                for alias, handler_path, options in configured_handlers
             ]
             # Resolve every worker class up front so a misconfigured alias fails
             # here rather than when its queue first receives work.
@@ -64,10 +129,19 @@ class Command(BaseCommand):
                 activation.queue.resolve_worker(activation.alias)
         except InvalidQueueBackendError as exc:
             raise CommandError(str(exc)) from exc
+        for activation in activations:
+            if activation.processes > 1 and activation.queue.process_local:
+                raise CommandError(
+                    f"Queue '{activation.alias}' cannot run in more than one "
+                    "process: memory queues are local to the process that "
+                    "created them."
+                )
         return activations
 
     @staticmethod
-    def _load_handler(alias: str, handler_path: object) -> Handler:
+    def _load_handler(
+        alias: str, handler_path: object, executor: str = "loop"
+    ) -> Handler:
         if not isinstance(handler_path, str) or not handler_path:
             raise CommandError(
                 f"Queue '{alias}' HANDLER must be a non-empty dotted path."
@@ -78,6 +152,13 @@ class Command(BaseCommand):
             raise CommandError(
                 f"Queue '{alias}' HANDLER could not be imported: {handler_path}"
             ) from exc
+        if executor == "process":
+            if not callable(handler) or _is_async_handler(handler):
+                raise CommandError(
+                    f"Queue '{alias}' HANDLER must be a synchronous callable "
+                    "when HANDLER_EXECUTOR is 'process'."
+                )
+            return ProcessHandler(handler_path)
         if not callable(handler) or not _is_async_handler(handler):
             raise CommandError(
                 f"Queue '{alias}' HANDLER must be an asynchronous callable."
@@ -96,17 +177,191 @@ class Command(BaseCommand):
             ): activation.alias
             for activation in activations
         }
-        await self._supervise_workers(
-            tasks, shutdown_event, tuple(activation.queue for activation in activations)
-        )
+        try:
+            await self._supervise_workers(
+                tasks,
+                shutdown_event,
+                tuple(activation.queue for activation in activations),
+            )
+        finally:
+            for activation in activations:
+                if isinstance(activation.handler, ProcessHandler):
+                    activation.handler.close()
 
     async def _activate_worker(self, activation: WorkerActivation) -> None:
         while not await activation.queue.ahas_pending():
-            await asyncio.sleep(0.1)
+            await activation.queue._await_pending(_ACTIVATION_WAIT_SECONDS)
         worker = activation.queue.create_worker(activation.alias, activation.handler)
+        self._workers[activation.alias] = worker
         self.stdout.write(f"Started queue handler for {activation.alias}.")
         await worker.run()
 
+    def _supervise_processes(
+        self, plan: Sequence[tuple[WorkerActivation, ...]]
+    ) -> None:
+        """Run each slot of ``plan`` in a forked worker process until shutdown.
+
+        The supervisor stays synchronous so that it never forks from inside a
+        running event loop, and it stops this process's queue runtime, and
+        waits for its thread, before the first fork: a child forked while that
+        thread held a lock would inherit the lock held. SIGINT and SIGTERM
+        start a drain: every child is sent SIGTERM, which its own workers
+        handle as a cooperative shutdown.
+        """
+        queue_runtime.shutdown()
+        context = multiprocessing.get_context("fork")
+        children = [
+            _WorkerProcess(slot, activations) for slot, activations in enumerate(plan)
+        ]
+        wake_reader, wake_writer = os.pipe()
+        os.set_blocking(wake_writer, False)
+        shutdown = False
+
+        def request_shutdown(signum, frame) -> None:
+            nonlocal shutdown
+            shutdown = True
+            with contextlib.suppress(BlockingIOError):
+                os.write(wake_writer, b"\0")
+
+        previous_handlers = {
+            event_signal: signal.signal(event_signal, request_shutdown)
+            for event_signal in (signal.SIGINT, signal.SIGTERM)
+        }
+        try:
+            while not shutdown:
+                now = time.monotonic()
+                for child in children:
+                    if child.process is None and child.restart_at <= now:
+                        self._start_process(context, child)
+                waitables: list = [wake_reader]
+                for child in children:
+                    if child.process is not None:
+                        waitables.append(child.process.sentinel)
+                    if child.connection is not None:
+                        waitables.append(child.connection)
+                restart_in = min(
+                    (
+                        child.restart_at - now
+                        for child in children
+                        if child.process is None
+                    ),
+                    default=None,
+                )
+                ready = wait(
+                    waitables,
+                    timeout=None if restart_in is None else max(0.0, restart_in),
+                )
+                for child in children:
+                    if child.connection is not None and child.connection in ready:
+                        _receive_snapshots(child)
+                    if (
+                        not shutdown
+                        and child.process is not None
+                        and child.process.sentinel in ready
+                    ):
+                        self._schedule_restart(child)
+        finally:
+            for event_signal, handler in previous_handlers.items():
+                signal.signal(event_signal, handler)
+            os.close(wake_reader)
+            os.close(wake_writer)
+            _drain_processes(children)
+            self._report_process_snapshots(children)
+
+    def _start_process(self, context, child: _WorkerProcess) -> None:
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=self._run_worker_process,
+            args=(child.activations, sender),
+            name=f"runqueues:process:{child.slot}",
+        )
+        process.start()
+        sender.close()
+        child.process = process
+        child.connection = receiver
+        child.started_at = time.monotonic()
+
+    def _schedule_restart(self, child: _WorkerProcess) -> None:
+        process = cast(BaseProcess, child.process)
+        process.join()
+        if child.connection is not None:
+            _receive_snapshots(child)
+        if child.snapshots:
+            child.exited_snapshots.append(child.snapshots)
+            child.snapshots = {}
+        now = time.monotonic()
+        if now - child.started_at >= _RESTART_BACKOFF_MAX_SECONDS:
+            child.failures = 0
+        delay = min(
+            _RESTART_BACKOFF_SECONDS * 2**child.failures, _RESTART_BACKOFF_MAX_SECONDS
+        )
+        child.failures += 1
+        child.process = None
+        child.restart_at = now + delay
+        logger.error(
+            "Queue worker process %d exited with code %s; restarting in %.1f seconds",
+            child.slot,
+            process.exitcode,
+            delay,
+        )
+
+    def _run_worker_process(
+        self, activations: tuple[WorkerActivation, ...], connection: Connection
+    ) -> None:
+        # Forked children inherit the supervisor's handlers; their workers
+        # install their own once the event loop starts.
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        try:
+            asyncio.run(self._run_reporting_workers(activations, connection))
+        finally:
+            connection.close()
+
+    async def _run_reporting_workers(
+        self, activations: Sequence[WorkerActivation], connection: Connection
+    ) -> None:
+        reporter = asyncio.create_task(self._report_snapshots(connection))
+        try:
+            await self._run_configured_workers(activations)
+        finally:
+            reporter.cancel()
+            await asyncio.gather(reporter, return_exceptions=True)
+            with contextlib.suppress(OSError):
+                connection.send(self._snapshots())
+
+    async def _report_snapshots(self, connection: Connection) -> None:
+        while True:
+            await asyncio.sleep(_SNAPSHOT_INTERVAL_SECONDS)
+            connection.send(self._snapshots())
+
+    def _snapshots(self) -> dict[str, WorkerSnapshot]:
+        return {alias: worker.snapshot for alias, worker in self._workers.items()}
+
+    def _report_process_snapshots(self, children: Sequence[_WorkerProcess]) -> None:
+        for child in children:
+            # A restarted slot reports its processes' counts together.
+            counts: dict[str, list[int]] = {}
+            for snapshots in (*child.exited_snapshots, child.snapshots):
+                for alias, snapshot in snapshots.items():
+                    totals = counts.setdefault(alias, [0] * 5)
+                    for index, count in enumerate(_snapshot_counts(snapshot)):
+                        totals[index] += count
+            for alias, (
+                dispatched,
+                succeeded,
+                failed,
+                cancelled,
+                timed_out,
+            ) in counts.items():
+                self.stdout.write(
+                    f"Worker process {child.slot} handled {alias}: "
+                    f"{dispatched} dispatched, "
+                    f"{succeeded} succeeded, "
+                    f"{failed} failed, "
+                    f"{cancelled} cancelled, "
+                    f"{timed_out} timed out."
+                )
+
     async def _supervise_workers(
         self,
         tasks: dict[asyncio.Task[None], str],
@@ -164,6 +419,59 @@ class Command(BaseCommand):
                     logger.error("Unable to dispose queue resources", exc_info=result)
 
 
+def _process_plan(
+    activations: Sequence[WorkerActivation],
+) -> list[tuple[WorkerActivation, ...]]:
+    """Group activations into worker processes.
+
+    Process ``n`` runs every alias configured for more than ``n`` processes,
+    so the first process runs them all and the total is the largest count.
+    """
+    return [
+        tuple(activation for activation in activations if activation.processes > slot)
+        for slot in range(max(activation.processes for activation in activations))
+    ]
+
+
+def _receive_snapshots(child: _WorkerProcess) -> None:
+    connection = cast(Connection, child.connection)
+    try:
+        while connection.poll():
+            child.snapshots.update(connection.recv())
+    except EOFError, OSError:
+        connection.close()
+        child.connection = None
+
+
+def _snapshot_counts(snapshot: WorkerSnapshot) -> tuple[int, ...]:
+    return (
+        snapshot.dispatch_count,
+        snapshot.succeeded_count,
+        snapshot.failed_count,
+        snapshot.cancelled_count,
+        snapshot.timed_out_count,
+    )
+
+
+def _drain_processes(children: Sequence[_WorkerProcess]) -> None:
+    running = [child for child in children if child.process is not None]
+    for child in running:
+        cast(BaseProcess, child.process).terminate()
+    deadline = time.monotonic() + _DRAIN_TIMEOUT_SECONDS
+    for child in running:
+        process = cast(BaseProcess, child.process)
+        process.join(max(0.0, deadline - time.monotonic()))
+        if process.is_alive():
+            logger.error(
+                "Queue worker process %d did not drain in time; killing it",
+                child.slot,
+            )
+            process.kill()
+            process.join()
+        if child.connection is not None:
+            _receive_snapshots(child)
+
+
 def _is_async_handler(handler: Callable[..., object]) -> bool:
     return inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(
         type(handler).__call__
@@ -0,0 +1,161 @@
+"""Run synchronous queue handlers in worker processes.
+
+A CPU-bound handler awaited on the worker's loop stalls every other dispatch,
+lease renewal and budget in that process. :class:`ProcessHandler` is an
+asynchronous handler that instead runs a synchronous one in a process of its
+own, sending it only the entry's wire dict.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.connection import Connection
+from typing import Any
+
+import django
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from django_queue.entries import QueueEntry
+from django_queue.worker import (
+    _active_timeout,
+    _ActiveTimeout,
+    _forward_heartbeat,
+    _restart_budget,
+)
+
+# Handlers imported by this handler process, by dotted path.
+_handlers: dict[str, Any] = {}
+# The pipe this handler process forwards heartbeats over.
+_heartbeat_sender: Connection | None = None
+
+
+class ProcessHandler:
+    """Run a synchronous handler, by dotted path, in a separate process.
+
+    Each call runs in a single-process pool of its own, reused by later calls
+    once it is idle. The entry crosses the boundary as `QueueEntry.to_dict`
+    output and is rebuilt with its own class, and the handler's result comes
+    back for the worker to validate and record as usual.
+
+    The dispatching worker's budget and cancellation still govern the call: a
+    handler that is abandoned -- its budget ran out, or it outlived shutdown's
+    grace period -- has its process killed, since a running call cannot
+    otherwise be stopped. `heartbeat()` called in the handler process restarts
+    the worker's budget for the entry.
+    """
+
+    def __init__(self, handler_path: str) -> None:
+        self.handler_path = handler_path
+        self._idle: list[_HandlerProcess] = []
+
+    async def __call__(self, entry: QueueEntry) -> object:
+        process = self._idle.pop() if self._idle else _HandlerProcess()
+        active_timeout = _active_timeout.get()
+        # Drop any heartbeat a previous call sent after it finished.
+        process.receive_heartbeats(None)
+        loop = asyncio.get_running_loop()
+        # Taken once: killing or closing the process closes the pipe, after
+        # which its descriptor can no longer be read or unregistered.
+        heartbeats = process.heartbeats.fileno()
+        loop.add_reader(heartbeats, process.receive_heartbeats, active_timeout)
+        future = process.executor.submit(
+            _call_handler, self.handler_path, type(entry), entry.to_dict()
+        )
+        try:
+            try:
+                result = await asyncio.wrap_future(future)
+            finally:
+                loop.remove_reader(heartbeats)
+        except BrokenProcessPool:
+            process.close()
+            raise
+        except BaseException:
+            if future.done():
+                self._idle.append(process)
+            else:
+                process.kill()
+            raise
+        else:
+            self._idle.append(process)
+            return result
+
+    def close(self) -> None:
+        """Shut down the idle handler processes."""
+        while self._idle:
+            self._idle.pop().close()
+
+
+class _HandlerProcess:
+    """One handler process and the pipe its heartbeats arrive on."""
+
+    def __init__(self) -> None:
+        # Started from a fork server rather than forked: a handler process is
+        # created from inside the running worker loop, whose process has
+        # threads of its own, and forking a threaded process can deadlock the
+        # child. So the child sets Django up again from its settings module.
+        context = multiprocessing.get_context("forkserver")
+        self.heartbeats, self._sender = context.Pipe(duplex=False)
+        self.executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=context,
+            initializer=_initialise_process,
+            initargs=(
+                self._sender,
+                os.environ.get("DJANGO_SETTINGS_MODULE")
+                if settings.configured
+                else None,
+            ),
+        )
+
+    def receive_heartbeats(self, active_timeout: _ActiveTimeout | None) -> None:
+        try:
+            while self.heartbeats.poll():
+                self.heartbeats.recv()
+                _restart_budget(active_timeout)
+        except EOFError, OSError:
+            pass
+
+    def kill(self) -> None:
+        self.executor.kill_workers()
+        self.close()
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.heartbeats.close()
+        self._sender.close()
+
+
+def _initialise_process(sender: Connection, settings_module: str | None) -> None:
+    global _heartbeat_sender
+    _heartbeat_sender = sender
+    if settings_module is not None:
+        from django_queue.queue_runtime import queue_runtime
+
+        # A handler process only runs handlers: setting Django up must not
+        # start a queue runtime of its own.
+        queue_runtime.shutdown()
+        os.environ["DJANGO_SETTINGS_MODULE"] = settings_module
+        django.setup()
+
+
+def _send_heartbeat() -> None:
+    if _heartbeat_sender is not None:
+        _heartbeat_sender.send(None)
+
+
+def _call_handler(
+    handler_path: str, entry_class: type[QueueEntry], wire: dict[str, Any]
+) -> object:
+    handler = _handlers.get(handler_path)
+    if handler is None:
+        handler = _handlers[handler_path] = import_string(handler_path)
+    forward_token = _forward_heartbeat.set(_send_heartbeat)
+    try:
+        return handler(entry_class.from_trusted_dict(wire))
+    finally:
+        _forward_heartbeat.reset(forward_token)
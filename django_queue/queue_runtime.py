@@ -9,6 +9,7 @@ from collections.abc import Iterator
 from typing import Protocol
 
 from django_queue.backends.base import AsyncQueue, BaseQueue, EventQueue
+from django_queue.event_worker import EventQueueWorker, ListenerStats
 from django_queue.observers import (
     _activate_pending_for,
     _alias_has_observer_registration,
@@ -33,6 +34,10 @@ class QueueRuntime:
     listeners, settle) or an AsyncQueue with observers registered (a
     receiver task: relay lifecycle snapshots to `queue_observer`
     callbacks) -- never both -- so one alias-keyed task dict serves both.
+
+    An event queue whose `LISTENER_EXECUTOR` is ``"thread"`` has its worker
+    run on a loop thread of its own instead, supervised from the shared loop,
+    so its listeners cannot delay the other aliases.
     """
 
     restart_initial_delay = 1.0
@@ -45,6 +50,7 @@ class QueueRuntime:
         self._ready = threading.Event()
         self._tasks: dict[str, asyncio.Task[None]] = {}
         self._queues: dict[str, EventQueue | AsyncQueue] = {}
+        self._workers: dict[str, EventQueueWorker] = {}
         self._closed = False
 
     def start_thread(self) -> None:
@@ -171,6 +177,7 @@ class QueueRuntime:
             with self._lock:
                 self._tasks.clear()
                 self._queues.clear()
+                self._workers.clear()
                 self._loop = None
                 self._thread = None
 
@@ -179,18 +186,48 @@ class QueueRuntime:
             if self._closed or alias in self._tasks:
                 return
             self._queues[alias] = queue
-            task = asyncio.create_task(
-                self._run_worker(alias, queue), name=f"event:{alias}"
+            supervise = (
+                self._run_dedicated_worker
+                if queue.listener_executor == "thread"
+                else self._run_worker
             )
+            task = asyncio.create_task(supervise(alias, queue), name=f"event:{alias}")
             self._tasks[alias] = task
         task.add_done_callback(lambda task: self._worker_done(alias, task))
 
+    async def _run_dedicated_worker(self, alias: str, queue: EventQueue) -> None:
+        """Run `_run_worker` for one alias on a loop thread of its own."""
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(
+            target=loop.run_forever,
+            name=f"django-queues-listeners-{alias}",
+            daemon=True,
+        )
+        thread.start()
+        try:
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(self._run_worker(alias, queue), loop)
+            )
+        finally:
+            # Cancelling the wrapped future only asks the worker to stop; wait
+            # for it, and for the queue's resources on that loop, before
+            # stopping the loop.
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(_close_dedicated_loop(queue), loop)
+            )
+            loop.call_soon_threadsafe(loop.stop)
+            await asyncio.to_thread(thread.join)
+            loop.close()
+
     async def _run_worker(self, alias: str, queue: EventQueue) -> None:
         """Keep one queue dispatcher available across transient failures."""
         delay = self.restart_initial_delay
         while True:
             try:
-                await queue.create_worker(alias).run()
+                worker = queue.create_worker(alias)
+                with self._lock:
+                    self._workers[alias] = worker
+                await worker.run()
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -207,6 +244,7 @@ class QueueRuntime:
     def _worker_done(self, alias: str, task: asyncio.Task[None]) -> None:
         with self._lock:
             self._tasks.pop(alias, None)
+            self._workers.pop(alias, None)
         if task.cancelled():
             return
         try:
@@ -239,6 +277,17 @@ class QueueRuntime:
             # retry -- a later registration for this alias starts a fresh one.
             logger.exception("Queue lifecycle receiver stopped", extra={"queue": alias})
 
+    def listener_stats(self) -> dict[str, ListenerStats]:
+        """Return listener timing for each running event worker, by alias.
+
+        Compare ``max_loop_lag`` across aliases to find one whose listeners
+        stall the loop they share, then move it to the ``"thread"`` or
+        ``"pool"`` executor.
+        """
+        with self._lock:
+            workers = dict(self._workers)
+        return {alias: worker.listener_stats for alias, worker in workers.items()}
+
     def stop_one(self, alias: str, timeout: float = 5.0) -> None:
         """Cancel and await one alias's task, leaving the runtime otherwise live.
 
@@ -284,4 +333,13 @@ class QueueRuntime:
             thread.join()
 
 
+async def _close_dedicated_loop(queue: EventQueue) -> None:
+    current = asyncio.current_task()
+    pending = [task for task in asyncio.all_tasks() if task is not current]
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    await queue.aclose()
+
+
 queue_runtime = QueueRuntime()
@@ -5,6 +5,7 @@ from django.dispatch import Signal
 queue_created = Signal()
 queue_closed = Signal()
 entry_enqueued = Signal()
+entries_enqueued = Signal()
 
 logger = logging.getLogger(__name__)
 
@@ -20,3 +21,16 @@ def send_entry_enqueued(sender, *, entry) -> None:
                 receiver,
                 exc_info=(type(response), response, response.__traceback__),
             )
+
+
+def send_entries_enqueued(sender, *, entries) -> None:
+    """Notify observers of a batch enqueue once, for the whole batch."""
+    for receiver, response in entries_enqueued.send_robust(
+        sender, entries=tuple(entries), queue_name=entries[0].queue
+    ):
+        if isinstance(response, Exception):
+            logger.error(
+                "Queue entry enqueue observer failed: %r",
+                receiver,
+                exc_info=(type(response), response, response.__traceback__),
+            )
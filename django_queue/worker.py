@@ -44,6 +44,7 @@ WORKER_EVENT_MESSAGES: Mapping[str, str] = {
 }
 
 _CLAIM_CONFLICT_LOG_INTERVAL_SECONDS = 60
+_FIRST_SEEN_SCAN_PAGE_SIZE = 500
 
 # A coroutine rather than any awaitable: the worker schedules handlers with
 # asyncio.create_task, and runqueues already rejects non-coroutine handlers.
@@ -64,20 +65,35 @@ class _ActiveTimeout:
 _active_timeout: ContextVar[_ActiveTimeout | None] = ContextVar(
     "django_queue_active_timeout", default=None
 )
+# Set while a handler runs in another process, which has no budget of its own
+# to restart: its heartbeat is forwarded to the dispatching worker instead.
+_forward_heartbeat: ContextVar[Callable[[], None] | None] = ContextVar(
+    "django_queue_forward_heartbeat", default=None
+)
 
 
 def heartbeat() -> None:
     """Restart the current handler's execution budget after real progress."""
     active_timeout = _active_timeout.get()
+    if active_timeout is None and (forward := _forward_heartbeat.get()) is not None:
+        forward()
+        return
+    if not _restart_budget(active_timeout):
+        raise RuntimeError("Queue heartbeat requires an active handler dispatch")
+
+
+def _restart_budget(active_timeout: _ActiveTimeout | None) -> bool:
+    """Restart a dispatch's budget, returning whether it was still running."""
     if (
         active_timeout is None
         or not active_timeout.active
         or active_timeout.timeout.expired()
     ):
-        raise RuntimeError("Queue heartbeat requires an active handler dispatch")
+        return False
     active_timeout.timeout.reschedule(
         asyncio.get_running_loop().time() + active_timeout.budget
     )
+    return True
 
 
 class QueueLookup(Protocol):
@@ -99,7 +115,7 @@ class BaseQueueWorker:
     provider_type = "generic"
 
     def __init__(
-        self, *, idle_delay: float = 0.1, worker_id: UUID | None = None
+        self, *, idle_delay: float = 1.0, worker_id: UUID | None = None
     ) -> None:
         self._idle_delay = idle_delay
         self._worker_id = uuid.uuid7() if worker_id is None else worker_id
@@ -114,6 +130,8 @@ class BaseQueueWorker:
 class WorkerSnapshot:
     """Immutable, process-local state for an asynchronous queue worker.
 
+    ``active_entry_ids`` lists every entry in flight, oldest dispatch first;
+    ``active_entry_id`` and ``active_queue_name`` describe the newest of them.
     The queue clock determines ``running_for``. A synchronous inspection of a
     running Redis-backed worker can therefore calibrate its Redis clock.
     """
@@ -124,6 +142,7 @@ class WorkerSnapshot:
     running_for: float | None
     active_entry_id: UUID | None
     active_queue_name: str | None
+    active_entry_ids: tuple[UUID, ...]
     queue_names: tuple[str, ...]
     dispatch_count: int
     succeeded_count: int
@@ -133,14 +152,18 @@ class WorkerSnapshot:
 
 
 class AsyncQueueWorker(BaseQueueWorker):
-    """Sequentially process registered queues until its task is cancelled."""
+    """Process registered queues until its task is cancelled.
+
+    Each queue dispatches up to its ``concurrency`` entries at once, each in
+    its own task, so a slow handler on one alias never holds up another.
+    """
 
     def __init__(
         self,
         queues: QueueLookup,
         handlers: Mapping[str, Handler],
         *,
-        idle_delay: float = 0.1,
+        idle_delay: float = 1.0,
         cancellation_grace_period: float = 30,
         clock: QueueClock | None = None,
         timeout_seconds: float | None = None,
@@ -177,8 +200,13 @@ class AsyncQueueWorker(BaseQueueWorker):
         self._cancellation_grace_period = cancellation_grace_period
         self._started_at: ClockTime | None = None
         self._stopped_at: ClockTime | None = None
-        self._active_entry_id: UUID | None = None
-        self._active_queue_name: str | None = None
+        # Entry ID to queue alias, in dispatch order.
+        self._active_entries: dict[UUID, str] = {}
+        self._dispatch_slots: dict[AsyncQueue, asyncio.Semaphore] = {}
+        self._dispatch_tasks: dict[AsyncQueue, set[asyncio.Task[None]]] = {}
+        # One outstanding `_await_pending` per queue, kept across idle rounds
+        # so a wait is never abandoned just because a dispatch finished first.
+        self._wake_tasks: dict[AsyncQueue, asyncio.Task[None]] = {}
         self._dispatch_count = 0
         self._succeeded_count = 0
         self._failed_count = 0
@@ -219,13 +247,17 @@ class AsyncQueueWorker(BaseQueueWorker):
     @property
     def snapshot(self) -> WorkerSnapshot:
         """Return an immutable snapshot of this worker's local state."""
+        active_entry_id, active_queue_name = next(
+            reversed(self._active_entries.items()), (None, None)
+        )
         return WorkerSnapshot(
             worker_id=self._worker_id,
             running=self.running,
             started_at=self._started_at,
             running_for=self._running_for(),
-            active_entry_id=self._active_entry_id,
-            active_queue_name=self._active_queue_name,
+            active_entry_id=active_entry_id,
+            active_queue_name=active_queue_name,
+            active_entry_ids=tuple(self._active_entries),
             queue_names=tuple(self._queues),
             dispatch_count=self._dispatch_count,
             succeeded_count=self._succeeded_count,
@@ -258,70 +290,176 @@ class AsyncQueueWorker(BaseQueueWorker):
         # than the previous run's start with no stop at all.
         self._started_at = await self._clock.anow()
         self._stopped_at = None
+        self._dispatch_slots = {
+            queue: asyncio.Semaphore(queue.concurrency)
+            for queue in self._queues.values()
+        }
+        self._dispatch_tasks = {queue: set() for queue in self._queues.values()}
         self._log_state_change("started")
         try:
             while True:
+                self._reap_dispatches()
                 dispatched = False
                 for name, queue in self._queues.items():
                     await self._publish_new(queue)
                     await self._prune_expired(queue)
+                    slots = self._dispatch_slots[queue]
+                    # Checked before claiming, so an entry this worker has no
+                    # room for stays pending for another worker to take.
+                    if slots.locked():
+                        continue
+                    next_entry = None
+                    await slots.acquire()
                     try:
                         next_entry = await self._next(queue)
                     except QueueEmptyException:
-                        continue
+                        pass
                     except QueueClaimConflictError as exc:
                         self._log_claim_conflict(exc.entry_id)
-                        continue
                     except QueueEntryMissingError as exc:
                         await self._discard_missing(queue, exc.entry_id)
-                        continue
                     except QueueEntryNotFoundError as exc:
                         self._log_missing_entry(exc.entry_id)
-                        continue
+                    finally:
+                        if next_entry is None:
+                            slots.release()
                     if next_entry is None:
                         continue
                     entry, lease_seconds = next_entry
                     dispatched = True
-                    self._active_entry_id = entry.id
-                    self._active_queue_name = name
+                    self._active_entries[entry.id] = name
                     self._dispatch_count += 1
                     self._log_state_change("dispatch_started")
-                    try:
-                        await self._dispatch(
-                            queue, self._handlers[name], entry, lease_seconds
+                    self._dispatch_tasks[queue].add(
+                        asyncio.create_task(
+                            self._dispatch_claimed(name, queue, entry, lease_seconds)
                         )
-                    except QueueEntryNotFoundError as exc:
-                        self._log_missing_entry(exc.entry_id)
-                        if lease_seconds is not None:
-                            await self._discard_missing(queue, exc.entry_id)
+                    )
                 if not dispatched:
-                    await asyncio.sleep(self._idle_delay)
+                    await self._wait_for_capacity()
         finally:
+            await self._stop_dispatches()
             self._running = False
             self._stopped_at = await self._clock.anow()
-            self._active_entry_id = None
-            self._active_queue_name = None
+            self._active_entries.clear()
             self._log_state_change("stopped")
 
+    async def _dispatch_claimed(
+        self,
+        name: str,
+        queue: AsyncQueue,
+        entry: QueueEntry,
+        lease_seconds: float | None,
+    ) -> None:
+        """Run one dispatch in its own task, tolerating a vanished entry."""
+        try:
+            await self._dispatch(queue, self._handlers[name], entry, lease_seconds)
+        except QueueEntryNotFoundError as exc:
+            self._log_missing_entry(exc.entry_id)
+            if lease_seconds is not None:
+                await self._discard_missing(queue, exc.entry_id)
+        finally:
+            self._active_entries.pop(entry.id, None)
+
+    def _reap_dispatches(self) -> None:
+        """Free the slots of finished dispatches, raising the first failure.
+
+        A dispatch only fails when an outcome could not be persisted, which
+        stops the worker exactly as it did when dispatches ran inline. Any
+        further failures among the same finished dispatches are logged.
+        """
+        error: BaseException | None = None
+        for queue, tasks in self._dispatch_tasks.items():
+            for task in [task for task in tasks if task.done()]:
+                tasks.discard(task)
+                self._dispatch_slots[queue].release()
+                if task.cancelled() or (failure := task.exception()) is None:
+                    continue
+                if error is None:
+                    error = failure
+                else:
+                    logger.error(
+                        "Queue dispatch failed",
+                        exc_info=(type(failure), failure, failure.__traceback__),
+                    )
+        if error is not None:
+            raise error
+
+    async def _wait_for_capacity(self) -> None:
+        """Idle until a dispatch finishes, work arrives for a queue with a free
+        slot, or the idle delay elapses."""
+        tasks = [task for tasks in self._dispatch_tasks.values() for task in tasks]
+        for queue, slots in self._dispatch_slots.items():
+            if slots.locked():
+                continue
+            wake_task = self._wake_tasks.get(queue)
+            if wake_task is None or wake_task.done():
+                if (
+                    wake_task is not None
+                    and not wake_task.cancelled()
+                    and (error := wake_task.exception()) is not None
+                ):
+                    logger.warning(
+                        "Queue wake-up failed; polling until it recovers",
+                        exc_info=(type(error), error, error.__traceback__),
+                    )
+                wake_task = self._wake_tasks[queue] = asyncio.create_task(
+                    queue._await_pending(self._idle_delay)
+                )
+            tasks.append(wake_task)
+        if tasks:
+            await asyncio.wait(
+                tasks, timeout=self._idle_delay, return_when=asyncio.FIRST_COMPLETED
+            )
+        else:
+            await asyncio.sleep(self._idle_delay)
+
+    async def _stop_dispatches(self) -> None:
+        """Cancel every dispatch still in flight and wait for it to settle.
+
+        Each dispatch applies its own cancellation grace period, so they wind
+        down in parallel rather than one grace period after another.
+        """
+        wake_tasks = list(self._wake_tasks.values())
+        self._wake_tasks.clear()
+        for task in wake_tasks:
+            task.cancel()
+        await asyncio.gather(*wake_tasks, return_exceptions=True)
+        tasks = [task for tasks in self._dispatch_tasks.values() for task in tasks]
+        for task in tasks:
+            task.cancel()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for queue, queue_tasks in self._dispatch_tasks.items():
+            for _ in queue_tasks:
+                self._dispatch_slots[queue].release()
+            queue_tasks.clear()
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(
+                    "Queue dispatch failed during shutdown",
+                    exc_info=(type(result), result, result.__traceback__),
+                )
+
     async def _publish_new(self, queue: AsyncQueue) -> None:
-        """Publish snapshots beyond this worker's completed-scan UUIDv7 cursor."""
+        """Publish snapshots beyond this worker's completed-scan UUIDv7 cursor.
+
+        Reads the queue's ID-ordered index a page at a time from the cursor,
+        so a scan costs what was created since the last one, not the whole
+        retained history.
+        """
         now = asyncio.get_running_loop().time()
         if now - self._last_first_seen_scan_at.get(queue, float("-inf")) < 1:
             return
         self._last_first_seen_scan_at[queue] = now
-        entries = await queue.alist()
-        previous_entry_id = self._last_observed_entry_id.get(queue)
-        new_entries = [
-            entry
-            for entry in entries
-            if previous_entry_id is None or entry.id > previous_entry_id
-        ]
-        for entry in sorted(new_entries, key=lambda entry: entry.id):
-            await queue.apublish(entry)
-        if entries:
-            largest_entry_id = max(entry.id for entry in entries)
-            if previous_entry_id is None or largest_entry_id > previous_entry_id:
-                self._last_observed_entry_id[queue] = largest_entry_id
+        while True:
+            entries = await queue._alist_after(
+                self._last_observed_entry_id.get(queue), _FIRST_SEEN_SCAN_PAGE_SIZE
+            )
+            for entry in entries:
+                await queue.apublish(entry)
+                self._last_observed_entry_id[queue] = entry.id
+            if len(entries) < _FIRST_SEEN_SCAN_PAGE_SIZE:
+                return
 
     async def _prune_expired(self, queue: AsyncQueue) -> None:
         """Periodically remove expired AsyncQueue terminal records."""
@@ -373,19 +511,22 @@ class AsyncQueueWorker(BaseQueueWorker):
         entry: QueueEntry,
         lease_seconds: float | None = None,
     ) -> None:
-        if not self._observed(queue, entry):
+        # A backend whose claim also starts the entry hands it over RUNNING,
+        # with its snapshots already published.
+        if entry.status is not QueueEntryStatus.RUNNING:
+            if not self._observed(queue, entry):
+                await queue.apublish(entry)
+            if lease_seconds is not None:
+                running_entry = await self._mark_running(queue, entry)
+                if running_entry is None:
+                    logger.warning(
+                        "Lost claim for queue entry %s before dispatch", entry.id
+                    )
+                    return
+                entry = running_entry
+            else:
+                entry = await queue._amark_running(entry.id)
             await queue.apublish(entry)
-        if lease_seconds is not None:
-            running_entry = await self._mark_running(queue, entry)
-            if running_entry is None:
-                logger.warning(
-                    "Lost claim for queue entry %s before dispatch", entry.id
-                )
-                return
-            entry = running_entry
-        else:
-            entry = await queue._amark_running(entry.id)
-        await queue.apublish(entry)
         timeout_seconds = self.budget_for(queue, entry)
         active_timeout: _ActiveTimeout | None = None
         timeout_token = None
@@ -467,8 +608,7 @@ class AsyncQueueWorker(BaseQueueWorker):
                 _active_timeout.reset(timeout_token)
             if renewal_task is not None:
                 await self._stop_renewal_task(renewal_task)
-            self._active_entry_id = None
-            self._active_queue_name = None
+            self._active_entries.pop(entry.id, None)
 
     def _observed(self, queue: AsyncQueue, entry: QueueEntry) -> bool:
         """Return whether an AsyncQueue scan already published this entry."""
@@ -734,8 +874,7 @@ class AsyncQueueWorker(BaseQueueWorker):
                 self._timed_out_count += 1
             case _:
                 return
-        self._active_entry_id = None
-        self._active_queue_name = None
+        self._active_entries.pop(entry.id, None)
         self._last_claim_conflict_at.pop(entry.id, None)
         self._log_state_change("terminal_recorded", entry)
 
@@ -763,6 +902,9 @@ class AsyncQueueWorker(BaseQueueWorker):
                 if snapshot.active_entry_id is not None
                 else None,
                 "queue_worker_active_queue_name": snapshot.active_queue_name,
+                "queue_worker_active_entry_ids": tuple(
+                    str(entry_id) for entry_id in snapshot.active_entry_ids
+                ),
                 "queue_worker_queue_names": snapshot.queue_names,
                 "queue_worker_dispatch_count": snapshot.dispatch_count,
                 "queue_worker_succeeded_count": snapshot.succeeded_count,
@@ -5,6 +5,7 @@ import time
 import pytest
 
 from django_queue.clock import (
+    MAX_CLOCK_DRIFT_SECONDS,
     ClockTime,
     LocalQueueClock,
     QueueClockError,
@@ -71,6 +72,60 @@ class TestRedisQueueClock:
 
         asyncio.run(exercise())
 
+    def test_serves_a_calibrated_async_clock_without_its_lock(self):
+        async def exercise():
+            clock = RedisQueueClock(
+                AsyncFakeRedisTime((1_785_800_000, 0)),
+                utcnow=lambda: ClockTime(1_785_800_000),
+                asynchronous=True,
+            )
+            await clock.anow()
+
+            async with clock._async_lock:
+                assert await asyncio.wait_for(clock.anow(), 1) == ClockTime(
+                    1_785_800_000
+                )
+                assert clock.now() == ClockTime(1_785_800_000)
+
+        asyncio.run(exercise())
+
+    def test_refreshes_an_async_clock_from_sync_time_on_its_loop(self):
+        async def exercise():
+            monotonic = FakeMonotonic(100.0)
+            redis = AsyncFakeRedisTime((1_785_800_000, 0), (1_785_800_001, 0))
+            clock = RedisQueueClock(
+                redis,
+                monotonic=monotonic,
+                utcnow=lambda: ClockTime(1_785_800_000),
+                asynchronous=True,
+            )
+            await clock.anow()
+            monotonic.value = 700.0
+
+            assert clock.now() == ClockTime(1_785_800_000)
+            assert clock.refreshing
+            await clock._refresh_task
+
+            assert clock.now() == ClockTime(1_785_800_001)
+
+        asyncio.run(exercise())
+
+    def test_calibrates_from_an_observed_instant_only_when_due(self):
+        redis = FakeRedisTime()
+        monotonic = FakeMonotonic(100.0)
+        utcnow = FakeUtcNow(LOCAL)
+        clock = RedisQueueClock(redis, monotonic=monotonic, utcnow=utcnow)
+
+        clock.observe(LOCAL + 2)
+        clock.observe(LOCAL + 3)
+        assert clock.now() == LOCAL + 2
+
+        monotonic.value = 700.0
+        clock.observe(LOCAL + 3)
+        clock.observe(LOCAL + MAX_CLOCK_DRIFT_SECONDS + 1)
+        assert clock.now() == LOCAL + 3
+        assert redis.time_calls == 0
+
     def test_reports_an_instant(self):
         clock = RedisQueueClock(
             FakeRedisTime((1_785_800_000, 0)), utcnow=lambda: ClockTime(1_785_800_000)
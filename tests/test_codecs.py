@@ -0,0 +1,484 @@
+import asyncio
+import json
+from dataclasses import replace
+from uuid import uuid4
+
+import pytest
+
+from django_queue.backends.redis import (
+    RedisAsyncPriorityQueue,
+    RedisAsyncQueue,
+    RedisAsyncQueueWorker,
+    RedisEventQueue,
+    RedisEventQueueWorker,
+)
+from django_queue.clock import ClockTime
+from django_queue.codecs import (
+    CompactEntryCodec,
+    EntryCodec,
+    HashEntryCodec,
+    JsonEntryCodec,
+)
+from django_queue.entries import QueueEntry, QueueEntryStatus
+from django_queue.listeners import ListenerRegistration
+from tests.helpers import FIXED_CLOCK_TIME, FIXED_UUID7, CustomQueueEntry
+
+
+def _finished_entry(entry_class=QueueEntry, **fields):
+    return entry_class(
+        id=FIXED_UUID7,
+        queue="requests",
+        status=QueueEntryStatus.SUCCEEDED,
+        queued_at=FIXED_CLOCK_TIME,
+        dispatched_at=ClockTime(FIXED_CLOCK_TIME.seconds, 123_456),
+        finished_at=ClockTime(FIXED_CLOCK_TIME.seconds + 1, 999_999),
+        payload={"items": [], "text": "café"},
+        result=[1, 2],
+        error=None,
+        timeout_seconds=2.5,
+        priority=-7,
+        **fields,
+    )
+
+
+def test_compact_codec_round_trips_every_field():
+    codec = CompactEntryCodec()
+    entry = _finished_entry(CustomQueueEntry, kind="report")
+
+    assert codec.decode(codec.encode(entry), CustomQueueEntry) == entry
+
+
+def test_compact_codec_round_trips_a_queued_entry():
+    codec = CompactEntryCodec()
+    entry = QueueEntry.create(queue="requests", payload="work")
+
+    assert codec.decode(codec.encode(entry), QueueEntry) == entry
+
+
+def test_compact_records_are_smaller_than_json_records():
+    entry = _finished_entry()
+
+    assert len(CompactEntryCodec().encode(entry)) < len(JsonEntryCodec().encode(entry))
+
+
+def test_compact_codec_reads_json_records():
+    entry = _finished_entry()
+
+    assert CompactEntryCodec().decode(JsonEntryCodec().encode(entry), QueueEntry) == (
+        entry
+    )
+
+
+def test_compact_codec_stores_an_out_of_range_priority_as_json():
+    codec = CompactEntryCodec()
+    entry = replace(_finished_entry(), priority=2**70)
+
+    raw = codec.encode(entry)
+
+    assert json.loads(raw)["priority"] == 2**70
+    assert codec.decode(raw, QueueEntry) == entry
+
+
+def test_compact_codec_ignores_fields_the_entry_class_does_not_declare():
+    codec = CompactEntryCodec()
+    entry = _finished_entry(CustomQueueEntry, kind="report")
+
+    decoded = codec.decode(codec.encode(entry), QueueEntry)
+
+    assert decoded == _finished_entry()
+
+
+def test_compact_codec_rejects_a_damaged_record():
+    raw = CompactEntryCodec().encode(_finished_entry())
+
+    with pytest.raises(ValueError, match="Queue entry record is invalid"):
+        CompactEntryCodec().decode(raw[:40], QueueEntry)
+    with pytest.raises(ValueError, match="unsupported record version"):
+        CompactEntryCodec().decode(raw[:1] + b"\x09" + raw[2:], QueueEntry)
+
+
+def test_hash_codec_round_trips_every_field():
+    codec = HashEntryCodec()
+    entry = _finished_entry(CustomQueueEntry, kind="report")
+
+    assert codec.decode(codec.encode(entry), CustomQueueEntry) == entry
+
+
+def test_hash_codec_reads_json_and_compact_records():
+    entry = _finished_entry()
+
+    for raw in (JsonEntryCodec().encode(entry), CompactEntryCodec().encode(entry)):
+        assert HashEntryCodec().decode(raw, QueueEntry) == entry
+
+
+def test_hash_codec_leaves_the_payload_out_of_transition_records():
+    entry = _finished_entry()
+
+    changes = HashEntryCodec().encode_changes(entry)
+
+    assert changes[0] == 2
+    assert b"payload" not in changes.split(b"\0")
+    assert b"result" in changes.split(b"\0")
+
+
+def test_hash_codec_rejects_a_damaged_record():
+    raw = HashEntryCodec().encode(_finished_entry())
+
+    with pytest.raises(ValueError, match="Queue entry record is invalid"):
+        HashEntryCodec().decode(raw.replace(b"\0status\0", b"\0"), QueueEntry)
+
+
+def test_a_codec_missing_a_method_cannot_be_created():
+    class EncodeOnlyCodec(EntryCodec):
+        def encode(self, entry):
+            return b""
+
+    with pytest.raises(TypeError, match="decode"):
+        EncodeOnlyCodec()
+
+
+async def _run_until_terminal(queue, entry_id, handler):
+    worker = RedisAsyncQueueWorker(
+        {"requests": queue}, {"requests": handler}, idle_delay=0.001
+    )
+    task = asyncio.create_task(worker.run())
+    try:
+        while (await queue.afind(entry_id)).status not in {
+            QueueEntryStatus.SUCCEEDED,
+            QueueEntryStatus.FAILED,
+        }:
+            await asyncio.sleep(0.001)
+    finally:
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+def test_redis_worker_runs_a_compact_entry_to_completion(redis_client):
+    queue = RedisAsyncQueue(
+        redis_client,
+        queue_name=f"compact-{uuid4().hex}",
+        entry_codec=CompactEntryCodec(),
+    )
+
+    async def exercise():
+        entry_id = await queue.aenqueue({"n": 1}, timeout_seconds=30)
+        raw = await queue._provider._async_redis().get(
+            queue._provider._entry_key(entry_id)
+        )
+        assert raw[0] == 0
+
+        async def handle(entry):
+            return entry.payload["n"] + 1
+
+        await _run_until_terminal(queue, entry_id, handle)
+        entry = await queue.afind(entry_id)
+        await queue.aprune(entry_id)
+        await queue.aclose()
+        return entry
+
+    entry = asyncio.run(exercise())
+
+    assert entry.status is QueueEntryStatus.SUCCEEDED
+    assert entry.result == 2
+    assert entry.timeout_seconds == 30
+    assert entry.ran_for is not None
+
+
+def test_redis_claim_and_start_rewrites_a_compact_header(redis_client):
+    queue = RedisAsyncQueue(
+        redis_client,
+        queue_name=f"compact-{uuid4().hex}",
+        entry_codec=CompactEntryCodec(),
+    )
+
+    async def exercise():
+        entry_id = await queue.aenqueue("work", timeout_seconds=30)
+        started = await queue.aclaim_and_start(
+            uuid4(),
+            budget_seconds=None,
+            default_budget_seconds=600,
+            grace_seconds=5,
+            published_through=None,
+        )
+        stored = await queue.afind(entry_id)
+        await queue.aclose()
+        return entry_id, started, stored
+
+    entry_id, started, stored = asyncio.run(exercise())
+
+    assert started.id == entry_id
+    assert started.status is QueueEntryStatus.RUNNING
+    assert started.dispatched_at is not None
+    assert stored == started
+
+
+def test_redis_recovers_an_expired_compact_claim(redis_client):
+    queue = RedisAsyncQueue(
+        redis_client,
+        queue_name=f"compact-{uuid4().hex}",
+        entry_codec=CompactEntryCodec(),
+    )
+
+    async def exercise():
+        entry_id = await queue.aenqueue("work")
+        provider = queue._provider
+        worker_id = uuid4()
+        claimed = await provider.aclaim(worker_id, 0.01)
+        running = replace(
+            claimed,
+            status=QueueEntryStatus.RUNNING,
+            dispatched_at=await queue.clock.anow(),
+        )
+        assert await provider.amark_running(worker_id, running)
+        await asyncio.sleep(0.05)
+        assert await provider.arecover(10) == (1, 0)
+        recovered = await queue.afind(entry_id)
+        assert (await provider.aclaim(uuid4(), 10)).id == entry_id
+        await queue.aclose()
+        return recovered
+
+    recovered = asyncio.run(exercise())
+
+    assert recovered.status is QueueEntryStatus.QUEUED
+    assert recovered.dispatched_at is None
+    assert recovered.payload == "work"
+
+
+def test_redis_priority_queue_orders_compact_entries_by_priority(redis_client):
+    queue = RedisAsyncPriorityQueue(
+        redis_client,
+        queue_name=f"compact-{uuid4().hex}",
+        entry_codec=CompactEntryCodec(),
+    )
+
+    async def exercise():
+        low = await queue.aenqueue("low", priority=1)
+        high = await queue.aenqueue("high", priority=5)
+        provider = queue._provider
+        worker_id = uuid4()
+        claimed = await provider.aclaim_priority(worker_id, 10)
+        assert claimed.id == high
+        assert await provider.arelease_priority(high, worker_id, 0.001)
+        order = [(await provider.aclaim_priority(uuid4(), 10)).id for _ in range(2)]
+        await queue.aclose()
+        return order, [high, low]
+
+    order, expected = asyncio.run(exercise())
+
+    assert order == expected
+
+
+def test_redis_event_queue_delivers_compact_events(redis_client, monkeypatch):
+    queue = RedisEventQueue(
+        redis_client,
+        queue_name=f"compact-{uuid4().hex}",
+        entry_codec=CompactEntryCodec(),
+    )
+    received = []
+
+    async def receive(entry):
+        received.append(entry.payload)
+        return True
+
+    monkeypatch.setattr(
+        "django_queue.event_worker.listeners_for",
+        lambda queue_name: (ListenerRegistration(receive),),
+    )
+
+    async def exercise():
+        await queue.aenqueue({"event": 1})
+        assert await RedisEventQueueWorker(queue).adispatch_once()
+        assert not await queue.ahas_pending()
+        await queue.aclose()
+
+    asyncio.run(exercise())
+
+    assert received == [{"event": 1}]
+
+
+def test_redis_worker_runs_a_hash_entry_to_completion(redis_client):
+    queue = RedisAsyncQueue(
+        redis_client,
+        queue_name=f"hash-{uuid4().hex}",
+        entry_codec=HashEntryCodec(),
+    )
+
+    async def exercise():
+        entry_id = await queue.aenqueue({"n": 1}, timeout_seconds=30)
+        client = queue._provider._async_redis()
+        key = queue._provider._entry_key(entry_id)
+        assert await client.type(key) == b"hash"
+        assert await client.hget(key, "status") == b"queued"
+
+        async def handle(entry):
+            return entry.payload["n"] + 1
+
+        await _run_until_terminal(queue, entry_id, handle)
+        entry = await queue.afind(entry_id)
+        listed = await queue.alist()
+        payload = await client.hget(key, "payload")
+        await queue.aprune(entry_id)
+        remaining = await client.exists(key)
+        await queue.aclose()
+        return entry, listed, payload, remaining
+
+    entry, listed, payload, remaining = asyncio.run(exercise())
+
+    assert entry.status is QueueEntryStatus.SUCCEEDED
+    assert entry.result == 2
+    assert entry.timeout_seconds == 30
+    assert listed == [entry]
+    assert payload == b'{"n":1}'
+    assert remaining == 0
+
+
+def test_redis_claim_and_start_sets_hash_fields(redis_client):
+    queue = RedisAsyncQueue(
+        redis_client,
+        queue_name=f"hash-{uuid4().hex}",
+        entry_codec=HashEntryCodec(),
+    )
+
+    async def exercise():
+        entry_id = await queue.aenqueue("work", timeout_seconds=30)
+        started = await queue.aclaim_and_start(
+            uuid4(),
+            budget_seconds=None,
+            default_budget_seconds=600,
+            grace_seconds=5,
+            published_through=None,
+        )
+        stored = await queue.afind(entry_id)
+        await queue.aclose()
+        return entry_id, started, stored
+
+    entry_id, started, stored = asyncio.run(exercise())
+
+    assert started.id == entry_id
+    assert started.status is QueueEntryStatus.RUNNING
+    assert started.dispatched_at is not None
+    assert stored == started
+
+
+def test_redis_recovers_an_expired_hash_claim_into_priority_order(redis_client):
+    queue = RedisAsyncPriorityQueue(
+        redis_client,
+        queue_name=f"hash-{uuid4().hex}",
+        entry_codec=HashEntryCodec(),
+    )
+
+    async def exercise():
+        low = await queue.aenqueue("low", priority=1)
+        high = await queue.aenqueue("high", priority=5)
+        provider = queue._provider
+        worker_id = uuid4()
+        claimed = await provider.aclaim_priority(worker_id, 0.01)
+        running = replace(
+            claimed,
+            status=QueueEntryStatus.RUNNING,
+            dispatched_at=await queue.clock.anow(),
+        )
+        assert await provider.amark_running(worker_id, running)
+        await asyncio.sleep(0.05)
+        assert await provider.arecover_priority(10) == (1, 0)
+        recovered = await queue.afind(high)
+        order = [(await provider.aclaim_priority(uuid4(), 10)).id for _ in range(2)]
+        await queue.aclose()
+        return recovered, order, [high, low]
+
+    recovered, order, expected = asyncio.run(exercise())
+
+    assert recovered.status is QueueEntryStatus.QUEUED
+    assert recovered.dispatched_at is None
+    assert recovered.payload == "high"
+    assert order == expected
+
+
+def test_redis_event_queue_delivers_hash_events(redis_client, monkeypatch):
+    queue = RedisEventQueue(
+        redis_client,
+        queue_name=f"hash-{uuid4().hex}",
+        entry_codec=HashEntryCodec(),
+    )
+    received = []
+
+    async def receive(entry):
+        received.append(entry.payload)
+        return True
+
+    monkeypatch.setattr(
+        "django_queue.event_worker.listeners_for",
+        lambda queue_name: (ListenerRegistration(receive),),
+    )
+
+    async def exercise():
+        await queue.aenqueue({"event": 1})
+        assert await RedisEventQueueWorker(queue).adispatch_once()
+        assert not await queue.ahas_pending()
+        await queue.aclose()
+
+    asyncio.run(exercise())
+
+    assert received == [{"event": 1}]
+
+
+def test_redis_hash_queue_runs_entries_stored_as_strings(redis_client):
+    queue_name = f"hash-{uuid4().hex}"
+    before = RedisAsyncQueue(redis_client, queue_name=queue_name)
+    queue = RedisAsyncQueue(
+        redis_client, queue_name=queue_name, entry_codec=HashEntryCodec()
+    )
+
+    async def exercise():
+        entry_id = await before.aenqueue(3)
+        await before.aclose()
+
+        async def handle(entry):
+            return entry.payload * 2
+
+        await _run_until_terminal(queue, entry_id, handle)
+        client = queue._provider._async_redis()
+        kind = await client.type(queue._provider._entry_key(entry_id))
+        entry = await queue.afind(entry_id)
+        await queue.aclose()
+        return kind, entry
+
+    kind, entry = asyncio.run(exercise())
+
+    assert kind == b"hash"
+    assert entry.status is QueueEntryStatus.SUCCEEDED
+    assert entry.result == 6
+
+
+def test_redis_migrates_string_entries_to_hashes(redis_client):
+    queue_name = f"hash-{uuid4().hex}"
+    before = RedisAsyncQueue(
+        redis_client, queue_name=queue_name, entry_codec=CompactEntryCodec()
+    )
+    queue = RedisAsyncQueue(
+        redis_client, queue_name=queue_name, entry_codec=HashEntryCodec()
+    )
+
+    async def exercise():
+        entry_ids = [await before.aenqueue(n) for n in range(3)]
+        expected = [await before.afind(entry_id) for entry_id in entry_ids]
+        await before.aclose()
+        provider = queue._provider
+        migrated = await queue.amigrate_entries(batch_size=2)
+        again = await queue.amigrate_entries()
+        client = provider._async_redis()
+        kinds = {
+            await client.type(provider._entry_key(entry_id)) for entry_id in entry_ids
+        }
+        entries = [await queue.afind(entry_id) for entry_id in entry_ids]
+        claimed = await provider.aclaim(uuid4(), 10)
+        await queue.aclose()
+        return migrated, again, kinds, entries, expected, claimed.id, entry_ids[0]
+
+    migrated, again, kinds, entries, expected, claimed, first = asyncio.run(exercise())
+
+    assert (migrated, again) == (3, 0)
+    assert kinds == {b"hash"}
+    assert entries == expected
+    assert claimed == first
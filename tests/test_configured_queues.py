@@ -13,6 +13,7 @@ from django_queue.backends import (
     MemoryEventQueue,
 )
 from django_queue.backends.exceptions import QueueException
+from django_queue.codecs import CompactEntryCodec, JsonEntryCodec
 from django_queue.entries import QueueEntry
 from django_queue.event_worker import EventQueueWorker
 from django_queue.worker import AsyncQueueWorker
@@ -514,6 +515,70 @@ class TestConfiguredQueueInitialization:
         queue = handler["events"]
         assert queue.entry_class is TrackingEntry
 
+    @pytest.mark.parametrize(
+        "codec", [CompactEntryCodec, "django_queue.codecs.CompactEntryCodec"]
+    )
+    def test_passes_the_configured_entry_codec_to_a_redis_provider(
+        self, codec, no_runtime_startup
+    ):
+        handler = django_queue.QueueRegistry(
+            {
+                "events": {
+                    "BACKEND": "django_queue.backends.redis.RedisEventQueue",
+                    "LOCATION": "redis://localhost:6379/0",
+                    "ENTRY_CODEC": codec,
+                },
+                "default": {
+                    "BACKEND": "django_queue.backends.redis.RedisAsyncQueue",
+                    "LOCATION": "redis://localhost:6379/0",
+                },
+            }
+        )
+
+        django_queue.initialise_queues(handler)
+
+        assert isinstance(handler["events"]._provider.entry_codec, CompactEntryCodec)
+        assert isinstance(handler["default"]._provider.entry_codec, JsonEntryCodec)
+        assert handler.settings["events"]["ENTRY_CODEC"] is codec
+
+    @pytest.mark.parametrize(
+        ("backend", "codec", "message"),
+        [
+            (
+                "django_queue.backends.redis.RedisAsyncQueue",
+                "tests.test_configured_queues.TrackingEntry",
+                "ENTRY_CODEC must be a EntryCodec subclass",
+            ),
+            (
+                "django_queue.backends.redis.RedisAsyncQueue",
+                "tests.test_configured_queues.UnknownCodec",
+                "ENTRY_CODEC could not be imported",
+            ),
+            (
+                "django_queue.backends.MemoryAsyncQueue",
+                CompactEntryCodec,
+                "ENTRY_CODEC is not supported",
+            ),
+        ],
+        ids=["not-a-codec", "missing-codec-path", "memory-backend"],
+    )
+    def test_rejects_an_invalid_entry_codec(
+        self, backend, codec, message, no_runtime_startup
+    ):
+        handler = django_queue.QueueRegistry(
+            {
+                "default": {
+                    "BACKEND": backend,
+                    "LOCATION": "redis://localhost:6379/0",
+                    "ENTRY_CODEC": codec,
+                }
+            }
+        )
+
+        with pytest.raises(InvalidQueueBackendError, match=f"default.*{message}"):
+            django_queue.initialise_queues(handler)
+            handler["default"]
+
     def test_rejects_an_event_worker_configured_for_an_async_queue(self):
         handler = django_queue.QueueRegistry(
             {
@@ -627,3 +692,121 @@ class TestConfiguredQueueInitialization:
 
         with pytest.raises(InvalidQueueBackendError, match="RETENTION_TIMEOUT"):
             django_queue.initialise_queues(handler)
+
+    def test_defaults_async_queue_concurrency_to_one(self):
+        handler = django_queue.QueueRegistry(
+            {"default": {"BACKEND": "django_queue.backends.MemoryAsyncQueue"}}
+        )
+
+        django_queue.initialise_queues(handler)
+
+        assert handler["default"].concurrency == 1
+
+    def test_accepts_a_positive_async_queue_concurrency(self):
+        handler = django_queue.QueueRegistry(
+            {
+                "default": {
+                    "BACKEND": "django_queue.backends.MemoryAsyncQueue",
+                    "CONCURRENCY": 4,
+                }
+            }
+        )
+
+        django_queue.initialise_queues(handler)
+
+        assert handler["default"].concurrency == 4
+
+    @pytest.mark.parametrize("concurrency", [0, -1, "4", True, 2.0, None])
+    def test_rejects_an_invalid_async_queue_concurrency(self, concurrency):
+        handler = django_queue.QueueRegistry(
+            {
+                "default": {
+                    "BACKEND": "django_queue.backends.MemoryAsyncQueue",
+                    "CONCURRENCY": concurrency,
+                }
+            }
+        )
+
+        with pytest.raises(InvalidQueueBackendError, match="default.*CONCURRENCY"):
+            django_queue.initialise_queues(handler)
+
+    @pytest.mark.parametrize("processes", [0, -1, "2", True, 2.0, None])
+    def test_rejects_an_invalid_process_count(self, processes):
+        handler = django_queue.QueueRegistry(
+            {
+                "default": {
+                    "BACKEND": "django_queue.backends.MemoryAsyncQueue",
+                    "PROCESSES": processes,
+                }
+            }
+        )
+
+        with pytest.raises(InvalidQueueBackendError, match="default.*PROCESSES"):
+            django_queue.initialise_queues(handler)
+
+    @pytest.mark.parametrize("executor", ["thread", "", None, 1])
+    def test_rejects_an_unknown_handler_executor(self, executor):
+        handler = django_queue.QueueRegistry(
+            {
+                "default": {
+                    "BACKEND": "django_queue.backends.MemoryAsyncQueue",
+                    "HANDLER_EXECUTOR": executor,
+                }
+            }
+        )
+
+        with pytest.raises(InvalidQueueBackendError, match="default.*HANDLER_EXECUTOR"):
+            django_queue.initialise_queues(handler)
+
+    def test_applies_event_queue_listener_settings(self):
+        handler = django_queue.QueueRegistry(
+            {
+                "default": {
+                    "BACKEND": "django_queue.backends.MemoryEventQueue",
+                    "LISTENER_EXECUTOR": "pool",
+                    "LISTENER_TIMEOUT": 2.5,
+                }
+            }
+        )
+
+        django_queue.initialise_queues(handler)
+
+        assert handler["default"].listener_executor == "pool"
+        assert handler["default"].listener_timeout == 2.5
+
+    @pytest.mark.parametrize(
+        ("option", "value"),
+        [
+            ("LISTENER_EXECUTOR", "process"),
+            ("LISTENER_EXECUTOR", None),
+            ("LISTENER_TIMEOUT", 0),
+            ("LISTENER_TIMEOUT", float("inf")),
+            ("LISTENER_TIMEOUT", "5"),
+        ],
+    )
+    def test_rejects_invalid_listener_settings(self, option, value):
+        handler = django_queue.QueueRegistry(
+            {
+                "default": {
+                    "BACKEND": "django_queue.backends.MemoryEventQueue",
+                    option: value,
+                }
+            }
+        )
+
+        with pytest.raises(InvalidQueueBackendError, match=f"default.*{option}"):
+            django_queue.initialise_queues(handler)
+
+    def test_applies_concurrency_to_an_event_queue(self):
+        handler = django_queue.QueueRegistry(
+            {
+                "default": {
+                    "BACKEND": "django_queue.backends.MemoryEventQueue",
+                    "CONCURRENCY": 8,
+                }
+            }
+        )
+
+        django_queue.initialise_queues(handler)
+
+        assert handler["default"].concurrency == 8
@@ -6,7 +6,12 @@ from uuid import UUID
 import pytest
 
 from django_queue.clock import ClockTime
-from django_queue.entries import QueueEntry, QueueEntryStatus, validate_json_value
+from django_queue.entries import (
+    QueueEntry,
+    QueueEntryStatus,
+    trusted_entry,
+    validate_json_value,
+)
 from tests.helpers import FIXED_CLOCK_TIME, FIXED_UUID7, CustomQueueEntry
 
 
@@ -488,6 +493,61 @@ class TestQueueEntry:
 
         assert CustomQueueEntry.from_dict(stored).kind == "task"
 
+    def test_restores_a_trusted_record_like_a_validated_one(self):
+        entry = replace(
+            CustomQueueEntry.create(
+                queue="requests", payload={"items": [1]}, timeout_seconds=2.5
+            ),
+            status=QueueEntryStatus.SUCCEEDED,
+            dispatched_at=ClockTime(FIXED_CLOCK_TIME.seconds, 1),
+            finished_at=ClockTime(FIXED_CLOCK_TIME.seconds, 2),
+            result=[3],
+            kind="report",
+        )
+        stored = entry.to_dict()
+
+        assert CustomQueueEntry.from_trusted_dict(stored) == entry
+        del stored["kind"]
+        assert CustomQueueEntry.from_trusted_dict(stored).kind == "task"
+
+    def test_does_not_revalidate_a_trusted_record(self, monkeypatch):
+        stored = QueueEntry.create(queue="requests", payload={"n": 1}).to_dict()
+
+        def refuse(value):
+            raise TypeError("Queue entry values must be JSON-serialisable")
+
+        monkeypatch.setattr("django_queue.entries.validate_json_value", refuse)
+
+        assert QueueEntry.from_trusted_dict(stored).payload == {"n": 1}
+        with pytest.raises(ValueError, match="JSON-serialisable"):
+            QueueEntry.from_dict(stored)
+
+    @pytest.mark.parametrize(
+        ("field", "value"), [("status", "bogus"), ("queued_at", "not-a-number")]
+    )
+    def test_rejects_a_trusted_record_that_will_not_decode(self, field, value):
+        stored = QueueEntry.create(queue="requests", payload=None).to_dict()
+
+        with pytest.raises(ValueError, match=rf"Queue entry .*\b{field}\b"):
+            QueueEntry.from_trusted_dict(stored | {field: value})
+
+    def test_rejects_trusted_values_missing_a_required_field(self):
+        with pytest.raises(ValueError, match=r"Queue entry record is missing id"):
+            trusted_entry(QueueEntry, {"queue": "requests"})
+
+    def test_keeps_a_subclass_post_init_for_trusted_values(self):
+        @dataclass(frozen=True, slots=True)
+        class CheckedEntry(QueueEntry):
+            def __post_init__(self):
+                super(CheckedEntry, self).__post_init__()
+                if self.payload == "forbidden":
+                    raise ValueError("Forbidden payload")
+
+        stored = QueueEntry.create(queue="requests", payload="forbidden").to_dict()
+
+        with pytest.raises(ValueError, match="Forbidden payload"):
+            CheckedEntry.from_trusted_dict(stored)
+
     def test_is_immutable(self):
         entry = QueueEntry.create(queue="requests", payload=None)
 
@@ -500,6 +560,45 @@ class TestQueueEntry:
         with pytest.raises(TypeError, match="QueueEntryStatus"):
             replace(entry, status="queued")
 
+    def test_serialises_the_payload_once_across_its_lifecycle(self, monkeypatch):
+        calls = []
+
+        def counting(value):
+            calls.append(value)
+            return json.dumps(value, separators=(",", ":"))
+
+        monkeypatch.setattr("django_queue.entries.validate_json_value", counting)
+        entry = QueueEntry.create(queue="requests", payload={"items": [1, 2]})
+        running = replace(
+            entry, status=QueueEntryStatus.RUNNING, dispatched_at=FIXED_CLOCK_TIME
+        )
+        finished = replace(running, status=QueueEntryStatus.SUCCEEDED, result="ok")
+
+        assert finished.payload_json() == '{"items":[1,2]}'
+        assert calls.count({"items": [1, 2]}) == 1
+
+    def test_serialises_a_replaced_payload_again(self):
+        entry = QueueEntry.create(queue="requests", payload={"n": 1})
+
+        assert replace(entry, payload=[2]).payload_json() == "[2]"
+        with pytest.raises(TypeError, match="JSON-serialisable"):
+            replace(entry, payload={1, 2})
+
+    def test_serialises_a_trusted_payload_only_when_asked(self):
+        stored = QueueEntry.create(queue="requests", payload={"n": 1}).to_dict()
+
+        assert trusted_entry(QueueEntry, stored, '{"n": 1}').payload_json() == (
+            '{"n": 1}'
+        )
+        assert QueueEntry.from_trusted_dict(stored).payload_json() == '{"n":1}'
+
+    def test_keeps_the_serialised_payload_out_of_its_record(self):
+        entry = QueueEntry.create(queue="requests", payload={"n": 1})
+
+        assert "_payload_json" not in entry.to_dict()
+        assert "_payload_json" not in repr(entry)
+        assert entry == QueueEntry.from_dict(entry.to_dict())
+
 
 @pytest.mark.parametrize("payload", [{"nested": [1, None, False]}, "text", 1.2, None])
 def test_validate_json_value_accepts_json_values(payload):
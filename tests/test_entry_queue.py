@@ -31,7 +31,7 @@ from django_queue.observers import (
     _pending_by_alias,
     _Registration,
 )
-from django_queue.signals import entry_enqueued
+from django_queue.signals import entries_enqueued, entry_enqueued
 from django_queue.worker import AsyncQueueWorker
 from tests.helpers import FIXED_CLOCK_TIME, CustomQueueEntry, FixedClock
 
@@ -282,6 +282,36 @@ class TestMemoryAsyncQueueEntries:
 
         assert observed_ids == [first_id, second_id, third_id]
 
+    def test_worker_pages_first_seen_scans_from_its_cursor(self, queue, monkeypatch):
+        monkeypatch.setattr("django_queue.worker._FIRST_SEEN_SCAN_PAGE_SIZE", 2)
+        observed_ids = []
+        cursors = []
+
+        async def exercise():
+            worker = AsyncQueueWorker(
+                {"requests": queue},
+                {"requests": lambda entry: asyncio.sleep(0)},
+            )
+            original_list_entries = queue._alist_after
+
+            async def list_entries(after, limit):
+                cursors.append(after)
+                return await original_list_entries(after, limit)
+
+            async def publish(entry):
+                observed_ids.append(entry.id)
+
+            queue._alist_after = list_entries
+            queue.apublish = publish
+            entry_ids = [await queue.aenqueue(number) for number in range(5)]
+            await worker._publish_new(queue)
+            return entry_ids
+
+        entry_ids = asyncio.run(exercise())
+
+        assert observed_ids == entry_ids
+        assert cursors == [None, entry_ids[1], entry_ids[3]]
+
     def test_worker_throttles_first_seen_scans_per_queue(self, queue):
         async def exercise():
             worker = AsyncQueueWorker(
@@ -289,14 +319,14 @@ class TestMemoryAsyncQueueEntries:
                 {"requests": lambda entry: asyncio.sleep(0)},
             )
             scan_count = 0
-            original_list_entries = queue.alist
+            original_list_entries = queue._alist_after
 
-            async def list_entries():
+            async def list_entries(after, limit):
                 nonlocal scan_count
                 scan_count += 1
-                return await original_list_entries()
+                return await original_list_entries(after, limit)
 
-            queue.alist = list_entries
+            queue._alist_after = list_entries
             await worker._publish_new(queue)
             await worker._publish_new(queue)
             return scan_count
@@ -568,6 +598,38 @@ class TestMemoryAsyncQueueEntries:
             QueueEntryStatus.SUCCEEDED,
         }
 
+    def test_list_filters_by_status_and_pages_from_a_cursor(self, queue):
+        entry_ids = [queue.enqueue(n) for n in range(5)]
+        queue._mark_running(entry_ids[1])
+        for entry_id in entry_ids[2:4]:
+            queue._mark_running(entry_id)
+            queue._mark_failed(entry_id, RuntimeError("boom"))
+
+        def ids(**kwargs):
+            return [entry.id for entry in queue.list(**kwargs)]
+
+        assert ids(status=QueueEntryStatus.QUEUED) == [entry_ids[0], entry_ids[4]]
+        assert ids(status="running") == [entry_ids[1]]
+        assert ids(status=["running", "failed"], limit=2) == entry_ids[1:3]
+        assert ids(status=["running", "failed"], after=entry_ids[2]) == [entry_ids[3]]
+        assert ids(status="failed", newest_first=True, limit=1) == [entry_ids[3]]
+        assert ids(after=entry_ids[3], newest_first=True) == entry_ids[2::-1]
+        assert ids(limit=2) == entry_ids[:2]
+        assert ids(status=QueueEntryStatus.SUCCEEDED) == []
+
+    @pytest.mark.parametrize(
+        ("kwargs", "error"),
+        [
+            ({"status": "lost"}, ValueError),
+            ({"limit": 0}, ValueError),
+            ({"limit": True}, ValueError),
+            ({"after": "entry"}, TypeError),
+        ],
+    )
+    def test_list_rejects_an_invalid_filter(self, queue, kwargs, error):
+        with pytest.raises(error):
+            queue.list(**kwargs)
+
     def test_observer_orders_a_terminated_snapshot_during_bootstrap(self, queue):
         entry_id = queue.enqueue("completed")
         queued = queue.find(entry_id)
@@ -646,6 +708,43 @@ class TestMemoryAsyncQueueEntries:
         assert entry.queued_at == FIXED_CLOCK_TIME
         assert entry.payload == {"request_id": 42}
 
+    def test_enqueue_many_returns_ids_in_payload_order_and_signals_once(self, queue):
+        batches = []
+
+        def receiver(sender, *, entries, queue_name, **kwargs):
+            batches.append((queue_name, [entry.id for entry in entries]))
+
+        entries_enqueued.connect(receiver, weak=False)
+        try:
+            entry_ids = queue.enqueue_many(["first", "second", "third"])
+        finally:
+            entries_enqueued.disconnect(receiver)
+
+        assert [queue.find(entry_id).payload for entry_id in entry_ids] == [
+            "first",
+            "second",
+            "third",
+        ]
+        assert batches == [("requests", entry_ids)]
+        assert {queue.dequeue().id for _ in entry_ids} == set(entry_ids)
+
+    def test_enqueue_many_stores_nothing_when_any_payload_is_invalid(self, queue):
+        with pytest.raises(TypeError):
+            queue.enqueue_many(["valid", object()])
+
+        assert not queue.has_pending()
+        assert queue.list() == []
+
+    def test_enqueue_many_of_nothing_sends_no_signal(self, queue):
+        def receiver(sender, **kwargs):
+            raise AssertionError("an empty batch must not signal")
+
+        entries_enqueued.connect(receiver, weak=False)
+        try:
+            assert queue.enqueue_many([]) == []
+        finally:
+            entries_enqueued.disconnect(receiver)
+
     def test_dequeue_removes_the_entry_from_pending_work_but_retains_its_record(
         self, queue
     ):
@@ -780,6 +879,45 @@ class TestMemoryAsyncQueueEntries:
         with pytest.raises(QueueEntryNotFoundError):
             queue.find(entry_id)
 
+    def test_expired_pruning_takes_only_expired_entries_in_batches(self):
+        clock = FixedClock()
+        queue = MemoryAsyncQueue(queue_name="requests", clock=clock)
+        queue.retention_timeout = 10
+        queue.retention_batch_size = 2
+        published = []
+
+        async def record(entry):
+            published.append(entry)
+
+        queue.apublish = record
+        expired_ids = []
+        for payload in ("first", "second", "third"):
+            entry_id = queue.enqueue(payload)
+            queue._mark_failed(entry_id, ValueError(payload))
+            expired_ids.append(entry_id)
+        clock.timestamp = FIXED_CLOCK_TIME + 5
+        retained_id = queue.enqueue("retained")
+        queue._mark_running(retained_id)
+        queue._mark_succeeded(retained_id, "done")
+        queued_id = queue.enqueue("queued")
+        clock.timestamp = FIXED_CLOCK_TIME + 10
+
+        assert asyncio.run(queue._aprune_expired()) == 3
+        assert [entry.id for entry in published] == expired_ids
+        assert {entry.status for entry in published} == {QueueEntryStatus.TERMINATED}
+        assert {entry.id for entry in queue.list()} == {retained_id, queued_id}
+
+    def test_expired_pruning_skips_an_entry_already_pruned_by_hand(self):
+        clock = FixedClock()
+        queue = MemoryAsyncQueue(queue_name="requests", clock=clock)
+        queue.retention_timeout = 10
+        entry_id = queue.enqueue("work")
+        queue._mark_failed(entry_id, ValueError("work"))
+        queue.prune(entry_id)
+        clock.timestamp = FIXED_CLOCK_TIME + 10
+
+        assert asyncio.run(queue._aprune_expired()) == 0
+
     def test_worker_prunes_expired_terminal_entries(
         self, observer_queue, no_runtime_startup
     ):
@@ -954,6 +1092,56 @@ def test_memory_async_queue_releases_one_earliest_due_entry_per_round():
     assert queue.dequeue().id == later_id
 
 
+def test_memory_async_queue_enqueue_many_schedules_the_whole_batch():
+    clock = FixedClock()
+    queue = MemoryAsyncQueue(queue_name="scheduled", clock=clock)
+
+    entry_ids = queue.enqueue_many(["a", "b"], available_at=FIXED_CLOCK_TIME + 10)
+
+    with pytest.raises(QueueEmptyException):
+        queue.dequeue()
+    clock.timestamp = FIXED_CLOCK_TIME + 10
+    assert {queue.dequeue().id, queue.dequeue().id} == set(entry_ids)
+
+
+def test_memory_queue_wakes_an_idle_waiter_when_work_is_enqueued(queue):
+    async def exercise():
+        waiter = asyncio.create_task(queue._await_pending(30))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        await queue.aenqueue("work")
+        await asyncio.wait_for(waiter, timeout=1)
+
+    asyncio.run(exercise())
+
+
+def test_memory_queue_wakes_a_waiter_from_a_synchronous_enqueue_thread():
+    queue = MemoryAsyncQueue(queue_name="requests")
+
+    async def exercise():
+        waiter = asyncio.create_task(queue._await_pending(30))
+        await asyncio.sleep(0.01)
+        await asyncio.to_thread(queue.enqueue, "work")
+        await asyncio.wait_for(waiter, timeout=1)
+
+    asyncio.run(exercise())
+
+
+def test_memory_queue_wait_ends_when_scheduled_work_falls_due():
+    queue = MemoryAsyncQueue(queue_name="scheduled")
+
+    async def exercise():
+        entry_id = await queue.aenqueue(
+            "soon", available_at=await queue.clock.anow() + 0.05
+        )
+        await asyncio.wait_for(queue._await_pending(30), timeout=1)
+        return entry_id, await queue.adequeue()
+
+    entry_id, dequeued = asyncio.run(exercise())
+
+    assert dequeued.id == entry_id
+
+
 def test_memory_async_queue_rejects_a_non_clocktime_available_at(queue):
     with pytest.raises(TypeError, match="available_at must be a ClockTime or None"):
         queue.enqueue("work", available_at=10)
@@ -1044,6 +1232,15 @@ def test_memory_priority_queue_dispatches_the_tracked_path_in_priority_order():
     assert queue.dequeue().id == low_id
 
 
+def test_memory_priority_queue_enqueue_many_keeps_arrival_order_in_priority():
+    queue = MemoryAsyncPriorityQueue(queue_name="priority")
+
+    low_id = queue.enqueue("low", priority=1)
+    batch_ids = queue.enqueue_many(["a", "b", "c"], priority=5)
+
+    assert [queue.dequeue().id for _ in range(4)] == [*batch_ids, low_id]
+
+
 def test_memory_priority_queue_preserves_arrival_order_within_one_priority():
     queue = MemoryAsyncPriorityQueue(queue_name="priority")
 
@@ -224,6 +224,33 @@ def test_redis_event_aenqueue_routes_through_the_atomic_store_and_push_path(
     assert dequeued.id == event_id
 
 
+def test_redis_event_enqueue_many_indexes_each_unclaimed_deadline(redis_client):
+    queue = RedisEventQueue(redis_client, queue_name=f"events-{uuid4().hex}")
+    provider = queue._provider
+
+    async def scenario():
+        event_ids = await queue.aenqueue_many(["first", "second"], timeout_seconds=30)
+        deadlines = await provider._async_redis().zmscore(
+            provider._entry_unclaimed_deadlines_name,
+            [str(event_id) for event_id in event_ids],
+        )
+        expected = [
+            round(
+                ((await queue.afind(event_id)).queued_at + 30).to_timestamp()
+                * 1_000_000
+            )
+            for event_id in event_ids
+        ]
+        dequeued = [(await queue.adequeue()).id for _ in event_ids]
+        await queue.aclose()
+        return event_ids, deadlines, expected, dequeued
+
+    event_ids, deadlines, expected, dequeued = asyncio.run(scenario())
+
+    assert deadlines == expected
+    assert dequeued == event_ids
+
+
 def test_directly_dequeuing_a_redis_event_removes_its_record(redis_client):
     queue = RedisEventQueue(redis_client)
 
@@ -1,5 +1,6 @@
 import asyncio
 import threading
+import time
 from uuid import uuid4
 
 import pytest
@@ -243,3 +244,348 @@ def test_redis_event_worker_dispatches_an_event(redis_client, monkeypatch):
     asyncio.run(exercise())
 
     assert received == ["event"]
+
+
+@pytest.mark.parametrize("queue_type", ["memory", "redis"])
+def test_an_idle_event_worker_wakes_for_a_new_event(queue_type, monkeypatch, request):
+    if queue_type == "memory":
+        queue = MemoryEventQueue(queue_name="events")
+        worker_class = MemoryEventQueueWorker
+    else:
+        queue = RedisEventQueue(
+            request.getfixturevalue("redis_client"),
+            queue_name=f"events-{uuid4().hex}",
+        )
+        worker_class = RedisEventQueueWorker
+
+    async def exercise():
+        received = asyncio.Event()
+
+        async def receive(entry):
+            received.set()
+            return True
+
+        monkeypatch.setattr(
+            "django_queue.event_worker.listeners_for",
+            lambda queue_name: (ListenerRegistration(receive),),
+        )
+        task = asyncio.create_task(worker_class(queue, idle_delay=30).run())
+        try:
+            await asyncio.sleep(0.02)
+            await queue.aenqueue("event")
+            await asyncio.wait_for(received.wait(), timeout=1)
+        finally:
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            await queue.aclose()
+
+    asyncio.run(exercise())
+
+
+def test_event_worker_records_listener_timing(monkeypatch, caplog):
+    queue = MemoryEventQueue(queue_name="events")
+
+    async def receive(entry):
+        await asyncio.sleep(0.05)
+        return True
+
+    monkeypatch.setattr(
+        "django_queue.event_worker.listeners_for",
+        lambda queue_name: (ListenerRegistration(receive),),
+    )
+
+    async def exercise():
+        await queue.aenqueue("event")
+        worker = MemoryEventQueueWorker(queue)
+        worker.slow_listener_seconds = 0.01
+        assert await worker.adispatch_once()
+        await queue.aclose()
+        return worker.listener_stats
+
+    stats = asyncio.run(exercise())
+
+    assert stats.executor == "loop"
+    assert stats.invocations == 1
+    assert stats.slow_invocations == 1
+    assert stats.timed_out_invocations == 0
+    assert stats.max_duration >= 0.05
+    assert "Event listener ran for" in caplog.text
+
+
+def test_event_worker_reports_a_listener_that_stalls_its_loop(monkeypatch):
+    queue = MemoryEventQueue(queue_name="events")
+
+    async def block(entry):
+        time.sleep(0.2)  # noqa: ASYNC251 - deliberately blocks the loop
+        return True
+
+    monkeypatch.setattr(
+        "django_queue.event_worker.listeners_for",
+        lambda queue_name: (ListenerRegistration(block),),
+    )
+
+    async def exercise():
+        worker = MemoryEventQueueWorker(queue, idle_delay=0.01)
+        worker.loop_lag_interval = 0.01
+        task = asyncio.create_task(worker.run())
+        await asyncio.sleep(0.05)
+        await queue.aenqueue("event")
+        while worker.listener_stats.invocations == 0:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await queue.aclose()
+        return worker.listener_stats
+
+    stats = asyncio.run(exercise())
+
+    assert stats.max_loop_lag >= 0.1
+
+
+def test_pooled_listener_is_cancelled_and_retried_after_its_budget(monkeypatch, caplog):
+    clock = FixedClock()
+    queue = MemoryEventQueue(queue_name="events", clock=clock)
+    queue.listener_executor = "pool"
+    queue.listener_timeout = 0.05
+    cancelled = []
+
+    async def hang(entry):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(entry.id)
+            raise
+
+    monkeypatch.setattr(
+        "django_queue.event_worker.listeners_for",
+        lambda queue_name: (ListenerRegistration(hang),),
+    )
+
+    async def exercise():
+        entry_id = await queue.aenqueue("event")
+        worker = MemoryEventQueueWorker(queue)
+        assert await worker.adispatch_once()
+        await asyncio.sleep(0)
+        clock.timestamp = FIXED_CLOCK_TIME + worker.release_delay
+        assert await queue.ahas_pending()
+        await queue.aclose()
+        return entry_id, worker.listener_stats
+
+    entry_id, stats = asyncio.run(exercise())
+
+    assert cancelled == [entry_id]
+    assert stats.executor == "pool"
+    assert stats.timed_out_invocations == 1
+    assert "exceeded its 0.05 second budget" in caplog.text
+
+
+def test_pooled_listener_result_is_returned_within_its_budget(monkeypatch):
+    queue = MemoryEventQueue(queue_name="events")
+    queue.listener_executor = "pool"
+    received = []
+
+    async def receive(entry):
+        received.append(entry.payload)
+        return True
+
+    monkeypatch.setattr(
+        "django_queue.event_worker.listeners_for",
+        lambda queue_name: (ListenerRegistration(receive),),
+    )
+
+    async def exercise():
+        await queue.aenqueue("event")
+        worker = MemoryEventQueueWorker(queue)
+        assert await worker.adispatch_once()
+        assert not await queue.ahas_pending()
+        await queue.aclose()
+        return worker.listener_stats
+
+    stats = asyncio.run(exercise())
+
+    assert received == ["event"]
+    assert stats.invocations == 1
+    assert stats.timed_out_invocations == 0
+
+
+@pytest.mark.parametrize("queue_type", ["memory", "redis"])
+def test_event_worker_dispatches_up_to_the_queue_concurrency_at_once(
+    queue_type, monkeypatch, request
+):
+    if queue_type == "memory":
+        queue = MemoryEventQueue(queue_name="events")
+        worker_class = MemoryEventQueueWorker
+    else:
+        queue = RedisEventQueue(
+            request.getfixturevalue("redis_client"),
+            queue_name=f"events-{uuid4().hex}",
+        )
+        worker_class = RedisEventQueueWorker
+    queue.concurrency = 3
+
+    async def exercise():
+        gate = asyncio.Event()
+        in_flight = []
+        consumed = []
+
+        async def receive(entry):
+            in_flight.append(entry.payload)
+            await gate.wait()
+            consumed.append(entry.payload)
+            return True
+
+        monkeypatch.setattr(
+            "django_queue.event_worker.listeners_for",
+            lambda queue_name: (ListenerRegistration(receive),),
+        )
+        await queue.aenqueue_many(range(5))
+        task = asyncio.create_task(worker_class(queue, idle_delay=0.01).run())
+        try:
+            async with asyncio.timeout(2):
+                while len(in_flight) < 3:
+                    await asyncio.sleep(0.01)
+                await asyncio.sleep(0.05)
+                assert len(in_flight) == 3
+                gate.set()
+                while len(consumed) < 5:
+                    await asyncio.sleep(0.01)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        assert sorted(consumed) == [0, 1, 2, 3, 4]
+        assert not await queue.ahas_pending()
+        await queue.aclose()
+
+    asyncio.run(exercise())
+
+
+def test_reaping_logs_every_failed_event_dispatch_and_raises_the_first(caplog):
+    worker = MemoryEventQueueWorker(MemoryEventQueue(queue_name="events"))
+
+    async def fail(message):
+        raise RuntimeError(message)
+
+    async def exercise():
+        dispatches = {asyncio.create_task(fail(message)) for message in ("a", "b")}
+        await asyncio.wait(dispatches)
+        failures = {task.exception() for task in dispatches}
+        with pytest.raises(RuntimeError) as raised:
+            worker._reap_dispatches(dispatches)
+        return dispatches, failures, raised.value
+
+    dispatches, failures, raised = asyncio.run(exercise())
+
+    logged = [record.exc_info[1] for record in caplog.records if record.exc_info]
+    assert len(logged) == 1
+    assert {raised, *logged} == failures
+    assert not dispatches
+
+
+def test_concurrent_event_dispatches_start_at_successive_listeners(monkeypatch):
+    queue = MemoryEventQueue(queue_name="events")
+    queue.concurrency = 2
+    received = []
+
+    async def exercise():
+        gate = asyncio.Event()
+
+        def listener(name):
+            async def receive(entry):
+                received.append(name)
+                await gate.wait()
+                return True
+
+            return ListenerRegistration(receive)
+
+        registrations = (listener("first"), listener("second"))
+        monkeypatch.setattr(
+            "django_queue.event_worker.listeners_for",
+            lambda queue_name: registrations,
+        )
+        await queue.aenqueue_many(["one", "two"])
+        worker = MemoryEventQueueWorker(queue, idle_delay=0.01)
+        task = asyncio.create_task(worker.run())
+        try:
+            async with asyncio.timeout(2):
+                while len(received) < 2:
+                    await asyncio.sleep(0.01)
+                gate.set()
+                while await queue.ahas_pending():
+                    await asyncio.sleep(0.01)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await queue.aclose()
+
+    asyncio.run(exercise())
+
+    assert received == ["first", "second"]
+
+
+def test_cancelling_a_concurrent_event_worker_releases_every_claim(monkeypatch):
+    queue = MemoryEventQueue(queue_name="events")
+    queue.concurrency = 2
+
+    async def hang(entry):
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(
+        "django_queue.event_worker.listeners_for",
+        lambda queue_name: (ListenerRegistration(hang),),
+    )
+
+    async def exercise():
+        await queue.aenqueue_many(["one", "two"])
+        worker = MemoryEventQueueWorker(queue, idle_delay=0.01)
+        task = asyncio.create_task(worker.run())
+        while worker._dispatches_started < 2:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        claims = dict(queue._provider._claims)
+        remaining = await queue._provider.alist()
+        await queue.aclose()
+        return claims, remaining
+
+    claims, remaining = asyncio.run(exercise())
+
+    assert claims == {}
+    assert len(remaining) == 2
+
+
+def test_concurrent_redis_event_dispatches_renew_their_own_claims(
+    redis_client, monkeypatch, caplog
+):
+    queue = RedisEventQueue(redis_client, queue_name=f"events-{uuid4().hex}")
+    queue.concurrency = 2
+    queue.default_claim_lease_seconds = 0.3
+    consumed = []
+
+    async def receive(entry):
+        await asyncio.sleep(0.7)
+        consumed.append(entry.payload)
+        return True
+
+    monkeypatch.setattr(
+        "django_queue.event_worker.listeners_for",
+        lambda queue_name: (ListenerRegistration(receive),),
+    )
+
+    async def exercise():
+        await queue.aenqueue_many(["one", "two"])
+        task = asyncio.create_task(RedisEventQueueWorker(queue, idle_delay=0.01).run())
+        try:
+            async with asyncio.timeout(3):
+                while len(consumed) < 2:
+                    await asyncio.sleep(0.01)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await queue.aclose()
+
+    asyncio.run(exercise())
+
+    assert sorted(consumed) == ["one", "two"]
+    assert "Lost claim" not in caplog.text
@@ -0,0 +1,208 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from django_queue import heartbeat
+from django_queue.backends import MemoryAsyncQueue
+from django_queue.entries import QueueEntryStatus
+from django_queue.process_handlers import ProcessHandler
+from django_queue.worker import AsyncQueueWorker
+from tests.helpers import CustomQueueEntry
+
+
+def report_process(entry):
+    return {"pid": os.getpid(), "payload": entry.payload}
+
+
+def report_entry_class(entry):
+    return {"class": type(entry).__name__, "kind": entry.kind}
+
+
+def sleep_forever(entry):
+    time.sleep(60)
+
+
+def sleep_with_heartbeats(entry):
+    for _ in range(6):
+        time.sleep(0.1)
+        heartbeat()
+    return "done"
+
+
+def stall_or_heartbeat(entry):
+    if entry.payload == "stall":
+        time.sleep(60)
+    return sleep_with_heartbeats(entry)
+
+
+def fail(entry):
+    raise ValueError("handler failed")
+
+
+_parent_lock = threading.Lock()
+
+
+def acquire_parent_lock(entry):
+    # A child forked while the parent held this lock would inherit it held.
+    if not _parent_lock.acquire(timeout=2):
+        return "deadlocked"
+    _parent_lock.release()
+    return "acquired"
+
+
+async def _run_until_terminal(queue, handler, entry_id, **worker_options):
+    worker = AsyncQueueWorker(
+        {"requests": queue}, {"requests": handler}, **worker_options
+    )
+    task = asyncio.create_task(worker.run())
+    try:
+        async with asyncio.timeout(10):
+            while True:
+                entry = await queue.afind(entry_id)
+                if entry.status not in {
+                    QueueEntryStatus.QUEUED,
+                    QueueEntryStatus.RUNNING,
+                }:
+                    return entry
+                await asyncio.sleep(0.01)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        handler.close()
+
+
+def test_runs_a_synchronous_handler_in_another_process():
+    async def exercise():
+        queue = MemoryAsyncQueue(queue_name="requests")
+        entry_id = await queue.aenqueue({"image": 1})
+        handler = ProcessHandler("tests.test_process_handlers.report_process")
+
+        entry = await _run_until_terminal(queue, handler, entry_id)
+
+        assert entry.status is QueueEntryStatus.SUCCEEDED
+        assert entry.result["payload"] == {"image": 1}
+        assert entry.result["pid"] != os.getpid()
+
+    asyncio.run(exercise())
+
+
+def test_rebuilds_the_entry_with_its_own_class():
+    async def exercise():
+        queue = MemoryAsyncQueue(queue_name="requests", entry_class=CustomQueueEntry)
+        entry_id = await queue.aenqueue("work")
+        handler = ProcessHandler("tests.test_process_handlers.report_entry_class")
+
+        entry = await _run_until_terminal(queue, handler, entry_id)
+
+        assert entry.result == {"class": "CustomQueueEntry", "kind": "task"}
+
+    asyncio.run(exercise())
+
+
+def test_records_a_handler_process_failure():
+    async def exercise():
+        queue = MemoryAsyncQueue(queue_name="requests")
+        entry_id = await queue.aenqueue("work")
+        handler = ProcessHandler("tests.test_process_handlers.fail")
+
+        entry = await _run_until_terminal(queue, handler, entry_id)
+
+        assert entry.status is QueueEntryStatus.FAILED
+        assert "handler failed" in entry.error["message"]
+
+    asyncio.run(exercise())
+
+
+def test_kills_a_handler_process_that_exceeds_its_budget():
+    async def exercise():
+        queue = MemoryAsyncQueue(queue_name="requests")
+        entry_id = await queue.aenqueue("work")
+        handler = ProcessHandler("tests.test_process_handlers.sleep_forever")
+        started = time.monotonic()
+
+        entry = await _run_until_terminal(queue, handler, entry_id, timeout_seconds=0.2)
+
+        assert entry.status is QueueEntryStatus.TIMEOUT
+        assert time.monotonic() - started < 5
+        assert handler._idle == []
+
+    asyncio.run(exercise())
+
+
+def test_heartbeats_in_the_handler_process_restart_the_budget():
+    async def exercise():
+        queue = MemoryAsyncQueue(queue_name="requests")
+        entry_id = await queue.aenqueue("work")
+        handler = ProcessHandler("tests.test_process_handlers.sleep_with_heartbeats")
+
+        entry = await _run_until_terminal(
+            queue, handler, entry_id, timeout_seconds=0.35
+        )
+
+        assert entry.status is QueueEntryStatus.SUCCEEDED
+        assert entry.result == "done"
+
+    asyncio.run(exercise())
+
+
+def test_heartbeats_reach_the_worker_after_a_timed_out_call(caplog):
+    async def exercise():
+        queue = MemoryAsyncQueue(queue_name="requests")
+        stalled_id, entry_id = await queue.aenqueue_many(["stall", "work"])
+        handler = ProcessHandler("tests.test_process_handlers.stall_or_heartbeat")
+
+        entry = await _run_until_terminal(
+            queue, handler, entry_id, timeout_seconds=0.35
+        )
+
+        assert (await queue.afind(stalled_id)).status is QueueEntryStatus.TIMEOUT
+        assert entry.status is QueueEntryStatus.SUCCEEDED
+        assert entry.result == "done"
+
+    asyncio.run(exercise())
+
+    assert "failed after cancellation" not in caplog.text
+
+
+def test_reuses_an_idle_handler_process():
+    async def exercise():
+        queue = MemoryAsyncQueue(queue_name="requests")
+        handler = ProcessHandler("tests.test_process_handlers.report_process")
+        first = await handler(await queue.afind(await queue.aenqueue("first")))
+        second = await handler(await queue.afind(await queue.aenqueue("second")))
+        handler.close()
+
+        assert first["pid"] == second["pid"]
+
+    asyncio.run(exercise())
+
+
+def test_close_shuts_down_idle_processes():
+    async def exercise():
+        queue = MemoryAsyncQueue(queue_name="requests")
+        handler = ProcessHandler("tests.test_process_handlers.fail")
+        with pytest.raises(ValueError, match="handler failed"):
+            await handler(await queue.afind(await queue.aenqueue("work")))
+
+        handler.close()
+
+        assert handler._idle == []
+
+    asyncio.run(exercise())
+
+
+def test_handler_processes_are_not_forked_from_the_worker():
+    async def exercise():
+        queue = MemoryAsyncQueue(queue_name="requests")
+        handler = ProcessHandler("tests.test_process_handlers.acquire_parent_lock")
+        entry = await queue.afind(await queue.aenqueue("work"))
+        with _parent_lock:
+            try:
+                return await handler(entry)
+            finally:
+                handler.close()
+
+    assert asyncio.run(exercise()) == "acquired"
@@ -1,19 +1,28 @@
 import asyncio
 import json
+import time
 from typing import runtime_checkable
 from uuid import uuid4
 
 import pytest
+from redis.asyncio.cluster import RedisCluster
+from redis.crc import key_slot
 
 import django_queue
 from django_queue import QueueProvider
 from django_queue.backends.exceptions import (
+    InvalidQueueBackendError,
     QueueClaimConflictError,
     QueueEmptyException,
+    QueueEntryNotFoundError,
 )
 from django_queue.backends.memory.provider import QueueProviderMemory
+from django_queue.backends.redis.connections import connection_pools
 from django_queue.backends.redis.provider import QueueProviderRedis
+from django_queue.backends.redis.streamprovider import QueueProviderRedisStream
+from django_queue.clock import ClockTime
 from django_queue.entries import QueueEntry
+from tests.helpers import FIXED_CLOCK_TIME, FixedClock
 
 
 def test_providers_implement_the_minimal_public_provider_contract():
@@ -54,6 +63,279 @@ def test_redis_provider_claims_and_removes_an_owned_entry(redis_client):
     asyncio.run(exercise())
 
 
+def test_redis_providers_share_one_pool_per_url_and_pool_options(redis_client):
+    async def exercise():
+        baseline = connection_pools.pool_count()
+        first, second = (
+            QueueProviderRedis(
+                redis_client,
+                queue_name=f"provider-pool-{uuid4().hex}",
+                entry_class=QueueEntry,
+                max_connections=4,
+            )
+            for _ in range(2)
+        )
+        bounded_differently = QueueProviderRedis(
+            redis_client,
+            queue_name=f"provider-pool-{uuid4().hex}",
+            entry_class=QueueEntry,
+            max_connections=8,
+        )
+        client = first._async_redis()
+        assert second._async_redis() is client
+        assert bounded_differently._async_redis() is not client
+        assert client.connection_pool.max_connections == 4
+        assert await first.clock.anow()
+        assert connection_pools.pool_count() == baseline + 2
+
+        await first.aclose()
+        assert await client.ping()
+        await second.aclose()
+        await bounded_differently.aclose()
+        assert connection_pools.pool_count() == baseline
+
+    asyncio.run(exercise())
+
+
+def test_blocking_waits_do_not_take_a_bounded_pool_s_connections(redis_client):
+    async def exercise():
+        provider = QueueProviderRedis(
+            redis_client,
+            queue_name=f"provider-blocking-{uuid4().hex}",
+            entry_class=QueueEntry,
+            max_connections=1,
+            pool_timeout=0.5,
+        )
+        waits = [asyncio.create_task(provider.await_pending(5)) for _ in range(3)]
+        observer = asyncio.create_task(provider.aobserve(lambda entry: None))
+        try:
+            await asyncio.sleep(0.1)
+            async with asyncio.timeout(1):
+                await provider.astore(QueueEntry.create(queue="events", payload=None))
+                await provider.alist_after(None, 10)
+            assert provider._async_blocking_redis() is not provider._async_redis()
+        finally:
+            for task in (*waits, observer):
+                task.cancel()
+            await asyncio.gather(*waits, observer, return_exceptions=True)
+            await provider.aclear_records()
+            await provider.aclose()
+
+    asyncio.run(exercise())
+
+
+def test_redis_provider_calibrates_its_clock_from_a_claim(redis_client):
+    async def exercise():
+        provider = QueueProviderRedis(
+            redis_client,
+            queue_name=f"provider-claim-time-{uuid4().hex}",
+            entry_class=QueueEntry,
+        )
+        try:
+            entry = QueueEntry.create(queue="events", payload=None)
+            await provider.astore_and_push(entry)
+
+            await provider.aclaim(uuid4())
+
+            # The claim's own TIME calibrated the loop's clock, so it now
+            # answers synchronously without having read Redis time itself.
+            assert abs(provider.clock.now() - ClockTime.from_timestamp(time.time())) < 5
+        finally:
+            await provider.aclose()
+
+    asyncio.run(exercise())
+
+
+@pytest.mark.parametrize(
+    ("option", "value"),
+    [
+        ("max_connections", 0),
+        ("max_connections", True),
+        ("health_check_interval", -1),
+        ("pool_timeout", float("inf")),
+        ("socket_keepalive", "yes"),
+        ("cluster", 1),
+    ],
+)
+def test_redis_provider_rejects_invalid_pool_options(option, value):
+    with pytest.raises(InvalidQueueBackendError, match=option):
+        QueueProviderRedis(
+            "redis://localhost:6379/0", entry_class=QueueEntry, **{option: value}
+        )
+
+
+@pytest.mark.parametrize(
+    ("option", "value"),
+    [
+        ("publish_batch_size", 0),
+        ("publish_buffer_size", True),
+        ("publish_interval", -1),
+    ],
+)
+def test_redis_provider_rejects_invalid_publish_options(option, value):
+    with pytest.raises(InvalidQueueBackendError, match=option):
+        QueueProviderRedis(
+            "redis://localhost:6379/0", entry_class=QueueEntry, **{option: value}
+        )
+
+
+async def _observing(provider, snapshots):
+    observer = asyncio.create_task(provider.aobserve(snapshots.append))
+    await asyncio.sleep(0.1)
+    return observer
+
+
+async def _until(predicate):
+    async with asyncio.timeout(5):
+        while not predicate():
+            await asyncio.sleep(0.005)
+
+
+def test_redis_provider_publishes_snapshots_in_pipelined_batches(redis_client):
+    async def exercise():
+        provider = QueueProviderRedis(
+            redis_client,
+            queue_name=f"provider-publish-{uuid4().hex}",
+            entry_class=QueueEntry,
+            publish_batch_size=3,
+        )
+        snapshots = []
+        observer = await _observing(provider, snapshots)
+        client = provider._async_redis()
+        pipelines = []
+        pipeline = client.pipeline
+
+        def counting_pipeline(**kwargs):
+            pipelines.append(kwargs)
+            return pipeline(**kwargs)
+
+        client.pipeline = counting_pipeline
+        entries = [QueueEntry.create(queue="events", payload=n) for n in range(7)]
+        try:
+            await provider.apublish_many(entries[:5])
+            for entry in entries[5:]:
+                await provider.apublish(entry)
+            await _until(lambda: len(snapshots) == 7)
+            assert snapshots == entries
+            assert len(pipelines) == 3
+        finally:
+            observer.cancel()
+            del client.pipeline
+            await provider.aclose()
+
+    asyncio.run(exercise())
+
+
+def test_redis_provider_drops_snapshots_past_its_publish_buffer(redis_client, caplog):
+    async def exercise():
+        provider = QueueProviderRedis(
+            redis_client,
+            queue_name=f"provider-publish-{uuid4().hex}",
+            entry_class=QueueEntry,
+            publish_buffer_size=2,
+        )
+        snapshots = []
+        observer = await _observing(provider, snapshots)
+        entries = [QueueEntry.create(queue="events", payload=n) for n in range(5)]
+        try:
+            await provider.apublish_many(entries)
+            await provider._aflush_snapshots()
+            await _until(lambda: len(snapshots) == 2)
+            await asyncio.sleep(0.05)
+            assert snapshots == entries[:2]
+        finally:
+            observer.cancel()
+            await provider.aclose()
+
+    asyncio.run(exercise())
+
+    assert "Dropped 3 queue lifecycle snapshots" in caplog.text
+
+
+def test_redis_provider_flushes_buffered_snapshots_before_a_claim_starts(
+    redis_client,
+):
+    async def exercise():
+        provider = QueueProviderRedis(
+            redis_client,
+            queue_name=f"provider-publish-{uuid4().hex}",
+            entry_class=QueueEntry,
+            publish_interval=60,
+        )
+        snapshots = []
+        observer = await _observing(provider, snapshots)
+        entry = QueueEntry.create(queue="events", payload=None)
+        try:
+            await provider.astore_and_push(entry)
+            await provider.apublish(entry)
+            running = await provider.aclaim_and_start(
+                uuid4(),
+                budget_seconds=None,
+                default_budget_seconds=30,
+                grace_seconds=1,
+                published_through=entry.id,
+            )
+            await _until(lambda: len(snapshots) == 2)
+            assert snapshots == [entry, running]
+        finally:
+            observer.cancel()
+            await provider.aclose()
+
+    asyncio.run(exercise())
+
+
+def test_redis_cluster_provider_keeps_every_queue_key_in_one_slot():
+    provider = QueueProviderRedisStream(
+        "redis://localhost:7000",
+        queue_name="orders",
+        entry_class=QueueEntry,
+        cluster=True,
+    )
+    entry_id = uuid4()
+    keys = [
+        provider._entry_pending_name,
+        provider._entry_pending_priority_name,
+        provider._entry_scheduled_name,
+        provider._entry_index_name,
+        provider._entry_finished_name,
+        provider._entry_wake_name,
+        provider._entry_claim_deadlines_name,
+        provider._stream_name,
+        provider._entry_key(entry_id),
+    ]
+
+    assert provider._entry_pending_name == "{orders}:entries:pending"
+    assert {key_slot(key.encode()) for key in keys} | {
+        key_slot(provider._claim_key(entry_id))
+    } == {key_slot(b"orders")}
+    assert (
+        QueueProviderRedis(
+            "redis://localhost:6379/0", queue_name="orders", entry_class=QueueEntry
+        )._entry_pending_name
+        == "orders:entries:pending"
+    )
+
+
+def test_redis_cluster_provider_uses_a_cluster_client():
+    async def exercise():
+        provider = QueueProviderRedis(
+            "redis://localhost:7000", entry_class=QueueEntry, cluster=True
+        )
+        try:
+            assert isinstance(provider._async_redis(), RedisCluster)
+        finally:
+            await provider.aclose()
+
+    asyncio.run(exercise())
+
+
+def test_redis_cluster_provider_rejects_a_database_number():
+    with pytest.raises(InvalidQueueBackendError, match="database"):
+        QueueProviderRedis(
+            "redis://localhost:7000/3", entry_class=QueueEntry, cluster=True
+        )
+
+
 def test_redis_provider_recovers_an_expired_priority_claim_to_the_priority_store(
     redis_client,
 ):
@@ -151,6 +433,156 @@ def test_memory_provider_does_not_replace_an_active_claim_with_a_duplicate_id():
     asyncio.run(exercise())
 
 
+def test_memory_provider_promotes_scheduled_entries_in_availability_order():
+    clock = FixedClock()
+
+    async def exercise():
+        provider = QueueProviderMemory(clock=clock)
+        entries = [
+            QueueEntry.create(queue="tasks", payload=index) for index in range(4)
+        ]
+        for entry, offset in zip(entries, (30, 10, 20, 10), strict=True):
+            await provider.astore(entry)
+            await provider.aschedule(entry.id, FIXED_CLOCK_TIME + offset)
+        # Rescheduling replaces the earlier deadline rather than adding one.
+        await provider.aschedule(entries[2].id, FIXED_CLOCK_TIME + 40)
+        clock.timestamp = FIXED_CLOCK_TIME + 40
+        claimed = []
+        while True:
+            try:
+                claimed.append((await provider.aclaim(uuid4())).payload)
+            except QueueEmptyException:
+                return claimed
+
+    assert asyncio.run(exercise()) == [1, 3, 0, 2]
+
+
+def test_memory_provider_recovers_only_claims_whose_lease_has_expired():
+    clock = FixedClock()
+
+    async def exercise():
+        provider = QueueProviderMemory(clock=clock)
+        short, long = (
+            QueueEntry.create(queue="tasks", payload=payload)
+            for payload in ("short", "long")
+        )
+        for entry in (short, long):
+            await provider.astore(entry)
+            await provider.apush(entry.id)
+        first_worker = uuid4()
+        await provider.aclaim(first_worker, lease_seconds=10)
+        await provider.aclaim(first_worker, lease_seconds=60)
+        assert await provider.arenew(short.id, first_worker, 5)
+        clock.timestamp = FIXED_CLOCK_TIME + 30
+        recovered = await provider.aclaim(uuid4())
+        with pytest.raises(QueueEmptyException):
+            await provider.aclaim(uuid4())
+        return recovered.id, short.id
+
+    recovered_id, short_id = asyncio.run(exercise())
+
+    assert recovered_id == short_id
+
+
+def test_memory_provider_expires_only_unclaimed_events_past_their_lifetime():
+    clock = FixedClock()
+
+    async def exercise():
+        provider = QueueProviderMemory(clock=clock)
+        events = [
+            QueueEntry.create(
+                queue="events",
+                payload=index,
+                queued_at=FIXED_CLOCK_TIME,
+                timeout_seconds=lifetime,
+            )
+            for index, lifetime in enumerate((10, 20, 60))
+        ]
+        for event in events:
+            await provider.astore_event(event)
+            await provider.apush(event.id)
+        await provider.aclaim(uuid4(), lease_seconds=120)
+        clock.timestamp = FIXED_CLOCK_TIME + 30
+        expired = await provider.aexpire_due()
+        remaining = {entry.id for entry in await provider.alist()}
+        return events, expired, remaining
+
+    events, expired, remaining = asyncio.run(exercise())
+
+    # The first event is claimed, so only the unclaimed second one expires.
+    assert expired == [events[1].id]
+    assert remaining == {events[0].id, events[2].id}
+
+
+@pytest.mark.parametrize("stack", [False, True], ids=["fifo", "stack"])
+def test_memory_provider_removal_keeps_the_remaining_delivery_order(stack):
+    async def exercise():
+        provider = QueueProviderMemory(stack=stack)
+        entries = [
+            QueueEntry.create(queue="tasks", payload=index) for index in range(4)
+        ]
+        for entry in entries:
+            await provider.astore(entry)
+            await provider.apush(entry.id)
+        await provider.adiscard(entries[1].id)
+        await provider.adiscard(uuid4())
+        popped = []
+        while True:
+            try:
+                popped.append((await provider.apop()).payload)
+            except QueueEmptyException:
+                return popped
+
+    assert asyncio.run(exercise()) == ([3, 2, 0] if stack else [0, 2, 3])
+
+
+def test_memory_provider_priority_removal_spares_a_later_push_of_the_same_id():
+    async def exercise():
+        provider = QueueProviderMemory()
+        entries = [
+            QueueEntry.create(queue="tasks", payload=index) for index in range(3)
+        ]
+        for entry in entries:
+            await provider.astore(entry)
+            await provider.apush_priority(entry.id, 5)
+        await provider.adiscard_priority(entries[0].id)
+        await provider.apush_priority(entries[0].id, 1)
+        popped = []
+        while True:
+            try:
+                popped.append((await provider.apop_priority()).payload)
+            except QueueEmptyException:
+                return popped
+
+    assert asyncio.run(exercise()) == [1, 2, 0]
+
+
+def test_memory_stack_files_a_not_yet_due_entry_beneath_newer_work():
+    clock = FixedClock()
+
+    async def exercise():
+        provider = QueueProviderMemory(clock=clock, stack=True)
+        released, newer = (
+            QueueEntry.create(queue="tasks", payload=payload)
+            for payload in ("released", "newer")
+        )
+        await provider.astore(released)
+        await provider.apush(released.id)
+        worker_id = uuid4()
+        await provider.aclaim(worker_id)
+        assert await provider.arelease(released.id, worker_id, 10)
+        await provider.astore(newer)
+        await provider.apush(newer.id)
+        claimed = [(await provider.aclaim(uuid4())).payload]
+        with pytest.raises(QueueEmptyException):
+            await provider.aclaim(uuid4())
+        clock.timestamp = FIXED_CLOCK_TIME + 10
+        claimed.append((await provider.aclaim(uuid4())).payload)
+        return claimed
+
+    assert asyncio.run(exercise()) == ["newer", "released"]
+
+
 def test_redis_provider_priority_claim_conflict_reinserts_at_the_original_score(
     redis_client,
 ):
@@ -381,3 +813,125 @@ def test_redis_provider_astore_event_and_push_makes_the_event_findable_and_claim
     found, claimed, unclaimed_deadline = asyncio.run(exercise())
     assert found.id == claimed.id
     assert unclaimed_deadline is not None
+
+
+@pytest.fixture(params=["memory", "redis"])
+def claim_provider(request):
+    def make(*, stack=False):
+        if request.param == "memory":
+            return QueueProviderMemory(stack=stack)
+        return QueueProviderRedis(
+            request.getfixturevalue("redis_client"),
+            queue_name=f"claim-many-{uuid4().hex}",
+            stack=stack,
+            entry_class=QueueEntry,
+        )
+
+    return make
+
+
+@pytest.mark.parametrize("stack", [False, True], ids=["fifo", "stack"])
+def test_providers_claim_many_in_delivery_order(claim_provider, stack):
+    async def exercise():
+        provider = claim_provider(stack=stack)
+        try:
+            entries = [
+                QueueEntry.create(queue="tasks", payload=index) for index in range(3)
+            ]
+            for entry in entries:
+                await provider.astore(entry)
+                await provider.apush(entry.id)
+            worker_id = uuid4()
+            first = await provider.aclaim_many(worker_id, 60, 2)
+            rest = await provider.aclaim_many(worker_id, 60, 5)
+            empty = await provider.aclaim_many(worker_id, 60, 5)
+            return (
+                entries,
+                first,
+                rest,
+                empty,
+                await provider.aremove(first[0].id, worker_id),
+            )
+        finally:
+            await provider.aclose()
+
+    entries, first, rest, empty, owned = asyncio.run(exercise())
+
+    expected = entries[::-1] if stack else entries
+    assert [entry.id for entry in first + rest] == [entry.id for entry in expected]
+    assert (len(first), empty, owned) == (2, [], True)
+
+
+def test_providers_claim_many_by_priority_then_arrival(claim_provider):
+    async def exercise():
+        provider = claim_provider()
+        try:
+            entries = [
+                QueueEntry.create(queue="tasks", payload=index, priority=priority)
+                for index, priority in enumerate((1, 5, 3, 5))
+            ]
+            for entry in entries:
+                await provider.astore(entry)
+                await provider.apush_priority(entry.id, entry.priority)
+            return await provider.aclaim_many_priority(uuid4(), 60, 10)
+        finally:
+            await provider.aclose()
+
+    assert [entry.payload for entry in asyncio.run(exercise())] == [1, 3, 2, 0]
+
+
+def test_providers_claim_many_unexpired_skips_expired_events(claim_provider):
+    async def exercise():
+        provider = claim_provider()
+        try:
+            expired = QueueEntry.create(
+                queue="events", payload="expired", timeout_seconds=0.001
+            )
+            live = QueueEntry.create(queue="events", payload="live", timeout_seconds=60)
+            for entry in (expired, live):
+                await provider.astore_event(entry)
+                await provider.apush(entry.id)
+            await asyncio.sleep(0.01)
+            claimed = await provider.aclaim_many_unexpired(uuid4(), 60, 10)
+            with pytest.raises(QueueEntryNotFoundError):
+                await provider.afind(expired.id)
+            return claimed
+        finally:
+            await provider.aclose()
+
+    assert [entry.payload for entry in asyncio.run(exercise())] == ["live"]
+
+
+def test_providers_claim_many_stops_at_a_claim_conflict(claim_provider):
+    async def exercise():
+        provider = claim_provider()
+        try:
+            first = QueueEntry.create(queue="tasks", payload="first")
+            second = QueueEntry.create(queue="tasks", payload="second")
+            for entry in (first, second):
+                await provider.astore(entry)
+                await provider.apush(entry.id)
+            owner = uuid4()
+            assert [entry.id for entry in await provider.aclaim_many(owner, 60, 1)] == [
+                first.id
+            ]
+            # A duplicate pending ID for the entry `owner` still holds.
+            await provider.apush(first.id)
+            return await provider.aclaim_many(uuid4(), 60, 10)
+        finally:
+            await provider.aclose()
+
+    assert [entry.payload for entry in asyncio.run(exercise())] == ["second"]
+
+
+@pytest.mark.parametrize("limit", [0, -1, 1.5, True])
+def test_providers_reject_an_invalid_claim_batch_size(claim_provider, limit):
+    async def exercise():
+        provider = claim_provider()
+        try:
+            with pytest.raises(ValueError, match="batch size"):
+                await provider.aclaim_many(uuid4(), 60, limit)
+        finally:
+            await provider.aclose()
+
+    asyncio.run(exercise())
@@ -1,4 +1,5 @@
 import asyncio
+import threading
 import time
 from typing import ClassVar
 from uuid import UUID
@@ -415,3 +416,63 @@ def test_event_queue_rejects_a_task_worker_class():
 
     with pytest.raises(InvalidQueueBackendError, match="EventQueueWorker"):
         configured["events"]
+
+
+def test_runtime_runs_a_thread_executor_alias_on_its_own_loop(
+    monkeypatch, no_runtime_startup
+):
+    configured = django_queue.QueueRegistry(
+        {
+            "isolated": {
+                "BACKEND": "django_queue.backends.MemoryEventQueue",
+                "LOCATION": "",
+                "LISTENER_EXECUTOR": "thread",
+            },
+            "shared": {
+                "BACKEND": "django_queue.backends.MemoryEventQueue",
+                "LOCATION": "",
+            },
+        }
+    )
+    threads = {}
+
+    async def receive(entry):
+        threads[entry.queue] = threading.current_thread().name
+        if entry.queue == "isolated":
+            time.sleep(0.3)  # noqa: ASYNC251 - deliberately blocks the loop
+        return True
+
+    monkeypatch.setattr(
+        "django_queue.event_worker.listeners_for",
+        lambda alias: (ListenerRegistration(receive),),
+    )
+    runtime = QueueRuntime()
+    try:
+        runtime.start_thread()
+        runtime.start(configured)
+        configured["isolated"].enqueue("slow")
+        time.sleep(0.05)
+        started = time.monotonic()
+        configured["shared"].enqueue("fast")
+        deadline = time.monotonic() + 1
+        while "shared" not in threads and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert time.monotonic() - started < 0.2
+        deadline = time.monotonic() + 1
+        while len(threads) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert threads == {
+            "isolated": "django-queues-listeners-isolated",
+            "shared": "django-queues-runtime",
+        }
+        stats = runtime.listener_stats()
+        assert stats["isolated"].executor == "thread"
+        assert stats["shared"].executor == "loop"
+    finally:
+        runtime.shutdown()
+
+    assert not [
+        thread
+        for thread in threading.enumerate()
+        if thread.name == "django-queues-listeners-isolated"
+    ]
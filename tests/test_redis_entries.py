@@ -1,4 +1,5 @@
 import asyncio
+import json
 import threading
 import time
 from uuid import uuid4
@@ -16,6 +17,8 @@ from django_queue.backends.redis import (
     RedisAsyncQueue,
     RedisAsyncQueueWorker,
 )
+from django_queue.clock import MICROSECONDS_PER_SECOND
+from django_queue.codecs import CompactEntryCodec, HashEntryCodec, JsonEntryCodec
 from django_queue.entries import QueueEntryStatus
 from django_queue.observers import _discard_observers_for
 from django_queue.queue_runtime import queue_runtime
@@ -100,6 +103,369 @@ def test_list_returns_retained_entry_snapshots(redis_client):
     }
 
 
+def test_list_after_pages_the_entry_index_from_a_cursor(redis_entry_queue):
+    async def exercise():
+        try:
+            entry_ids = [
+                await redis_entry_queue.aenqueue(payload)
+                for payload in ("first", "second", "third")
+            ]
+            first_page = await redis_entry_queue._alist_after(None, 2)
+            second_page = await redis_entry_queue._alist_after(first_page[-1].id, 2)
+            await redis_entry_queue._provider.adelete(entry_ids[1])
+            after_delete = await redis_entry_queue._alist_after(None, 10)
+            return entry_ids, first_page, second_page, after_delete
+        finally:
+            await redis_entry_queue.aclose()
+
+    entry_ids, first_page, second_page, after_delete = asyncio.run(exercise())
+
+    assert [entry.id for entry in first_page] == entry_ids[:2]
+    assert [entry.id for entry in second_page] == entry_ids[2:]
+    assert [entry.id for entry in after_delete] == [entry_ids[0], entry_ids[2]]
+
+
+def test_list_after_drops_an_index_member_whose_record_is_gone(redis_entry_queue):
+    async def exercise():
+        try:
+            entry_id = await redis_entry_queue.aenqueue("work")
+            provider = redis_entry_queue._provider
+            client = provider._async_redis()
+            await client.delete(provider._entry_key(entry_id))
+            entries = await redis_entry_queue._alist_after(None, 10)
+            return entries, await client.zcard(provider._entry_index_name)
+        finally:
+            await redis_entry_queue.aclose()
+
+    assert asyncio.run(exercise()) == ([], 0)
+
+
+@pytest.mark.parametrize(
+    "entry_codec", [JsonEntryCodec(), CompactEntryCodec(), HashEntryCodec()]
+)
+def test_list_reads_the_status_indexes(redis_client, entry_codec):
+    queue = RedisAsyncQueue(
+        redis_client, queue_name=f"entries-{uuid4().hex}", entry_codec=entry_codec
+    )
+
+    async def ids(**kwargs):
+        return [entry.id for entry in await queue.alist(**kwargs)]
+
+    async def exercise():
+        try:
+            entry_ids = await queue.aenqueue_many(range(5), timeout_seconds=30)
+            claimed = await queue.aclaim_and_start(
+                uuid4(),
+                budget_seconds=None,
+                default_budget_seconds=600,
+                grace_seconds=5,
+                published_through=None,
+            )
+            for entry_id in entry_ids[1:3]:
+                await queue._amark_running(entry_id)
+                await queue._amark_failed(entry_id, RuntimeError("boom"))
+            await queue.aprune(entry_ids[2])
+            return (
+                entry_ids,
+                claimed.id,
+                [
+                    await ids(status="queued"),
+                    await ids(status=QueueEntryStatus.RUNNING),
+                    await ids(status="failed"),
+                    await ids(status=["queued", "running"], limit=2),
+                    await ids(status="queued", after=entry_ids[3]),
+                    await ids(status="queued", newest_first=True, limit=1),
+                    await ids(after=entry_ids[4], newest_first=True, limit=2),
+                ],
+            )
+        finally:
+            await queue._provider.aclear_records()
+            await queue.aclose()
+
+    entry_ids, claimed_id, listings = asyncio.run(exercise())
+
+    assert claimed_id == entry_ids[0]
+    assert listings == [
+        entry_ids[3:],
+        [entry_ids[0]],
+        [entry_ids[1]],
+        [entry_ids[0], entry_ids[3]],
+        [entry_ids[4]],
+        [entry_ids[4]],
+        [entry_ids[3], entry_ids[1]],
+    ]
+
+
+def test_migration_indexes_unindexed_entries(redis_entry_queue):
+    provider = redis_entry_queue._provider
+
+    async def exercise():
+        try:
+            entry_ids = await redis_entry_queue.aenqueue_many(range(3))
+            await redis_entry_queue._amark_running(entry_ids[1])
+            client = provider._async_redis()
+            # As stored before the series of indexes: in none of them.
+            await client.delete(
+                provider._entry_index_name,
+                *(provider._entry_status_index_name(s) for s in QueueEntryStatus),
+            )
+            before = await redis_entry_queue.alist(status="queued")
+            migrated = await redis_entry_queue.amigrate_entries(batch_size=2)
+            return (
+                entry_ids,
+                before,
+                migrated,
+                [
+                    [e.id for e in await redis_entry_queue.alist(status=status)]
+                    for status in ("queued", "running")
+                ],
+                [e.id for e in await redis_entry_queue.alist(limit=10)],
+            )
+        finally:
+            await provider.aclear_records()
+            await redis_entry_queue.aclose()
+
+    entry_ids, before, migrated, listings, page = asyncio.run(exercise())
+
+    assert (before, migrated) == ([], 0)
+    assert listings == [[entry_ids[0], entry_ids[2]], [entry_ids[1]]]
+    assert page == entry_ids
+
+
+def test_expired_pruning_reads_the_finished_at_index(redis_entry_queue):
+    redis_entry_queue.retention_timeout = 0
+    redis_entry_queue.retention_batch_size = 2
+    provider = redis_entry_queue._provider
+    published = []
+    publish_many = provider.apublish_many
+
+    async def record(entries):
+        published.append([entry.status for entry in entries])
+        await publish_many(entries)
+
+    provider.apublish_many = record
+
+    async def exercise():
+        try:
+            for payload in ("first", "second"):
+                entry_id = await redis_entry_queue.aenqueue(payload)
+                await redis_entry_queue._amark_failed(entry_id, ValueError(payload))
+            entry_id = await redis_entry_queue.aenqueue("third")
+            await redis_entry_queue._amark_running(entry_id)
+            await redis_entry_queue._amark_succeeded(entry_id, "done")
+            queued_id = await redis_entry_queue.aenqueue("queued")
+            client = provider._async_redis()
+            indexed = await client.zcard(provider._entry_finished_name)
+            pruned = await redis_entry_queue._aprune_expired()
+            remaining = await redis_entry_queue.alist()
+            return (
+                queued_id,
+                indexed,
+                pruned,
+                remaining,
+                await client.zcard(provider._entry_finished_name),
+                await client.zrange(provider._entry_index_name, 0, -1),
+            )
+        finally:
+            await redis_entry_queue.aclose()
+
+    queued_id, indexed, pruned, remaining, finished, index = asyncio.run(exercise())
+
+    assert (indexed, pruned, finished) == (3, 3, 0)
+    assert [entry.id for entry in remaining] == [queued_id]
+    assert index == [str(queued_id).encode()]
+    assert published == [
+        [QueueEntryStatus.TERMINATED] * 2,
+        [QueueEntryStatus.TERMINATED],
+    ]
+
+
+def test_expired_pruning_reads_past_stale_finished_at_ids(redis_entry_queue):
+    redis_entry_queue.retention_timeout = 0
+    redis_entry_queue.retention_batch_size = 2
+    provider = redis_entry_queue._provider
+
+    async def exercise():
+        try:
+            entry_id = await redis_entry_queue.aenqueue("failed")
+            await redis_entry_queue._amark_failed(entry_id, ValueError("failed"))
+            client = provider._async_redis()
+            # Left behind by entries removed since, ahead of the expired one.
+            await client.zadd(
+                provider._entry_finished_name,
+                {str(uuid4()): 0 for _ in range(4)},
+            )
+            pruned = await redis_entry_queue._aprune_expired()
+            return (
+                pruned,
+                await redis_entry_queue.alist(),
+                await client.zcard(provider._entry_finished_name),
+            )
+        finally:
+            await provider.aclear_records()
+            await redis_entry_queue.aclose()
+
+    assert asyncio.run(exercise()) == (1, [], 0)
+
+
+def test_migration_lets_pruning_find_unindexed_terminal_entries(redis_entry_queue):
+    redis_entry_queue.retention_timeout = 0
+    provider = redis_entry_queue._provider
+
+    async def exercise():
+        try:
+            failed_id = await redis_entry_queue.aenqueue("failed")
+            await redis_entry_queue._amark_failed(failed_id, ValueError("failed"))
+            queued_id = await redis_entry_queue.aenqueue("queued")
+            client = provider._async_redis()
+            # As stored before the finished-at index existed.
+            await client.delete(provider._entry_finished_name)
+            before = await redis_entry_queue._aprune_expired()
+            await redis_entry_queue.amigrate_entries()
+            pruned = await redis_entry_queue._aprune_expired()
+            return queued_id, before, pruned, await redis_entry_queue.alist()
+        finally:
+            await provider.aclear_records()
+            await redis_entry_queue.aclose()
+
+    queued_id, before, pruned, remaining = asyncio.run(exercise())
+
+    assert (before, pruned) == (0, 1)
+    assert [entry.id for entry in remaining] == [queued_id]
+
+
+def test_worker_settlement_indexes_the_finished_entry(redis_entry_queue):
+    async def exercise():
+        entry_id = await redis_entry_queue.aenqueue("work")
+
+        async def handle(entry):
+            return entry.payload
+
+        try:
+            await _run_until_terminal(redis_entry_queue, entry_id, handle)
+            provider = redis_entry_queue._provider
+            entry = await redis_entry_queue.afind(entry_id)
+            score = await provider._async_redis().zscore(
+                provider._entry_finished_name, str(entry_id)
+            )
+            return entry, score
+        finally:
+            await redis_entry_queue.aclose()
+
+    entry, score = asyncio.run(exercise())
+
+    assert score == (
+        entry.finished_at.seconds * MICROSECONDS_PER_SECOND
+        + entry.finished_at.microseconds
+    )
+
+
+def test_claim_and_start_runs_leases_and_publishes_in_one_call(redis_entry_queue):
+    payload = {"items": [], "nested": {"status": "queued"}, "big": 2**60}
+    provider = redis_entry_queue._provider
+
+    async def exercise():
+        try:
+            entry_id = await redis_entry_queue.aenqueue(payload, timeout_seconds=30)
+            client = provider._async_redis()
+            async with client.pubsub() as pubsub:
+                await pubsub.subscribe(provider.lifecycle_channel)
+                await pubsub.get_message(timeout=1)
+                entry = await redis_entry_queue.aclaim_and_start(
+                    uuid4(),
+                    budget_seconds=None,
+                    default_budget_seconds=600,
+                    grace_seconds=5,
+                    published_through=None,
+                )
+                published = [
+                    (await pubsub.get_message(timeout=1))["data"] for _ in range(2)
+                ]
+            claim = json.loads(await client.get(provider._claim_key(entry_id)))
+            return (
+                entry_id,
+                entry,
+                await redis_entry_queue.afind(entry_id),
+                published,
+                claim,
+            )
+        finally:
+            await redis_entry_queue.aclose()
+
+    entry_id, entry, stored, published, claim = asyncio.run(exercise())
+
+    assert entry.id == entry_id
+    assert entry.status is QueueEntryStatus.RUNNING
+    assert entry.dispatched_at is not None
+    assert entry.payload == payload
+    assert stored == entry
+    assert [json.loads(raw)["status"] for raw in published] == ["queued", "running"]
+    claimed_at = (
+        claim["claimed_at"]["seconds"] * MICROSECONDS_PER_SECOND
+        + claim["claimed_at"]["microseconds"]
+    )
+    assert claim["lease_deadline"] - claimed_at == pytest.approx(
+        35 * MICROSECONDS_PER_SECOND, abs=1000
+    )
+
+
+def test_claim_and_start_skips_the_queued_snapshot_a_scan_published(
+    redis_entry_queue,
+):
+    provider = redis_entry_queue._provider
+
+    async def exercise():
+        try:
+            entry_id = await redis_entry_queue.aenqueue("work")
+            client = provider._async_redis()
+            async with client.pubsub() as pubsub:
+                await pubsub.subscribe(provider.lifecycle_channel)
+                await pubsub.get_message(timeout=1)
+                await redis_entry_queue.aclaim_and_start(
+                    uuid4(),
+                    budget_seconds=10,
+                    default_budget_seconds=600,
+                    grace_seconds=0,
+                    published_through=entry_id,
+                )
+                first = await pubsub.get_message(timeout=1)
+                second = await pubsub.get_message(timeout=0.05)
+            return first, second
+        finally:
+            await redis_entry_queue.aclose()
+
+    first, second = asyncio.run(exercise())
+
+    assert json.loads(first["data"])["status"] == "running"
+    assert second is None
+
+
+def test_worker_starts_a_record_the_claim_script_cannot_splice(redis_entry_queue):
+    provider = redis_entry_queue._provider
+
+    async def exercise():
+        try:
+            entry_id = await redis_entry_queue.aenqueue("work")
+            client = provider._async_redis()
+            key = provider._entry_key(entry_id)
+            record = json.loads(await client.get(key))
+            await client.set(key, json.dumps(record, separators=(",", ":")))
+
+            async def handle(entry):
+                return entry.payload
+
+            await _run_until_terminal(redis_entry_queue, entry_id, handle)
+            return await redis_entry_queue.afind(entry_id)
+        finally:
+            await redis_entry_queue.aclose()
+
+    entry = asyncio.run(exercise())
+
+    assert entry.status is QueueEntryStatus.SUCCEEDED
+    assert entry.dispatched_at is not None
+    assert entry.result == "work"
+
+
 def test_direct_dequeue_is_atomic_and_fifo(redis_entry_queue):
     first_id = redis_entry_queue.enqueue("first")
     second_id = redis_entry_queue.enqueue("second")
@@ -311,6 +677,128 @@ def test_aenqueue_routes_through_the_atomic_store_and_push_path(redis_entry_queu
     assert redis_entry_queue.dequeue().id == entry_id
 
 
+def test_redis_enqueue_many_stores_each_chunk_in_one_script_call(
+    redis_entry_queue, monkeypatch
+):
+    provider = redis_entry_queue._provider
+    chunks = []
+    store_many = provider.astore_and_push_many
+
+    async def record(entries, **kwargs):
+        chunks.append(len(entries))
+        await store_many(entries, **kwargs)
+
+    async def _fail(*args, **kwargs):
+        raise AssertionError("a batch must not store entries one at a time")
+
+    monkeypatch.setattr(provider, "astore_and_push_many", record)
+    monkeypatch.setattr(provider, "astore_and_push", _fail)
+    monkeypatch.setattr(redis_entry_queue, "enqueue_batch_size", 2)
+
+    async def exercise():
+        entry_ids = await redis_entry_queue.aenqueue_many(["a", "b", "c"])
+        dequeued = [(await redis_entry_queue.adequeue()).id for _ in entry_ids]
+        listed = {entry.id for entry in await redis_entry_queue.alist()}
+        await redis_entry_queue.aclose()
+        return entry_ids, dequeued, listed
+
+    entry_ids, dequeued, listed = asyncio.run(exercise())
+
+    assert chunks == [2, 1]
+    assert dequeued == entry_ids
+    assert listed == set(entry_ids)
+
+
+def test_redis_enqueue_many_schedules_a_future_batch(redis_entry_queue):
+    async def exercise():
+        available_at = await redis_entry_queue.clock.anow() + 60
+        entry_ids = await redis_entry_queue.aenqueue_many(
+            ["a", "b"], available_at=available_at
+        )
+        with pytest.raises(QueueEmptyException):
+            await redis_entry_queue.aclaim(uuid4())
+        scores = await redis_entry_queue._provider._async_redis().zmscore(
+            redis_entry_queue._provider._entry_scheduled_name,
+            [str(entry_id) for entry_id in entry_ids],
+        )
+        await redis_entry_queue.aclose()
+        return scores, available_at
+
+    scores, available_at = asyncio.run(exercise())
+
+    assert (
+        scores
+        == [available_at.seconds * MICROSECONDS_PER_SECOND + available_at.microseconds]
+        * 2
+    )
+
+
+def test_redis_priority_enqueue_many_keeps_arrival_order_in_priority(redis_client):
+    queue = RedisAsyncPriorityQueue(redis_client, queue_name=f"priority-{uuid4().hex}")
+
+    async def exercise():
+        low_id = await queue.aenqueue("low", priority=1)
+        batch_ids = await queue.aenqueue_many(["a", "b", "c"], priority=5)
+        claimed = [(await queue.aclaim(uuid4())).id for _ in range(4)]
+        await queue.aclose()
+        return [*batch_ids, low_id], claimed
+
+    expected, claimed = asyncio.run(exercise())
+
+    assert claimed == expected
+
+
+def test_redis_priority_enqueue_many_rejects_an_out_of_range_priority(redis_client):
+    queue = RedisAsyncPriorityQueue(redis_client, queue_name=f"priority-{uuid4().hex}")
+
+    with pytest.raises(ValueError):
+        queue.enqueue_many(["a"], priority=2**60)
+
+    assert queue.list() == []
+
+
+def test_redis_enqueue_wakes_an_idle_waiter(redis_entry_queue):
+    async def exercise():
+        waiter = asyncio.create_task(redis_entry_queue._await_pending(30))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        await redis_entry_queue.aenqueue("work")
+        await asyncio.wait_for(waiter, timeout=1)
+        await redis_entry_queue.aclose()
+
+    asyncio.run(exercise())
+
+
+def test_redis_wait_ends_when_scheduled_work_falls_due(redis_entry_queue):
+    async def exercise():
+        entry_id = await redis_entry_queue.aenqueue(
+            "soon", available_at=await redis_entry_queue.clock.anow() + 0.2
+        )
+        # Drop the token the scheduling left, so only the due time can wake.
+        provider = redis_entry_queue._provider
+        await provider._async_redis().delete(provider._entry_wake_name)
+        await asyncio.wait_for(redis_entry_queue._await_pending(30), timeout=2)
+        claimed = await redis_entry_queue.aclaim(uuid4())
+        await redis_entry_queue.aclose()
+        return entry_id, claimed.id
+
+    entry_id, claimed_id = asyncio.run(exercise())
+
+    assert claimed_id == entry_id
+
+
+def test_redis_wake_tokens_are_bounded(redis_entry_queue):
+    async def exercise():
+        await redis_entry_queue.aenqueue_many(range(100))
+        await redis_entry_queue.aenqueue("one more")
+        provider = redis_entry_queue._provider
+        length = await provider._async_redis().llen(provider._entry_wake_name)
+        await redis_entry_queue.aclose()
+        return length
+
+    assert asyncio.run(exercise()) == 64
+
+
 def test_redis_queue_restores_the_configured_entry_class(redis_client):
     queue = RedisAsyncQueue(
         redis_client,
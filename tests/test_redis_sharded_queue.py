@@ -0,0 +1,145 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from django_queue.backends.exceptions import (
+    InvalidQueueBackendError,
+    QueueEmptyException,
+)
+from django_queue.backends.redis import (
+    RedisAsyncQueue,
+    RedisAsyncQueueWorker,
+    RedisShardedAsyncQueue,
+    RedisShardedAsyncStack,
+)
+from django_queue.entries import QueueEntryStatus
+
+
+@pytest.fixture
+def shard_urls(redis_client):
+    # Separate databases on one server stand in for separate servers.
+    base = redis_client.rsplit("/", 1)[0]
+    return [f"{base}/1", f"{base}/2", f"{base}/3"]
+
+
+@pytest.fixture
+def queue(shard_urls):
+    return RedisShardedAsyncQueue(shard_urls, queue_name=f"sharded-{uuid4().hex}")
+
+
+def test_sharded_queue_uses_the_redis_worker(shard_urls):
+    queue = RedisShardedAsyncQueue(shard_urls)
+
+    assert isinstance(queue, RedisAsyncQueue)
+    assert queue.resolve_worker("tasks") is RedisAsyncQueueWorker
+
+
+@pytest.mark.parametrize(
+    ("location", "message"),
+    [
+        ("redis://localhost:6379/0", "list of Redis URLs"),
+        ([], "at least one"),
+        (["redis://localhost:6379/0"] * 2, "different database"),
+    ],
+)
+def test_sharded_queue_rejects_an_invalid_location(location, message):
+    with pytest.raises(InvalidQueueBackendError, match=message):
+        RedisShardedAsyncQueue(location)
+
+
+def test_sharded_queue_stores_each_entry_on_the_shard_its_id_selects(queue):
+    async def exercise():
+        entry_ids = await queue.aenqueue_many(range(30))
+        provider = queue._provider
+        try:
+            for entry_id in entry_ids:
+                shard = provider.shard_for(entry_id)
+                assert await shard.afind(entry_id) == await queue.afind(entry_id)
+                for other in provider.shards:
+                    if other is not shard:
+                        assert not await other._async_redis().exists(
+                            other._entry_key(entry_id)
+                        )
+            assert all([await shard.alist() for shard in provider.shards])
+            assert {entry.id for entry in await queue.alist()} == set(entry_ids)
+            assert [entry.id for entry in await queue._alist_after(None, 10)] == sorted(
+                entry_ids
+            )[:10]
+            assert [
+                entry.id for entry in await queue._alist_after(entry_ids[9], 100)
+            ] == sorted(entry_ids)[10:]
+            newest = await queue.alist(status="queued", newest_first=True, limit=3)
+            assert [entry.id for entry in newest] == sorted(entry_ids)[:-4:-1]
+        finally:
+            await provider.aclear_records()
+            await queue.aclose()
+
+    asyncio.run(exercise())
+
+
+def test_sharded_queue_claims_across_shards_until_all_are_empty(queue):
+    async def exercise():
+        entry_ids = await queue.aenqueue_many(range(12))
+        worker_id = uuid4()
+        try:
+            claimed = [await queue.aclaim(worker_id, 30) for _ in range(5)]
+            claimed += await queue.aclaim_many(worker_id, 30, 20)
+            assert sorted(entry.id for entry in claimed) == sorted(entry_ids)
+            with pytest.raises(QueueEmptyException):
+                await queue.aclaim(worker_id, 30)
+            assert not await queue.ahas_pending()
+        finally:
+            await queue._provider.aclear_records()
+            await queue.aclose()
+
+    asyncio.run(exercise())
+
+
+def test_sharded_stack_makes_every_shard_a_stack(shard_urls):
+    stack = RedisShardedAsyncStack(shard_urls)
+
+    assert stack.stack
+    assert all(shard.stack for shard in stack._provider.shards)
+
+
+def test_sharded_queue_runs_entries_on_every_shard_to_completion(queue):
+    snapshots = []
+
+    async def handle(entry):
+        return entry.payload * 2
+
+    async def exercise():
+        observer = asyncio.create_task(queue._provider.aobserve(snapshots.append))
+        worker = RedisAsyncQueueWorker(
+            {"tasks": queue}, {"tasks": handle}, idle_delay=0.01
+        )
+        task = asyncio.create_task(worker.run())
+        try:
+            await asyncio.sleep(0.05)
+            # Enough entries that every shard is all but certain to get one.
+            entry_ids = await queue.aenqueue_many(range(30), timeout_seconds=30)
+            while True:
+                entries = [await queue.afind(entry_id) for entry_id in entry_ids]
+                if all(e.status is QueueEntryStatus.SUCCEEDED for e in entries):
+                    break
+                await asyncio.sleep(0.005)
+            assert [entry.result for entry in entries] == [n * 2 for n in range(30)]
+            assert {queue._provider.shard_for(i) for i in entry_ids} == set(
+                queue._provider.shards
+            )
+            await asyncio.sleep(0.05)
+            for entry_id in entry_ids:
+                statuses = [s.status for s in snapshots if s.id == entry_id]
+                assert statuses[-2:] == [
+                    QueueEntryStatus.RUNNING,
+                    QueueEntryStatus.SUCCEEDED,
+                ]
+        finally:
+            task.cancel()
+            observer.cancel()
+            await asyncio.gather(task, observer, return_exceptions=True)
+            await queue._provider.aclear_records()
+            await queue.aclose()
+
+    asyncio.run(exercise())
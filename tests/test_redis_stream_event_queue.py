@@ -0,0 +1,232 @@
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from django_queue.backends.exceptions import (
+    InvalidQueueBackendError,
+    QueueEmptyException,
+    QueueEntryNotFoundError,
+)
+from django_queue.backends.redis import (
+    RedisEventQueue,
+    RedisEventQueueWorker,
+    RedisStreamEventQueue,
+    RedisStreamEventQueueWorker,
+)
+from django_queue.listeners import ListenerRegistration
+
+
+@pytest.fixture
+def queue(redis_client):
+    return RedisStreamEventQueue(redis_client, queue_name=f"events-{uuid4().hex}")
+
+
+def _listen(monkeypatch, listener):
+    monkeypatch.setattr(
+        "django_queue.event_worker.listeners_for",
+        lambda queue_name: (ListenerRegistration(listener),),
+    )
+
+
+def test_redis_stream_event_queue_uses_its_own_default_worker():
+    queue = RedisStreamEventQueue("redis://localhost:6379/0")
+
+    assert isinstance(queue, RedisEventQueue)
+    assert queue.resolve_worker("events") is RedisStreamEventQueueWorker
+
+
+def test_redis_stream_event_queue_rejects_the_redis_event_worker(queue):
+    queue.worker_class = RedisEventQueueWorker
+
+    with pytest.raises(InvalidQueueBackendError, match="not compatible"):
+        queue.resolve_worker("events")
+
+
+def test_redis_stream_event_worker_consumes_an_event(queue, monkeypatch):
+    received = []
+
+    async def receive(entry):
+        received.append(entry.payload)
+        return True
+
+    _listen(monkeypatch, receive)
+
+    async def exercise():
+        await queue.aenqueue({"event": 1})
+        assert await RedisStreamEventQueueWorker(queue).adispatch_once()
+        assert not await queue.ahas_pending()
+        assert await queue._provider.alist() == []
+        assert (
+            await queue._provider._async_redis().xlen(queue._provider._stream_name) == 0
+        )
+        await queue.aclose()
+
+    asyncio.run(exercise())
+
+    assert received == [{"event": 1}]
+
+
+def test_redis_stream_event_worker_redelivers_a_passed_event_after_its_delay(
+    queue, monkeypatch
+):
+    calls = []
+
+    def pass_event(entry):
+        calls.append(entry.id)
+
+    _listen(monkeypatch, pass_event)
+
+    async def exercise():
+        event_id = await queue.aenqueue("event")
+        worker = RedisStreamEventQueueWorker(queue)
+        worker.release_delay = 0.05
+        assert await worker.adispatch_once()
+        assert not await worker.adispatch_once()
+        assert await queue.ahas_pending()
+        await asyncio.sleep(0.06)
+        assert await worker.adispatch_once()
+        assert (await queue.afind(event_id)).payload == "event"
+        await queue.aclose()
+
+    asyncio.run(exercise())
+
+    assert len(calls) == 2
+
+
+def test_redis_stream_event_keeps_its_remaining_lifetime_across_a_claim(queue):
+    async def exercise():
+        event_id = await queue.aenqueue("event", timeout_seconds=0.3)
+        provider = queue._provider
+        worker_id = uuid4()
+        entry = await provider.aclaim_unexpired(worker_id, 10)
+        assert entry.id == event_id
+        # A claimed event cannot expire under its consumer.
+        await asyncio.sleep(0.35)
+        assert await provider.aexpire_due() == []
+        assert await provider.arelease(event_id, worker_id, 0.001)
+        assert await provider.aexpire_due() == []
+        await asyncio.sleep(0.4)
+        assert await provider.aexpire_due() == [event_id]
+        with pytest.raises(QueueEntryNotFoundError):
+            await queue.afind(event_id)
+        await queue.aclose()
+
+    asyncio.run(exercise())
+
+
+def test_redis_stream_event_expires_unclaimed(queue):
+    async def exercise():
+        await queue.aenqueue("event", timeout_seconds=0.001)
+        await asyncio.sleep(0.01)
+        assert not await queue.ahas_pending()
+        with pytest.raises(QueueEmptyException):
+            await queue._provider.aclaim_unexpired(uuid4(), 10)
+        await queue.aclose()
+
+    asyncio.run(exercise())
+
+
+def test_redis_stream_claims_are_owned_by_their_consumer(queue):
+    async def exercise():
+        event_id = await queue.aenqueue("event")
+        provider = queue._provider
+        owner, other = uuid4(), uuid4()
+        await provider.aclaim_unexpired(owner, 10)
+        with pytest.raises(QueueEmptyException):
+            await provider.aclaim_unexpired(other, 10)
+        assert not await provider.arenew(event_id, other, 10)
+        assert not await provider.arelease(event_id, other, 0.001)
+        assert not await provider.aremove(event_id, other)
+        assert await provider.arenew(event_id, owner, 10)
+        assert await provider.aremove(event_id, owner)
+        assert not await provider.aremove(event_id, owner)
+        await queue.aclose()
+
+    asyncio.run(exercise())
+
+
+def test_redis_stream_recovers_a_claim_idle_past_its_lease(queue):
+    async def exercise():
+        event_id = await queue.aenqueue("event")
+        provider = queue._provider
+        lost, survivor = uuid4(), uuid4()
+        await provider.aclaim_unexpired(lost, 0.05)
+        assert await provider.arecover(10, 0.05) == (0, 0)
+        await asyncio.sleep(0.1)
+        assert not await provider.arenew(event_id, lost, 0.05)
+        assert await provider.arecover(10, 0.05) == (1, 0)
+        assert (await provider.aclaim_unexpired(survivor, 10)).id == event_id
+        assert not await provider.aremove(event_id, lost)
+        assert await provider.aremove(event_id, survivor)
+        await queue.aclose()
+
+    asyncio.run(exercise())
+
+
+def test_an_idle_redis_stream_event_worker_wakes_for_a_new_event(queue, monkeypatch):
+    async def exercise():
+        received = asyncio.Event()
+
+        async def receive(entry):
+            received.set()
+            return True
+
+        _listen(monkeypatch, receive)
+        task = asyncio.create_task(
+            RedisStreamEventQueueWorker(queue, idle_delay=30).run()
+        )
+        try:
+            await asyncio.sleep(0.05)
+            started = time.monotonic()
+            await queue.aenqueue("event")
+            await asyncio.wait_for(received.wait(), timeout=1)
+            assert time.monotonic() - started < 0.5
+        finally:
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            await queue.aclose()
+
+    asyncio.run(exercise())
+
+
+def test_redis_stream_event_queue_supports_direct_consumers(queue):
+    async def exercise():
+        first, second = await queue.aenqueue_many(["first", "second"])
+        assert [entry.id for entry in await queue._provider.alist()] == [first, second]
+        assert (await queue.afind(second)).payload == "second"
+        assert (await queue.adequeue()).id == first
+        await queue.aclear()
+        assert await queue._provider.alist() == []
+        with pytest.raises(QueueEmptyException):
+            await queue.adequeue()
+        await queue.aclose()
+
+    asyncio.run(exercise())
+
+
+def test_redis_stream_event_queue_uses_a_fixed_set_of_keys(queue):
+    async def exercise():
+        await queue.aenqueue_many([{"index": index} for index in range(20)])
+        provider = queue._provider
+        await provider.aclaim_unexpired(uuid4(), 10)
+        keys = {
+            key.decode()
+            async for key in provider._async_redis().scan_iter(
+                match=f"{queue.queue_name}*"
+            )
+        }
+        await queue.aclear()
+        await queue.aclose()
+        return keys
+
+    keys = asyncio.run(exercise())
+
+    assert keys == {
+        f"{queue.queue_name}:entries:stream",
+        f"{queue.queue_name}:entries:stream:ids",
+        f"{queue.queue_name}:entries:stream:remaining",
+        f"{queue.queue_name}:entries:unclaimed-leases",
+    }
@@ -321,3 +321,17 @@ def test_release_does_not_let_a_low_priority_claim_jump_ahead_of_a_higher_priori
         f"expected higher-priority entry {high_id} to claim next, "
         f"got {next_id} (low-priority released entry was {low_id})"
     )
+
+
+def test_priority_queue_claims_a_batch_from_its_priority_store(tracked_redis_queue):
+    async def exercise():
+        try:
+            for payload, priority in (("low", 1), ("high", 9), ("middle", 5)):
+                await tracked_redis_queue.aenqueue(payload, priority=priority)
+            return await tracked_redis_queue.aclaim_many(uuid4(), 60, 2)
+        finally:
+            await tracked_redis_queue.aclose()
+
+    claimed = asyncio.run(exercise())
+
+    assert [entry.payload for entry in claimed] == ["high", "middle"]
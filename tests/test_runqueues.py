@@ -1,9 +1,13 @@
 import asyncio
 import logging
+import os
 import signal
 import threading
+import time
 from collections.abc import Awaitable, Callable
+from dataclasses import replace
 from io import StringIO
+from uuid import uuid4
 
 import pytest
 from django.core.management.base import CommandError
@@ -11,10 +15,15 @@ from django.core.management.base import CommandError
 import django_queue
 from django_queue.backends import MemoryAsyncQueue
 from django_queue.backends.memory import MemoryAsyncQueueWorker
+from django_queue.entries import QueueEntryStatus
+from django_queue.management.commands import runqueues
 from django_queue.management.commands.runqueues import (
     Command,
     WorkerActivation,
+    _process_plan,
 )
+from django_queue.process_handlers import ProcessHandler
+from django_queue.queue_runtime import QueueRuntime
 from django_queue.worker import AsyncQueueWorker
 
 
@@ -42,6 +51,14 @@ class TrackingWorker(AsyncQueueWorker):
         super().__init__(*args, **kwargs)
 
 
+@pytest.fixture(autouse=True)
+def supervisor_runtime(monkeypatch):
+    # The supervisor shuts its runtime down for good; keep the shared one open.
+    runtime = QueueRuntime()
+    monkeypatch.setattr(runqueues, "queue_runtime", runtime)
+    return runtime
+
+
 @pytest.fixture(autouse=True)
 def reset_tracking_worker_instances():
     TrackingWorker.instances = 0
@@ -295,6 +312,42 @@ class TestRunQueuesCommand:
         with pytest.raises(CommandError, match="default.*asynchronous"):
             Command().handle()
 
+    def test_wraps_a_synchronous_handler_for_the_process_executor(self, monkeypatch):
+        queues = django_queue.QueueRegistry(
+            {
+                "default": {
+                    "BACKEND": "django_queue.backends.MemoryAsyncQueue",
+                    "HANDLER": "tests.test_runqueues.synchronous_handler",
+                    "HANDLER_EXECUTOR": "process",
+                }
+            }
+        )
+        monkeypatch.setattr(django_queue, "queues", queues)
+
+        (activation,) = Command()._create_workers()
+
+        assert isinstance(activation.handler, ProcessHandler)
+        assert activation.handler.handler_path == (
+            "tests.test_runqueues.synchronous_handler"
+        )
+
+    def test_rejects_an_asynchronous_handler_for_the_process_executor(
+        self, monkeypatch
+    ):
+        queues = django_queue.QueueRegistry(
+            {
+                "default": {
+                    "BACKEND": "django_queue.backends.MemoryAsyncQueue",
+                    "HANDLER": "tests.test_runqueues.handle_entry",
+                    "HANDLER_EXECUTOR": "process",
+                }
+            }
+        )
+        monkeypatch.setattr(django_queue, "queues", queues)
+
+        with pytest.raises(CommandError, match="default.*synchronous callable"):
+            Command().handle()
+
     def test_accepts_an_asynchronous_callable_object(self, monkeypatch):
         queues = django_queue.QueueRegistry(
             {
@@ -531,3 +584,186 @@ class ExplodingQueue(MemoryAsyncQueue):
     async def adequeue(self):
         self.dequeue_started.set()
         raise RuntimeError("backend failed")
+
+
+class TestRunQueuesProcesses:
+    def test_plans_one_process_per_alias_process_count(self):
+        first = WorkerActivation("first", MemoryAsyncQueue(), handle_entry, 1)
+        second = WorkerActivation("second", MemoryAsyncQueue(), handle_entry, 3)
+        third = WorkerActivation("third", MemoryAsyncQueue(), handle_entry, 2)
+
+        assert _process_plan([first, second, third]) == [
+            (first, second, third),
+            (second, third),
+            (second,),
+        ]
+
+    def test_reads_per_alias_process_counts_over_the_command_default(self, monkeypatch):
+        queues = django_queue.QueueRegistry(
+            {
+                "first": {
+                    "BACKEND": "tests.test_runqueues.SharedQueue",
+                    "HANDLER": "tests.test_runqueues.handle_entry",
+                },
+                "second": {
+                    "BACKEND": "tests.test_runqueues.SharedQueue",
+                    "HANDLER": "tests.test_runqueues.handle_entry",
+                    "PROCESSES": 4,
+                },
+            }
+        )
+        monkeypatch.setattr(django_queue, "queues", queues)
+
+        activations = Command()._create_workers(2)
+
+        assert [activation.processes for activation in activations] == [2, 4]
+
+    def test_rejects_more_than_one_process_for_a_memory_queue(self, monkeypatch):
+        queues = django_queue.QueueRegistry(
+            {
+                "default": {
+                    "BACKEND": "django_queue.backends.MemoryAsyncQueue",
+                    "HANDLER": "tests.test_runqueues.handle_entry",
+                }
+            }
+        )
+        monkeypatch.setattr(django_queue, "queues", queues)
+
+        with pytest.raises(CommandError, match="default.*more than one process"):
+            Command().handle(processes=2)
+
+    def test_rejects_a_non_positive_process_count(self):
+        with pytest.raises(CommandError, match="--processes"):
+            Command().handle(processes=0)
+
+    def test_restarts_a_crashed_process_and_forwards_shutdown(
+        self, monkeypatch, tmp_path, caplog
+    ):
+        starts = tmp_path / "starts"
+        snapshot = AsyncQueueWorker({}, {}).snapshot
+
+        def run_worker_process(self, activations, connection):
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            with starts.open("a") as handle:
+                handle.write(f"{os.getpid()}\n")
+            if len(starts.read_text().splitlines()) == 1:
+                connection.send(
+                    {"default": replace(snapshot, dispatch_count=1, failed_count=1)}
+                )
+                raise SystemExit(1)
+            connection.send(
+                {"default": replace(snapshot, dispatch_count=2, succeeded_count=2)}
+            )
+            while True:
+                time.sleep(1)
+
+        finished = threading.Event()
+
+        def shut_down_after_restart():
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline and (
+                not starts.exists() or len(starts.read_text().splitlines()) < 2
+            ):
+                time.sleep(0.01)
+            if not finished.is_set():
+                os.kill(os.getpid(), signal.SIGTERM)
+
+        monkeypatch.setattr(Command, "_run_worker_process", run_worker_process)
+        monkeypatch.setattr(runqueues, "_RESTART_BACKOFF_SECONDS", 0.01)
+        output = StringIO()
+        activation = WorkerActivation("default", MemoryAsyncQueue(), handle_entry)
+        watcher = threading.Thread(target=shut_down_after_restart)
+        watcher.start()
+
+        try:
+            Command(stdout=output)._supervise_processes([(activation,)])
+        finally:
+            finished.set()
+            watcher.join()
+
+        assert len(starts.read_text().splitlines()) == 2
+        assert "Queue worker process 0 exited with code 1" in caplog.text
+        assert output.getvalue() == (
+            "Worker process 0 handled default: 3 dispatched, 2 succeeded, "
+            "1 failed, 0 cancelled, 0 timed out.\n"
+        )
+
+    def test_stops_the_queue_runtime_before_forking(
+        self, monkeypatch, tmp_path, supervisor_runtime
+    ):
+        report = tmp_path / "report"
+
+        def run_worker_process(self, activations, connection):
+            # A forked child keeps only the forking thread, but inherits the
+            # runtime's state: its loop is cleared once its thread has stopped.
+            report.write_text(str(runqueues.queue_runtime._loop is None))
+            os.kill(os.getppid(), signal.SIGTERM)
+
+        monkeypatch.setattr(Command, "_run_worker_process", run_worker_process)
+        supervisor_runtime.start_thread()
+        activation = WorkerActivation("default", MemoryAsyncQueue(), handle_entry)
+
+        Command(stdout=StringIO())._supervise_processes([(activation,)])
+
+        assert report.read_text() == "True"
+        assert supervisor_runtime._thread is None
+
+    def test_processes_share_a_redis_queue(self, monkeypatch, redis_client):
+        alias = f"requests-{uuid4().hex}"
+        queues = django_queue.QueueRegistry(
+            {
+                alias: {
+                    "BACKEND": "django_queue.backends.redis.RedisAsyncQueue",
+                    "LOCATION": redis_client,
+                    "HANDLER": "tests.test_runqueues.handle_entry",
+                }
+            }
+        )
+        monkeypatch.setattr(django_queue, "queues", queues)
+        entry_ids = [queues[alias].enqueue(index) for index in range(4)]
+
+        finished = threading.Event()
+
+        def shut_down_when_handled():
+            deadline = time.monotonic() + 10
+            while (
+                not finished.is_set()
+                and time.monotonic() < deadline
+                and any(
+                    queues[alias].find(entry_id).status
+                    is not QueueEntryStatus.SUCCEEDED
+                    for entry_id in entry_ids
+                )
+            ):
+                time.sleep(0.01)
+            if not finished.is_set():
+                os.kill(os.getpid(), signal.SIGTERM)
+
+        output = StringIO()
+        watcher = threading.Thread(target=shut_down_when_handled)
+        watcher.start()
+
+        try:
+            Command(stdout=output).handle(processes=2)
+        finally:
+            finished.set()
+            watcher.join()
+
+        assert [queues[alias].find(entry_id).result for entry_id in entry_ids] == [
+            {"handled": index} for index in range(4)
+        ]
+        lines = output.getvalue().splitlines()
+        assert lines[:2] == [
+            "Starting 1 queue handlers.",
+            "Starting 2 worker processes.",
+        ]
+        assert sum(int(line.split(": ")[1].split()[0]) for line in lines[2:]) == 4
+
+
+class SharedQueue(MemoryAsyncQueue):
+    """A memory queue posing as shared, to plan processes without Redis."""
+
+    process_local = False
+    worker_provider_kind = "generic"
+    worker_class = "django_queue.worker.AsyncQueueWorker"
+    compatible_worker_class = "django_queue.worker.AsyncQueueWorker"
@@ -7,6 +7,7 @@ import pytest
 
 from django_queue import ClockTime, WorkerSnapshot
 from django_queue.backends import MemoryAsyncQueue
+from django_queue.backends.base import AsyncQueue
 from django_queue.clock import LocalQueueClock
 from django_queue.entries import QueueEntryStatus
 from django_queue.worker import (
@@ -71,6 +72,7 @@ class TestAsyncQueueWorker:
         assert snapshot.started_at is None
         assert snapshot.active_entry_id is None
         assert snapshot.active_queue_name is None
+        assert snapshot.active_entry_ids == ()
         assert snapshot.queue_names == ()
         assert snapshot.dispatch_count == 0
         assert snapshot.succeeded_count == 0
@@ -1207,3 +1209,222 @@ class TestBudgetAndEntryClocksStaySeparate:
                 return
             await asyncio.sleep(0.005)
         raise AssertionError(f"{name} never reached {expected}")
+
+
+class TestConcurrentDispatch:
+    def test_dispatches_up_to_the_queue_concurrency_at_once(self):
+        asyncio.run(self._dispatches_up_to_the_queue_concurrency_at_once())
+
+    async def _dispatches_up_to_the_queue_concurrency_at_once(self):
+        queue = MemoryAsyncQueue(queue_name="requests")
+        queue.concurrency = 2
+        entry_ids = [await queue.aenqueue(payload) for payload in ("a", "b", "c")]
+        started = []
+        release = asyncio.Event()
+
+        async def handle(entry):
+            started.append(entry.payload)
+            await release.wait()
+            return entry.payload
+
+        worker = AsyncQueueWorker(
+            {"requests": queue}, {"requests": handle}, idle_delay=0.001
+        )
+        task = asyncio.create_task(worker.run())
+        await self._wait_for_snapshot_count(worker, "dispatch_count", 2)
+        await asyncio.sleep(0.02)
+
+        snapshot = worker.snapshot
+        assert started == ["a", "b"]
+        assert snapshot.dispatch_count == 2
+        assert snapshot.active_entry_ids == tuple(entry_ids[:2])
+        assert snapshot.active_entry_id == entry_ids[1]
+        assert snapshot.active_queue_name == "requests"
+        # The third entry was never claimed, so another worker could take it.
+        assert (await queue.afind(entry_ids[2])).status is QueueEntryStatus.QUEUED
+
+        release.set()
+        await self._wait_for_snapshot_count(worker, "succeeded_count", 3)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert started == ["a", "b", "c"]
+        assert worker.snapshot.dispatch_count == 3
+        assert worker.snapshot.active_entry_ids == ()
+
+    def test_a_slow_handler_does_not_hold_up_another_alias(self):
+        asyncio.run(self._a_slow_handler_does_not_hold_up_another_alias())
+
+    async def _a_slow_handler_does_not_hold_up_another_alias(self):
+        slow_queue = MemoryAsyncQueue(queue_name="slow")
+        fast_queue = MemoryAsyncQueue(queue_name="fast")
+        slow_id = await slow_queue.aenqueue("slow")
+        release = asyncio.Event()
+
+        async def handle_slow(entry):
+            await release.wait()
+            return entry.payload
+
+        async def handle_fast(entry):
+            return entry.payload
+
+        worker = AsyncQueueWorker(
+            {"slow": slow_queue, "fast": fast_queue},
+            {"slow": handle_slow, "fast": handle_fast},
+            idle_delay=0.001,
+        )
+        task = asyncio.create_task(worker.run())
+        await self._wait_for_snapshot_count(worker, "dispatch_count", 1)
+        fast_ids = [await fast_queue.aenqueue(payload) for payload in ("x", "y")]
+        await self._wait_for_snapshot_count(worker, "succeeded_count", 2)
+
+        assert worker.snapshot.active_entry_ids == (slow_id,)
+        for entry_id in fast_ids:
+            assert (await fast_queue.afind(entry_id)).status is (
+                QueueEntryStatus.SUCCEEDED
+            )
+
+        release.set()
+        await self._wait_for_snapshot_count(worker, "succeeded_count", 3)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    def test_reaping_logs_every_failed_dispatch_and_raises_the_first(self, caplog):
+        asyncio.run(
+            self._reaping_logs_every_failed_dispatch_and_raises_the_first(caplog)
+        )
+
+    async def _reaping_logs_every_failed_dispatch_and_raises_the_first(self, caplog):
+        queue = MemoryAsyncQueue(queue_name="requests")
+        worker = AsyncQueueWorker({"requests": queue}, {"requests": lambda e: None})
+        slots = asyncio.Semaphore(2)
+        worker._dispatch_slots = {queue: slots}
+
+        async def fail(message):
+            raise QueuePersistenceError(message)
+
+        tasks = [asyncio.create_task(fail(message)) for message in ("one", "two")]
+        await asyncio.wait(tasks)
+        worker._dispatch_tasks = {queue: set(tasks)}
+        for _ in tasks:
+            await slots.acquire()
+
+        with pytest.raises(QueuePersistenceError) as raised:
+            worker._reap_dispatches()
+
+        logged = [record.exc_info[1] for record in caplog.records if record.exc_info]
+        assert {raised.value, *logged} == {task.exception() for task in tasks}
+        assert len(logged) == 1
+        assert not slots.locked()
+
+    def test_each_entry_in_flight_keeps_its_own_budget(self):
+        asyncio.run(self._each_entry_in_flight_keeps_its_own_budget())
+
+    async def _each_entry_in_flight_keeps_its_own_budget(self):
+        queue = MemoryAsyncQueue(queue_name="requests")
+        queue.concurrency = 2
+        hung_id = await queue.aenqueue("hangs", timeout_seconds=0.05)
+        slow_id = await queue.aenqueue("slow", timeout_seconds=5)
+
+        async def handle(entry):
+            if entry.payload == "hangs":
+                await asyncio.Event().wait()
+            await asyncio.sleep(0.1)
+            return entry.payload
+
+        worker = AsyncQueueWorker(
+            {"requests": queue}, {"requests": handle}, idle_delay=0.001
+        )
+        task = asyncio.create_task(worker.run())
+        await self._wait_for_snapshot_count(worker, "timed_out_count", 1)
+        await self._wait_for_snapshot_count(worker, "succeeded_count", 1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert (await queue.afind(hung_id)).status is QueueEntryStatus.TIMEOUT
+        assert (await queue.afind(slow_id)).status is QueueEntryStatus.SUCCEEDED
+        assert worker.snapshot.dispatch_count == 2
+
+    def test_shutdown_gives_every_entry_in_flight_its_grace_period(self):
+        asyncio.run(self._shutdown_gives_every_entry_in_flight_its_grace_period())
+
+    async def _shutdown_gives_every_entry_in_flight_its_grace_period(self):
+        queue = MemoryAsyncQueue(queue_name="requests")
+        queue.concurrency = 3
+        finishing_id = await queue.aenqueue("finishes")
+        hung_ids = [await queue.aenqueue("hangs") for _ in range(2)]
+        release = asyncio.Event()
+
+        async def handle(entry):
+            if entry.payload == "hangs":
+                await asyncio.Future()
+            await release.wait()
+            return entry.payload
+
+        worker = AsyncQueueWorker(
+            {"requests": queue},
+            {"requests": handle},
+            idle_delay=0.001,
+            cancellation_grace_period=0.05,
+        )
+        task = asyncio.create_task(worker.run())
+        await self._wait_for_snapshot_count(worker, "dispatch_count", 3)
+        task.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert (await queue.afind(finishing_id)).status is QueueEntryStatus.SUCCEEDED
+        for entry_id in hung_ids:
+            assert (await queue.afind(entry_id)).status is QueueEntryStatus.TIMEOUT
+        snapshot = worker.snapshot
+        assert snapshot.running is False
+        assert snapshot.active_entry_ids == ()
+        assert snapshot.succeeded_count == 1
+        assert snapshot.timed_out_count == 2
+
+    async def _wait_for_snapshot_count(self, worker, name, expected):
+        async with asyncio.timeout(1):
+            while getattr(worker.snapshot, name) < expected:
+                await asyncio.sleep(0.001)
+
+
+class TestIdleWakeUp:
+    def test_an_idle_worker_picks_up_new_work_before_its_idle_delay(self):
+        asyncio.run(self._an_idle_worker_picks_up_new_work_before_its_idle_delay())
+
+    async def _an_idle_worker_picks_up_new_work_before_its_idle_delay(self):
+        queue = MemoryAsyncQueue(queue_name="requests")
+        handled = asyncio.Event()
+
+        async def handle(entry):
+            handled.set()
+            return entry.payload
+
+        worker = AsyncQueueWorker(
+            {"requests": queue}, {"requests": handle}, idle_delay=30
+        )
+        task = asyncio.create_task(worker.run())
+        await asyncio.sleep(0.02)
+        await queue.aenqueue("work")
+        try:
+            await asyncio.wait_for(handled.wait(), timeout=1)
+        finally:
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    def test_a_backend_without_wake_ups_is_polled_at_its_poll_interval(self):
+        queue = MemoryAsyncQueue(queue_name="requests")
+        queue.poll_interval = 0.01
+
+        async def exercise():
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            await AsyncQueue._await_pending(queue, 30)
+            return loop.time() - started
+
+        assert asyncio.run(exercise()) < 1